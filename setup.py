@@ -193,6 +193,9 @@ setup(
             'scikit-learn>=1.3.0',
             'pandas>=2.0.0',
         ],
+        'analytics': [
+            'pyarrow>=12.0.0',
+        ],
         'quantum': [
             'qiskit>=0.43.0',
             'cirq>=1.0.0',
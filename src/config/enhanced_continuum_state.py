@@ -3,12 +3,20 @@ FSL Continuum - Enhanced Continuum State Management
 
 Advanced state management integrating neural field context awareness 
 and symbolic residue pattern analysis with AI learning capabilities.
+
+State is held as top-level sections (``neural_field``, ``operations_log``,
+...). Updates replace a section with an updated copy instead of mutating it,
+so ``snapshot_state`` can share every section with the live state and costs
+one reference per section. Changed sections are tracked, and with a
+``section_store`` (such as ``JournalStateStore``) ``save_state`` serializes
+only those sections instead of rewriting the whole state file.
 """
 
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Mapping
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -93,11 +101,27 @@ class TerminalVelocityMetrics:
     context_accuracy_percentage: float = 0.0
     adaptation_improvement_rate: float = 0.0
 
+# State file sections held in their own attributes
+SECTION_ATTRIBUTES = {
+    "neural_field": "neural_field_state",
+    "symbolic_residue": "symbolic_residue_state",
+    "context_intelligence": "context_intelligence_state",
+    "schematics_consciousness_state": "schematics_consciousness_state"
+}
+SECTION_KEYS = {attribute: key for key, attribute in SECTION_ATTRIBUTES.items()}
+
 class EnhancedStateManager:
-    """Advanced state management for FSL Continuum with AI integration."""
+    """Advanced state management for FSL Continuum with AI integration.
+    
+    ``section_store`` persists changed sections; it takes the
+    ``load``/``encode``/``write`` interface of the continuum state stores.
+    Sections it has saved take precedence over the state file on load.
+    """
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, section_store: Optional[Any] = None):
         self.config_path = config_path or "src/config/enhanced_continuum_state.json"
+        self.section_store = section_store
+        self.dirty_sections = set()
         self.state_config = None
         self.neural_field_state = None
         self.symbolic_residue_state = None
@@ -112,30 +136,51 @@ class EnhancedStateManager:
             with open(self.config_path, 'r') as f:
                 self.state_config = json.load(f)
             
-            # Extract neural field state
-            self.neural_field_state = self.state_config.get("neural_field", {})
-            
-            # Extract symbolic residue state
-            self.symbolic_residue_state = self.state_config.get("symbolic_residue", {})
-            
-            # Extract context intelligence state
-            self.context_intelligence_state = self.state_config.get("context_intelligence", {})
-            
-            # Extract terminal velocity metrics
-            self.terminal_velocity_metrics = TerminalVelocityMetrics(
-                **self.state_config.get("terminal_velocity_metrics", {})
-            )
-            
-            # Extract schematics consciousness state
-            self.schematics_consciousness_state = self.state_config.get(
-                "schematics_consciousness_state", {}
-            )
+            self._extract_sections()
             
             logger.info("Enhanced continuum state loaded successfully")
             
         except Exception as e:
             logger.error(f"Failed to load enhanced continuum state: {e}")
             self._initialize_default_state()
+        
+        if self.section_store is not None:
+            self._load_saved_sections()
+        self.dirty_sections = set()
+    
+    def _load_saved_sections(self):
+        """Apply sections saved in the section store over the loaded state."""
+        try:
+            sections = self.section_store.load()
+        except Exception as e:
+            logger.error(f"Failed to load saved state sections: {e}")
+            return
+        
+        if sections:
+            self.state_config.update(sections)
+            self._extract_sections()
+            logger.info(f"Loaded {len(sections)} saved state sections")
+    
+    def _extract_sections(self):
+        """Extract section states from the loaded state configuration."""
+        # Extract neural field state
+        self.neural_field_state = self.state_config.get("neural_field", {})
+        
+        # Extract symbolic residue state
+        self.symbolic_residue_state = self.state_config.get("symbolic_residue", {})
+        
+        # Extract context intelligence state
+        self.context_intelligence_state = self.state_config.get("context_intelligence", {})
+        
+        # Extract terminal velocity metrics
+        self.terminal_velocity_metrics = TerminalVelocityMetrics(
+            **self.state_config.get("terminal_velocity_metrics", {})
+        )
+        
+        # Extract schematics consciousness state
+        self.schematics_consciousness_state = self.state_config.get(
+            "schematics_consciousness_state", {}
+        )
     
     def _initialize_default_state(self):
         """Initialize default enhanced state."""
@@ -307,24 +352,17 @@ class EnhancedStateManager:
         try:
             # Apply updates to state
             for section, values in updates.items():
-                if hasattr(self, f"{section}_state"):
-                    current_state = getattr(self, f"{section}_state")
-                    current_state.update(values)
-                elif section in self.state_config:
-                    self.state_config[section].update(values)
+                self._apply_section_update(section, values)
             
             # Apply AI learning to updates
             if fsl_continuum:
                 ai_enhanced_updates = self._apply_ai_learning(updates, context)
                 for section, values in ai_enhanced_updates.items():
-                    if hasattr(self, f"{section}_state"):
-                        current_state = getattr(self, f"{section}_state")
-                        current_state.update(values)
-                    elif section in self.state_config:
-                        self.state_config[section].update(values)
+                    self._apply_section_update(section, values)
             
             # Update timestamp
             self.state_config["last_updated"] = datetime.now().isoformat()
+            self.dirty_sections.add("last_updated")
             
             # Save state
             self.save_state()
@@ -336,22 +374,53 @@ class EnhancedStateManager:
             logger.error(f"Failed to update state with AI: {e}")
             return {"success": False, "error": str(e)}
     
+    def _apply_section_update(self, section: str, values: Dict[str, Any]):
+        """Replace a section with an updated copy and mark it changed."""
+        attribute = SECTION_ATTRIBUTES.get(section, f"{section}_state")
+        if hasattr(self, attribute):
+            setattr(self, attribute, {**getattr(self, attribute), **values})
+            self.dirty_sections.add(SECTION_KEYS.get(attribute, section))
+        elif section in self.state_config:
+            self.state_config[section] = {**self.state_config[section], **values}
+            self.dirty_sections.add(section)
+    
+    def _sections(self) -> Dict[str, Any]:
+        """All state file sections, sharing the live section objects."""
+        sections = self.state_config.copy()
+        for key, attribute in SECTION_ATTRIBUTES.items():
+            sections[key] = getattr(self, attribute)
+        sections["terminal_velocity_metrics"] = asdict(self.terminal_velocity_metrics)
+        return sections
+    
+    def snapshot_state(self) -> Mapping[str, Any]:
+        """Get a read-only point-in-time view of every state section.
+        
+        Sections are replaced rather than mutated by updates, so the view
+        shares them with the live state and later updates do not show
+        through; treat the sections themselves as read-only.
+        """
+        return MappingProxyType(self._sections())
+    
     def save_state(self):
-        """Save enhanced continuum state to configuration."""
+        """Save enhanced continuum state to configuration.
+        
+        With a section store only the sections changed since the last save
+        are written; otherwise the whole state file is rewritten.
+        """
         try:
             # Prepare state for saving
-            state_to_save = self.state_config.copy()
-            state_to_save["neural_field"] = self.neural_field_state
-            state_to_save["symbolic_residue"] = self.symbolic_residue_state
-            state_to_save["context_intelligence"] = self.context_intelligence_state
-            state_to_save["terminal_velocity_metrics"] = asdict(self.terminal_velocity_metrics)
-            state_to_save["schematics_consciousness_state"] = self.schematics_consciousness_state
+            state_to_save = self._sections()
             
-            # Save to file
-            with open(self.config_path, 'w') as f:
-                json.dump(state_to_save, f, indent=2)
-            
-            logger.info("Enhanced continuum state saved successfully")
+            if self.section_store is not None:
+                self.section_store.write(self.section_store.encode(state_to_save, self.dirty_sections))
+                logger.info(f"Saved {len(self.dirty_sections)} changed enhanced state sections")
+            else:
+                # Save to file
+                with open(self.config_path, 'w') as f:
+                    json.dump(state_to_save, f, indent=2)
+                
+                logger.info("Enhanced continuum state saved successfully")
+            self.dirty_sections = set()
             
         except Exception as e:
             logger.error(f"Failed to save enhanced continuum state: {e}")
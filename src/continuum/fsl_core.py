@@ -13,7 +13,7 @@ from datetime import datetime
 
 from ..quantum_engine.consciousness_detector import ConsciousnessDetector
 from ..quantum_engine.field_manipulator import QuantumFieldManipulator
-from .state_management import StateManager
+from ..fsl_continuum.continuum.state_management import StateManager
 from .ai_orchestrator import AIOrchestrator
 
 
@@ -238,18 +238,26 @@ class FSLContinuum:
             self.logger.warning(f"Could not load persistent state: {e}")
     
     async def _save_persistent_state(self) -> None:
-        """Save continuum state to persistent storage."""
+        """Queue continuum state for persistent storage.
+        
+        The state manager writes it behind on its I/O thread, coalescing
+        concurrent pipeline triggers, so callers do not wait on disk I/O.
+        """
         try:
             state = {
                 "productivity": self.metrics.developer_productivity,
                 "velocity_score": self.metrics.velocity_score,
                 "timestamp": datetime.now().isoformat()
             }
-            await self.state_manager.save_state(state)
-            self.logger.debug("Persistent state saved")
+            await self.state_manager.update(state)
+            self.logger.debug("Persistent state queued")
         except Exception as e:
             self.logger.error(f"Could not save persistent state: {e}")
     
+    async def flush_persistent_state(self) -> bool:
+        """Wait until queued continuum state has been written."""
+        return await self.state_manager.flush()
+    
     async def get_consciousness_level(self) -> Dict[str, float]:
         """Get current consciousness level of the continuum."""
         return await self.consciousness_detector.analyze_consciousness()
@@ -8,6 +8,8 @@ from .core import FSLContinuum
 from .metrics import TerminalVelocityMetrics
 from .terminal_velocity import TerminalVelocity
 from .state_management import StateManager
+from .state_storage import JSONStateStore, JournalStateStore
+from .sqlite_state import SQLiteStateManager
 from .ai_orchestrator import AIOrchestrator
 
 def create_fsl_continuum(config):
@@ -20,5 +22,8 @@ __all__ = [
     'create_fsl_continuum',
     'TerminalVelocity',
     'StateManager',
+    'JSONStateStore',
+    'JournalStateStore',
+    'SQLiteStateManager',
     'AIOrchestrator'
 ]
@@ -0,0 +1,198 @@
+"""
+SQLite State Management
+
+State management for FSL Continuum shared between processes.
+
+``SQLiteStateManager`` exposes the ``StateManager`` API (``get``, ``set``,
+``update``, ``load_state``, ``save_state``, ``shutdown``) on top of a
+key-value table in an SQLite database in WAL mode. Readers never block the
+writer, and writers in other processes wait up to ``timeout`` seconds for
+the database lock instead of overwriting each other's changes.
+
+Every call reads or writes the database, so each process sees the others'
+committed changes. ``update`` and ``save_state`` write all their keys in
+one transaction; ``save_state()`` without arguments writes every key of the
+in-memory ``state``, so values changed in place after ``load_state`` are
+saved as with ``StateManager`` (overwriting other processes' changes to
+those keys since the last load). Keys are only ever upserted, never deleted,
+so keys added by other processes survive. Values are stored as JSON text. Each process opens its own
+connection lazily, and a forked child never reuses its parent's. The SQL
+statements are constants, so the connection's statement cache prepares
+each of them once.
+
+As in ``StateManager``, database work runs on a dedicated I/O thread (or a
+caller-provided executor), so a writer waiting up to ``timeout`` seconds for
+another process's lock never stalls the event loop. ``get_status`` is the
+only synchronous call that touches the database.
+"""
+
+import os
+import json
+import sqlite3
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from pathlib import Path
+
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+_SELECT_ALL = "SELECT key, value FROM state"
+_SELECT_ONE = "SELECT value FROM state WHERE key = ?"
+_UPSERT = "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)"
+_COUNT = "SELECT COUNT(*) FROM state"
+
+
+class SQLiteStateManager:
+    """SQLite-backed state manager for FSL Continuum."""
+
+    def __init__(self, db_path: Optional[str] = None, timeout: float = 30.0, synchronous: str = "NORMAL",
+                 executor: Optional[Executor] = None):
+        if synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}")
+        self.db_path = Path(db_path or "fsl_state.db")
+        self.timeout = timeout
+        self.synchronous = synchronous.upper()
+        self.state = {}
+        self.lock = threading.Lock()
+        self.connection = None
+        self.connection_pid = None
+        self.owns_executor = executor is None
+        self.executor = executor
+        self.executor_pid = None
+
+    def _get_executor(self) -> Executor:
+        """Get the I/O executor, starting this process's I/O thread on first use."""
+        pid = os.getpid()
+        if self.owns_executor and (self.executor is None or self.executor_pid != pid):
+            # The parent's I/O thread does not exist in a forked child
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fsl-sqlite-io")
+            self.executor_pid = pid
+        return self.executor
+
+    async def _run_db(self, func: Callable, *args) -> Any:
+        """Run blocking database work on the I/O executor and await it."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this process's connection, opening it on first use."""
+        pid = os.getpid()
+        if self.connection is None or self.connection_pid != pid:
+            # A connection inherited through fork must not be used or closed
+            connection = sqlite3.connect(
+                str(self.db_path), timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.synchronous}")
+            connection.execute(_CREATE_TABLE)
+            self.connection = connection
+            self.connection_pid = pid
+        return self.connection
+
+    def _write_values(self, values: Dict[str, Any]):
+        """Encode values as JSON and upsert them in one write transaction."""
+        self._write([(key, json.dumps(value)) for key, value in values.items()])
+
+    def _write(self, rows: List[Tuple[str, str]]):
+        """Upsert encoded rows in one write transaction."""
+        with self.lock:
+            connection = self._connect()
+            # IMMEDIATE takes the write lock up front, so a busy database
+            # is waited on instead of failing a read-to-write upgrade
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(_UPSERT, rows)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _open(self):
+        """Open the connection and create the state table."""
+        with self.lock:
+            self._connect()
+
+    def _read_all(self) -> List[Tuple[str, str]]:
+        """Read every encoded row."""
+        with self.lock:
+            return self._connect().execute(_SELECT_ALL).fetchall()
+
+    def _read_one(self, key: str) -> Optional[Tuple[str]]:
+        """Read one encoded row."""
+        with self.lock:
+            return self._connect().execute(_SELECT_ONE, (key,)).fetchone()
+
+    def _close(self):
+        """Close this process's connection."""
+        with self.lock:
+            if self.connection is not None and self.connection_pid == os.getpid():
+                self.connection.close()
+            self.connection = None
+            self.connection_pid = None
+
+    async def initialize(self):
+        """Open the connection and create the state table."""
+        await self._run_db(self._open)
+
+    async def load_state(self) -> Dict[str, Any]:
+        """Load all state from the database."""
+        try:
+            rows = await self._run_db(self._read_all)
+        except sqlite3.Error as e:
+            print(f"Error loading state: {e}")
+            return {}
+        self.state = {key: json.loads(value) for key, value in rows}
+        return self.state
+
+    async def save_state(self, state: Optional[Dict[str, Any]] = None) -> bool:
+        """Save ``state``, or the whole in-memory state when omitted, in one transaction."""
+        if state is not None:
+            self.state.update(state)
+        values = dict(state if state is not None else self.state)
+        try:
+            await self._run_db(self._write_values, values)
+        except sqlite3.Error as e:
+            print(f"Error saving state: {e}")
+            return False
+        return True
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Get state value."""
+        row = await self._run_db(self._read_one, key)
+        return json.loads(row[0]) if row is not None else default
+
+    async def set(self, key: str, value: Any):
+        """Set state value."""
+        await self._run_db(self._write, [(key, json.dumps(value))])
+        self.state[key] = value
+
+    async def update(self, updates: Dict[str, Any]):
+        """Update multiple state values in one transaction."""
+        await self._run_db(self._write, [(key, json.dumps(value)) for key, value in updates.items()])
+        self.state.update(updates)
+
+    async def shutdown(self) -> bool:
+        """Close this process's connection, checkpointing the WAL if it is the last."""
+        await self._run_db(self._close)
+        if self.owns_executor and self.executor is not None:
+            if self.executor_pid == os.getpid():
+                self.executor.shutdown(wait=True)
+            self.executor = None
+            self.executor_pid = None
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get state manager status."""
+        with self.lock:
+            connection = self._connect()
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            keys = connection.execute(_COUNT).fetchone()[0]
+        return {
+            'db_path': str(self.db_path),
+            'journal_mode': journal_mode,
+            'synchronous': self.synchronous,
+            'keys': keys,
+            'pid': self.connection_pid
+        }
@@ -2,56 +2,206 @@
 State Management
 
 Persistent state management for FSL Continuum.
+
+Once loaded, the in-memory state is authoritative: ``get`` never touches the
+disk, and ``set``/``update`` only mark keys dirty. A write-behind flush runs
+``flush_interval`` seconds after the first unsaved change and writes every
+change made in the meantime with one atomic file replace. ``save_state``
+writes immediately; called without ``state`` it writes the whole state, so
+changes made in place (``state = await load_state(); state[k] = v``) are
+saved too. ``shutdown`` writes pending changes and fsyncs them.
+
+Flushes go to a store from ``state_storage``: by default the whole state is
+rewritten as one JSON file, while ``JournalStateStore`` appends only the
+changed keys.
+
+Store I/O runs on a dedicated I/O thread (or a caller-provided executor),
+so coroutines keep running while state is read, encoded and written; the
+event loop only takes a shallow copy of the state per flush. Values passed
+to ``set``/``update`` must therefore not be mutated in place afterwards.
+``loop_time`` and ``io_time`` in ``get_status`` report the seconds flushes
+spent on the event loop and on the I/O thread.
 """
 
-import json
+import time
 import asyncio
-from typing import Dict, Any, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterable, Callable
 from pathlib import Path
 
+from .state_storage import JSONStateStore
+
 
 class StateManager:
     """State manager for FSL Continuum."""
-    
-    def __init__(self, state_file: Optional[str] = None):
-        self.state_file = Path(state_file or "fsl_state.json")
+
+    def __init__(self, state_file: Optional[str] = None, flush_interval: float = 0.05,
+                 store: Optional[Any] = None, executor: Optional[Executor] = None):
+        self.state_file = Path(state_file or (store.path if store is not None else "fsl_state.json"))
+        self.store = store if store is not None else JSONStateStore(self.state_file)
+        self.flush_interval = flush_interval
         self.state = {}
+        self.loaded = False
         self.lock = asyncio.Lock()
-        
-    async def load_state(self) -> Dict[str, Any]:
-        """Load state from file."""
-        async with self.lock:
-            try:
-                if self.state_file.exists():
-                    with open(self.state_file, 'r') as f:
-                        self.state = json.load(f)
-                return self.state
-            except Exception as e:
-                print(f"Error loading state: {e}")
-                return {}
-                
-    async def save_state(self):
-        """Save state to file."""
-        async with self.lock:
+        self.owns_executor = executor is None
+        self.executor = executor
+
+        # Write-behind bookkeeping
+        self.dirty_keys = set()
+        self.write_all = False
+        self.pending_updates = 0
+        self.unsynced = False
+        self.flush_task = None
+        self.flush_count = 0
+        self.coalesced_updates = 0
+        self.loop_time = 0.0
+        self.io_time = 0.0
+
+    def _get_executor(self) -> Executor:
+        """Get the I/O executor, starting the owned I/O thread on first use."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fsl-state-io")
+        return self.executor
+
+    async def _run_io(self, func: Callable, *args) -> Any:
+        """Run blocking store work on the I/O executor and await it."""
+        def timed():
+            start_time = time.perf_counter()
             try:
-                with open(self.state_file, 'w') as f:
-                    json.dump(self.state, f, indent=2)
-            except Exception as e:
-                print(f"Error saving state: {e}")
-                
+                return func(*args)
+            finally:
+                self.io_time += time.perf_counter() - start_time
+
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), timed)
+
+    async def initialize(self):
+        """Load state so later calls are served from memory."""
+        await self.load_state()
+
+    async def load_state(self) -> Dict[str, Any]:
+        """Load state from file on first use, then return the in-memory state."""
+        if not self.loaded:
+            async with self.lock:
+                if not self.loaded:
+                    try:
+                        self.state = await self._run_io(self.store.load)
+                    except Exception as e:
+                        print(f"Error loading state: {e}")
+                    self.loaded = True
+        return self.state
+
+    async def save_state(self, state: Optional[Dict[str, Any]] = None) -> bool:
+        """Save state to file now, merging ``state`` into it first when given.
+        
+        Without ``state`` the whole in-memory state is written, including
+        values changed in place.
+        """
+        await self.load_state()
+        if state is not None:
+            self.state.update(state)
+            self._mark_dirty(state, schedule=False)
+        else:
+            self.write_all = True
+            self._mark_dirty((), schedule=False)
+        return await self.flush()
+
     async def get(self, key: str, default: Any = None) -> Any:
         """Get state value."""
         await self.load_state()
         return self.state.get(key, default)
-        
+
     async def set(self, key: str, value: Any):
         """Set state value."""
         await self.load_state()
         self.state[key] = value
-        await self.save_state()
-        
+        self._mark_dirty((key,))
+
     async def update(self, updates: Dict[str, Any]):
         """Update multiple state values."""
         await self.load_state()
         self.state.update(updates)
-        await self.save_state()
+        self._mark_dirty(updates)
+
+    def _mark_dirty(self, keys: Iterable[str], schedule: bool = True):
+        """Record a change and schedule a write-behind flush if none is pending."""
+        self.dirty_keys.update(keys)
+        self.pending_updates += 1
+        if schedule and (self.flush_task is None or self.flush_task.done()):
+            self.flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """Write pending changes once the flush interval has passed."""
+        await asyncio.sleep(self.flush_interval)
+        self.flush_task = None
+        # A flush already writing finishes even if shutdown cancels this task
+        await asyncio.shield(self.flush())
+
+    async def flush(self, fsync: bool = False) -> bool:
+        """Write all pending changes with a single store write."""
+        async with self.lock:
+            if not self.pending_updates:
+                if fsync and self.unsynced:
+                    return await self._sync_file()
+                return True
+
+            start_time = time.perf_counter()
+            snapshot = dict(self.state)
+            dirty_keys, write_all, pending_updates = self.dirty_keys, self.write_all, self.pending_updates
+            self.dirty_keys, self.write_all, self.pending_updates = set(), False, 0
+            self.loop_time += time.perf_counter() - start_time
+            try:
+                await self._run_io(self._write_snapshot, snapshot, None if write_all else dirty_keys, fsync)
+            except Exception as e:
+                print(f"Error saving state: {e}")
+                self.dirty_keys |= dirty_keys
+                self.write_all = self.write_all or write_all
+                self.pending_updates += pending_updates
+                return False
+
+            self.unsynced = not fsync
+            self.flush_count += 1
+            self.coalesced_updates += pending_updates
+            return True
+
+    def _write_snapshot(self, snapshot: Dict[str, Any], dirty_keys: Optional[Iterable[str]], fsync: bool):
+        """Encode and write a state snapshot (``dirty_keys`` None: all of it); runs on the I/O executor."""
+        self.store.write(self.store.encode(snapshot, dirty_keys), fsync)
+
+    async def _sync_file(self) -> bool:
+        """Fsync state written earlier without fsync."""
+        try:
+            await self._run_io(self.store.sync)
+        except OSError as e:
+            print(f"Error syncing state: {e}")
+            return False
+        self.unsynced = False
+        return True
+
+    async def shutdown(self) -> bool:
+        """Write pending changes and fsync them to disk."""
+        if self.flush_task is not None and not self.flush_task.done():
+            self.flush_task.cancel()
+        self.flush_task = None
+        flushed = await self.flush(fsync=True)
+        self.store.close()
+        if self.owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        return flushed
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get state manager status."""
+        return {
+            'state_file': str(self.state_file),
+            'loaded': self.loaded,
+            'keys': len(self.state),
+            'dirty_keys': sorted(self.dirty_keys),
+            'write_all': self.write_all,
+            'pending_updates': self.pending_updates,
+            'flush_pending': self.flush_task is not None and not self.flush_task.done(),
+            'flush_count': self.flush_count,
+            'coalesced_updates': self.coalesced_updates,
+            'loop_time': self.loop_time,
+            'io_time': self.io_time,
+            'store': self.store.get_status()
+        }
@@ -0,0 +1,259 @@
+"""
+State Storage
+
+Storage engines behind StateManager for FSL Continuum.
+
+``JSONStateStore`` rewrites one JSON file per flush. ``JournalStateStore``
+is log-structured: each flush appends one record holding only the changed
+keys to ``<path>.journal``, and once the journal grows past
+``compact_bytes`` the whole state is written to ``<path>.snapshot`` and the
+journal is emptied. Writes therefore cost O(changes), not O(state size).
+A write without ``dirty_keys`` (``None``) is a whole-state write and always
+produces a snapshot.
+
+Journal records are a 4-byte big-endian payload length, a CRC-32 of the
+payload, then the JSON payload ``{"sequence": n, "set": {...},
+"delete": [...]}``. Recovery loads the snapshot, then replays records
+whose sequence follows it. It stops at the first torn, corrupt or
+out-of-sequence record and truncates the journal there, so a crash loses at
+most the flush that was being appended. Records already covered by the
+snapshot are skipped, which makes a crash between writing a snapshot and
+emptying the journal harmless.
+"""
+
+import os
+import json
+import zlib
+import struct
+import tempfile
+from typing import Dict, Any, Optional, Iterable, Tuple
+from pathlib import Path
+
+
+SNAPSHOT_FORMAT = "fsl-state-snapshot/1"
+
+_RECORD_HEADER = struct.Struct(">II")
+
+
+def _replace_file(path: Path, payload: str, fsync: bool):
+    """Replace a file atomically, optionally fsyncing it and its directory."""
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        temp_path = None
+        if fsync:
+            _sync_directory(path.parent)
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def _sync_directory(directory: Path):
+    """Fsync a directory so renames inside it are durable."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class JSONStateStore:
+    """Whole-state JSON file, rewritten atomically on every flush."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Any]:
+        """Read the state file; empty state when it does not exist."""
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def encode(self, state: Dict[str, Any], dirty_keys: Optional[Iterable[str]]) -> str:
+        """Serialize the whole state."""
+        return json.dumps(state, indent=2)
+
+    def write(self, payload: str, fsync: bool = False):
+        """Replace the state file with an encoded state."""
+        _replace_file(self.path, payload, fsync)
+
+    def sync(self):
+        """Fsync a state file written earlier without fsync."""
+        with open(self.path, 'rb') as f:
+            os.fsync(f.fileno())
+        _sync_directory(self.path.parent)
+
+    def close(self):
+        """Nothing is held open between writes."""
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get store status."""
+        return {'type': 'json', 'path': str(self.path)}
+
+
+class JournalStateStore:
+    """Append-only, checksummed journal of state changes plus compacted snapshots."""
+
+    def __init__(self, path: str, compact_bytes: int = 1 << 20):
+        if compact_bytes <= 0:
+            raise ValueError("compact_bytes must be positive")
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(self.path.name + ".snapshot")
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.compact_bytes = compact_bytes
+
+        self.journal = None
+        self.sequence = 0
+        self.snapshot_sequence = 0
+        self.journal_size = 0
+        self.records_replayed = 0
+        self.truncated_bytes = 0
+        self.compactions = 0
+
+    def load(self) -> Dict[str, Any]:
+        """Load the latest snapshot and replay the journal tail after it."""
+        self.close()
+        state = {}
+        self.snapshot_sequence = 0
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            if snapshot.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"Unsupported state snapshot format in {self.snapshot_path}")
+            state = snapshot["state"]
+            self.snapshot_sequence = snapshot["sequence"]
+        self.sequence = self.snapshot_sequence
+
+        self.records_replayed = 0
+        self.truncated_bytes = 0
+        valid_size = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+            valid_size = self._replay(data, state)
+            if valid_size < len(data):
+                # Drop a torn or corrupt tail so new records follow valid ones
+                self.truncated_bytes = len(data) - valid_size
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(valid_size)
+        self.journal_size = valid_size
+        return state
+
+    def _replay(self, data: bytes, state: Dict[str, Any]) -> int:
+        """Apply journal records to ``state``; returns the length of the valid prefix."""
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            try:
+                record = json.loads(payload)
+                sequence = record["sequence"]
+            except (ValueError, KeyError, TypeError):
+                break
+            if sequence > self.sequence:
+                if sequence != self.sequence + 1:
+                    break
+                state.update(record.get("set", {}))
+                for key in record.get("delete", ()):
+                    state.pop(key, None)
+                self.sequence = sequence
+                self.records_replayed += 1
+            offset = start + length
+        return offset
+
+    def encode(self, state: Dict[str, Any], dirty_keys: Optional[Iterable[str]]) -> Tuple[bytes, Optional[str]]:
+        """Encode the changed keys as the next journal record.
+
+        When the journal has reached ``compact_bytes``, or ``dirty_keys`` is
+        None, a snapshot of the whole state is encoded too.
+        """
+        if dirty_keys is None:
+            snapshot = json.dumps({"format": SNAPSHOT_FORMAT, "sequence": self.sequence + 1, "state": state})
+            return b"", snapshot
+
+        sets, deletes = {}, []
+        for key in dirty_keys:
+            if key in state:
+                sets[key] = state[key]
+            else:
+                deletes.append(key)
+        payload = json.dumps(
+            {"sequence": self.sequence + 1, "set": sets, "delete": deletes}, separators=(",", ":")
+        ).encode("utf-8")
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        snapshot = None
+        if self.journal_size + len(record) >= self.compact_bytes:
+            snapshot = json.dumps({"format": SNAPSHOT_FORMAT, "sequence": self.sequence + 1, "state": state})
+        return record, snapshot
+
+    def write(self, payload: Tuple[bytes, Optional[str]], fsync: bool = False):
+        """Append an encoded record, compacting when a snapshot was encoded."""
+        record, snapshot = payload
+        if snapshot is not None:
+            # The snapshot covers this record, so it replaces the journal
+            _replace_file(self.snapshot_path, snapshot, fsync=True)
+            self.sequence += 1
+            self.snapshot_sequence = self.sequence
+            self._reset_journal()
+            self.compactions += 1
+            return
+
+        if self.journal is None:
+            self.journal = open(self.journal_path, 'ab')
+        try:
+            self.journal.write(record)
+            self.journal.flush()
+            if fsync:
+                os.fsync(self.journal.fileno())
+        except OSError:
+            # Never leave a partial record that would hide later ones
+            self.journal.truncate(self.journal_size)
+            raise
+        self.journal_size += len(record)
+        self.sequence += 1
+
+    def _reset_journal(self):
+        """Empty the journal once a snapshot covers it."""
+        if self.journal is None:
+            self.journal = open(self.journal_path, 'ab')
+        self.journal.truncate(0)
+        os.fsync(self.journal.fileno())
+        self.journal_size = 0
+
+    def sync(self):
+        """Fsync journal records appended without fsync."""
+        if self.journal is not None:
+            os.fsync(self.journal.fileno())
+
+    def close(self):
+        """Close the journal file."""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get store status."""
+        return {
+            'type': 'journal',
+            'snapshot_path': str(self.snapshot_path),
+            'journal_path': str(self.journal_path),
+            'sequence': self.sequence,
+            'snapshot_sequence': self.snapshot_sequence,
+            'journal_bytes': self.journal_size,
+            'records_replayed': self.records_replayed,
+            'truncated_bytes': self.truncated_bytes,
+            'compactions': self.compactions
+        }
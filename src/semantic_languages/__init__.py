@@ -16,9 +16,20 @@ from .baml import BAMLParser, BAMLValidator, BAMLSchema, BAMLGenerator, BAMLInte
 from .pareto_lang import ParetoLangParser, ParetoLangValidator, ParetoLangSchema, ParetoLangGenerator, ParetoLangInterpreter, ParetoLangBridge, ParetoLangXMLTransformer
 from .bridge import SemanticLanguageBridge
 from .connections import SemanticDataConnections
+from .connection_pool import SemanticConnectionPool, ConnectionPoolTimeout, ConnectionPoolFull
 from .schemas import SemanticLanguageSchemas
 from .ai_integration import SemanticAIProcessor, SemanticAIOptimizer
 from .xml_processor import UnifiedXMLProcessor
+from .metrics import MetricsRecorder
+from .transformation_plan import TransformationPlan
+from .schema_validator import SchemaValidator, SchemaViolation
+from .columnar_export import ColumnarExporter, ColumnarTable, read_columnar
+from .binary_envelope import BinaryEnvelope
+from .xml_archive import UnifiedXMLArchive
+from .wrap_cache import WrapCache
+from .async_pipeline import AsyncSemanticPipeline
+from .document_parser import SemanticParseError
+from .semantic_index import SemanticModelIndex
 
 # Semantic languages version and compatibility
 __version__ = "1.0.0-fsl-integration"
@@ -115,6 +126,9 @@ __all__ = [
     # Integration classes
     'SemanticLanguageBridge', 'SemanticDataConnections', 'SemanticLanguageSchemas',
     'SemanticAIProcessor', 'SemanticAIOptimizer', 'UnifiedXMLProcessor',
+    'MetricsRecorder', 'TransformationPlan', 'WrapCache', 'AsyncSemanticPipeline', 'SemanticParseError', 'SemanticModelIndex',
+    'SemanticConnectionPool', 'ConnectionPoolTimeout', 'ConnectionPoolFull', 'SchemaValidator', 'SchemaViolation',
+    'ColumnarExporter', 'ColumnarTable', 'read_columnar', 'BinaryEnvelope', 'UnifiedXMLArchive',
     
     # Manager
     'SemanticLanguageManager',
@@ -9,17 +9,75 @@ import json
 import time
 import logging
 import asyncio
+import itertools
 import numpy as np
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Sequence
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
 
+from .metrics import MetricsRecorder
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns of the per-document semantic feature matrix
+FEATURE_COLUMNS = (
+    "feature_count",
+    "boundary_count",
+    "connection_count",
+    "constraint_count",
+    "optimization_count",
+    "resource_count",
+    "efficiency_sum",
+    "efficiency_count"
+)
+
+def _section_records(data: Dict[str, Any], section: str) -> List[Any]:
+    """Get a list section of a semantic document, or an empty list."""
+    records = data.get(section)
+    return records if isinstance(records, list) else []
+
+def _semantic_feature_row(data: Dict[str, Any]) -> Tuple[float, ...]:
+    """Count the semantic records of one BAML or Pareto-Lang document.
+
+    Constraints are counted at the top level and inside boundaries and
+    optimizations; efficiencies are the numeric ``efficiency`` values of
+    optimizations.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Semantic documents must be dictionaries, got {type(data).__name__}")
+    
+    boundaries = _section_records(data, "boundaries")
+    optimizations = _section_records(data, "optimizations")
+    constraint_count = len(_section_records(data, "constraints"))
+    efficiency_sum = 0.0
+    efficiency_count = 0
+    
+    for record in boundaries:
+        if isinstance(record, dict):
+            constraint_count += len(_section_records(record, "constraints"))
+    for record in optimizations:
+        if isinstance(record, dict):
+            constraint_count += len(_section_records(record, "constraints"))
+            efficiency = record.get("efficiency")
+            if isinstance(efficiency, (int, float)) and not isinstance(efficiency, bool):
+                efficiency_sum += efficiency
+                efficiency_count += 1
+    
+    return (
+        len(data),
+        len(boundaries),
+        len(_section_records(data, "connections")),
+        constraint_count,
+        len(optimizations),
+        len(_section_records(data, "resources")),
+        efficiency_sum,
+        efficiency_count
+    )
+
 class AIStrategy(Enum):
     """AI processing strategies for semantic languages."""
     CONTEXT_AWARE = "context_aware"
@@ -54,7 +112,7 @@ class SemanticAICapabilities:
 class SemanticAIProcessor:
     """AI processor for semantic languages."""
     
-    def __init__(self):
+    def __init__(self, history_size: int = 100):
         self.ai_capabilities = SemanticAICapabilities(
             semantic_analysis=True,
             context_awareness=True,
@@ -65,13 +123,34 @@ class SemanticAIProcessor:
             confidence_threshold=0.75
         )
         
-        self.processing_history = []
+        self.processing_metrics = MetricsRecorder(history_size)
         self.learning_data = {}
         self.optimization_patterns = {}
         self.prediction_models = {}
         
         self.ai_config = self._load_ai_config()
         
+    @property
+    def processing_history(self):
+        """Most recent AI processing records (bounded by ``history_size``)."""
+        return self.processing_metrics.recent_records
+    
+    def _record_processing(self, language_type: str, processing_time: float, 
+                           success: bool, confidence_score: float = 0.0):
+        """Record an AI processing operation in the bounded processing metrics."""
+        self.processing_metrics.record(
+            processing_time,
+            success,
+            {
+                "timestamp": datetime.now().isoformat(),
+                "language_type": language_type,
+                "processing_time": processing_time,
+                "confidence_score": confidence_score,
+                "success": success
+            },
+            (language_type,)
+        )
+    
     def _load_ai_config(self) -> Dict[str, Any]:
         """Load AI integration configuration."""
         config_path = Path(__file__).parent / "config" / "ai_config.json"
@@ -109,9 +188,15 @@ class SemanticAIProcessor:
             }
         }
     
-    def analyze_baml_semantics(self, baml_data: Dict[str, Any], 
+    def analyze_baml_semantics(self, baml_data: Union[Dict[str, Any], Sequence[Dict[str, Any]]], 
                                  context: Optional[Dict[str, Any]] = None) -> AIProcessingResult:
-        """AI-enhanced BAML semantic analysis."""
+        """AI-enhanced BAML semantic analysis.
+        
+        A list of documents is analyzed as one batch; see ``process_semantic_batch``.
+        """
+        if isinstance(baml_data, (list, tuple)):
+            return self.process_semantic_batch(baml_data, "baml", context)
+        
         start_time = time.time()
         
         try:
@@ -154,6 +239,8 @@ class SemanticAIProcessor:
                 optimized_data, "baml", context
             )
             
+            self._record_processing("baml", processing_time, True, confidence_score)
+            
             return AIProcessingResult(
                 success=True,
                 processed_data=optimized_data,
@@ -174,6 +261,8 @@ class SemanticAIProcessor:
         except Exception as e:
             logger.error(f"Failed to analyze BAML semantics with AI: {e}")
             processing_time = time.time() - start_time
+            self._record_processing("baml", processing_time, False)
+            
             return AIProcessingResult(
                 success=False,
                 processed_data={},
@@ -185,9 +274,15 @@ class SemanticAIProcessor:
                 predictions={}
             )
     
-    def optimize_pareto_semantics(self, pareto_data: Dict[str, Any], 
+    def optimize_pareto_semantics(self, pareto_data: Union[Dict[str, Any], Sequence[Dict[str, Any]]], 
                                   constraints: Optional[Dict[str, Any]] = None) -> AIProcessingResult:
-        """AI-enhanced Pareto-Lang semantic optimization."""
+        """AI-enhanced Pareto-Lang semantic optimization.
+        
+        A list of documents is optimized as one batch; see ``process_semantic_batch``.
+        """
+        if isinstance(pareto_data, (list, tuple)):
+            return self.process_semantic_batch(pareto_data, "pareto_lang", constraints)
+        
         start_time = time.time()
         
         try:
@@ -230,6 +325,8 @@ class SemanticAIProcessor:
                 analyzed_data, "pareto_lang", constraints
             )
             
+            self._record_processing("pareto_lang", processing_time, True, confidence_score)
+            
             return AIProcessingResult(
                 success=True,
                 processed_data=analyzed_data,
@@ -250,6 +347,124 @@ class SemanticAIProcessor:
         except Exception as e:
             logger.error(f"Failed to optimize Pareto-Lang semantics with AI: {e}")
             processing_time = time.time() - start_time
+            self._record_processing("pareto_lang", processing_time, False)
+            
+            return AIProcessingResult(
+                success=False,
+                processed_data={},
+                ai_enhancements={},
+                processing_time=processing_time,
+                confidence_score=0.0,
+                optimization_applied=False,
+                learning_updates={},
+                predictions={}
+            )
+    
+    def extract_feature_matrix(self, documents: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Turn semantic documents into an N x len(FEATURE_COLUMNS) feature matrix in one pass."""
+        rows = itertools.chain.from_iterable(map(_semantic_feature_row, documents))
+        return np.fromiter(
+            rows, dtype=np.float64, count=len(documents) * len(FEATURE_COLUMNS)
+        ).reshape(len(documents), len(FEATURE_COLUMNS))
+    
+    def process_semantic_batch(self, documents: Sequence[Dict[str, Any]], 
+                               language_type: str, 
+                               context: Optional[Dict[str, Any]] = None) -> AIProcessingResult:
+        """AI-enhanced processing of many BAML or Pareto-Lang documents at once.
+        
+        Documents are reduced to a feature matrix once; features, confidence
+        scores and predicted outcomes are then arrays with one entry per
+        document, in input order. The batch is recorded as one processing
+        operation.
+        """
+        if language_type not in ("baml", "pareto_lang"):
+            raise ValueError(f"Unsupported language type for batch processing: {language_type}")
+        
+        start_time = time.time()
+        ai_settings = self.ai_config.get("ai_settings", {})
+        
+        try:
+            features = self.extract_feature_matrix(documents)
+            
+            # AI semantic analysis over the whole batch
+            processed_data = {
+                "semantic_analysis": True,
+                "analysis_model": "transformer-based",
+                "language_type": language_type,
+                "context_applied": context is not None,
+                "analysis_timestamp": datetime.now().isoformat(),
+                "batch_size": len(documents),
+                "semantic_features": self._extract_batch_semantic_features(features)
+            }
+            
+            # AI optimization (always applied to Pareto-Lang, as for single documents)
+            if language_type == "pareto_lang":
+                optimization_applied = True
+                optimization_factor = 1.20
+            else:
+                optimization_applied = ai_settings.get("optimization_enabled", False)
+                optimization_factor = 1.15
+            if optimization_applied:
+                processed_data.update(
+                    optimization_applied=True,
+                    optimization_model="genetic-algorithm",
+                    optimization_timestamp=datetime.now().isoformat(),
+                    optimization_factor=optimization_factor
+                )
+            
+            # AI learning from the feature matrix rather than every document
+            if ai_settings.get("learning_enabled", False):
+                batch_summary = {"batch_size": len(documents), "feature_matrix": features}
+                if language_type == "baml":
+                    learning_updates = self._learn_from_baml_analysis(batch_summary, processed_data, context)
+                else:
+                    learning_updates = self._learn_from_pareto_optimization(batch_summary, processed_data, context)
+            else:
+                learning_updates = {}
+            
+            # AI predictions, one value per document
+            if ai_settings.get("prediction_enabled", False):
+                if language_type == "baml":
+                    predictions = self._predict_baml_outcomes(processed_data, context)
+                else:
+                    predictions = self._predict_pareto_outcomes(processed_data, context)
+                predictions["predicted_outcomes"] = {
+                    outcome: np.full(len(documents), value)
+                    for outcome, value in predictions["predicted_outcomes"].items()
+                }
+            else:
+                predictions = {}
+            
+            confidence_scores = self._calculate_confidence_scores(features, language_type, context)
+            processed_data["confidence_scores"] = confidence_scores
+            confidence_score = float(confidence_scores.mean()) if len(documents) else 0.0
+            
+            processing_time = time.time() - start_time
+            self._record_processing(language_type, processing_time, True, confidence_score)
+            
+            return AIProcessingResult(
+                success=True,
+                processed_data=processed_data,
+                ai_enhancements={
+                    "context_awareness_applied": context is not None,
+                    "semantic_analysis_model": "transformer-based",
+                    "batch_processing_applied": True,
+                    "optimization_applied": optimization_applied,
+                    "learning_applied": bool(learning_updates),
+                    "prediction_applied": bool(predictions)
+                },
+                processing_time=processing_time,
+                confidence_score=confidence_score,
+                optimization_applied=optimization_applied,
+                learning_updates=learning_updates,
+                predictions=predictions
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to process {language_type} semantic batch with AI: {e}")
+            processing_time = time.time() - start_time
+            self._record_processing(language_type, processing_time, False)
+            
             return AIProcessingResult(
                 success=False,
                 processed_data={},
@@ -306,6 +521,8 @@ class SemanticAIProcessor:
                 optimized_integration, "integration", {}
             )
             
+            self._record_processing("integration", processing_time, True, confidence_score)
+            
             return AIProcessingResult(
                 success=True,
                 processed_data=optimized_integration,
@@ -326,6 +543,8 @@ class SemanticAIProcessor:
         except Exception as e:
             logger.error(f"Failed to integrate semantic languages with AI: {e}")
             processing_time = time.time() - start_time
+            self._record_processing("integration", processing_time, False)
+            
             return AIProcessingResult(
                 success=False,
                 processed_data={},
@@ -431,7 +650,7 @@ class SemanticAIProcessor:
             "learning_status": {
                 "learning_enabled": self.ai_capabilities.learning,
                 "learning_data_size": len(self.learning_data),
-                "patterns_learned": len(self.processing_history)
+                "patterns_learned": self.processing_metrics.count
             },
             "prediction_status": {
                 "prediction_enabled": self.ai_capabilities.prediction,
@@ -471,13 +690,6 @@ class SemanticAIProcessor:
             "confidence_score": 0.85
         }
         
-        # Store in processing history
-        self.processing_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "language_type": language_type,
-            "analysis_result": analysis_result
-        })
-        
         return analysis_result
     
     def _optimize_baml_semantics(self, semantic_data: Dict[str, Any], 
@@ -602,6 +814,12 @@ class SemanticAIProcessor:
         
         return min(base_confidence + context_bonus + language_bonus, 1.0)
     
+    def _calculate_confidence_scores(self, features: np.ndarray, 
+                                     language_type: str, 
+                                     context: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Calculate AI processing confidence scores for a feature matrix."""
+        return np.full(len(features), self._calculate_confidence_score({}, language_type, context))
+    
     def _unify_semantic_data_with_ai(self, baml_data: Dict[str, Any], 
                                       pareto_data: Dict[str, Any]) -> Dict[str, Any]:
         """Unify BAML and Pareto-Lang semantic data with AI."""
@@ -664,12 +882,40 @@ class SemanticAIProcessor:
     
     def _extract_semantic_features(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract semantic features from data."""
-        return {
+        # Record counts come from the document itself, not its context wrapper
+        source = data.get("original_data", data) if data.get("context_enhanced") else data
+        row = _semantic_feature_row(source)
+        efficiency_sum, efficiency_count = row[-2:]
+        
+        features = {
             "feature_count": len(data.keys()),
             "data_complexity": "high" if len(data) > 10 else "medium",
-            "semantic_density": 0.75,
+            "semantic_density": 0.75
+        }
+        features.update(zip(FEATURE_COLUMNS[1:-2], row[1:-2]))
+        features["efficiency_mean"] = efficiency_sum / efficiency_count if efficiency_count else 0.0
+        features["extracted_at"] = datetime.now().isoformat()
+        return features
+    
+    def _extract_batch_semantic_features(self, features: np.ndarray) -> Dict[str, Any]:
+        """Extract semantic feature arrays from a feature matrix."""
+        columns = dict(zip(FEATURE_COLUMNS, features.T))
+        efficiency_count = columns.pop("efficiency_count")
+        efficiency_sum = columns.pop("efficiency_sum")
+        
+        batch_features = {
+            "feature_columns": list(FEATURE_COLUMNS),
+            "feature_matrix": features,
+            "data_complexity": np.where(columns["feature_count"] > 10, "high", "medium"),
+            "semantic_density": np.full(len(features), 0.75),
+            "efficiency_mean": np.divide(
+                efficiency_sum, efficiency_count,
+                out=np.zeros(len(features)), where=efficiency_count > 0
+            ),
             "extracted_at": datetime.now().isoformat()
         }
+        batch_features.update(columns)
+        return batch_features
     
     def _extract_shared_features(self, baml_data: Dict[str, Any], 
                                   pareto_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -693,14 +939,21 @@ class SemanticAIProcessor:
     
     def _get_ai_performance_metrics(self) -> Dict[str, Any]:
         """Get AI performance metrics."""
+        summary = self.processing_metrics.summary()
+        
         return {
-            "processing_history_size": len(self.processing_history),
+            "processing_history_size": summary["count"],
             "learning_data_size": len(self.learning_data),
             "optimization_patterns_count": len(self.optimization_patterns),
             "prediction_models_count": len(self.prediction_models),
-            "average_processing_time": 0.125,
+            "average_processing_time": summary["mean_time"],
+            "processing_time_percentiles": {
+                "p50": summary["p50"],
+                "p95": summary["p95"],
+                "p99": summary["p99"]
+            },
             "average_confidence_score": 0.86,
-            "ai_success_rate": 0.95
+            "ai_success_rate": summary["success_rate"]
         }
     
     def _get_prediction_accuracy(self) -> float:
@@ -882,5 +1135,6 @@ __all__ = [
     'SemanticAIOptimizer',
     'AIProcessingResult',
     'SemanticAICapabilities',
-    'AIStrategy'
+    'AIStrategy',
+    'FEATURE_COLUMNS'
 ]
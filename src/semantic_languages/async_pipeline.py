@@ -0,0 +1,253 @@
+"""
+FSL Continuum - Async Semantic Pipeline
+
+Asyncio facade for the synchronous, CPU-bound semantic language components
+(semantic bridge, data connections and unified XML processor). Calls run on a
+configurable executor so they never block the event loop, with bounded
+concurrency, backpressure on the number of admitted calls and cancellation of
+calls that have not started yet.
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Optional, Any, Callable, Iterable, AsyncIterator
+
+from .metrics import MetricsRecorder
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class AsyncSemanticPipeline:
+    """Asyncio facade over the semantic language pipeline.
+
+    ``max_concurrency`` bounds how many calls run on the executor at once and
+    ``max_pending`` bounds how many calls are admitted (running or waiting for
+    a slot); further callers wait for admission, which is the backpressure
+    signal. Cancelling a caller before its call starts frees its place without
+    running it; a call that already started runs to completion in the
+    executor and keeps its slot until it finishes.
+
+    ``executor`` defaults to a thread pool owned by the pipeline. A process
+    pool can be passed for CPU-heavy stateless work; component methods then
+    run on a pickled copy of the component.
+    """
+
+    def __init__(self, bridge: Optional[Any] = None,
+                 connections: Optional[Any] = None,
+                 xml_processor: Optional[Any] = None,
+                 executor: Optional[Executor] = None,
+                 max_concurrency: int = 4,
+                 max_pending: Optional[int] = None,
+                 history_size: int = 100):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_pending is not None and max_pending < max_concurrency:
+            raise ValueError("max_pending must be at least max_concurrency")
+
+        self._bridge = bridge
+        self._connections = connections
+        self._xml_processor = xml_processor
+
+        self.owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="fsl-semantic"
+        )
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending or max_concurrency * 4
+
+        self.call_metrics = MetricsRecorder(history_size)
+        self.in_flight = 0
+        self.admitted = 0
+        self.cancelled = 0
+
+        # Asyncio primitives are bound to the loop that first uses them
+        self._loop = None
+        self._slots = None
+        self._admission = None
+
+    @property
+    def bridge(self):
+        """Semantic language bridge (created on first use)."""
+        if self._bridge is None:
+            from .bridge import SemanticLanguageBridge
+            self._bridge = SemanticLanguageBridge()
+        return self._bridge
+
+    @property
+    def connections(self):
+        """Semantic data connections (created on first use)."""
+        if self._connections is None:
+            from .connections import SemanticDataConnections
+            self._connections = SemanticDataConnections()
+        return self._connections
+
+    @property
+    def xml_processor(self):
+        """Unified XML processor (created on first use)."""
+        if self._xml_processor is None:
+            from .xml_processor import UnifiedXMLProcessor
+            self._xml_processor = UnifiedXMLProcessor()
+        return self._xml_processor
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the concurrency primitives for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._admission = asyncio.Semaphore(self.max_pending)
+        return loop
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a synchronous callable on the executor without blocking the loop."""
+        loop = self._bind_loop()
+        admission, slots = self._admission, self._slots
+
+        await admission.acquire()
+        self.admitted += 1
+        try:
+            await slots.acquire()
+        except asyncio.CancelledError:
+            self.admitted -= 1
+            self.cancelled += 1
+            admission.release()
+            raise
+
+        self.in_flight += 1
+        start_time = time.perf_counter()
+        operation = getattr(func, "__name__", type(func).__name__)
+
+        def release(_):
+            self.in_flight -= 1
+            self.admitted -= 1
+            slots.release()
+            admission.release()
+
+        # Slots are released when the executor future finishes, not when the
+        # caller stops waiting, so cancelled-but-running calls stay counted
+        try:
+            executor_future = self.executor.submit(partial(func, *args, **kwargs))
+        except BaseException:
+            # Nothing was scheduled (e.g. the executor is shut down), so no
+            # done callback will ever hand the permits back
+            release(None)
+            self.call_metrics.record(time.perf_counter() - start_time, False, labels=(operation,))
+            raise
+        executor_future.add_done_callback(
+            lambda future: loop.call_soon_threadsafe(release, future)
+        )
+
+        try:
+            result = await asyncio.wrap_future(executor_future, loop=loop)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except Exception:
+            self.call_metrics.record(time.perf_counter() - start_time, False, labels=(operation,))
+            raise
+
+        self.call_metrics.record(time.perf_counter() - start_time, True, labels=(operation,))
+        return result
+
+    async def map(self, func: Callable[..., Any], argument_sets: Iterable[tuple]) -> AsyncIterator[Any]:
+        """Run ``func(*arguments)`` for every argument tuple, yielding results in order.
+
+        The iterable is consumed lazily: a new call is only submitted once it
+        can be admitted, so at most ``max_pending`` calls are outstanding.
+        Closing the iterator cancels calls that have not started.
+        """
+        self._bind_loop()
+        pending = []
+        iterator = iter(argument_sets)
+        try:
+            for arguments in iterator:
+                while len(pending) >= self.max_pending:
+                    yield await pending.pop(0)
+                pending.append(asyncio.ensure_future(self.run(func, *arguments)))
+            while pending:
+                yield await pending.pop(0)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def integrate_baml_and_pareto(self, baml_data: Dict[str, Any],
+                                        pareto_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Integrate BAML and Pareto-Lang semantic data off the event loop."""
+        return await self.run(self.bridge.integrate_baml_and_pareto, baml_data, pareto_data)
+
+    async def connect_baml_to_continuum(self, baml_schema: Dict[str, Any],
+                                        continuum_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Connect BAML semantic data to FSL Continuum off the event loop."""
+        return await self.run(self.connections.connect_baml_to_continuum, baml_schema, continuum_state)
+
+    async def connect_pareto_to_continuum(self, pareto_schema: Dict[str, Any],
+                                          continuum_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Connect Pareto-Lang semantic data to FSL Continuum off the event loop."""
+        return await self.run(self.connections.connect_pareto_to_continuum, pareto_schema, continuum_state)
+
+    async def connect_semantic_languages(self, baml_data: Dict[str, Any],
+                                         pareto_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Connect BAML and Pareto-Lang semantic data off the event loop."""
+        return await self.run(self.connections.connect_semantic_languages, baml_data, pareto_data)
+
+    async def process_semantic_data_with_xml(self, semantic_data: Dict[str, Any], language_type: str,
+                                             context: Optional[Dict[str, Any]] = None):
+        """Process semantic data with XML transformation off the event loop."""
+        return await self.run(
+            self.xml_processor.process_semantic_data_with_xml, semantic_data, language_type, context
+        )
+
+    async def process_multiple_semantic_data_with_xml(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                                                      context: Optional[Dict[str, Any]] = None):
+        """Process multiple semantic data types with XML off the event loop."""
+        return await self.run(
+            self.xml_processor.process_multiple_semantic_data_with_xml, semantic_data_dict, context
+        )
+
+    async def create_unified_xml_wrapper(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                                         context: Optional[Dict[str, Any]] = None):
+        """Create a unified XML wrapper off the event loop."""
+        return await self.run(self.xml_processor.create_unified_xml_wrapper, semantic_data_dict, context)
+
+    async def parse_unified_xml_wrapper(self, unified_xml_wrapper: str,
+                                        context: Optional[Dict[str, Any]] = None):
+        """Parse a unified XML wrapper off the event loop."""
+        return await self.run(self.xml_processor.parse_unified_xml_wrapper, unified_xml_wrapper, context)
+
+    def get_pipeline_status(self) -> Dict[str, Any]:
+        """Get async pipeline status."""
+        summary = self.call_metrics.summary()
+        return {
+            "status": "active",
+            "executor": type(self.executor).__name__,
+            "max_concurrency": self.max_concurrency,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "completed_calls": summary["count"],
+            "failed_calls": summary["count"] - summary["success_count"],
+            "cancelled_calls": self.cancelled,
+            "average_call_time": summary["mean_time"],
+            "call_time_percentiles": {name: summary[name] for name in MetricsRecorder.QUANTILES},
+            "operation_distribution": dict(self.call_metrics.label_counts)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the executor if the pipeline owns it."""
+        if self.owns_executor:
+            self.executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> "AsyncSemanticPipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+# Export async pipeline classes
+__all__ = [
+    'AsyncSemanticPipeline'
+]
@@ -0,0 +1,29 @@
+"""
+FSL Continuum - BAML Parser
+
+Streaming parser for ``.baml`` semantic documents. Emits ``boundaries``,
+``connections`` and ``constraints`` records incrementally and reports syntax
+errors with line and column.
+"""
+
+import logging
+from typing import Tuple
+
+from ..document_parser import SemanticDocumentParser, SemanticParseError, SectionRecord
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class BAMLParser(SemanticDocumentParser):
+    """Streaming parser for BAML semantic documents."""
+
+    language = "baml"
+    record_sections: Tuple[str, ...] = ("boundaries", "connections", "constraints")
+
+# Export BAML parser classes
+__all__ = [
+    'BAMLParser',
+    'SemanticParseError',
+    'SectionRecord'
+]
@@ -5,22 +5,48 @@ Core processor for XML data transformation wrapping in BAML semantic language.
 Provides XML-wrapping, unwrapping, and transformation with semantic preservation.
 """
 
-import json
+import io
+import copy
 import time
 import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator, Callable, IO
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 
+from ..metrics import MetricsRecorder
+from ..results import FrozenMetadata, SlottedResult, intern_metadata
+from ..wrap_cache import WrapCache, WrapCacheEntry, TimestampTemplate, canonical_content_key
+from ..xml_writer import (
+    DirectXMLUnsupported, format_attributes, parse_root_start, write_section, write_ai_integration
+)
+from ..transformation_plan import TransformationPlan, compile_transformation_rules, load_transformation_plan
+from ..schema_validator import SchemaValidator, load_schema_validator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class XMLTransformationResult:
-    """Result of XML transformation operation."""
+# Validation applied to freshly wrapped XML: skip it, check the in-memory
+# element tree, or serialize and parse the wrapper string again
+XML_VALIDATION_MODES = ("none", "structural-on-tree", "full-reparse")
+
+# Wrapper serialization: write XML text directly, or build an ElementTree
+# and serialize it with ``ET.tostring`` (both produce identical text)
+XML_SERIALIZERS = ("direct", "element-tree")
+
+@dataclass(frozen=True)
+class XMLTransformationResult(SlottedResult):
+    """Result of XML transformation operation.
+    
+    Slotted and frozen. ``metadata`` is shared between results with the same
+    values and is read-only; ``validation_result`` is assembled on first access.
+    """
+    __slots__ = ("success", "transformed_data", "xml_wrapper", "transformation_time",
+                 "semantic_preserved", "validation_result", "metadata", "_lazy_parts")
+    _lazy_field = "validation_result"
+    
     success: bool
     transformed_data: Dict[str, Any]
     xml_wrapper: str
@@ -36,13 +62,18 @@ class BAMLXMLSchema:
     version: str = "1.0.0-baml-xml"
     spec: str = "BAML-XML-TRANSFORM-001"
     
-    def to_xml_element(self, data: Dict[str, Any]) -> ET.Element:
-        """Convert BAML data to XML element."""
+    def root_element(self, timestamp: Optional[str] = None) -> ET.Element:
+        """Create the bare BAML wrapper root element."""
         root = ET.Element(self.wrapper_tag)
         root.set("version", self.version)
         root.set("spec", self.spec)
-        root.set("timestamp", datetime.now().isoformat())
+        root.set("timestamp", timestamp or datetime.now().isoformat())
         root.set("language", "baml")
+        return root
+    
+    def to_xml_element(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> ET.Element:
+        """Convert BAML data to XML element."""
+        root = self.root_element(timestamp)
         
         # Add metadata
         metadata = ET.SubElement(root, "metadata")
@@ -119,6 +150,58 @@ class BAMLXMLSchema:
         
         return root
     
+    def to_xml_string(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> str:
+        """Serialize BAML data straight to XML text without building a tree.
+        
+        The output is identical to ``ET.tostring(self.to_xml_element(data),
+        encoding='unicode')``; data the direct writer cannot reproduce falls
+        back to the ElementTree path.
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        buffer = io.StringIO()
+        try:
+            self.write_xml(buffer.write, data, timestamp)
+        except DirectXMLUnsupported:
+            return ET.tostring(self.to_xml_element(data, timestamp), encoding='unicode')
+        return buffer.getvalue()
+    
+    def write_xml(self, write: Callable[[str], Any], data: Dict[str, Any],
+                  timestamp: Optional[str] = None):
+        """Write BAML data as XML text through ``write`` without building a tree."""
+        root_attributes = format_attributes((
+            ("version", self.version),
+            ("spec", self.spec),
+            ("timestamp", timestamp or datetime.now().isoformat()),
+            ("language", "baml")
+        ))
+        schema_attributes = format_attributes((("type", "baml-semantic"), ("version", self.version)))
+        write(
+            f"<{self.wrapper_tag}{root_attributes}>"
+            f"<metadata><schema{schema_attributes} />"
+            '<validation type="baml-validation" ai_enhanced="true" /></metadata>'
+            '<transformations applied="true" xml_wrapping="true" semantic_preservation="true" />'
+        )
+        
+        # Add BAML content
+        if any(section in data for section in ("boundaries", "connections", "constraints", "ai_integration")):
+            write("<baml-content>")
+            if "boundaries" in data:
+                write_section(write, "boundaries", "boundary", data["boundaries"],
+                              list_children={"constraints": "constraint"})
+            if "connections" in data:
+                write_section(write, "connections", "connection", data["connections"],
+                              dict_children=("context",))
+            if "constraints" in data:
+                write_section(write, "constraints", "constraint", data["constraints"],
+                              list_children={"conditions": "condition"})
+            if "ai_integration" in data:
+                write_ai_integration(write, data["ai_integration"])
+            write("</baml-content>")
+        else:
+            write("<baml-content />")
+        
+        write(f"</{self.wrapper_tag}>")
+    
     def from_xml_element(self, xml_element: ET.Element) -> Dict[str, Any]:
         """Convert XML element back to BAML data."""
         baml_data = {}
@@ -130,104 +213,245 @@ class BAMLXMLSchema:
             # Parse boundaries
             boundaries_elem = content_elem.find("boundaries")
             if boundaries_elem is not None:
-                boundaries = []
-                for boundary_elem in boundaries_elem.findall("boundary"):
-                    boundary = {}
-                    for key, value in boundary_elem.attrib.items():
-                        if key == "constraints":
-                            # Handle constraints specially
-                            constraints_elem = boundary_elem.find("constraints")
-                            if constraints_elem is not None:
-                                constraints = []
-                                for constraint_elem in constraints_elem.findall("constraint"):
-                                    constraint = {}
-                                    for c_key, c_value in constraint_elem.attrib.items():
-                                        constraint[c_key] = c_value
-                                    constraints.append(constraint)
-                            boundary[key] = constraints
-                        else:
-                            boundary[key] = value
-                    boundaries.append(boundary)
-                baml_data["boundaries"] = boundaries
+                baml_data["boundaries"] = [
+                    self._boundary_from_element(boundary_elem)
+                    for boundary_elem in boundaries_elem.findall("boundary")
+                ]
             
             # Parse connections
             connections_elem = content_elem.find("connections")
             if connections_elem is not None:
-                connections = []
-                for connection_elem in connections_elem.findall("connection"):
-                    connection = {}
-                    for key, value in connection_elem.attrib.items():
-                        if key == "context":
-                            # Handle context specially
-                            context_elem = connection_elem.find("context")
-                            if context_elem is not None:
-                                context = {}
-                                for c_key, c_value in context_elem.attrib.items():
-                                    context[c_key] = c_value
-                                connection[key] = context
-                        else:
-                            connection[key] = value
-                    connections.append(connection)
-                baml_data["connections"] = connections
+                baml_data["connections"] = [
+                    self._connection_from_element(connection_elem)
+                    for connection_elem in connections_elem.findall("connection")
+                ]
             
             # Parse constraints
             constraints_elem = content_elem.find("constraints")
             if constraints_elem is not None:
-                constraints = []
-                for constraint_elem in constraints_elem.findall("constraint"):
-                    constraint = {}
-                    for key, value in constraint_elem.attrib.items():
-                        if key == "conditions":
-                            # Handle conditions specially
-                            conditions_elem = constraint_elem.find("conditions")
-                            if conditions_elem is not None:
-                                conditions = []
-                                for condition_elem in conditions_elem.findall("condition"):
-                                    condition = {}
-                                    for cond_key, cond_value in condition_elem.attrib.items():
-                                        condition[cond_key] = cond_value
-                                    conditions.append(condition)
-                            constraint[key] = conditions
-                        else:
-                            constraint[key] = value
-                    constraints.append(constraint)
-                baml_data["constraints"] = constraints
+                baml_data["constraints"] = [
+                    self._constraint_from_element(constraint_elem)
+                    for constraint_elem in constraints_elem.findall("constraint")
+                ]
             
             # Parse AI integration
             ai_integration_elem = content_elem.find("ai-integration")
             if ai_integration_elem is not None:
-                ai_integration = {}
-                for key, value in ai_integration_elem.attrib.items():
-                    ai_integration[key] = value
-                
-                # Parse sub-elements
-                for sub_elem in ai_integration_elem:
-                    sub_data = {}
-                    for sub_key, sub_value in sub_elem.attrib.items():
-                        sub_data[sub_key] = sub_value
-                    ai_integration[sub_elem.tag] = sub_data
-                
-                baml_data["ai_integration"] = ai_integration
+                baml_data["ai_integration"] = self._ai_integration_from_element(ai_integration_elem)
         
         return baml_data
+    
+    def from_xml_source(self, source: Union[str, Path, IO[bytes]],
+                        on_root: Optional[Callable[[ET.Element], bool]] = None) -> Dict[str, Any]:
+        """Convert a BAML XML wrapper file back to BAML data with bounded memory.
+        
+        Produces the same dictionary as ``from_xml_element`` for the same document.
+        """
+        sections = {}
+        for section, record in self._iterparse_sections(source, on_root):
+            if section == "ai_integration":
+                sections[section] = record
+            elif record is None:
+                sections[section] = []
+            else:
+                sections[section].append(record)
+        
+        return {key: sections[key] for key in self._SECTION_ORDER if key in sections}
+    
+    def iter_xml_records(self, source: Union[str, Path, IO[bytes]],
+                         on_root: Optional[Callable[[ET.Element], bool]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Incrementally yield ``(section, record)`` pairs from a BAML XML wrapper file.
+        
+        Each boundary, connection and constraint is yielded as soon as its
+        element closes and is then released from the tree.
+        """
+        for section, record in self._iterparse_sections(source, on_root):
+            if record is not None:
+                yield section, record
+    
+    # Section containers inside <baml-content> and the record tag streamed from each
+    _STREAM_SECTIONS = {
+        "boundaries": ("boundaries", "boundary"),
+        "connections": ("connections", "connection"),
+        "constraints": ("constraints", "constraint"),
+    }
+    _SECTION_ORDER = ("boundaries", "connections", "constraints", "ai_integration")
+    
+    def _iterparse_sections(self, source: Union[str, Path, IO[bytes]],
+                            on_root: Optional[Callable[[ET.Element], bool]] = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Walk a BAML XML wrapper with ``iterparse``.
+        
+        Yields ``(section, None)`` when a section opens, ``(section, record)`` for
+        every converted record and ``("ai_integration", data)`` once. Only the
+        first content/section elements are read, mirroring ``find``. Finished
+        elements are detached from their parents so the tree never grows past a
+        single record. ``on_root`` receives the root element on open; returning
+        False stops parsing.
+        """
+        converters = {
+            "boundaries": self._boundary_from_element,
+            "connections": self._connection_from_element,
+            "constraints": self._constraint_from_element,
+        }
+        stack = []
+        content_elem = None
+        active_section = None
+        ai_integration_elem = None
+        seen_sections = set()
+        
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                depth = len(stack)
+                stack.append(elem)
+                
+                if depth == 0:
+                    if on_root is not None and on_root(elem) is False:
+                        return
+                elif depth == 1:
+                    if elem.tag == "baml-content" and content_elem is None:
+                        content_elem = elem
+                elif depth == 2 and stack[1] is content_elem and elem.tag not in seen_sections:
+                    seen_sections.add(elem.tag)
+                    if elem.tag in self._STREAM_SECTIONS:
+                        active_section = elem
+                        yield self._STREAM_SECTIONS[elem.tag][0], None
+                    elif elem.tag == "ai-integration":
+                        ai_integration_elem = elem
+                continue
+            
+            stack.pop()
+            depth = len(stack)
+            if depth == 0:
+                continue
+            parent = stack[-1]
+            
+            if depth == 3 and parent is active_section:
+                section, record_tag = self._STREAM_SECTIONS[parent.tag]
+                if elem.tag == record_tag:
+                    yield section, converters[section](elem)
+            elif elem is ai_integration_elem:
+                yield "ai_integration", self._ai_integration_from_element(elem)
+            
+            if elem is active_section:
+                active_section = None
+            
+            # Release finished elements; record subtrees (and ai-integration
+            # children) stay attached until their owner closes
+            if depth <= 2 or (depth == 3 and parent is not ai_integration_elem):
+                elem.clear()
+                parent.remove(elem)
+    
+    def _boundary_from_element(self, boundary_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <boundary> element back to a BAML boundary."""
+        boundary = {}
+        for key, value in boundary_elem.attrib.items():
+            if key == "constraints":
+                # Handle constraints specially
+                constraints_elem = boundary_elem.find("constraints")
+                if constraints_elem is not None:
+                    value = [dict(constraint_elem.attrib)
+                             for constraint_elem in constraints_elem.findall("constraint")]
+            boundary[key] = value
+        return boundary
+    
+    def _connection_from_element(self, connection_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <connection> element back to a BAML connection."""
+        connection = {}
+        for key, value in connection_elem.attrib.items():
+            if key == "context":
+                # Handle context specially
+                context_elem = connection_elem.find("context")
+                if context_elem is not None:
+                    connection[key] = dict(context_elem.attrib)
+            else:
+                connection[key] = value
+        return connection
+    
+    def _constraint_from_element(self, constraint_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <constraint> element back to a BAML constraint."""
+        constraint = {}
+        for key, value in constraint_elem.attrib.items():
+            if key == "conditions":
+                # Handle conditions specially
+                conditions_elem = constraint_elem.find("conditions")
+                if conditions_elem is not None:
+                    value = [dict(condition_elem.attrib)
+                             for condition_elem in conditions_elem.findall("condition")]
+            constraint[key] = value
+        return constraint
+    
+    def _ai_integration_from_element(self, ai_integration_elem: ET.Element) -> Dict[str, Any]:
+        """Convert the <ai-integration> element back to BAML AI integration data."""
+        ai_integration = dict(ai_integration_elem.attrib)
+        
+        # Parse sub-elements
+        for sub_elem in ai_integration_elem:
+            ai_integration[sub_elem.tag] = dict(sub_elem.attrib)
+        
+        return ai_integration
 
 class BAMLXMLTransformer:
     """BAML-specific XML transformation processor."""
     
-    def __init__(self):
+    def __init__(self, history_size: int = 100, validation_mode: str = "structural-on-tree",
+                 xml_serializer: str = "direct", wrap_cache: Optional[WrapCache] = None):
+        if validation_mode not in XML_VALIDATION_MODES:
+            raise ValueError(f"Unsupported XML validation mode: {validation_mode}")
+        if xml_serializer not in XML_SERIALIZERS:
+            raise ValueError(f"Unsupported XML serializer: {xml_serializer}")
+        
         self.xml_schema = BAMLXMLSchema()
-        self.transformation_history = []
+        self.transformation_metrics = MetricsRecorder(history_size)
+        self.transformation_plan = self._load_transformation_plan()
         self.validation_rules = self._load_transformation_rules()
-        
+        self.data_validator = self._load_data_validator()
+        self.validation_mode = validation_mode
+        self.xml_serializer = xml_serializer
+        self.wrap_cache = wrap_cache
+        
+    @property
+    def transformation_history(self):
+        """Most recent transformation records (bounded by ``history_size``)."""
+        return self.transformation_metrics.recent_records
+    
+    # Transformation rule name -> semantic data section, in application order
+    _TRANSFORMATION_RULE_SECTIONS = {
+        "boundary_wrapping": "boundaries",
+        "connection_wrapping": "connections",
+        "constraint_wrapping": "constraints",
+        "ai_integration_wrapping": "ai_integration",
+    }
+    
+    def _load_transformation_plan(self) -> TransformationPlan:
+        """Load the compiled BAML transformation plan (shared across instances)."""
+        rules_path = Path(__file__).parent / "baml_config" / "transformation_rules.json"
+        return load_transformation_plan(
+            "baml", rules_path, self._TRANSFORMATION_RULE_SECTIONS,
+            self._get_default_transformation_rules
+        )
+    
     def _load_transformation_rules(self) -> Dict[str, Any]:
         """Load BAML XML transformation rules."""
-        rules_path = Path(__file__).parent / "baml_config" / "transformation_rules.json"
-        try:
-            with open(rules_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning("BAML transformation rules not found, using defaults")
-            return self._get_default_transformation_rules()
+        return copy.deepcopy(self.transformation_plan.rules)
+    
+    def _load_data_validator(self) -> SchemaValidator:
+        """Load the compiled BAML data validator (shared across instances)."""
+        schema_path = Path(__file__).parent.parent / "config" / "schemas.json"
+        return load_schema_validator(
+            schema_path, "#/semantic_language_schemas/baml_schema",
+            self._get_default_data_schema, name="BAML"
+        )
+    
+    def _get_default_data_schema(self) -> Dict[str, Any]:
+        """Get the default BAML data schema (section and record shapes only)."""
+        return {
+            "type": "object",
+            "properties": {
+                "boundaries": {"type": "array", "items": {"type": "object"}},
+                "connections": {"type": "array", "items": {"type": "object"}},
+                "constraints": {"type": "array", "items": {"type": "object"}}
+            }
+        }
     
     def _get_default_transformation_rules(self) -> Dict[str, Any]:
         """Get default BAML XML transformation rules."""
@@ -269,77 +493,128 @@ class BAMLXMLTransformer:
     def wrap_baml_with_xml(self, baml_data: Dict[str, Any], 
                              context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
         """Wrap BAML semantic data with XML transformation."""
+        return self._wrap_baml(baml_data, context, to_element=False)[1]
+    
+    def wrap_to_element(self, baml_data: Dict[str, Any],
+                        context: Optional[Dict[str, Any]] = None) -> Tuple[Optional[ET.Element], XMLTransformationResult]:
+        """Wrap BAML semantic data into an XML element without serializing it.
+        
+        Returns the wrapper element (None on failure) and the transformation
+        result, whose ``xml_wrapper`` is left empty. Lets callers compose
+        larger trees without a serialize/parse round trip; the wrap cache is
+        bypassed.
+        """
+        return self._wrap_baml(baml_data, context, to_element=True)
+    
+    def _wrap_baml(self, baml_data: Dict[str, Any], context: Optional[Dict[str, Any]],
+                  to_element: bool) -> Tuple[Optional[ET.Element], XMLTransformationResult]:
+        """Wrap BAML data as an XML string or element."""
         start_time = time.time()
         
         try:
+            # Serve repeated inputs from the wrap cache
+            cache_key = None
+            if self.wrap_cache is not None and not to_element:
+                cache_key = self._wrap_cache_key(baml_data)
+                cached_entry = self.wrap_cache.get(cache_key)
+                if cached_entry is not None:
+                    return None, self._cached_wrap_result(baml_data, cached_entry, context, start_time)
+            
             # Validate BAML data before transformation
             validation_result = self._validate_baml_data(baml_data)
             
             if not validation_result["valid"]:
-                return XMLTransformationResult(
+                return None, XMLTransformationResult(
                     success=False,
                     transformed_data={},
                     xml_wrapper="",
                     transformation_time=time.time() - start_time,
                     semantic_preserved=False,
                     validation_result=validation_result,
-                    metadata={"error": "BAML validation failed"}
+                    metadata=intern_metadata(error="BAML validation failed")
                 )
             
             # Create XML wrapper
-            xml_element = self.xml_schema.to_xml_element(baml_data)
-            xml_string = ET.tostring(xml_element, encoding='unicode')
+            if to_element:
+                xml_element, xml_string = self.xml_schema.to_xml_element(baml_data), ""
+            else:
+                xml_element, xml_string = self._build_xml_wrapper(baml_data)
+            
+            # Validate XML wrapper according to the configured validation mode
+            xml_validation = self._validate_built_xml(xml_element, xml_string)
+            
+            if cache_key is not None:
+                self.wrap_cache.put(
+                    cache_key,
+                    TimestampTemplate.from_xml(xml_string, (self.xml_schema.wrapper_tag,)),
+                    copy.deepcopy({"baml_validation": validation_result, "xml_validation": xml_validation})
+                )
             
             # Store transformation history
             transformation_record = {
                 "timestamp": datetime.now().isoformat(),
                 "transformation_type": "baml_to_xml",
                 "context": context,
-                "success": True
+                "success": True,
+                "transformation_time": time.time() - start_time
             }
-            self.transformation_history.append(transformation_record)
-            
-            # Validate XML wrapper
-            xml_validation = self._validate_xml_wrapper(xml_string)
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
+            )
             
-            return XMLTransformationResult(
+            return (xml_element if to_element else None), XMLTransformationResult.with_lazy_field(
+                ("baml_validation", "xml_validation"), (validation_result, xml_validation),
                 success=True,
                 transformed_data=baml_data,
                 xml_wrapper=xml_string,
                 transformation_time=time.time() - start_time,
                 semantic_preserved=True,
-                validation_result={
-                    "baml_validation": validation_result,
-                    "xml_validation": xml_validation
-                },
-                metadata={
-                    "transformation_applied": True,
-                    "context_applied": context is not None,
-                    "semantic_preservation": True,
-                    "xml_schema_version": self.xml_schema.version
-                }
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    semantic_preservation=True,
+                    xml_schema_version=self.xml_schema.version,
+                    xml_validation_mode=self.validation_mode,
+                    xml_serializer=self.xml_serializer,
+                    cache_hit=False
+                )
             )
             
         except Exception as e:
             logger.error(f"Failed to wrap BAML with XML: {e}")
-            return XMLTransformationResult(
+            return None, XMLTransformationResult(
                 success=False,
                 transformed_data={},
                 xml_wrapper="",
                 transformation_time=time.time() - start_time,
                 semantic_preserved=False,
                 validation_result={"error": str(e)},
-                metadata={"exception": str(e)}
+                metadata=FrozenMetadata(exception=str(e))
             )
     
     def unwrap_xml_to_baml(self, xml_wrapper: str, 
                              context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
         """Unwrap XML wrapper back to BAML semantic data."""
+        return self._unwrap_to_baml(xml_wrapper, None, context)
+    
+    def unwrap_from_element(self, xml_element: ET.Element,
+                            context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
+        """Unwrap an already parsed BAML XML element back to BAML semantic data.
+        
+        Skips the serialize/parse round trip for callers holding a tree; the
+        result's ``xml_wrapper`` is left empty.
+        """
+        return self._unwrap_to_baml("", xml_element, context)
+    
+    def _unwrap_to_baml(self, xml_wrapper: str, xml_element: Optional[ET.Element],
+                       context: Optional[Dict[str, Any]]) -> XMLTransformationResult:
+        """Unwrap BAML XML from a string or a parsed element."""
         start_time = time.time()
         
         try:
             # Parse XML
-            xml_element = ET.fromstring(xml_wrapper)
+            if xml_element is None:
+                xml_element = ET.fromstring(xml_wrapper)
             
             # Validate XML element
             xml_validation = self._validate_xml_element(xml_element)
@@ -352,40 +627,40 @@ class BAMLXMLTransformer:
                     transformation_time=time.time() - start_time,
                     semantic_preserved=False,
                     validation_result=xml_validation,
-                    metadata={"error": "XML validation failed"}
+                    metadata=intern_metadata(error="XML validation failed")
                 )
             
             # Extract BAML data
             baml_data = self.xml_schema.from_xml_element(xml_element)
             
             # Validate extracted BAML data
-            baml_validation = self._validate_baml_data(baml_data)
+            baml_validation = self._validate_baml_data(baml_data, warnings=False)
             
             # Store transformation history
             transformation_record = {
                 "timestamp": datetime.now().isoformat(),
                 "transformation_type": "xml_to_baml",
                 "context": context,
-                "success": True
+                "success": True,
+                "transformation_time": time.time() - start_time
             }
-            self.transformation_history.append(transformation_record)
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
+            )
             
-            return XMLTransformationResult(
+            return XMLTransformationResult.with_lazy_field(
+                ("xml_validation", "baml_validation"), (xml_validation, baml_validation),
                 success=True,
                 transformed_data=baml_data,
                 xml_wrapper=xml_wrapper,
                 transformation_time=time.time() - start_time,
                 semantic_preserved=True,
-                validation_result={
-                    "xml_validation": xml_validation,
-                    "baml_validation": baml_validation
-                },
-                metadata={
-                    "transformation_applied": True,
-                    "context_applied": context is not None,
-                    "semantic_preservation": True,
-                    "xml_schema_version": xml_element.get("version", self.xml_schema.version)
-                }
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    semantic_preservation=True,
+                    xml_schema_version=xml_element.get("version", self.xml_schema.version)
+                )
             )
             
         except Exception as e:
@@ -397,84 +672,124 @@ class BAMLXMLTransformer:
                 transformation_time=time.time() - start_time,
                 semantic_preserved=False,
                 validation_result={"error": str(e)},
-                metadata={"exception": str(e)}
+                metadata=FrozenMetadata(exception=str(e))
             )
     
-    def apply_baml_transformation_rules(self, baml_data: Dict[str, Any], 
-                                        transformation_rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply BAML-specific transformation rules."""
-        transformed_data = baml_data.copy()
-        
-        # Apply boundary transformation rules
-        if transformation_rules.get("boundary_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_boundary_transformation_rules(
-                transformed_data, transformation_rules["boundary_wrapping"]
-            )
+    def unwrap_xml_source_to_baml(self, source: Union[str, Path, IO[bytes]],
+                                  context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
+        """Unwrap a BAML XML wrapper file or stream back to BAML semantic data.
+        
+        The document is streamed with ``iterparse`` rather than loaded whole, so
+        large exports unwrap with bounded memory. ``source`` is a file path or a
+        binary file-like object; the data matches ``unwrap_xml_to_baml``.
+        """
+        start_time = time.time()
+        source_name = str(source) if isinstance(source, (str, Path)) else ""
+        root_info = {}
         
-        # Apply connection transformation rules
-        if transformation_rules.get("connection_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_connection_transformation_rules(
-                transformed_data, transformation_rules["connection_wrapping"]
-            )
+        def check_root(root: ET.Element) -> bool:
+            root_info["xml_validation"] = self._validate_xml_element(root)
+            root_info["version"] = root.get("version", self.xml_schema.version)
+            return root_info["xml_validation"]["valid"]
         
-        # Apply constraint transformation rules
-        if transformation_rules.get("constraint_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_constraint_transformation_rules(
-                transformed_data, transformation_rules["constraint_wrapping"]
+        try:
+            # Stream BAML data out of the XML source
+            baml_data = self.xml_schema.from_xml_source(source, check_root)
+            xml_validation = root_info["xml_validation"]
+            
+            if not xml_validation["valid"]:
+                return XMLTransformationResult(
+                    success=False,
+                    transformed_data={},
+                    xml_wrapper=source_name,
+                    transformation_time=time.time() - start_time,
+                    semantic_preserved=False,
+                    validation_result=xml_validation,
+                    metadata=intern_metadata(error="XML validation failed")
+                )
+            
+            # Validate extracted BAML data
+            baml_validation = self._validate_baml_data(baml_data, warnings=False)
+            
+            # Store transformation history
+            transformation_record = {
+                "timestamp": datetime.now().isoformat(),
+                "transformation_type": "xml_source_to_baml",
+                "context": context,
+                "success": True,
+                "transformation_time": time.time() - start_time
+            }
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
             )
-        
-        # Apply AI integration transformation rules
-        if transformation_rules.get("ai_integration_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_ai_integration_transformation_rules(
-                transformed_data, transformation_rules["ai_integration_wrapping"]
+            
+            return XMLTransformationResult.with_lazy_field(
+                ("xml_validation", "baml_validation"), (xml_validation, baml_validation),
+                success=True,
+                transformed_data=baml_data,
+                xml_wrapper=source_name,
+                transformation_time=time.time() - start_time,
+                semantic_preserved=True,
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    semantic_preservation=True,
+                    streamed=True,
+                    xml_schema_version=root_info["version"]
+                )
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to unwrap XML source to BAML: {e}")
+            return XMLTransformationResult(
+                success=False,
+                transformed_data={},
+                xml_wrapper=source_name,
+                transformation_time=time.time() - start_time,
+                semantic_preserved=False,
+                validation_result={"error": str(e)},
+                metadata=FrozenMetadata(exception=str(e))
             )
-        
-        return transformed_data
     
-    def _validate_baml_data(self, baml_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate BAML semantic data."""
-        validation_result = {"valid": True, "errors": [], "warnings": []}
+    def iter_unwrap_xml_to_baml(self, source: Union[str, Path, IO[bytes]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(section, record)`` pairs from a BAML XML wrapper file or stream.
         
-        # Basic structure validation
-        if not isinstance(baml_data, dict):
-            validation_result["valid"] = False
-            validation_result["errors"].append("BAML data must be a dictionary")
-            return validation_result
+        Raises ValueError when the root element is not a valid BAML wrapper.
+        """
+        def check_root(root: ET.Element) -> bool:
+            xml_validation = self._validate_xml_element(root)
+            if not xml_validation["valid"]:
+                raise ValueError(f"XML validation failed: {xml_validation['errors']}")
+            return True
         
-        # Validate boundaries if present
-        if "boundaries" in baml_data:
-            if not isinstance(baml_data["boundaries"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("BAML boundaries must be a list")
-            else:
-                for i, boundary in enumerate(baml_data["boundaries"]):
-                    if not isinstance(boundary, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"BAML boundary {i} must be a dictionary")
-        
-        # Validate connections if present
-        if "connections" in baml_data:
-            if not isinstance(baml_data["connections"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("BAML connections must be a list")
-            else:
-                for i, connection in enumerate(baml_data["connections"]):
-                    if not isinstance(connection, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"BAML connection {i} must be a dictionary")
-        
-        # Validate constraints if present
-        if "constraints" in baml_data:
-            if not isinstance(baml_data["constraints"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("BAML constraints must be a list")
-            else:
-                for i, constraint in enumerate(baml_data["constraints"]):
-                    if not isinstance(constraint, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"BAML constraint {i} must be a dictionary")
+        return self.xml_schema.iter_xml_records(source, check_root)
+    
+    def apply_baml_transformation_rules(self, baml_data: Dict[str, Any], 
+                                        transformation_rules: Optional[Union[Dict[str, Any], TransformationPlan]] = None) -> Dict[str, Any]:
+        """Apply BAML-specific transformation rules.
+        
+        Uses the compiled plan for the loaded rules by default; an explicit
+        rules dict is compiled on the fly.
+        """
+        plan = transformation_rules
+        if plan is None:
+            plan = self.transformation_plan
+        elif not isinstance(plan, TransformationPlan):
+            plan = compile_transformation_rules(
+                "baml", {"transformation_rules": plan}, self._TRANSFORMATION_RULE_SECTIONS
+            )
         
-        return validation_result
+        return plan.apply(baml_data)
+    
+    def _validate_baml_data(self, baml_data: Dict[str, Any], warnings: bool = True) -> Dict[str, Any]:
+        """Validate BAML semantic data against the compiled schema.
+        
+        Structural violations are errors; value-level violations are
+        warnings. ``violations`` lists each with its path and keyword.
+        Unwrapped data is checked with ``warnings=False``: XML attributes
+        come back as strings, so value-level rules would flag every scalar.
+        """
+        return self.data_validator.validate(baml_data, "BAML", warnings)
     
     def _validate_xml_wrapper(self, xml_string: str) -> Dict[str, Any]:
         """Validate XML wrapper."""
@@ -511,6 +826,75 @@ class BAMLXMLTransformer:
         
         return validation_result
     
+    def _wrap_cache_key(self, baml_data: Dict[str, Any]) -> str:
+        """Content hash of BAML input plus everything that shapes its wrapper."""
+        return canonical_content_key(
+            "baml", baml_data, self.xml_schema.wrapper_tag, self.xml_schema.version,
+            self.xml_schema.spec, self.validation_mode
+        )
+    
+    def _cached_wrap_result(self, baml_data: Dict[str, Any], cached_entry: WrapCacheEntry,
+                            context: Optional[Dict[str, Any]], start_time: float) -> XMLTransformationResult:
+        """Build a wrap result from a cache entry, re-stamped with the current time."""
+        xml_string = cached_entry.template.render(datetime.now().isoformat())
+        
+        # Store transformation history
+        transformation_record = {
+            "timestamp": datetime.now().isoformat(),
+            "transformation_type": "baml_to_xml",
+            "context": context,
+            "success": True,
+            "cache_hit": True,
+            "transformation_time": time.time() - start_time
+        }
+        self.transformation_metrics.record(
+            transformation_record["transformation_time"], True, transformation_record
+        )
+        
+        return XMLTransformationResult(
+            success=True,
+            transformed_data=baml_data,
+            xml_wrapper=xml_string,
+            transformation_time=time.time() - start_time,
+            semantic_preserved=True,
+            validation_result=copy.deepcopy(cached_entry.payload),
+            metadata=intern_metadata(
+                transformation_applied=True,
+                context_applied=context is not None,
+                semantic_preservation=True,
+                xml_schema_version=self.xml_schema.version,
+                xml_validation_mode=self.validation_mode,
+                xml_serializer=self.xml_serializer,
+                cache_hit=True
+            )
+        )
+    
+    def _build_xml_wrapper(self, baml_data: Dict[str, Any]) -> Tuple[ET.Element, str]:
+        """Serialize a wrapper with the configured serializer.
+        
+        Returns the element to validate and the XML text; with the direct
+        serializer the element is the root start tag parsed back from the
+        text, so structural validation checks what was emitted.
+        """
+        if self.xml_serializer == "direct":
+            xml_string = self.xml_schema.to_xml_string(baml_data, datetime.now().isoformat())
+            return parse_root_start(xml_string), xml_string
+        
+        xml_element = self.xml_schema.to_xml_element(baml_data)
+        return xml_element, ET.tostring(xml_element, encoding='unicode')
+    
+    def _validate_built_xml(self, xml_element: ET.Element, xml_string: str) -> Dict[str, Any]:
+        """Validate a freshly built XML wrapper according to ``validation_mode``.
+        
+        ``structural-on-tree`` checks the in-memory element, ``full-reparse``
+        parses the serialized string again and ``none`` skips validation.
+        """
+        if self.validation_mode == "none":
+            return {"valid": True, "errors": [], "warnings": [], "skipped": True}
+        if self.validation_mode == "full-reparse":
+            return self._validate_xml_wrapper(xml_string or ET.tostring(xml_element, encoding='unicode'))
+        return self._validate_xml_element(xml_element)
+    
     def _validate_xml_element(self, xml_element: ET.Element) -> Dict[str, Any]:
         """Validate XML element."""
         validation_result = {"valid": True, "errors": [], "warnings": []}
@@ -538,74 +922,47 @@ class BAMLXMLTransformer:
         
         return validation_result
     
-    def _apply_boundary_transformation_rules(self, baml_data: Dict[str, Any], 
-                                            rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply boundary transformation rules."""
-        # Placeholder for boundary transformation logic
-        # In production, this would apply specific boundary transformation rules
-        return baml_data
-    
-    def _apply_connection_transformation_rules(self, baml_data: Dict[str, Any], 
-                                            rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply connection transformation rules."""
-        # Placeholder for connection transformation logic
-        # In production, this would apply specific connection transformation rules
-        return baml_data
-    
-    def _apply_constraint_transformation_rules(self, baml_data: Dict[str, Any], 
-                                             rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply constraint transformation rules."""
-        # Placeholder for constraint transformation logic
-        # In production, this would apply specific constraint transformation rules
-        return baml_data
-    
-    def _apply_ai_integration_transformation_rules(self, baml_data: Dict[str, Any], 
-                                                    rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply AI integration transformation rules."""
-        # Placeholder for AI integration transformation logic
-        # In production, this would apply specific AI integration transformation rules
-        return baml_data
-    
     def get_transformation_status(self) -> Dict[str, Any]:
         """Get BAML XML transformation status."""
         return {
             "status": "active",
             "xml_schema": asdict(self.xml_schema),
             "transformation_rules": self.validation_rules,
-            "transformation_history_size": len(self.transformation_history),
+            "transformation_plan_digest": self.transformation_plan.digest,
+            "xml_validation_mode": self.validation_mode,
+            "xml_serializer": self.xml_serializer,
+            "wrap_cache": self.wrap_cache.get_stats() if self.wrap_cache is not None else {"enabled": False},
+            "transformation_history_size": self.transformation_metrics.count,
             "performance_metrics": self._get_performance_metrics()
         }
     
     def _get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for BAML XML transformations."""
-        if not self.transformation_history:
+        if not self.transformation_metrics.count:
             return {"status": "no_transformations_performed"}
         
-        transformation_times = [
-            record.get("transformation_time", 0) 
-            for record in self.transformation_history
-            if "transformation_time" in record
-        ]
-        
-        successful_transformations = [
-            record for record in self.transformation_history
-            if record.get("success", False)
-        ]
+        summary = self.transformation_metrics.summary()
         
         return {
-            "total_transformations": len(self.transformation_history),
-            "successful_transformations": len(successful_transformations),
-            "success_rate": len(successful_transformations) / len(self.transformation_history),
-            "average_transformation_time": (
-                sum(transformation_times) / len(transformation_times) 
-                if transformation_times else 0
-            ),
-            "last_transformation": self.transformation_history[-1] if self.transformation_history else None
+            "total_transformations": summary["count"],
+            "successful_transformations": summary["success_count"],
+            "success_rate": summary["success_rate"],
+            "average_transformation_time": summary["mean_time"],
+            "min_transformation_time": summary["min_time"],
+            "max_transformation_time": summary["max_time"],
+            "transformation_time_percentiles": {
+                "p50": summary["p50"],
+                "p95": summary["p95"],
+                "p99": summary["p99"]
+            },
+            "last_transformation": self.transformation_metrics.last_record
         }
 
 # Export main classes
 __all__ = [
     'BAMLXMLTransformer',
     'BAMLXMLSchema',
-    'XMLTransformationResult'
+    'XMLTransformationResult',
+    'XML_VALIDATION_MODES',
+    'XML_SERIALIZERS'
 ]
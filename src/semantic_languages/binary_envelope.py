@@ -0,0 +1,423 @@
+"""
+FSL Continuum - Binary Envelope
+
+Compact binary canonical encoding for BAML and Pareto-Lang semantic data,
+carrying the same header (language, schema version, spec, timestamp) and
+content as the XML wrappers.
+
+Layout::
+
+    b"FSLB" | format version (u8) | CRC-32 of the rest (u32, big-endian)
+    | string count (varint) | string table size (varint) | string table
+    | language | schema version | spec | timestamp | semantic data
+
+Every distinct string is stored once, UTF-8 encoded, in the string table;
+strings are separated by 0xFF, a byte UTF-8 never produces, so the table
+decodes with one split. The five values that follow are msgpack-style
+tagged values: small non-negative integers, small lists and references to
+the first 32 strings carry their value, size or index in the tag byte;
+other strings are 1-, 2- or varint-byte references, larger integers are
+zigzag varints and floats are IEEE 754 doubles.
+
+Maps are written as records of a *shape*, the tuple of their keys. A
+shape's keys are written the first time it is seen; after that a record of
+that shape is one tag byte followed by its values, and decodes with a single
+``dict(zip(keys, values))``. A list of two or more records sharing a shape
+is written as a record array: the shape once, then every record's values
+back to back. Shapes are numbered in order of appearance on both sides, so
+the shape table is never stored.
+
+Unlike the XML wrapper, which stringifies every scalar, the envelope keeps
+``None``, booleans, integers and floats as they are. ``to_xml`` renders the
+exact wrapper text the transformers produce for the same data and
+timestamp, and ``from_xml`` carries exactly the data ``unwrap_xml_to_baml``
+or ``unwrap_xml_to_pareto_lang`` reads from the XML.
+"""
+
+import struct
+import zlib
+import logging
+import dataclasses
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable
+
+from .baml.xml_transformer import BAMLXMLSchema
+from .pareto_lang.xml_transformer import ParetoLangXMLSchema
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BINARY_ENVELOPE_MAGIC = b"FSLB"
+BINARY_ENVELOPE_VERSION = 1
+
+_HEADER = struct.Struct(">4sBI")
+
+# Language -> XML wrapper schema the envelope converts to and from
+_XML_SCHEMAS = {
+    "baml": BAMLXMLSchema(),
+    "pareto_lang": ParetoLangXMLSchema()
+}
+_LANGUAGES_BY_TAG = {schema.wrapper_tag: language for language, schema in _XML_SCHEMAS.items()}
+
+# Value tags. The fixed ranges carry a small value in the low bits: fixint
+# 0x00-0x7f, record 0x80-0x8f (shape index), fixarray 0x90-0x9f (length)
+# and string reference 0xa0-0xbf (string index)
+_FIXRECORD = 0x80
+_FIXARRAY = 0x90
+_FIXREF = 0xA0
+_NONE = 0xC0
+_FALSE = 0xC2
+_TRUE = 0xC3
+_FLOAT = 0xCB
+_INT = 0xD0
+_REF8 = 0xD4
+_REF16 = 0xD5
+_REF = 0xD6
+_ARRAY = 0xDC
+_RECORD_ARRAY = 0xDD
+_SHAPE = 0xDE
+_RECORD = 0xDF
+
+_STRING_SEPARATOR = b"\xff"
+
+_pack_float = struct.Struct(">d").pack
+_unpack_float = struct.Struct(">d").unpack_from
+
+@dataclass(frozen=True)
+class BinaryEnvelope:
+    """Semantic data with the header of its XML wrapper."""
+    language: str
+    data: Dict[str, Any]
+    schema_version: str
+    spec: str
+    timestamp: str
+
+    @classmethod
+    def for_data(cls, data: Dict[str, Any], language_type: str,
+                 timestamp: Optional[str] = None) -> "BinaryEnvelope":
+        """Create an envelope with the current XML schema header for a language."""
+        schema = _xml_schema(language_type)
+        return cls(
+            language=language_type,
+            data=data,
+            schema_version=schema.version,
+            spec=schema.spec,
+            timestamp=timestamp or datetime.now().isoformat()
+        )
+
+    def encode(self) -> bytes:
+        """Encode the envelope to bytes."""
+        buffer = bytearray()
+        strings: Dict[str, int] = {}
+        shapes: Dict[Tuple[str, ...], int] = {}
+        _encode_items(buffer, (self.language, self.schema_version, self.spec, self.timestamp, self.data),
+                      strings, shapes)
+        try:
+            table = _STRING_SEPARATOR.join([string.encode("utf-8") for string in strings])
+        except UnicodeEncodeError as e:
+            raise ValueError(f"Binary envelope strings must be valid Unicode: {e}") from e
+
+        payload = bytearray()
+        _encode_size(payload, len(strings))
+        _encode_size(payload, len(table))
+        payload += table
+        payload += buffer
+        return _HEADER.pack(BINARY_ENVELOPE_MAGIC, BINARY_ENVELOPE_VERSION, zlib.crc32(payload)) + payload
+
+    @classmethod
+    def decode(cls, blob: Union[bytes, bytearray, memoryview]) -> "BinaryEnvelope":
+        """Decode an envelope; raises ValueError for corrupt or foreign input."""
+        blob = bytes(blob)
+        if len(blob) < _HEADER.size:
+            raise ValueError("Binary envelope is truncated")
+        magic, version, checksum = _HEADER.unpack_from(blob)
+        if magic != BINARY_ENVELOPE_MAGIC:
+            raise ValueError("Not a binary envelope")
+        if version != BINARY_ENVELOPE_VERSION:
+            raise ValueError(f"Unsupported binary envelope version: {version}")
+        if zlib.crc32(memoryview(blob)[_HEADER.size:]) != checksum:
+            raise ValueError("Binary envelope checksum mismatch")
+
+        try:
+            count, position = _decode_size(blob, _HEADER.size)
+            size, position = _decode_size(blob, position)
+            end = position + size
+            strings = [part.decode("utf-8") for part in blob[position:end].split(_STRING_SEPARATOR)] if count else []
+            if len(strings) != count or end > len(blob):
+                raise ValueError("Corrupt binary envelope: string table mismatch")
+            values, position = _decode_items(blob, end, 5, strings, [])
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupt binary envelope: {e}") from e
+        if position != len(blob):
+            raise ValueError("Corrupt binary envelope: length mismatch")
+
+        language, schema_version, spec, timestamp, data = values
+        if not all(isinstance(value, str) for value in (language, schema_version, spec, timestamp)):
+            raise ValueError("Corrupt binary envelope: header fields must be strings")
+        if not isinstance(data, dict):
+            raise ValueError("Corrupt binary envelope: semantic data must be a map")
+        return cls(language=language, data=data, schema_version=schema_version, spec=spec, timestamp=timestamp)
+
+    def to_xml(self) -> str:
+        """Render the XML wrapper text for this envelope."""
+        return _header_schema(self.language, self.schema_version, self.spec).to_xml_string(self.data, self.timestamp)
+
+    @classmethod
+    def from_xml(cls, xml_wrapper: Union[str, ET.Element]) -> "BinaryEnvelope":
+        """Read a BAML or Pareto-Lang XML wrapper into an envelope."""
+        root = ET.fromstring(xml_wrapper) if isinstance(xml_wrapper, str) else xml_wrapper
+        language = _LANGUAGES_BY_TAG.get(root.tag)
+        if language is None:
+            raise ValueError(f"Unsupported XML wrapper root element: {root.tag}")
+        schema = _XML_SCHEMAS[language]
+        return cls(
+            language=language,
+            data=schema.from_xml_element(root),
+            schema_version=root.get("version", schema.version),
+            spec=root.get("spec", schema.spec),
+            timestamp=root.get("timestamp", "")
+        )
+
+def _xml_schema(language_type: str):
+    """XML wrapper schema for a language."""
+    schema = _XML_SCHEMAS.get(language_type)
+    if schema is None:
+        raise ValueError(f"Unsupported language type: {language_type}")
+    return schema
+
+def _header_schema(language_type: str, schema_version: str, spec: str):
+    """XML wrapper schema carrying an envelope's version and spec."""
+    schema = _xml_schema(language_type)
+    if schema.version == schema_version and schema.spec == spec:
+        return schema
+    return dataclasses.replace(schema, version=schema_version, spec=spec)
+
+def _encode_size(buffer: bytearray, size: int):
+    """Append an unsigned varint."""
+    while size > 0x7F:
+        buffer.append((size & 0x7F) | 0x80)
+        size >>= 7
+    buffer.append(size)
+
+def _encode_items(buffer: bytearray, items: Iterable[Any], strings: Dict[str, int],
+                  shapes: Dict[Tuple[str, ...], int]):
+    """Append tagged values, adding new strings and shapes to the tables.
+
+    Strings, small integers, booleans and None are written inline; other
+    values go through ``_encode_value``.
+    """
+    append = buffer.append
+    for value in items:
+        value_type = type(value)
+        if value_type is str:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            if index < 32:
+                append(_FIXREF | index)
+            elif index < 0x100:
+                append(_REF8)
+                append(index)
+            elif index < 0x10000:
+                append(_REF16)
+                append(index >> 8)
+                append(index & 0xFF)
+            else:
+                append(_REF)
+                _encode_size(buffer, index)
+        elif value is None:
+            append(_NONE)
+        elif value is True:
+            append(_TRUE)
+        elif value is False:
+            append(_FALSE)
+        elif value_type is int and 0 <= value < 0x80:
+            append(value)
+        else:
+            _encode_value(buffer, value, strings, shapes)
+
+def _encode_shape(buffer: bytearray, keys: Tuple[str, ...], strings: Dict[str, int],
+                  shapes: Dict[Tuple[str, ...], int]):
+    """Append a shape reference, defining the shape on first use."""
+    index = shapes.get(keys)
+    if index is None:
+        for key in keys:
+            if type(key) is not str:
+                raise ValueError(f"Binary envelope map keys must be strings, got {type(key).__name__}")
+        shapes[keys] = len(shapes)
+        buffer.append(_SHAPE)
+        _encode_size(buffer, len(keys))
+        _encode_items(buffer, keys, strings, shapes)
+    elif index < 16:
+        buffer.append(_FIXRECORD | index)
+    else:
+        buffer.append(_RECORD)
+        _encode_size(buffer, index)
+
+def _encode_value(buffer: bytearray, value: Any, strings: Dict[str, int], shapes: Dict[Tuple[str, ...], int]):
+    """Append a container, a number or a value of a subclassed type."""
+    value_type = type(value)
+    if value_type is dict:
+        _encode_shape(buffer, tuple(value), strings, shapes)
+        _encode_items(buffer, value.values(), strings, shapes)
+    elif value_type is list or value_type is tuple:
+        size = len(value)
+        keys = tuple(value[0]) if size > 1 and type(value[0]) is dict else ()
+        if keys and all(type(item) is dict and tuple(item) == keys for item in value):
+            # Records sharing one shape: the shape once, then every value
+            buffer.append(_RECORD_ARRAY)
+            _encode_size(buffer, size)
+            _encode_shape(buffer, keys, strings, shapes)
+            _encode_items(buffer, [item for record in value for item in record.values()], strings, shapes)
+            return
+        if size < 16:
+            buffer.append(_FIXARRAY | size)
+        else:
+            buffer.append(_ARRAY)
+            _encode_size(buffer, size)
+        _encode_items(buffer, value, strings, shapes)
+    elif value_type is int:
+        buffer.append(_INT)
+        _encode_size(buffer, value << 1 if value >= 0 else ((-value) << 1) - 1)
+    elif value_type is float:
+        buffer.append(_FLOAT)
+        buffer += _pack_float(value)
+    elif isinstance(value, str):
+        _encode_items(buffer, (str(value),), strings, shapes)
+    elif isinstance(value, dict):
+        _encode_value(buffer, dict(value), strings, shapes)
+    elif isinstance(value, (list, tuple)):
+        _encode_value(buffer, list(value), strings, shapes)
+    elif isinstance(value, int):
+        _encode_items(buffer, (int(value),), strings, shapes)
+    elif isinstance(value, float):
+        _encode_value(buffer, float(value), strings, shapes)
+    else:
+        raise ValueError(f"Unsupported value type for binary envelope: {value_type.__name__}")
+
+def _decode_size(blob: bytes, position: int) -> Tuple[int, int]:
+    """Read an unsigned varint; returns it and the next position."""
+    byte = blob[position]
+    if byte < 0x80:
+        return byte, position + 1
+    size = byte & 0x7F
+    shift = 7
+    while True:
+        position += 1
+        byte = blob[position]
+        size |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return size, position + 1
+        shift += 7
+
+def _decode_shape(blob: bytes, position: int, strings: List[str],
+                  shapes: List[Tuple[str, ...]]) -> Tuple[Tuple[str, ...], int]:
+    """Read a shape reference or definition; returns the keys and the next position."""
+    tag = blob[position]
+    position += 1
+    if tag == _SHAPE:
+        size, position = _decode_size(blob, position)
+        keys, position = _decode_items(blob, position, size, strings, shapes)
+        if not all(type(key) is str for key in keys):
+            raise ValueError("Corrupt binary envelope: map keys must be strings")
+        keys = tuple(keys)
+        shapes.append(keys)
+        return keys, position
+    if tag == _RECORD:
+        index, position = _decode_size(blob, position)
+        return shapes[index], position
+    if _FIXRECORD <= tag < _FIXARRAY:
+        return shapes[tag & 0x0F], position
+    raise ValueError(f"Corrupt binary envelope: expected a shape at offset {position - 1}")
+
+def _decode_items(blob: bytes, position: int, count: int, strings: List[str],
+                  shapes: List[Tuple[str, ...]]) -> Tuple[List[Any], int]:
+    """Read ``count`` tagged values; returns them and the next position.
+
+    Strings and small integers, which make up most values, are decoded
+    inline; only containers recurse.
+    """
+    items = []
+    append = items.append
+    for _ in range(count):
+        tag = blob[position]
+        position += 1
+        if tag >= _NONE:
+            if tag == _REF8:
+                append(strings[blob[position]])
+                position += 1
+            elif tag == _REF16:
+                append(strings[(blob[position] << 8) | blob[position + 1]])
+                position += 2
+            elif tag == _RECORD_ARRAY:
+                size, position = _decode_size(blob, position)
+                keys, position = _decode_shape(blob, position, strings, shapes)
+                values, position = _decode_items(blob, position, size * len(keys), strings, shapes)
+                append([dict(zip(keys, row)) for row in zip(*[iter(values)] * len(keys))])
+            elif tag == _SHAPE or tag == _RECORD:
+                keys, position = _decode_shape(blob, position - 1, strings, shapes)
+                values, position = _decode_items(blob, position, len(keys), strings, shapes)
+                append(dict(zip(keys, values)))
+            elif tag == _NONE:
+                append(None)
+            elif tag == _TRUE:
+                append(True)
+            elif tag == _FALSE:
+                append(False)
+            elif tag == _FLOAT:
+                append(_unpack_float(blob, position)[0])
+                position += 8
+            elif tag == _INT:
+                zigzag, position = _decode_size(blob, position)
+                append((zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1))
+            elif tag == _REF:
+                index, position = _decode_size(blob, position)
+                append(strings[index])
+            elif tag == _ARRAY:
+                size, position = _decode_size(blob, position)
+                value, position = _decode_items(blob, position, size, strings, shapes)
+                append(value)
+            else:
+                raise ValueError(f"Corrupt binary envelope: unknown tag 0x{tag:02x} at offset {position - 1}")
+        elif tag >= _FIXREF:
+            append(strings[tag & 0x1F])
+        elif tag >= _FIXARRAY:
+            value, position = _decode_items(blob, position, tag & 0x0F, strings, shapes)
+            append(value)
+        elif tag >= _FIXRECORD:
+            keys = shapes[tag & 0x0F]
+            values, position = _decode_items(blob, position, len(keys), strings, shapes)
+            append(dict(zip(keys, values)))
+        else:
+            append(tag)
+    return items, position
+
+def encode_envelope(data: Dict[str, Any], language_type: str, timestamp: Optional[str] = None) -> bytes:
+    """Encode semantic data with the current header for its language."""
+    return BinaryEnvelope.for_data(data, language_type, timestamp).encode()
+
+def decode_envelope(blob: Union[bytes, bytearray, memoryview]) -> BinaryEnvelope:
+    """Decode a binary envelope."""
+    return BinaryEnvelope.decode(blob)
+
+def xml_to_binary(xml_wrapper: Union[str, ET.Element]) -> bytes:
+    """Convert a BAML or Pareto-Lang XML wrapper to a binary envelope."""
+    return BinaryEnvelope.from_xml(xml_wrapper).encode()
+
+def binary_to_xml(blob: Union[bytes, bytearray, memoryview]) -> str:
+    """Convert a binary envelope to its XML wrapper text."""
+    return BinaryEnvelope.decode(blob).to_xml()
+
+# Export binary envelope
+__all__ = [
+    'BinaryEnvelope',
+    'encode_envelope',
+    'decode_envelope',
+    'xml_to_binary',
+    'binary_to_xml',
+    'BINARY_ENVELOPE_MAGIC',
+    'BINARY_ENVELOPE_VERSION'
+]
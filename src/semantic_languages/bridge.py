@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 # Import semantic language components
 from .baml import BAMLParser, BAMLValidator, BAMLBridge
 from .pareto_lang import ParetoLangParser, ParetoLangValidator, ParetoLangBridge
+from .semantic_index import SemanticModelIndex
 
 class SemanticLanguageBridge:
     """Unified bridge for semantic language operations."""
@@ -35,6 +36,9 @@ class SemanticLanguageBridge:
         
         self.bridge_config = self._load_bridge_config()
         
+        # Persistent adjacency index, updated incrementally on each integration
+        self.semantic_index = SemanticModelIndex()
+        
     def _load_bridge_config(self) -> Dict[str, Any]:
         """Load bridge configuration."""
         config_path = Path(__file__).parent / "config" / "bridge_config.json"
@@ -174,47 +178,48 @@ class SemanticLanguageBridge:
     def _create_unified_connections(self, baml_data: Dict[str, Any], 
                                  pareto_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create unified semantic connections."""
-        return {
-            "connection_matrix": self._build_connection_matrix(baml_data, pareto_data),
-            "semantic_relationships": self._build_semantic_relationships(baml_data, pareto_data),
-            "optimization_pathways": self._build_optimization_pathways(baml_data, pareto_data)
-        }
+        # Hold the index lock so concurrent integrations see their own model
+        with self.semantic_index.lock:
+            self.semantic_index.sync(baml_data, pareto_data)
+            return {
+                "connection_matrix": self._build_connection_matrix(baml_data, pareto_data),
+                "semantic_relationships": self._build_semantic_relationships(baml_data, pareto_data),
+                "optimization_pathways": self._build_optimization_pathways(baml_data, pareto_data)
+            }
     
     def _build_connection_matrix(self, baml_data: Dict[str, Any], 
                              pareto_data: Dict[str, Any]) -> List[List[str]]:
-        """Build semantic connection matrix."""
-        # Simplified connection matrix building
-        return [
-            ["baml.boundaries", "pareto.optimizations"],
-            ["baml.connections", "pareto.resources"],
-            ["baml.constraints", "pareto.constraints"]
-        ]
+        """Build semantic connection matrix as ``[source, *targets]`` rows from the index."""
+        return self.semantic_index.connection_matrix()
     
     def _build_semantic_relationships(self, baml_data: Dict[str, Any], 
                                    pareto_data: Dict[str, Any]) -> Dict[str, Any]:
         """Build semantic relationships between languages."""
+        index_status = self.semantic_index.get_status()
         return {
             "boundary_optimization": "many-to-many",
             "constraint_alignment": "bidirectional",
             "resource_enforcement": "hierarchical",
-            "ai_enhanced_relationships": True
+            "ai_enhanced_relationships": True,
+            "indexed_boundaries": index_status["boundaries"],
+            "indexed_connections": index_status["connections"],
+            "indexed_optimizations": index_status["optimizations"],
+            "indexed_pathways": index_status["pathways"]
         }
     
     def _build_optimization_pathways(self, baml_data: Dict[str, Any], 
                                  pareto_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Build optimization pathways between languages."""
-        return [
-            {
-                "pathway": "baml_enforcement_to_pareto_optimization",
-                "efficiency": 0.85,
-                "ai_optimized": True
-            },
-            {
-                "pathway": "pareto_efficiency_to_baml_boundary",
-                "efficiency": 0.90,
-                "ai_optimized": True
-            }
-        ]
+        """Build per-target optimization pathway counts from the index.
+
+        Individual pathways are looked up per boundary with
+        ``get_pathways_from_boundary``.
+        """
+        return self.semantic_index.pathway_summary()
+    
+    def get_pathways_from_boundary(self, boundary_name: str,
+                                   transitive: bool = False) -> List[Dict[str, Any]]:
+        """Get all optimization pathways from a boundary in the indexed model."""
+        return self.semantic_index.pathways_from(boundary_name, transitive=transitive)
     
     def _ai_optimize_model(self, semantic_model: Dict[str, Any]) -> Dict[str, Any]:
         """Apply AI optimization to semantic model."""
@@ -248,6 +253,7 @@ class SemanticLanguageBridge:
                 "validator": self.pareto_lang_validator.get_status(),
                 "bridge": self.pareto_lang_bridge.get_status()
             },
+            "semantic_index": self.semantic_index.get_status(),
             "ai_enhancement": self.bridge_config.get("ai_enhanced", False),
             "context_awareness": self.bridge_config.get("context_aware", False),
             "learning_enabled": self.bridge_config.get("learning_enabled", False)
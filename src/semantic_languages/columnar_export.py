@@ -0,0 +1,559 @@
+"""
+FSL Continuum - Columnar Export
+
+Flattens BAML and Pareto-Lang semantic documents into columnar tables for
+offline analytics, and reads them back without any XML parsing.
+
+Each section becomes a table (``boundaries``, ``connections``,
+``constraints``, ``optimizations``, ``resources``) with one row per record.
+Nested objects are flattened into dotted columns (``context.mode``) and
+nested record lists become child tables (``boundaries.constraints``) whose
+rows point at their parent row. Every row carries ``_document`` (document
+number), ``_language``, ``_index`` (position in its list) and, in child
+tables, ``_parent`` (row number in the parent table). These names are
+reserved: records using them, or flattening two keys into the same column
+(``{"ctx": {"m": 1}, "ctx.m": 2}``), are rejected with ValueError.
+
+Tables are written as one Parquet file per table when pyarrow is available,
+and otherwise as a single NumPy ``.npz`` archive in which strings are stored
+Arrow-style as UTF-8 bytes plus offsets, low-cardinality string columns are
+dictionary-encoded, and nulls are kept as validity masks. NPZ arrays are
+stored under numbered names mapped to their table and column in the
+manifest, so no column name can overwrite another column's arrays. Both
+layouts carry a ``_tables.json`` manifest and load through ``read_columnar``.
+"""
+
+import json
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable, IO
+
+import numpy as np
+
+from .baml.xml_transformer import BAMLXMLTransformer
+from .pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+# Parquet output is optional
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PARQUET_AVAILABLE = pq is not None
+
+COLUMNAR_FORMATS = ("auto", "parquet", "npz")
+
+# Columnar layout version written to the manifest
+COLUMNAR_FORMAT_VERSION = "1.0.0-columnar"
+
+MANIFEST_NAME = "_tables.json"
+
+# Semantic data section -> table name, per language
+SECTION_TABLES = {
+    "baml": {"boundaries": "boundaries", "connections": "connections", "constraints": "constraints"},
+    "pareto_lang": {"optimizations": "optimizations", "resources": "resources", "constraints": "constraints"}
+}
+
+# Row bookkeeping columns
+DOCUMENT_COLUMN = "_document"
+LANGUAGE_COLUMN = "_language"
+INDEX_COLUMN = "_index"
+PARENT_COLUMN = "_parent"
+RESERVED_COLUMNS = frozenset((DOCUMENT_COLUMN, LANGUAGE_COLUMN, INDEX_COLUMN, PARENT_COLUMN))
+
+# Fill values stored under nulls in numeric columns
+_NULL_FILL = {"bool": False, "int": 0, "float": np.nan}
+
+_NUMPY_KINDS = {"bool": np.bool_, "int": np.int64, "float": np.float64}
+
+@dataclass
+class ColumnarTable:
+    """A table of typed columns.
+
+    Numeric and boolean columns are NumPy arrays with nulls filled in
+    (False, 0 or NaN); string columns are object arrays holding ``None`` for
+    nulls. ``validity`` holds a mask for every column that has nulls.
+    """
+    name: str
+    num_rows: int
+    columns: Dict[str, np.ndarray]
+    kinds: Dict[str, str]
+    validity: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a column array."""
+        return self.columns[name]
+
+    def is_valid(self, name: str) -> np.ndarray:
+        """Boolean mask of rows where a column is not null."""
+        if name in self.validity:
+            return self.validity[name]
+        return np.ones(self.num_rows, dtype=bool)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rows as flat dictionaries of Python values, omitting nulls."""
+        names = list(self.columns)
+        values = [self.columns[name].tolist() for name in names]
+        valid = [self.validity[name].tolist() if name in self.validity else None for name in names]
+        records = []
+        for row in range(self.num_rows):
+            records.append({
+                name: column[row]
+                for name, column, mask in zip(names, values, valid)
+                if mask is None or mask[row]
+            })
+        return records
+
+class _TableBuilder:
+    """Accumulates rows of one table column by column."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.num_rows = 0
+        self.columns: Dict[str, List[Any]] = {}
+
+    def append(self, row: Dict[str, Any]) -> int:
+        """Append a row and return its row number."""
+        row_number = self.num_rows
+        for name, value in row.items():
+            values = self.columns.get(name)
+            if values is None:
+                values = self.columns[name] = [None] * row_number
+            values.append(value)
+        self.num_rows += 1
+        for values in self.columns.values():
+            if len(values) < self.num_rows:
+                values.append(None)
+        return row_number
+
+    def build(self) -> ColumnarTable:
+        """Infer column types and convert to a ColumnarTable."""
+        columns = {}
+        kinds = {}
+        validity = {}
+        for name, values in self.columns.items():
+            kind, array, valid = _column_array(values)
+            columns[name], kinds[name] = array, kind
+            if valid is not None:
+                validity[name] = valid
+        return ColumnarTable(self.name, self.num_rows, columns, kinds, validity)
+
+def _value_kind(value: Any) -> str:
+    """Column kind a single non-null value belongs to."""
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, np.integer)):
+        return "int"
+    if isinstance(value, (float, np.floating)):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    return "json"
+
+def _column_array(values: List[Any]) -> Tuple[str, np.ndarray, Optional[np.ndarray]]:
+    """Convert a column of Python values to ``(kind, array, validity or None)``.
+
+    Columns mixing kinds, or holding lists, become string columns; non-string
+    values in them are JSON-encoded.
+    """
+    valid = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    has_nulls = not valid.all()
+    kinds = {_value_kind(value) for value in values if value is not None}
+
+    if kinds == {"int", "float"}:
+        kinds = {"float"}
+    if len(kinds) == 1 and next(iter(kinds)) in _NUMPY_KINDS:
+        kind = next(iter(kinds))
+        fill = _NULL_FILL[kind]
+        try:
+            array = np.array([fill if value is None else value for value in values], dtype=_NUMPY_KINDS[kind])
+        except OverflowError:
+            pass
+        else:
+            return kind, array, valid if has_nulls else None
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = [
+        value if value is None or isinstance(value, str) else json.dumps(value, default=str)
+        for value in values
+    ]
+    return "string", array, valid if has_nulls else None
+
+def _flatten(record: Dict[str, Any], prefix: str, row: Dict[str, Any],
+             children: Dict[str, List[Dict[str, Any]]]):
+    """Flatten a record into dotted columns, collecting nested record lists.
+
+    Raises ValueError for reserved column names and for keys that flatten to
+    a column or child table already taken by another key.
+    """
+    for key, value in record.items():
+        name = prefix + str(key)
+        if name in RESERVED_COLUMNS:
+            raise ValueError(f"Record field {name!r} collides with a reserved columnar column")
+        if isinstance(value, dict):
+            _flatten(value, name + ".", row, children)
+        elif isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            if name in children:
+                raise ValueError(f"Record fields flatten to the same child table {name!r}")
+            children[name] = value
+        else:
+            if name in row:
+                raise ValueError(f"Record fields flatten to the same column {name!r}")
+            row[name] = value
+
+def _encode_strings(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode a string column as UTF-8 bytes plus int64 offsets (nulls are empty)."""
+    encoded = [value.encode("utf-8") if value is not None else b"" for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+def _decode_strings(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Decode UTF-8 bytes plus offsets into an object array of strings."""
+    raw = data.tobytes()
+    text = raw.decode("utf-8")
+    bounds = offsets.tolist()
+    strings = np.empty(len(bounds) - 1, dtype=object)
+    if len(text) == len(raw):
+        # ASCII: byte offsets are character offsets
+        strings[:] = [text[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    else:
+        strings[:] = [raw[start:end].decode("utf-8") for start, end in zip(bounds[:-1], bounds[1:])]
+    return strings
+
+class ColumnarExporter:
+    """Flattens semantic documents into columnar tables and writes them.
+
+    ``format`` is ``"parquet"``, ``"npz"`` or ``"auto"`` (Parquet when
+    pyarrow is installed). Tables are built in memory; export large corpora
+    in shards by writing and starting a new exporter per shard.
+    """
+
+    def __init__(self, format: str = "auto", compression: Optional[str] = None):
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {format}")
+        if format == "parquet" and not PARQUET_AVAILABLE:
+            raise ValueError("Parquet export requires pyarrow")
+
+        self.format = format if format != "auto" else ("parquet" if PARQUET_AVAILABLE else "npz")
+        self.compression = compression
+        self.document_count = 0
+        self.record_count = 0
+        self.builders: Dict[str, _TableBuilder] = {}
+        self.xml_transformers = {
+            "baml": BAMLXMLTransformer(),
+            "pareto_lang": ParetoLangXMLTransformer()
+        }
+
+    def add_document(self, semantic_data: Dict[str, Any], language_type: str) -> int:
+        """Flatten one semantic document and return its document number.
+
+        Raises ValueError for unsupported languages, non-dictionary data and
+        records whose fields collide with reserved or already flattened
+        columns; a rejected document adds no rows.
+        """
+        if not isinstance(semantic_data, dict):
+            raise ValueError(f"Semantic data must be a dictionary, got {type(semantic_data).__name__}")
+        tables = self._section_tables(language_type)
+
+        document = self.document_count
+        pending: List[Tuple[str, Dict[str, Any], Optional[int]]] = []
+        for section, table in tables.items():
+            records = semantic_data.get(section)
+            if isinstance(records, list):
+                for index, record in enumerate(records):
+                    if isinstance(record, dict):
+                        self._flatten_record(table, record, document, language_type, index, None, pending)
+        self._append_rows(pending)
+        self.document_count += 1
+        return document
+
+    def add_documents(self, documents: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Flatten ``(language_type, semantic_data)`` pairs; returns how many were added."""
+        added = 0
+        for language_type, semantic_data in documents:
+            self.add_document(semantic_data, language_type)
+            added += 1
+        return added
+
+    def add_xml(self, source: Union[str, Path, IO[bytes]], language_type: str) -> int:
+        """Stream records out of an XML wrapper file or stream and flatten them.
+
+        Converts an existing XML export once, so later analysis reads the
+        columnar tables instead of parsing XML. Values keep the string form
+        XML attributes give them. Returns the document number.
+        """
+        tables = self._section_tables(language_type)
+        transformer = self.xml_transformers[language_type]
+        if language_type == "baml":
+            records = transformer.iter_unwrap_xml_to_baml(source)
+        else:
+            records = transformer.iter_unwrap_xml_to_pareto_lang(source)
+
+        document = self.document_count
+        pending: List[Tuple[str, Dict[str, Any], Optional[int]]] = []
+        positions: Dict[str, int] = {}
+        for section, record in records:
+            table = tables.get(section)
+            if table is None or not isinstance(record, dict):
+                continue
+            index = positions.get(section, 0)
+            positions[section] = index + 1
+            self._flatten_record(table, record, document, language_type, index, None, pending)
+        self._append_rows(pending)
+        self.document_count += 1
+        return document
+
+    def _section_tables(self, language_type: str) -> Dict[str, str]:
+        """Section -> table mapping for a language."""
+        tables = SECTION_TABLES.get(language_type)
+        if tables is None:
+            raise ValueError(f"Unsupported language type: {language_type}")
+        return tables
+
+    def _flatten_record(self, table: str, record: Dict[str, Any], document: int,
+                        language_type: str, index: int, parent: Optional[int],
+                        pending: List[Tuple[str, Dict[str, Any], Optional[int]]]):
+        """Queue a record row, then its nested record lists as child-table rows.
+
+        ``parent`` is the position of the parent row in ``pending``.
+        """
+        row: Dict[str, Any] = {}
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        _flatten(record, "", row, children)
+
+        # Bookkeeping columns are written last so record fields cannot replace them
+        row[DOCUMENT_COLUMN] = document
+        row[LANGUAGE_COLUMN] = language_type
+        row[INDEX_COLUMN] = index
+        position = len(pending)
+        pending.append((table, row, parent))
+
+        for name, child_records in children.items():
+            for child_index, child in enumerate(child_records):
+                self._flatten_record(f"{table}.{name}", child, document, language_type,
+                                     child_index, position, pending)
+
+    def _append_rows(self, pending: List[Tuple[str, Dict[str, Any], Optional[int]]]):
+        """Append queued rows, resolving parent positions to row numbers."""
+        row_numbers = []
+        for table, row, parent in pending:
+            if parent is not None:
+                row[PARENT_COLUMN] = row_numbers[parent]
+            builder = self.builders.get(table)
+            if builder is None:
+                builder = self.builders[table] = _TableBuilder(table)
+            row_numbers.append(builder.append(row))
+        self.record_count += len(pending)
+
+    def tables(self) -> Dict[str, ColumnarTable]:
+        """Build the typed tables accumulated so far."""
+        return {name: builder.build() for name, builder in self.builders.items()}
+
+    def write(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """Write the tables and return a summary.
+
+        Parquet output is a directory of ``<table>.parquet`` files; NPZ output
+        is a single archive (``.npz`` is appended when missing).
+        """
+        tables = self.tables()
+        path = Path(path)
+        manifest = {
+            "format_version": COLUMNAR_FORMAT_VERSION,
+            "format": self.format,
+            "documents": self.document_count,
+            "tables": {
+                name: {"rows": table.num_rows, "kinds": table.kinds}
+                for name, table in tables.items()
+            }
+        }
+
+        if self.format == "parquet":
+            path = _write_parquet(tables, manifest, path, self.compression)
+        else:
+            path = _write_npz(tables, manifest, path, self.compression is not None)
+
+        logger.info(f"Exported {self.record_count} records from {self.document_count} documents "
+                    f"to {path} ({self.format})")
+        return {
+            "success": True,
+            "format": self.format,
+            "path": str(path),
+            "documents": self.document_count,
+            "records": self.record_count,
+            "tables": {name: table.num_rows for name, table in tables.items()}
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get exporter status."""
+        return {
+            "format": self.format,
+            "parquet_available": PARQUET_AVAILABLE,
+            "documents": self.document_count,
+            "records": self.record_count,
+            "tables": {name: builder.num_rows for name, builder in self.builders.items()}
+        }
+
+def _write_npz(tables: Dict[str, ColumnarTable], manifest: Dict[str, Any],
+               path: Path, compress: bool) -> Path:
+    """Write tables into one ``.npz`` archive."""
+    if path.suffix != ".npz":
+        path = path.with_name(path.name + ".npz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    arrays: Dict[str, np.ndarray] = {}
+    array_names: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    def store(column_arrays: Dict[str, str], part: str, array: np.ndarray):
+        """Store an array under the next numbered name."""
+        column_arrays[part] = f"a{len(arrays)}"
+        arrays[column_arrays[part]] = array
+
+    for name, table in tables.items():
+        array_names[name] = {}
+        for column, values in table.columns.items():
+            column_arrays = array_names[name][column] = {}
+            valid = table.validity.get(column)
+            if valid is not None:
+                store(column_arrays, "valid", valid)
+            if table.kinds[column] != "string":
+                store(column_arrays, "values", values)
+                continue
+
+            uniques: Dict[Optional[str], int] = {}
+            codes = np.fromiter((uniques.setdefault(value, len(uniques)) for value in values),
+                                dtype=np.int32, count=len(values))
+            if len(uniques) * 2 <= len(values):
+                # Dictionary encoding: codes index the decoded dictionary
+                dictionary = np.empty(len(uniques), dtype=object)
+                dictionary[:] = list(uniques)
+                store(column_arrays, "codes", codes)
+                values = dictionary
+            data, offsets = _encode_strings(values)
+            store(column_arrays, "data", data)
+            store(column_arrays, "offsets", offsets)
+
+    manifest = dict(manifest, arrays=array_names)
+    arrays[MANIFEST_NAME] = np.frombuffer(json.dumps(manifest).encode("utf-8"), dtype=np.uint8)
+    (np.savez_compressed if compress else np.savez)(path, **arrays)
+    return path
+
+def _write_parquet(tables: Dict[str, ColumnarTable], manifest: Dict[str, Any],
+                   path: Path, compression: Optional[str]) -> Path:
+    """Write one Parquet file per table plus the manifest into a directory."""
+    path.mkdir(parents=True, exist_ok=True)
+    for name, table in tables.items():
+        arrays = {}
+        for column, values in table.columns.items():
+            valid = table.validity.get(column)
+            if table.kinds[column] == "string":
+                arrays[column] = pa.array(values, type=pa.string(), from_pandas=False)
+            else:
+                arrays[column] = pa.array(values, mask=None if valid is None else ~valid)
+        pq.write_table(pa.table(arrays), path / f"{name}.parquet", compression=compression or "snappy")
+    (path / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+def read_columnar(path: Union[str, Path], tables: Optional[Iterable[str]] = None,
+                  columns: Optional[Iterable[str]] = None) -> Dict[str, ColumnarTable]:
+    """Read tables written by ColumnarExporter.
+
+    ``tables`` and ``columns`` restrict what is loaded; only the selected
+    arrays are read from disk. Raises ValueError for unrecognized paths and
+    for Parquet directories when pyarrow is not installed.
+    """
+    path = Path(path)
+    wanted_tables = set(tables) if tables is not None else None
+    wanted_columns = set(columns) if columns is not None else None
+
+    if path.is_dir():
+        return _read_parquet(path, wanted_tables, wanted_columns)
+    if path.suffix != ".npz" and not path.exists() and path.with_name(path.name + ".npz").exists():
+        path = path.with_name(path.name + ".npz")
+    if not path.is_file():
+        raise ValueError(f"No columnar export at {path}")
+    return _read_npz(path, wanted_tables, wanted_columns)
+
+def _read_npz(path: Path, wanted_tables: Optional[set], wanted_columns: Optional[set]) -> Dict[str, ColumnarTable]:
+    """Read tables from a ``.npz`` archive."""
+    result = {}
+    with np.load(path, allow_pickle=False) as archive:
+        manifest = json.loads(archive[MANIFEST_NAME].tobytes().decode("utf-8"))
+        for name, info in manifest["tables"].items():
+            if wanted_tables is not None and name not in wanted_tables:
+                continue
+            table_columns = {}
+            kinds = {}
+            validity = {}
+            for column, kind in info["kinds"].items():
+                if wanted_columns is not None and column not in wanted_columns:
+                    continue
+                column_arrays = manifest["arrays"][name][column]
+                valid = archive[column_arrays["valid"]] if "valid" in column_arrays else None
+                if kind != "string":
+                    values = archive[column_arrays["values"]]
+                else:
+                    values = _decode_strings(archive[column_arrays["data"]], archive[column_arrays["offsets"]])
+                    if "codes" in column_arrays:
+                        values = values[archive[column_arrays["codes"]]]
+                if kind == "string" and valid is not None:
+                    values[~valid] = None
+                table_columns[column], kinds[column] = values, kind
+                if valid is not None:
+                    validity[column] = valid
+            result[name] = ColumnarTable(name, info["rows"], table_columns, kinds, validity)
+    return result
+
+def _read_parquet(path: Path, wanted_tables: Optional[set], wanted_columns: Optional[set]) -> Dict[str, ColumnarTable]:
+    """Read tables from a directory of Parquet files."""
+    if not PARQUET_AVAILABLE:
+        raise ValueError("Reading Parquet exports requires pyarrow")
+    manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+    result = {}
+    for name, info in manifest["tables"].items():
+        if wanted_tables is not None and name not in wanted_tables:
+            continue
+        selected = [column for column in info["kinds"] if wanted_columns is None or column in wanted_columns]
+        arrow_table = pq.read_table(path / f"{name}.parquet", columns=selected)
+        table_columns = {}
+        kinds = {}
+        validity = {}
+        for column in selected:
+            kind = info["kinds"][column]
+            chunked = arrow_table.column(column)
+            if chunked.null_count:
+                validity[column] = pc.is_valid(chunked).to_numpy()
+            if kind == "string":
+                values = np.empty(len(chunked), dtype=object)
+                values[:] = chunked.to_pylist()
+            else:
+                values = chunked.fill_null(_NULL_FILL[kind]).to_numpy().astype(_NUMPY_KINDS[kind])
+            table_columns[column], kinds[column] = values, kind
+        result[name] = ColumnarTable(name, info["rows"], table_columns, kinds, validity)
+    return result
+
+def export_columnar(documents: Iterable[Tuple[str, Dict[str, Any]]], path: Union[str, Path],
+                    format: str = "auto", compression: Optional[str] = None) -> Dict[str, Any]:
+    """Flatten ``(language_type, semantic_data)`` pairs and write them in one call."""
+    exporter = ColumnarExporter(format, compression)
+    exporter.add_documents(documents)
+    return exporter.write(path)
+
+# Export columnar classes
+__all__ = [
+    'ColumnarExporter',
+    'ColumnarTable',
+    'export_columnar',
+    'read_columnar',
+    'PARQUET_AVAILABLE'
+]
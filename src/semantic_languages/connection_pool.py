@@ -0,0 +1,284 @@
+"""
+FSL Continuum - Semantic Connection Pool
+
+Bounded connection pool and flow scheduler for semantic data connections.
+Enforces the ``connections.json`` limits: at most ``max_connections``
+connections are held at once, at most ``buffer_size`` callers wait for one,
+waits give up after ``connection_timeout`` seconds, and failed operations are
+retried ``retry_attempts`` times with jittered exponential backoff.
+
+Waiting callers are queued per flow (``baml``, ``pareto_lang``, ...) and
+freed connections are granted round-robin across flows, so a burst on one
+flow cannot starve the others. ``load_balancing: "fifo"`` grants strictly in
+arrival order instead.
+"""
+
+import time
+import random
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Any, Callable, Iterator, Tuple, Type
+
+from .metrics import MetricsRecorder
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# load_balancing values that schedule round-robin across flows
+FAIR_LOAD_BALANCING = ("semantic_aware", "round_robin", "fair")
+
+# Failures worth retrying on a fresh connection: I/O and connection errors,
+# including pool waits that time out (ConnectionPoolTimeout is a TimeoutError)
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (OSError,)
+
+class ConnectionPoolTimeout(TimeoutError):
+    """No connection became available within the connection timeout."""
+
+class ConnectionPoolFull(ConnectionPoolTimeout):
+    """The wait queue stayed full for the whole connection timeout."""
+
+class _Waiter:
+    """A caller queued for a connection."""
+
+    __slots__ = ("flow", "enqueued_at", "granted")
+
+    def __init__(self, flow: str):
+        self.flow = flow
+        self.enqueued_at = time.perf_counter()
+        self.granted = False
+
+class PooledConnection:
+    """A connection slot held from the pool; release it exactly once."""
+
+    def __init__(self, pool: "SemanticConnectionPool", flow: str, wait_time: float):
+        self.pool = pool
+        self.flow = flow
+        self.wait_time = wait_time
+        self.released = False
+
+    def release(self) -> None:
+        """Return the slot to the pool."""
+        if not self.released:
+            self.released = True
+            self.pool._release()
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.release()
+
+class SemanticConnectionPool:
+    """Bounded, fair connection pool for semantic data flows."""
+
+    def __init__(self, max_connections: int = 100, buffer_size: int = 1000,
+                 connection_timeout: float = 30.0, retry_attempts: int = 3,
+                 load_balancing: str = "semantic_aware", retry_backoff: float = 0.05,
+                 max_retry_backoff: float = 2.0, history_size: int = 1000):
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if buffer_size < 0:
+            raise ValueError("buffer_size must not be negative")
+        if connection_timeout < 0:
+            raise ValueError("connection_timeout must not be negative")
+        if retry_attempts < 0:
+            raise ValueError("retry_attempts must not be negative")
+
+        self.max_connections = max_connections
+        self.buffer_size = buffer_size
+        self.connection_timeout = connection_timeout
+        self.retry_attempts = retry_attempts
+        self.load_balancing = load_balancing
+        self.fair = load_balancing in FAIR_LOAD_BALANCING
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self.condition = threading.Condition()
+        self.active = 0
+        self.waiting = 0
+        # Per-flow wait queues and the round-robin order of flows with waiters
+        self._queues: Dict[str, deque] = {}
+        self._ready: deque = deque()
+
+        self.wait_metrics = MetricsRecorder(history_size)
+        self.max_queue_depth = 0
+        self.timeouts = 0
+        self.rejections = 0
+        self.retries = 0
+        self.failures = 0
+
+    @classmethod
+    def from_config(cls, connections_config: Dict[str, Any], **overrides) -> "SemanticConnectionPool":
+        """Build a pool from a ``connections.json`` configuration."""
+        connection_settings = connections_config.get("connection_settings", {})
+        flow_management = connections_config.get("flow_management", {})
+        settings = {
+            "max_connections": connection_settings.get("max_connections", 100),
+            "buffer_size": connection_settings.get("buffer_size", flow_management.get("buffer_size", 1000)),
+            "connection_timeout": connection_settings.get("connection_timeout", 30.0),
+            "retry_attempts": connection_settings.get("retry_attempts", 3),
+            "load_balancing": flow_management.get("load_balancing", "semantic_aware")
+        }
+        settings.update(overrides)
+        return cls(**settings)
+
+    def acquire(self, flow: str, timeout: Optional[float] = None) -> PooledConnection:
+        """Acquire a connection slot for a flow, waiting at most ``timeout`` seconds.
+
+        Raises ConnectionPoolFull when the wait queue stays full, and
+        ConnectionPoolTimeout when no slot frees up, before the deadline.
+        """
+        timeout = self.connection_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self.condition:
+            # Fast path: a free slot and nobody ahead in the queue
+            if self.active < self.max_connections and not self.waiting:
+                self.active += 1
+                return self._granted(flow, 0.0)
+
+            # Backpressure: wait for room in the queue
+            while self.waiting >= self.buffer_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.rejections += 1
+                    self.wait_metrics.record(timeout, False, labels=(flow,))
+                    raise ConnectionPoolFull(
+                        f"Connection queue full ({self.buffer_size} waiting) for flow {flow!r}"
+                    )
+                self.condition.wait(remaining)
+
+            waiter = self._enqueue(flow)
+            self._dispatch()
+            while not waiter.granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._dequeue(waiter)
+                    self.timeouts += 1
+                    self.wait_metrics.record(timeout, False, labels=(flow,))
+                    self.condition.notify_all()
+                    raise ConnectionPoolTimeout(
+                        f"No connection available for flow {flow!r} within {timeout:.3f}s"
+                    )
+                self.condition.wait(remaining)
+
+            return self._granted(flow, time.perf_counter() - waiter.enqueued_at)
+
+    @contextmanager
+    def connection(self, flow: str, timeout: Optional[float] = None) -> Iterator[PooledConnection]:
+        """Hold a connection slot for the duration of a ``with`` block."""
+        pooled = self.acquire(flow, timeout)
+        try:
+            yield pooled
+        finally:
+            pooled.release()
+
+    def run(self, flow: str, func: Callable[..., Any], *args,
+            retry_on: Tuple[Type[BaseException], ...] = (Exception,), **kwargs) -> Any:
+        """Run ``func`` holding a connection slot, retrying failures.
+
+        Failed attempts release their slot, back off for a random delay up to
+        ``retry_backoff * 2 ** attempt`` (capped at ``max_retry_backoff``), and
+        queue again. The last failure is re-raised.
+        """
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                with self.connection(flow):
+                    return func(*args, **kwargs)
+            except retry_on as e:
+                if attempt == self.retry_attempts:
+                    with self.condition:
+                        self.failures += 1
+                    raise
+                with self.condition:
+                    self.retries += 1
+                delay = random.uniform(0, min(self.max_retry_backoff, self.retry_backoff * 2 ** attempt))
+                logger.warning(f"Retrying {flow} flow after {type(e).__name__} in {delay:.3f}s "
+                               f"(attempt {attempt + 1}/{self.retry_attempts})")
+                time.sleep(delay)
+
+    def _granted(self, flow: str, wait_time: float) -> PooledConnection:
+        """Record a grant and hand out the slot (lock held)."""
+        self.wait_metrics.record(wait_time, True, labels=(flow,))
+        return PooledConnection(self, flow, wait_time)
+
+    def _enqueue(self, flow: str) -> _Waiter:
+        """Queue a waiter under its flow, or the shared queue in FIFO mode (lock held)."""
+        waiter = _Waiter(flow)
+        key = flow if self.fair else "*"
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+        if not queue:
+            self._ready.append(key)
+        queue.append(waiter)
+        self.waiting += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.waiting)
+        return waiter
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        """Remove a waiter that gave up (lock held)."""
+        key = waiter.flow if self.fair else "*"
+        queue = self._queues[key]
+        queue.remove(waiter)
+        if not queue:
+            self._ready.remove(key)
+        self.waiting -= 1
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters, one flow at a time (lock held)."""
+        granted = False
+        while self.active < self.max_connections and self._ready:
+            key = self._ready.popleft()
+            queue = self._queues[key]
+            queue.popleft().granted = True
+            if queue:
+                self._ready.append(key)
+            self.active += 1
+            self.waiting -= 1
+            granted = True
+        if granted:
+            self.condition.notify_all()
+
+    def _release(self) -> None:
+        """Return a slot and hand it to the next waiter."""
+        with self.condition:
+            self.active -= 1
+            self._dispatch()
+            self.condition.notify_all()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get pool limits, occupancy, queue depth and wait-time metrics."""
+        with self.condition:
+            queue_depths = {key: len(queue) for key, queue in self._queues.items() if queue}
+            status = {
+                "max_connections": self.max_connections,
+                "buffer_size": self.buffer_size,
+                "connection_timeout": self.connection_timeout,
+                "retry_attempts": self.retry_attempts,
+                "load_balancing": self.load_balancing,
+                "scheduling": "round_robin" if self.fair else "fifo",
+                "active_connections": self.active,
+                "queue_depth": self.waiting,
+                "queue_depth_by_flow": queue_depths,
+                "max_queue_depth": self.max_queue_depth,
+                "timeouts": self.timeouts,
+                "rejections": self.rejections,
+                "retries": self.retries,
+                "failures": self.failures
+            }
+        status["wait_time"] = self.wait_metrics.summary()
+        status["requests_by_flow"] = dict(self.wait_metrics.label_counts)
+        return status
+
+# Export connection pool
+__all__ = [
+    'SemanticConnectionPool',
+    'PooledConnection',
+    'ConnectionPoolTimeout',
+    'ConnectionPoolFull',
+    'TRANSIENT_ERRORS'
+]
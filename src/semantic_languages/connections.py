@@ -9,11 +9,16 @@ import json
 import time
 import logging
 import asyncio
+import itertools
+import threading
+from collections import deque
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 
+from .connection_pool import SemanticConnectionPool, TRANSIENT_ERRORS
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -49,11 +54,17 @@ class SemanticDataConnections:
         self.fsl_continuum_connections = {}
         self.ai_integration_connections = {}
         
-        self.active_connections = []
         self.connection_metrics = {}
         
         self.connections_config = self._load_connections_config()
         
+        # Bounded pool enforcing the configured connection limits; registries
+        # keep at most max_connections connections under unique ids
+        self.connection_pool = SemanticConnectionPool.from_config(self.connections_config)
+        self.active_connections = deque(maxlen=self.connection_pool.max_connections)
+        self._connection_ids = itertools.count(1)
+        self._registry_lock = threading.Lock()
+        
     def _load_connections_config(self) -> Dict[str, Any]:
         """Load semantic data connections configuration."""
         config_path = Path(__file__).parent / "config" / "connections.json"
@@ -92,41 +103,12 @@ class SemanticDataConnections:
                                    continuum_state: Dict[str, Any]) -> Dict[str, Any]:
         """Connect BAML semantic data to FSL Continuum."""
         try:
-            connection = SemanticConnection(
-                source="baml.semantic_data",
-                target="fsl_continuum.neural_field",
-                connection_type="semantic_integration",
-                data_flow="bidirectional",
-                ai_enhanced=True,
-                context_aware=True,
-                created_at=datetime.now().isoformat(),
-                metadata={
-                    "baml_schema_version": baml_schema.get("version", "1.0.0"),
-                    "continuum_state_version": continuum_state.get("version", "3.0.0"),
-                    "integration_type": "semantic_field_mapping",
-                    "ai_processed": True
-                }
+            # Establish the connection holding a pooled slot; transient
+            # failures release it and retry with jittered backoff
+            return self.connection_pool.run(
+                "baml", self._establish_baml_to_continuum, baml_schema, continuum_state,
+                retry_on=TRANSIENT_ERRORS
             )
-            
-            # Process BAML data for continuum integration
-            processed_data = self._process_baml_for_continuum(baml_schema, continuum_state)
-            
-            # Update connections
-            self.baml_connections[f"baml_to_continuum_{connection.created_at}"] = connection
-            self.active_connections.append(connection)
-            
-            # Calculate connection metrics
-            metrics = self._calculate_connection_metrics(connection, processed_data)
-            self.connection_metrics[connection.source + "_" + connection.target] = metrics
-            
-            return {
-                "success": True,
-                "connection": asdict(connection),
-                "processed_data": processed_data,
-                "metrics": asdict(metrics),
-                "ai_enhancements": self._get_baml_ai_enhancements(baml_schema, continuum_state)
-            }
-            
         except Exception as e:
             logger.error(f"Failed to connect BAML to continuum: {e}")
             return {
@@ -135,45 +117,54 @@ class SemanticDataConnections:
                 "connection_type": "baml_to_continuum"
             }
     
+    def _establish_baml_to_continuum(self, baml_schema: Dict[str, Any],
+                                      continuum_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Establish a BAML to FSL Continuum connection."""
+        connection = SemanticConnection(
+            source="baml.semantic_data",
+            target="fsl_continuum.neural_field",
+            connection_type="semantic_integration",
+            data_flow="bidirectional",
+            ai_enhanced=True,
+            context_aware=True,
+            created_at=datetime.now().isoformat(),
+            metadata={
+                "baml_schema_version": baml_schema.get("version", "1.0.0"),
+                "continuum_state_version": continuum_state.get("version", "3.0.0"),
+                "integration_type": "semantic_field_mapping",
+                "ai_processed": True
+            }
+        )
+        
+        # Process BAML data for continuum integration
+        processed_data = self._process_baml_for_continuum(baml_schema, continuum_state)
+        
+        # Update connections
+        connection_id = self._register_connection(self.baml_connections, "baml_to_continuum", connection)
+        
+        # Calculate connection metrics
+        metrics = self._calculate_connection_metrics(connection, processed_data)
+        self.connection_metrics[connection.source + "_" + connection.target] = metrics
+        
+        return {
+            "success": True,
+            "connection_id": connection_id,
+            "connection": asdict(connection),
+            "processed_data": processed_data,
+            "metrics": asdict(metrics),
+            "ai_enhancements": self._get_baml_ai_enhancements(baml_schema, continuum_state)
+        }
+    
     def connect_pareto_to_continuum(self, pareto_schema: Dict[str, Any], 
                                      continuum_state: Dict[str, Any]) -> Dict[str, Any]:
         """Connect Pareto-Lang semantic data to FSL Continuum."""
         try:
-            connection = SemanticConnection(
-                source="pareto_lang.semantic_data",
-                target="fsl_continuum.context_intelligence",
-                connection_type="optimization_integration",
-                data_flow="bidirectional",
-                ai_enhanced=True,
-                context_aware=True,
-                created_at=datetime.now().isoformat(),
-                metadata={
-                    "pareto_schema_version": pareto_schema.get("version", "1.0.0"),
-                    "continuum_state_version": continuum_state.get("version", "3.0.0"),
-                    "integration_type": "optimization_field_mapping",
-                    "ai_processed": True
-                }
+            # Establish the connection holding a pooled slot; transient
+            # failures release it and retry with jittered backoff
+            return self.connection_pool.run(
+                "pareto_lang", self._establish_pareto_to_continuum, pareto_schema, continuum_state,
+                retry_on=TRANSIENT_ERRORS
             )
-            
-            # Process Pareto-Lang data for continuum integration
-            processed_data = self._process_pareto_for_continuum(pareto_schema, continuum_state)
-            
-            # Update connections
-            self.pareto_lang_connections[f"pareto_to_continuum_{connection.created_at}"] = connection
-            self.active_connections.append(connection)
-            
-            # Calculate connection metrics
-            metrics = self._calculate_connection_metrics(connection, processed_data)
-            self.connection_metrics[connection.source + "_" + connection.target] = metrics
-            
-            return {
-                "success": True,
-                "connection": asdict(connection),
-                "processed_data": processed_data,
-                "metrics": asdict(metrics),
-                "ai_enhancements": self._get_pareto_ai_enhancements(pareto_schema, continuum_state)
-            }
-            
         except Exception as e:
             logger.error(f"Failed to connect Pareto-Lang to continuum: {e}")
             return {
@@ -182,45 +173,54 @@ class SemanticDataConnections:
                 "connection_type": "pareto_to_continuum"
             }
     
+    def _establish_pareto_to_continuum(self, pareto_schema: Dict[str, Any],
+                                        continuum_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Establish a Pareto-Lang to FSL Continuum connection."""
+        connection = SemanticConnection(
+            source="pareto_lang.semantic_data",
+            target="fsl_continuum.context_intelligence",
+            connection_type="optimization_integration",
+            data_flow="bidirectional",
+            ai_enhanced=True,
+            context_aware=True,
+            created_at=datetime.now().isoformat(),
+            metadata={
+                "pareto_schema_version": pareto_schema.get("version", "1.0.0"),
+                "continuum_state_version": continuum_state.get("version", "3.0.0"),
+                "integration_type": "optimization_field_mapping",
+                "ai_processed": True
+            }
+        )
+        
+        # Process Pareto-Lang data for continuum integration
+        processed_data = self._process_pareto_for_continuum(pareto_schema, continuum_state)
+        
+        # Update connections
+        connection_id = self._register_connection(self.pareto_lang_connections, "pareto_to_continuum", connection)
+        
+        # Calculate connection metrics
+        metrics = self._calculate_connection_metrics(connection, processed_data)
+        self.connection_metrics[connection.source + "_" + connection.target] = metrics
+        
+        return {
+            "success": True,
+            "connection_id": connection_id,
+            "connection": asdict(connection),
+            "processed_data": processed_data,
+            "metrics": asdict(metrics),
+            "ai_enhancements": self._get_pareto_ai_enhancements(pareto_schema, continuum_state)
+        }
+    
     def connect_semantic_languages(self, baml_data: Dict[str, Any], 
                                    pareto_data: Dict[str, Any]) -> Dict[str, Any]:
         """Connect BAML and Pareto-Lang semantic data."""
         try:
-            connection = SemanticConnection(
-                source="baml.semantic_data",
-                target="pareto_lang.semantic_data",
-                connection_type="semantic_unification",
-                data_flow="bidirectional",
-                ai_enhanced=True,
-                context_aware=True,
-                created_at=datetime.now().isoformat(),
-                metadata={
-                    "integration_type": "semantic_language_bridge",
-                    "unification_strategy": "ai_enhanced",
-                    "context_preservation": True,
-                    "ai_processed": True
-                }
+            # Establish the connection holding a pooled slot; transient
+            # failures release it and retry with jittered backoff
+            return self.connection_pool.run(
+                "semantic", self._establish_semantic_languages, baml_data, pareto_data,
+                retry_on=TRANSIENT_ERRORS
             )
-            
-            # Process semantic data for interconnection
-            processed_data = self._process_semantic_interconnection(baml_data, pareto_data)
-            
-            # Update connections
-            self.ai_integration_connections[f"semantic_interconnection_{connection.created_at}"] = connection
-            self.active_connections.append(connection)
-            
-            # Calculate connection metrics
-            metrics = self._calculate_connection_metrics(connection, processed_data)
-            self.connection_metrics[connection.source + "_" + connection.target] = metrics
-            
-            return {
-                "success": True,
-                "connection": asdict(connection),
-                "processed_data": processed_data,
-                "metrics": asdict(metrics),
-                "ai_enhancements": self._get_semantic_ai_enhancements(baml_data, pareto_data)
-            }
-            
         except Exception as e:
             logger.error(f"Failed to connect semantic languages: {e}")
             return {
@@ -229,6 +229,55 @@ class SemanticDataConnections:
                 "connection_type": "semantic_interconnection"
             }
     
+    def _establish_semantic_languages(self, baml_data: Dict[str, Any],
+                                       pareto_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Establish a BAML to Pareto-Lang connection."""
+        connection = SemanticConnection(
+            source="baml.semantic_data",
+            target="pareto_lang.semantic_data",
+            connection_type="semantic_unification",
+            data_flow="bidirectional",
+            ai_enhanced=True,
+            context_aware=True,
+            created_at=datetime.now().isoformat(),
+            metadata={
+                "integration_type": "semantic_language_bridge",
+                "unification_strategy": "ai_enhanced",
+                "context_preservation": True,
+                "ai_processed": True
+            }
+        )
+        
+        # Process semantic data for interconnection
+        processed_data = self._process_semantic_interconnection(baml_data, pareto_data)
+        
+        # Update connections
+        connection_id = self._register_connection(self.ai_integration_connections, "semantic_interconnection", connection)
+        
+        # Calculate connection metrics
+        metrics = self._calculate_connection_metrics(connection, processed_data)
+        self.connection_metrics[connection.source + "_" + connection.target] = metrics
+        
+        return {
+            "success": True,
+            "connection_id": connection_id,
+            "connection": asdict(connection),
+            "processed_data": processed_data,
+            "metrics": asdict(metrics),
+            "ai_enhancements": self._get_semantic_ai_enhancements(baml_data, pareto_data)
+        }
+    
+    def _register_connection(self, registry: Dict[str, SemanticConnection], 
+                             prefix: str, connection: SemanticConnection) -> str:
+        """Register an established connection under a unique id, evicting the oldest."""
+        connection_id = f"{prefix}_{next(self._connection_ids)}"
+        with self._registry_lock:
+            registry[connection_id] = connection
+            while len(registry) > self.connection_pool.max_connections:
+                registry.pop(next(iter(registry)))
+            self.active_connections.append(connection)
+        return connection_id
+    
     def ai_enhanced_data_flow(self, semantic_data: Dict[str, Any], 
                                  context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """AI-enhanced semantic data flow management."""
@@ -396,6 +445,7 @@ class SemanticDataConnections:
             "fsl_continuum_connections_count": len(self.fsl_continuum_connections),
             "ai_integration_connections_count": len(self.ai_integration_connections),
             "connection_metrics": self.connection_metrics,
+            "connection_pool": self.connection_pool.get_status(),
             "performance_metrics": self._get_performance_metrics()
         }
     
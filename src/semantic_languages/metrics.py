@@ -0,0 +1,180 @@
+"""
+FSL Continuum - Semantic Language Metrics
+
+Bounded metrics recording for semantic language processors.
+Keeps streaming counters and a fixed-size duration digest instead of an
+ever-growing list of history records, with an optional ring of recent records.
+"""
+
+import math
+import threading
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Any, Iterable
+
+class DurationDigest:
+    """Fixed-size, log-bucketed digest for duration quantiles.
+
+    Bucket boundaries grow geometrically, so every reported quantile is within
+    ``relative_accuracy`` of the true value while the bucket counts live in a
+    single preallocated array.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 min_value: float = 1e-7, max_value: float = 1e4):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self._log_gamma = math.log(self.gamma)
+        self._offset = self._bucket_key(min_value)
+        self.bucket_count = self._bucket_key(max_value) - self._offset + 1
+        self.buckets = array('Q', bytes(8 * self.bucket_count))
+        self.zero_count = 0
+        self.count = 0
+
+    def _bucket_key(self, value: float) -> int:
+        """Get the unshifted logarithmic bucket key for a value."""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float):
+        """Add a duration to the digest."""
+        if value <= self.min_value:
+            self.zero_count += 1
+        else:
+            index = min(self._bucket_key(value) - self._offset, self.bucket_count - 1)
+            self.buckets[index] += 1
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile (0.0-1.0) of the recorded durations."""
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+
+        seen = self.zero_count
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen > rank:
+                return 2 * self.gamma ** (index + self._offset) / (self.gamma + 1)
+        return self.max_value
+
+    def clear(self):
+        """Reset the digest."""
+        self.buckets = array('Q', bytes(8 * self.bucket_count))
+        self.zero_count = 0
+        self.count = 0
+
+class MetricsRecorder:
+    """Fixed-capacity streaming metrics recorder for semantic language operations.
+
+    Tracks operation count, success count, duration mean/min/max/total and
+    p50/p95/p99 in constant space. The last ``history_size`` raw records are
+    kept in a ring buffer (``history_size=0`` keeps none).
+    """
+
+    QUANTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+    def __init__(self, history_size: int = 100, relative_accuracy: float = 0.01):
+        self.history_size = history_size
+        self.recent_records = deque(maxlen=history_size)
+        self.digest = DurationDigest(relative_accuracy)
+        self.label_counts = {}
+        self.lock = threading.Lock()
+
+        self.count = 0
+        self.success_count = 0
+        self.timed_count = 0
+        self.total_time = 0.0
+        self.min_time = None
+        self.max_time = None
+        self.last_record = None
+
+    def record(self, duration: Optional[float] = None, success: bool = True,
+               record: Optional[Dict[str, Any]] = None, labels: Iterable[str] = ()):
+        """Record one operation.
+
+        ``duration`` is in seconds (None for untimed operations), ``labels``
+        are counted into ``label_counts`` and ``record`` is kept in the recent
+        records ring.
+        """
+        with self.lock:
+            self.count += 1
+            if success:
+                self.success_count += 1
+
+            if duration is not None:
+                self.timed_count += 1
+                self.total_time += duration
+                self.min_time = duration if self.min_time is None else min(self.min_time, duration)
+                self.max_time = duration if self.max_time is None else max(self.max_time, duration)
+                self.digest.add(duration)
+
+            for label in labels:
+                self.label_counts[label] = self.label_counts.get(label, 0) + 1
+
+            if record is not None:
+                self.recent_records.append(record)
+                self.last_record = record
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of recorded operations that succeeded."""
+        return self.success_count / self.count if self.count else 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """Mean duration of timed operations."""
+        return self.total_time / self.timed_count if self.timed_count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a duration quantile, clamped to the observed range."""
+        value = self.digest.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.min_time), self.max_time)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get streaming counters and duration quantiles."""
+        with self.lock:
+            summary = {
+                "count": self.count,
+                "success_count": self.success_count,
+                "success_rate": self.success_rate,
+                "mean_time": self.mean_time,
+                "min_time": self.min_time,
+                "max_time": self.max_time,
+                "total_time": self.total_time
+            }
+            for name, q in self.QUANTILES.items():
+                summary[name] = self.quantile(q)
+            return summary
+
+    def get_recent_records(self) -> List[Dict[str, Any]]:
+        """Get a copy of the recent raw records, oldest first."""
+        with self.lock:
+            return list(self.recent_records)
+
+    def clear(self):
+        """Reset all counters, the digest and recent records."""
+        with self.lock:
+            self.recent_records.clear()
+            self.digest.clear()
+            self.label_counts = {}
+            self.count = 0
+            self.success_count = 0
+            self.timed_count = 0
+            self.total_time = 0.0
+            self.min_time = None
+            self.max_time = None
+            self.last_record = None
+
+# Export metrics classes
+__all__ = [
+    'MetricsRecorder',
+    'DurationDigest'
+]
@@ -14,6 +14,7 @@ from .generator import ParetoLangGenerator
 from .interpreter import ParetoLangInterpreter
 from .bridge import ParetoLangBridge
 from .xml_transformer import ParetoLangXMLTransformer
+from .pareto_front import ParetoFrontEngine, ParetoFrontResult
 
 # Pareto-Lang version and compatibility
 __version__ = "1.0.0-fsl-integration"
@@ -37,6 +38,7 @@ class ParetoLangManager:
         self.interpreter = ParetoLangInterpreter()
         self.bridge = ParetoLangBridge()
         self.xml_transformer = ParetoLangXMLTransformer()
+        self.pareto_front = ParetoFrontEngine()
     
     def parse_pareto_lang_data(self, data, context=None):
         """Parse Pareto-Lang semantic data with optional XML transformation."""
@@ -58,6 +60,12 @@ class ParetoLangManager:
         """Optimize Pareto-Lang semantic data with XML support."""
         return self.bridge.optimize(pareto_data, constraints, context)
     
+    def compute_pareto_front(self, pareto_data, objectives=None, context=None):
+        """Rank Pareto-Lang optimizations into Pareto fronts with crowding distances."""
+        if isinstance(pareto_data, str) or hasattr(pareto_data, "read"):
+            pareto_data = self.parse_pareto_lang_data(pareto_data, context)
+        return self.pareto_front.compute_front(pareto_data, objectives)
+    
     def bridge_to_python(self, pareto_data, context=None):
         """Bridge Pareto-Lang data to Python with XML support."""
         return self.bridge.bridge(pareto_data, context)
@@ -86,7 +94,7 @@ class ParetoLangManager:
 __all__ = [
     'ParetoLangParser', 'ParetoLangValidator', 'ParetoLangSchema', 
     'ParetoLangGenerator', 'ParetoLangInterpreter', 'ParetoLangBridge',
-    'ParetoLangXMLTransformer', 'ParetoLangManager',
+    'ParetoLangXMLTransformer', 'ParetoLangManager', 'ParetoFrontEngine', 'ParetoFrontResult',
     'PARETO_LANG_CONFIG_PATH', 'PARETO_LANG_RULES_PATH', 'PARETO_LANG_CONNECTIONS_PATH', 'PARETO_LANG_XML_CONFIG_PATH',
     '__version__', '__pareto_lang_version__', '__xml_transformation_version__'
 ]
@@ -0,0 +1,384 @@
+"""
+FSL Continuum - Pareto-Lang Pareto Front Engine
+
+Vectorized non-dominated sorting and crowding distance over Pareto-Lang
+optimization objectives.
+
+Candidates are ranked with an efficient non-dominated sort: unique objective
+vectors are visited in descending lexicographic order, so a candidate can
+only be dominated by candidates already ranked, and each block of candidates
+binary-searches the existing fronts at once. Fronts keep a compact dominance
+index (a staircase for three objectives, members sorted on the second
+objective beyond that); two objectives reduce to one bisect per candidate.
+100k candidates rank in seconds.
+"""
+
+import time
+import bisect
+import logging
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union, Sequence
+
+from ..metrics import MetricsRecorder
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Accepted objective directions, mapped to "maximize"
+OBJECTIVE_DIRECTIONS = {
+    "maximize": True,
+    "max": True,
+    "minimize": False,
+    "min": False
+}
+
+# Objectives ranked when none are given
+DEFAULT_OBJECTIVES = {"efficiency": "maximize"}
+
+# Upper bound on elements in one broadcast dominance comparison
+_COMPARISON_BUDGET = 1 << 22
+
+class _FrontIndex:
+    """Dominance index over the members of one front.
+
+    Stores the objective columns after the first (at least two); candidates
+    are visited in descending order of the first objective, so a member
+    dominates a later candidate when it is at least as good on every stored
+    column.
+    """
+
+    def __init__(self, points: np.ndarray):
+        self.points = points[:0]
+        self.add(points)
+
+    def add(self, points: np.ndarray) -> None:
+        """Add members to the front."""
+        points = np.concatenate([self.points, points]) if len(self.points) else points
+
+        if points.shape[1] == 2:
+            # Keep the staircase: descending first column, rising second column
+            order = np.lexsort((-points[:, 1], -points[:, 0]))
+            points = points[order]
+            best_before = np.maximum.accumulate(np.r_[-np.inf, points[:-1, 1]])
+            self.points = points[points[:, 1] > best_before]
+        else:
+            self.points = points[np.argsort(-points[:, 0], kind="stable")]
+        self._first = -self.points[:, 0]
+
+    def dominates(self, candidates: np.ndarray) -> np.ndarray:
+        """Return which candidates some member of the front dominates."""
+        # Members at least as good on the first stored column form a prefix
+        prefix = np.searchsorted(self._first, -candidates[:, 0], side="right")
+        if self.points.shape[1] == 2:
+            last = self.points[np.maximum(prefix - 1, 0), 1]
+            return (prefix > 0) & (last >= candidates[:, 1])
+
+        dominated = np.zeros(len(candidates), dtype=bool)
+        rows = max(1, _COMPARISON_BUDGET // max(1, int(prefix.max())))
+        for start in range(0, len(candidates), rows):
+            chunk = candidates[start:start + rows]
+            members = self.points[:int(prefix[start:start + rows].max())]
+            if len(members):
+                dominated[start:start + rows] = _weakly_dominated(members, chunk).any(axis=1)
+        return dominated
+
+def _weakly_dominated(members: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Return ``[i, j]``: member ``j`` is at least as good as candidate ``i`` everywhere.
+
+    Compares one column at a time, which keeps temporaries two-dimensional.
+    """
+    result = members[None, :, 0] >= candidates[:, None, 0]
+    for column in range(1, members.shape[1]):
+        result &= members[None, :, column] >= candidates[:, None, column]
+    return result
+
+def non_dominated_sort(objectives: np.ndarray,
+                       maximize: Optional[Sequence[bool]] = None,
+                       block_size: int = 512) -> np.ndarray:
+    """Rank candidates into Pareto fronts.
+
+    Args:
+        objectives: ``(n, m)`` matrix of objective values, one row per candidate.
+        maximize: per objective, whether larger is better (default: all maximized).
+        block_size: candidates ranked together per vectorized step.
+
+    Returns:
+        Integer array of front ranks, 0 for the non-dominated front.
+    """
+    values = np.asarray(objectives, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] == 0:
+        raise ValueError("Objectives must be a 2-D matrix with at least one column")
+    if np.isnan(values).any():
+        raise ValueError("Objectives must not contain NaN")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+    if maximize is not None:
+        maximize = np.asarray(maximize, dtype=bool)
+        if maximize.shape != (values.shape[1],):
+            raise ValueError("maximize must give one direction per objective")
+        values = np.where(maximize, values, -values)
+
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Equal candidates share a rank; adding 0.0 folds -0.0 into 0.0
+    unique, inverse = np.unique(values + 0.0, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    ordered = np.ascontiguousarray(unique[::-1, 1:])
+    ranks = np.empty(len(unique), dtype=np.int64)
+
+    if ordered.shape[1] == 0:
+        # Single objective: every distinct value is its own front
+        ranks[:] = np.arange(len(unique))
+    elif ordered.shape[1] == 1:
+        # Two objectives: front maxima of the second objective never increase,
+        # so each candidate bisects straight to its front
+        negated_maxima: List[float] = []
+        for index, value in enumerate(ordered[:, 0].tolist()):
+            rank = bisect.bisect_right(negated_maxima, -value)
+            if rank == len(negated_maxima):
+                negated_maxima.append(-value)
+            else:
+                negated_maxima[rank] = -value
+            ranks[index] = rank
+    else:
+        fronts: List[_FrontIndex] = []
+        for start in range(0, len(ordered), block_size):
+            block = ordered[start:start + block_size]
+            block_ranks = _first_undominated_front(fronts, block)
+            _resolve_block(block, block_ranks)
+            ranks[start:start + len(block)] = block_ranks
+
+            for rank in np.unique(block_ranks):
+                members = block[block_ranks == rank]
+                if rank == len(fronts):
+                    fronts.append(_FrontIndex(members))
+                else:
+                    fronts[rank].add(members)
+
+    return ranks[::-1][inverse]
+
+def _first_undominated_front(fronts: List[_FrontIndex], block: np.ndarray) -> np.ndarray:
+    """Binary-search the existing fronts for the first not dominating each candidate.
+
+    Domination by front ``k`` implies domination by every earlier front, so
+    the search is valid for all candidates in the block at once.
+    """
+    low = np.zeros(len(block), dtype=np.int64)
+    high = np.full(len(block), len(fronts), dtype=np.int64)
+
+    searching = np.nonzero(low < high)[0]
+    while len(searching):
+        middle = (low[searching] + high[searching]) // 2
+        dominated = np.empty(len(searching), dtype=bool)
+        for front in np.unique(middle):
+            selected = middle == front
+            dominated[selected] = fronts[front].dominates(block[searching[selected]])
+        low[searching] = np.where(dominated, middle + 1, low[searching])
+        high[searching] = np.where(dominated, high[searching], middle)
+        searching = searching[low[searching] < high[searching]]
+
+    return low
+
+def _resolve_block(block: np.ndarray, block_ranks: np.ndarray) -> None:
+    """Raise ranks for domination between candidates of the same block, in place."""
+    count = len(block)
+    # dominated_by[j, i]: earlier candidate j dominates later candidate i
+    dominated_by = _weakly_dominated(block, block).T
+    dominated_by &= np.triu(np.ones((count, count), dtype=bool), 1)
+
+    for index in np.nonzero(dominated_by.any(axis=0))[0]:
+        dominators = block_ranks[:index][dominated_by[:index, index]]
+        block_ranks[index] = max(block_ranks[index], dominators.max() + 1)
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Crowding distance of every candidate within its front.
+
+    Boundary candidates of each front, and candidates of fronts with fewer
+    than three members, get ``inf``. Candidates with a negative rank
+    (excluded from ranking) get 0.
+    """
+    values = np.asarray(objectives, dtype=np.float64)
+    ranks = np.asarray(ranks)
+    distance = np.zeros(len(values))
+    ranked = np.nonzero(ranks >= 0)[0]
+    if len(ranked) == 0:
+        return distance
+
+    for column in range(values.shape[1]):
+        # Sort by front, then by objective value within the front
+        order = ranked[np.lexsort((values[ranked, column], ranks[ranked]))]
+        column_values = values[order, column]
+        front_ranks = ranks[order]
+
+        first = np.r_[True, front_ranks[1:] != front_ranks[:-1]]
+        last = np.r_[front_ranks[1:] != front_ranks[:-1], True]
+        front_id = np.cumsum(first) - 1
+        span = (column_values[last] - column_values[first])[front_id]
+
+        gap = np.r_[column_values[1:], 0.0] - np.r_[0.0, column_values[:-1]]
+        contribution = np.divide(gap, span, out=np.zeros_like(gap), where=span > 0)
+        contribution[first | last] = np.inf
+        distance[order] += contribution
+
+    return distance
+
+@dataclass
+class ParetoFrontResult:
+    """Result of ranking Pareto-Lang optimization candidates."""
+    success: bool
+    objectives: Dict[str, str]
+    ranks: np.ndarray
+    crowding_distance: np.ndarray
+    front_indices: np.ndarray
+    front: List[Dict[str, Any]]
+    front_count: int
+    computation_time: float
+    metadata: Dict[str, Any]
+
+class ParetoFrontEngine:
+    """Pareto front computation for Pareto-Lang optimizations."""
+
+    def __init__(self, objectives: Optional[Dict[str, str]] = None,
+                 block_size: int = 512, history_size: int = 100):
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.objectives = self._normalize_objectives(objectives or DEFAULT_OBJECTIVES)
+        self.block_size = block_size
+        self.front_metrics = MetricsRecorder(history_size)
+
+    def _normalize_objectives(self, objectives: Dict[str, str]) -> Dict[str, str]:
+        """Validate objective directions and spell them out."""
+        if not objectives:
+            raise ValueError("At least one objective is required")
+        normalized = {}
+        for name, direction in objectives.items():
+            maximize = OBJECTIVE_DIRECTIONS.get(str(direction).lower())
+            if maximize is None:
+                raise ValueError(f"Unknown direction for objective {name!r}: {direction!r}")
+            normalized[str(name)] = "maximize" if maximize else "minimize"
+        return normalized
+
+    def objective_matrix(self, optimizations: Sequence[Dict[str, Any]],
+                         objectives: Optional[Dict[str, str]] = None) -> np.ndarray:
+        """Build the candidate objective matrix from optimization records.
+
+        Each objective is read from the record itself, then from its
+        ``objectives`` and ``metadata`` mappings. Missing or non-numeric
+        values are NaN.
+        """
+        names = list(self._normalize_objectives(objectives) if objectives else self.objectives)
+        matrix = np.full((len(optimizations), len(names)), np.nan)
+
+        for row, record in enumerate(optimizations):
+            if not isinstance(record, dict):
+                continue
+            sources = [record] + [
+                record[key] for key in ("objectives", "metadata") if isinstance(record.get(key), dict)
+            ]
+            for column, name in enumerate(names):
+                for source in sources:
+                    value = source.get(name)
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        matrix[row, column] = value
+                        break
+
+        return matrix
+
+    def compute_front(self, candidates: Union[Dict[str, Any], Sequence[Dict[str, Any]], np.ndarray],
+                      objectives: Optional[Dict[str, str]] = None) -> ParetoFrontResult:
+        """Rank candidates into Pareto fronts with crowding distances.
+
+        Candidates are a Pareto-Lang document (its ``optimizations`` are
+        ranked), a list of optimization records, or an ``(n, m)`` objective
+        matrix whose columns follow ``objectives``. Candidates missing an
+        objective get rank -1 and are left out of every front.
+        """
+        objectives = self._normalize_objectives(objectives) if objectives else self.objectives
+        start_time = time.time()
+        records: List[Dict[str, Any]] = []
+
+        try:
+            if isinstance(candidates, np.ndarray):
+                matrix = np.asarray(candidates, dtype=np.float64)
+                if matrix.ndim != 2 or matrix.shape[1] != len(objectives):
+                    raise ValueError(
+                        f"Objective matrix must have {len(objectives)} columns, got shape {matrix.shape}"
+                    )
+            else:
+                if isinstance(candidates, dict):
+                    candidates = candidates.get("optimizations") or []
+                records = list(candidates)
+                matrix = self.objective_matrix(records, objectives)
+
+            ranked = ~np.isnan(matrix).any(axis=1)
+            ranks = np.full(len(matrix), -1, dtype=np.int64)
+            ranks[ranked] = non_dominated_sort(
+                matrix[ranked],
+                [direction == "maximize" for direction in objectives.values()],
+                self.block_size
+            )
+            distances = crowding_distance(matrix, ranks)
+            front_indices = np.nonzero(ranks == 0)[0]
+
+            if records:
+                front = [records[index] for index in front_indices]
+            else:
+                front = [dict(zip(objectives, matrix[index].tolist())) for index in front_indices]
+
+            computation_time = time.time() - start_time
+            self.front_metrics.record(computation_time, True, labels=(f"{len(objectives)}d",))
+
+            return ParetoFrontResult(
+                success=True,
+                objectives=objectives,
+                ranks=ranks,
+                crowding_distance=distances,
+                front_indices=front_indices,
+                front=front,
+                front_count=int(ranks.max()) + 1 if ranked.any() else 0,
+                computation_time=computation_time,
+                metadata={
+                    "candidate_count": len(matrix),
+                    "ranked_count": int(ranked.sum()),
+                    "front_size": len(front_indices),
+                    "sorting_algorithm": "efficient-non-dominated-sort"
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to compute Pareto front: {e}")
+            computation_time = time.time() - start_time
+            self.front_metrics.record(computation_time, False, labels=(f"{len(objectives)}d",))
+
+            return ParetoFrontResult(
+                success=False,
+                objectives=objectives,
+                ranks=np.zeros(0, dtype=np.int64),
+                crowding_distance=np.zeros(0),
+                front_indices=np.zeros(0, dtype=np.int64),
+                front=[],
+                front_count=0,
+                computation_time=computation_time,
+                metadata={"exception": str(e)}
+            )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get engine configuration and computation metrics."""
+        return {
+            "objectives": self.objectives,
+            "block_size": self.block_size,
+            "computations": self.front_metrics.summary(),
+            "computations_by_dimension": dict(self.front_metrics.label_counts)
+        }
+
+# Export Pareto front engine
+__all__ = [
+    'ParetoFrontEngine',
+    'ParetoFrontResult',
+    'non_dominated_sort',
+    'crowding_distance',
+    'DEFAULT_OBJECTIVES'
+]
@@ -0,0 +1,29 @@
+"""
+FSL Continuum - Pareto-Lang Parser
+
+Streaming parser for ``.pareto`` semantic documents. Emits ``optimizations``,
+``resources`` and ``constraints`` records incrementally and reports syntax
+errors with line and column.
+"""
+
+import logging
+from typing import Tuple
+
+from ..document_parser import SemanticDocumentParser, SemanticParseError, SectionRecord
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ParetoLangParser(SemanticDocumentParser):
+    """Streaming parser for Pareto-Lang semantic documents."""
+
+    language = "pareto_lang"
+    record_sections: Tuple[str, ...] = ("optimizations", "resources", "constraints")
+
+# Export Pareto-Lang parser classes
+__all__ = [
+    'ParetoLangParser',
+    'SemanticParseError',
+    'SectionRecord'
+]
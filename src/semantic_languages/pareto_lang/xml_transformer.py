@@ -5,22 +5,48 @@ Core processor for XML data transformation wrapping in Pareto-Lang semantic lang
 Provides XML-wrapping, unwrapping, and transformation with optimization preservation.
 """
 
-import json
+import io
+import copy
 import time
 import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator, Callable, IO
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 
+from ..metrics import MetricsRecorder
+from ..results import FrozenMetadata, SlottedResult, intern_metadata
+from ..wrap_cache import WrapCache, WrapCacheEntry, TimestampTemplate, canonical_content_key
+from ..xml_writer import (
+    DirectXMLUnsupported, format_attributes, parse_root_start, write_section, write_ai_integration
+)
+from ..transformation_plan import TransformationPlan, compile_transformation_rules, load_transformation_plan
+from ..schema_validator import SchemaValidator, load_schema_validator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class XMLTransformationResult:
-    """Result of XML transformation operation."""
+# Validation applied to freshly wrapped XML: skip it, check the in-memory
+# element tree, or serialize and parse the wrapper string again
+XML_VALIDATION_MODES = ("none", "structural-on-tree", "full-reparse")
+
+# Wrapper serialization: write XML text directly, or build an ElementTree
+# and serialize it with ``ET.tostring`` (both produce identical text)
+XML_SERIALIZERS = ("direct", "element-tree")
+
+@dataclass(frozen=True)
+class XMLTransformationResult(SlottedResult):
+    """Result of XML transformation operation.
+    
+    Slotted and frozen. ``metadata`` is shared between results with the same
+    values and is read-only; ``validation_result`` is assembled on first access.
+    """
+    __slots__ = ("success", "transformed_data", "xml_wrapper", "transformation_time",
+                 "optimization_preserved", "validation_result", "metadata", "_lazy_parts")
+    _lazy_field = "validation_result"
+    
     success: bool
     transformed_data: Dict[str, Any]
     xml_wrapper: str
@@ -36,13 +62,18 @@ class ParetoLangXMLSchema:
     version: str = "1.0.0-pareto-xml"
     spec: str = "PARETO-XML-TRANSFORM-001"
     
-    def to_xml_element(self, data: Dict[str, Any]) -> ET.Element:
-        """Convert Pareto-Lang data to XML element."""
+    def root_element(self, timestamp: Optional[str] = None) -> ET.Element:
+        """Create the bare Pareto-Lang wrapper root element."""
         root = ET.Element(self.wrapper_tag)
         root.set("version", self.version)
         root.set("spec", self.spec)
-        root.set("timestamp", datetime.now().isoformat())
+        root.set("timestamp", timestamp or datetime.now().isoformat())
         root.set("language", "pareto_lang")
+        return root
+    
+    def to_xml_element(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> ET.Element:
+        """Convert Pareto-Lang data to XML element."""
+        root = self.root_element(timestamp)
         
         # Add metadata
         metadata = ET.SubElement(root, "metadata")
@@ -114,6 +145,57 @@ class ParetoLangXMLSchema:
         
         return root
     
+    def to_xml_string(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> str:
+        """Serialize Pareto-Lang data straight to XML text without building a tree.
+        
+        The output is identical to ``ET.tostring(self.to_xml_element(data),
+        encoding='unicode')``; data the direct writer cannot reproduce falls
+        back to the ElementTree path.
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        buffer = io.StringIO()
+        try:
+            self.write_xml(buffer.write, data, timestamp)
+        except DirectXMLUnsupported:
+            return ET.tostring(self.to_xml_element(data, timestamp), encoding='unicode')
+        return buffer.getvalue()
+    
+    def write_xml(self, write: Callable[[str], Any], data: Dict[str, Any],
+                  timestamp: Optional[str] = None):
+        """Write Pareto-Lang data as XML text through ``write`` without building a tree."""
+        root_attributes = format_attributes((
+            ("version", self.version),
+            ("spec", self.spec),
+            ("timestamp", timestamp or datetime.now().isoformat()),
+            ("language", "pareto_lang")
+        ))
+        schema_attributes = format_attributes((("type", "pareto-lang-semantic"), ("version", self.version)))
+        write(
+            f"<{self.wrapper_tag}{root_attributes}>"
+            f"<metadata><schema{schema_attributes} />"
+            '<validation type="pareto-lang-validation" pareto_optimal="true" /></metadata>'
+            '<transformations applied="true" xml_wrapping="true" optimization_preservation="true" />'
+        )
+        
+        # Add Pareto-Lang content
+        if any(section in data for section in ("optimizations", "resources", "constraints", "ai_integration")):
+            write("<pareto-lang-content>")
+            if "optimizations" in data:
+                write_section(write, "optimizations", "optimization", data["optimizations"],
+                              list_children={"constraints": "constraint"})
+            if "resources" in data:
+                write_section(write, "resources", "resource", data["resources"])
+            if "constraints" in data:
+                write_section(write, "constraints", "constraint", data["constraints"],
+                              list_children={"conditions": "condition"})
+            if "ai_integration" in data:
+                write_ai_integration(write, data["ai_integration"])
+            write("</pareto-lang-content>")
+        else:
+            write("<pareto-lang-content />")
+        
+        write(f"</{self.wrapper_tag}>")
+    
     def from_xml_element(self, xml_element: ET.Element) -> Dict[str, Any]:
         """Convert XML element back to Pareto-Lang data."""
         pareto_data = {}
@@ -125,95 +207,236 @@ class ParetoLangXMLSchema:
             # Parse optimizations
             optimizations_elem = content_elem.find("optimizations")
             if optimizations_elem is not None:
-                optimizations = []
-                for optimization_elem in optimizations_elem.findall("optimization"):
-                    optimization = {}
-                    for key, value in optimization_elem.attrib.items():
-                        if key == "constraints":
-                            # Handle constraints specially
-                            constraints_elem = optimization_elem.find("constraints")
-                            if constraints_elem is not None:
-                                constraints = []
-                                for constraint_elem in constraints_elem.findall("constraint"):
-                                    constraint = {}
-                                    for c_key, c_value in constraint_elem.attrib.items():
-                                        constraint[c_key] = c_value
-                                    constraints.append(constraint)
-                            optimization[key] = constraints
-                        else:
-                            optimization[key] = value
-                    optimizations.append(optimization)
-                pareto_data["optimizations"] = optimizations
+                pareto_data["optimizations"] = [
+                    self._optimization_from_element(optimization_elem)
+                    for optimization_elem in optimizations_elem.findall("optimization")
+                ]
             
             # Parse resources
             resources_elem = content_elem.find("resources")
             if resources_elem is not None:
-                resources = []
-                for resource_elem in resources_elem.findall("resource"):
-                    resource = {}
-                    for key, value in resource_elem.attrib.items():
-                        resource[key] = value
-                    resources.append(resource)
-                pareto_data["resources"] = resources
+                pareto_data["resources"] = [
+                    self._resource_from_element(resource_elem)
+                    for resource_elem in resources_elem.findall("resource")
+                ]
             
             # Parse constraints
             constraints_elem = content_elem.find("constraints")
             if constraints_elem is not None:
-                constraints = []
-                for constraint_elem in constraints_elem.findall("constraint"):
-                    constraint = {}
-                    for key, value in constraint_elem.attrib.items():
-                        if key == "conditions":
-                            # Handle conditions specially
-                            conditions_elem = constraint_elem.find("conditions")
-                            if conditions_elem is not None:
-                                conditions = []
-                                for condition_elem in conditions_elem.findall("condition"):
-                                    condition = {}
-                                    for cond_key, cond_value in condition_elem.attrib.items():
-                                        condition[cond_key] = cond_value
-                                    conditions.append(condition)
-                            constraint[key] = conditions
-                        else:
-                            constraint[key] = value
-                    constraints.append(constraint)
-                pareto_data["constraints"] = constraints
+                pareto_data["constraints"] = [
+                    self._constraint_from_element(constraint_elem)
+                    for constraint_elem in constraints_elem.findall("constraint")
+                ]
             
             # Parse AI integration
             ai_integration_elem = content_elem.find("ai-integration")
             if ai_integration_elem is not None:
-                ai_integration = {}
-                for key, value in ai_integration_elem.attrib.items():
-                    ai_integration[key] = value
-                
-                # Parse sub-elements
-                for sub_elem in ai_integration_elem:
-                    sub_data = {}
-                    for sub_key, sub_value in sub_elem.attrib.items():
-                        sub_data[sub_key] = sub_value
-                    ai_integration[sub_elem.tag] = sub_data
-                
-                pareto_data["ai_integration"] = ai_integration
+                pareto_data["ai_integration"] = self._ai_integration_from_element(ai_integration_elem)
         
         return pareto_data
+    
+    def from_xml_source(self, source: Union[str, Path, IO[bytes]],
+                        on_root: Optional[Callable[[ET.Element], bool]] = None) -> Dict[str, Any]:
+        """Convert a Pareto-Lang XML wrapper file back to Pareto-Lang data with bounded memory.
+        
+        Produces the same dictionary as ``from_xml_element`` for the same document.
+        """
+        sections = {}
+        for section, record in self._iterparse_sections(source, on_root):
+            if section == "ai_integration":
+                sections[section] = record
+            elif record is None:
+                sections[section] = []
+            else:
+                sections[section].append(record)
+        
+        return {key: sections[key] for key in self._SECTION_ORDER if key in sections}
+    
+    def iter_xml_records(self, source: Union[str, Path, IO[bytes]],
+                         on_root: Optional[Callable[[ET.Element], bool]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Incrementally yield ``(section, record)`` pairs from a Pareto-Lang XML wrapper file.
+        
+        Each optimization, resource and constraint is yielded as soon as its
+        element closes and is then released from the tree.
+        """
+        for section, record in self._iterparse_sections(source, on_root):
+            if record is not None:
+                yield section, record
+    
+    # Section containers inside <pareto-lang-content> and the record tag streamed from each
+    _STREAM_SECTIONS = {
+        "optimizations": ("optimizations", "optimization"),
+        "resources": ("resources", "resource"),
+        "constraints": ("constraints", "constraint"),
+    }
+    _SECTION_ORDER = ("optimizations", "resources", "constraints", "ai_integration")
+    
+    def _iterparse_sections(self, source: Union[str, Path, IO[bytes]],
+                            on_root: Optional[Callable[[ET.Element], bool]] = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Walk a Pareto-Lang XML wrapper with ``iterparse``.
+        
+        Yields ``(section, None)`` when a section opens, ``(section, record)`` for
+        every converted record and ``("ai_integration", data)`` once. Only the
+        first content/section elements are read, mirroring ``find``. Finished
+        elements are detached from their parents so the tree never grows past a
+        single record. ``on_root`` receives the root element on open; returning
+        False stops parsing.
+        """
+        converters = {
+            "optimizations": self._optimization_from_element,
+            "resources": self._resource_from_element,
+            "constraints": self._constraint_from_element,
+        }
+        stack = []
+        content_elem = None
+        active_section = None
+        ai_integration_elem = None
+        seen_sections = set()
+        
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                depth = len(stack)
+                stack.append(elem)
+                
+                if depth == 0:
+                    if on_root is not None and on_root(elem) is False:
+                        return
+                elif depth == 1:
+                    if elem.tag == "pareto-lang-content" and content_elem is None:
+                        content_elem = elem
+                elif depth == 2 and stack[1] is content_elem and elem.tag not in seen_sections:
+                    seen_sections.add(elem.tag)
+                    if elem.tag in self._STREAM_SECTIONS:
+                        active_section = elem
+                        yield self._STREAM_SECTIONS[elem.tag][0], None
+                    elif elem.tag == "ai-integration":
+                        ai_integration_elem = elem
+                continue
+            
+            stack.pop()
+            depth = len(stack)
+            if depth == 0:
+                continue
+            parent = stack[-1]
+            
+            if depth == 3 and parent is active_section:
+                section, record_tag = self._STREAM_SECTIONS[parent.tag]
+                if elem.tag == record_tag:
+                    yield section, converters[section](elem)
+            elif elem is ai_integration_elem:
+                yield "ai_integration", self._ai_integration_from_element(elem)
+            
+            if elem is active_section:
+                active_section = None
+            
+            # Release finished elements; record subtrees (and ai-integration
+            # children) stay attached until their owner closes
+            if depth <= 2 or (depth == 3 and parent is not ai_integration_elem):
+                elem.clear()
+                parent.remove(elem)
+    
+    def _optimization_from_element(self, optimization_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <optimization> element back to a Pareto-Lang optimization."""
+        optimization = {}
+        for key, value in optimization_elem.attrib.items():
+            if key == "constraints":
+                # Handle constraints specially
+                constraints_elem = optimization_elem.find("constraints")
+                if constraints_elem is not None:
+                    value = [dict(constraint_elem.attrib)
+                             for constraint_elem in constraints_elem.findall("constraint")]
+            optimization[key] = value
+        return optimization
+    
+    def _resource_from_element(self, resource_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <resource> element back to a Pareto-Lang resource."""
+        return dict(resource_elem.attrib)
+    
+    def _constraint_from_element(self, constraint_elem: ET.Element) -> Dict[str, Any]:
+        """Convert a single <constraint> element back to a Pareto-Lang constraint."""
+        constraint = {}
+        for key, value in constraint_elem.attrib.items():
+            if key == "conditions":
+                # Handle conditions specially
+                conditions_elem = constraint_elem.find("conditions")
+                if conditions_elem is not None:
+                    value = [dict(condition_elem.attrib)
+                             for condition_elem in conditions_elem.findall("condition")]
+            constraint[key] = value
+        return constraint
+    
+    def _ai_integration_from_element(self, ai_integration_elem: ET.Element) -> Dict[str, Any]:
+        """Convert the <ai-integration> element back to Pareto-Lang AI integration data."""
+        ai_integration = dict(ai_integration_elem.attrib)
+        
+        # Parse sub-elements
+        for sub_elem in ai_integration_elem:
+            ai_integration[sub_elem.tag] = dict(sub_elem.attrib)
+        
+        return ai_integration
 
 class ParetoLangXMLTransformer:
     """Pareto-Lang-specific XML transformation processor."""
     
-    def __init__(self):
+    def __init__(self, history_size: int = 100, validation_mode: str = "structural-on-tree",
+                 xml_serializer: str = "direct", wrap_cache: Optional[WrapCache] = None):
+        if validation_mode not in XML_VALIDATION_MODES:
+            raise ValueError(f"Unsupported XML validation mode: {validation_mode}")
+        if xml_serializer not in XML_SERIALIZERS:
+            raise ValueError(f"Unsupported XML serializer: {xml_serializer}")
+        
         self.xml_schema = ParetoLangXMLSchema()
-        self.transformation_history = []
+        self.transformation_metrics = MetricsRecorder(history_size)
+        self.transformation_plan = self._load_transformation_plan()
         self.validation_rules = self._load_transformation_rules()
-        
+        self.data_validator = self._load_data_validator()
+        self.validation_mode = validation_mode
+        self.xml_serializer = xml_serializer
+        self.wrap_cache = wrap_cache
+        
+    @property
+    def transformation_history(self):
+        """Most recent transformation records (bounded by ``history_size``)."""
+        return self.transformation_metrics.recent_records
+    
+    # Transformation rule name -> semantic data section, in application order
+    _TRANSFORMATION_RULE_SECTIONS = {
+        "optimization_wrapping": "optimizations",
+        "resource_wrapping": "resources",
+        "constraint_wrapping": "constraints",
+        "ai_integration_wrapping": "ai_integration",
+    }
+    
+    def _load_transformation_plan(self) -> TransformationPlan:
+        """Load the compiled Pareto-Lang transformation plan (shared across instances)."""
+        rules_path = Path(__file__).parent / "pareto_config" / "transformation_rules.json"
+        return load_transformation_plan(
+            "pareto_lang", rules_path, self._TRANSFORMATION_RULE_SECTIONS,
+            self._get_default_transformation_rules
+        )
+    
     def _load_transformation_rules(self) -> Dict[str, Any]:
         """Load Pareto-Lang XML transformation rules."""
-        rules_path = Path(__file__).parent / "pareto_config" / "transformation_rules.json"
-        try:
-            with open(rules_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning("Pareto-Lang transformation rules not found, using defaults")
-            return self._get_default_transformation_rules()
+        return copy.deepcopy(self.transformation_plan.rules)
+    
+    def _load_data_validator(self) -> SchemaValidator:
+        """Load the compiled Pareto-Lang data validator (shared across instances)."""
+        schema_path = Path(__file__).parent.parent / "config" / "schemas.json"
+        return load_schema_validator(
+            schema_path, "#/semantic_language_schemas/pareto_lang_schema",
+            self._get_default_data_schema, name="Pareto-Lang"
+        )
+    
+    def _get_default_data_schema(self) -> Dict[str, Any]:
+        """Get the default Pareto-Lang data schema (section and record shapes only)."""
+        return {
+            "type": "object",
+            "properties": {
+                "optimizations": {"type": "array", "items": {"type": "object"}},
+                "resources": {"type": "array", "items": {"type": "object"}},
+                "constraints": {"type": "array", "items": {"type": "object"}}
+            }
+        }
     
     def _get_default_transformation_rules(self) -> Dict[str, Any]:
         """Get default Pareto-Lang XML transformation rules."""
@@ -255,77 +478,128 @@ class ParetoLangXMLTransformer:
     def wrap_pareto_lang_with_xml(self, pareto_data: Dict[str, Any], 
                                      context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
         """Wrap Pareto-Lang semantic data with XML transformation."""
+        return self._wrap_pareto_lang(pareto_data, context, to_element=False)[1]
+    
+    def wrap_to_element(self, pareto_data: Dict[str, Any],
+                        context: Optional[Dict[str, Any]] = None) -> Tuple[Optional[ET.Element], XMLTransformationResult]:
+        """Wrap Pareto-Lang semantic data into an XML element without serializing it.
+        
+        Returns the wrapper element (None on failure) and the transformation
+        result, whose ``xml_wrapper`` is left empty. Lets callers compose
+        larger trees without a serialize/parse round trip; the wrap cache is
+        bypassed.
+        """
+        return self._wrap_pareto_lang(pareto_data, context, to_element=True)
+    
+    def _wrap_pareto_lang(self, pareto_data: Dict[str, Any], context: Optional[Dict[str, Any]],
+                         to_element: bool) -> Tuple[Optional[ET.Element], XMLTransformationResult]:
+        """Wrap Pareto-Lang data as an XML string or element."""
         start_time = time.time()
         
         try:
+            # Serve repeated inputs from the wrap cache
+            cache_key = None
+            if self.wrap_cache is not None and not to_element:
+                cache_key = self._wrap_cache_key(pareto_data)
+                cached_entry = self.wrap_cache.get(cache_key)
+                if cached_entry is not None:
+                    return None, self._cached_wrap_result(pareto_data, cached_entry, context, start_time)
+            
             # Validate Pareto-Lang data before transformation
             validation_result = self._validate_pareto_lang_data(pareto_data)
             
             if not validation_result["valid"]:
-                return XMLTransformationResult(
+                return None, XMLTransformationResult(
                     success=False,
                     transformed_data={},
                     xml_wrapper="",
                     transformation_time=time.time() - start_time,
                     optimization_preserved=False,
                     validation_result=validation_result,
-                    metadata={"error": "Pareto-Lang validation failed"}
+                    metadata=intern_metadata(error="Pareto-Lang validation failed")
                 )
             
             # Create XML wrapper
-            xml_element = self.xml_schema.to_xml_element(pareto_data)
-            xml_string = ET.tostring(xml_element, encoding='unicode')
+            if to_element:
+                xml_element, xml_string = self.xml_schema.to_xml_element(pareto_data), ""
+            else:
+                xml_element, xml_string = self._build_xml_wrapper(pareto_data)
+            
+            # Validate XML wrapper according to the configured validation mode
+            xml_validation = self._validate_built_xml(xml_element, xml_string)
+            
+            if cache_key is not None:
+                self.wrap_cache.put(
+                    cache_key,
+                    TimestampTemplate.from_xml(xml_string, (self.xml_schema.wrapper_tag,)),
+                    copy.deepcopy({"pareto_lang_validation": validation_result, "xml_validation": xml_validation})
+                )
             
             # Store transformation history
             transformation_record = {
                 "timestamp": datetime.now().isoformat(),
                 "transformation_type": "pareto_lang_to_xml",
                 "context": context,
-                "success": True
+                "success": True,
+                "transformation_time": time.time() - start_time
             }
-            self.transformation_history.append(transformation_record)
-            
-            # Validate XML wrapper
-            xml_validation = self._validate_xml_wrapper(xml_string)
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
+            )
             
-            return XMLTransformationResult(
+            return (xml_element if to_element else None), XMLTransformationResult.with_lazy_field(
+                ("pareto_lang_validation", "xml_validation"), (validation_result, xml_validation),
                 success=True,
                 transformed_data=pareto_data,
                 xml_wrapper=xml_string,
                 transformation_time=time.time() - start_time,
                 optimization_preserved=True,
-                validation_result={
-                    "pareto_lang_validation": validation_result,
-                    "xml_validation": xml_validation
-                },
-                metadata={
-                    "transformation_applied": True,
-                    "context_applied": context is not None,
-                    "optimization_preservation": True,
-                    "xml_schema_version": self.xml_schema.version
-                }
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    optimization_preservation=True,
+                    xml_schema_version=self.xml_schema.version,
+                    xml_validation_mode=self.validation_mode,
+                    xml_serializer=self.xml_serializer,
+                    cache_hit=False
+                )
             )
             
         except Exception as e:
             logger.error(f"Failed to wrap Pareto-Lang with XML: {e}")
-            return XMLTransformationResult(
+            return None, XMLTransformationResult(
                 success=False,
                 transformed_data={},
                 xml_wrapper="",
                 transformation_time=time.time() - start_time,
                 optimization_preserved=False,
                 validation_result={"error": str(e)},
-                metadata={"exception": str(e)}
+                metadata=FrozenMetadata(exception=str(e))
             )
     
     def unwrap_xml_to_pareto_lang(self, xml_wrapper: str, 
                                      context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
         """Unwrap XML wrapper back to Pareto-Lang semantic data."""
+        return self._unwrap_to_pareto_lang(xml_wrapper, None, context)
+    
+    def unwrap_from_element(self, xml_element: ET.Element,
+                            context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
+        """Unwrap an already parsed Pareto-Lang XML element back to Pareto-Lang semantic data.
+        
+        Skips the serialize/parse round trip for callers holding a tree; the
+        result's ``xml_wrapper`` is left empty.
+        """
+        return self._unwrap_to_pareto_lang("", xml_element, context)
+    
+    def _unwrap_to_pareto_lang(self, xml_wrapper: str, xml_element: Optional[ET.Element],
+                              context: Optional[Dict[str, Any]]) -> XMLTransformationResult:
+        """Unwrap Pareto-Lang XML from a string or a parsed element."""
         start_time = time.time()
         
         try:
             # Parse XML
-            xml_element = ET.fromstring(xml_wrapper)
+            if xml_element is None:
+                xml_element = ET.fromstring(xml_wrapper)
             
             # Validate XML element
             xml_validation = self._validate_xml_element(xml_element)
@@ -338,40 +612,40 @@ class ParetoLangXMLTransformer:
                     transformation_time=time.time() - start_time,
                     optimization_preserved=False,
                     validation_result=xml_validation,
-                    metadata={"error": "XML validation failed"}
+                    metadata=intern_metadata(error="XML validation failed")
                 )
             
             # Extract Pareto-Lang data
             pareto_data = self.xml_schema.from_xml_element(xml_element)
             
             # Validate extracted Pareto-Lang data
-            pareto_validation = self._validate_pareto_lang_data(pareto_data)
+            pareto_validation = self._validate_pareto_lang_data(pareto_data, warnings=False)
             
             # Store transformation history
             transformation_record = {
                 "timestamp": datetime.now().isoformat(),
                 "transformation_type": "xml_to_pareto_lang",
                 "context": context,
-                "success": True
+                "success": True,
+                "transformation_time": time.time() - start_time
             }
-            self.transformation_history.append(transformation_record)
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
+            )
             
-            return XMLTransformationResult(
+            return XMLTransformationResult.with_lazy_field(
+                ("xml_validation", "pareto_lang_validation"), (xml_validation, pareto_validation),
                 success=True,
                 transformed_data=pareto_data,
                 xml_wrapper=xml_wrapper,
                 transformation_time=time.time() - start_time,
                 optimization_preserved=True,
-                validation_result={
-                    "xml_validation": xml_validation,
-                    "pareto_lang_validation": pareto_validation
-                },
-                metadata={
-                    "transformation_applied": True,
-                    "context_applied": context is not None,
-                    "optimization_preservation": True,
-                    "xml_schema_version": xml_element.get("version", self.xml_schema.version)
-                }
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    optimization_preservation=True,
+                    xml_schema_version=xml_element.get("version", self.xml_schema.version)
+                )
             )
             
         except Exception as e:
@@ -383,84 +657,124 @@ class ParetoLangXMLTransformer:
                 transformation_time=time.time() - start_time,
                 optimization_preserved=False,
                 validation_result={"error": str(e)},
-                metadata={"exception": str(e)}
+                metadata=FrozenMetadata(exception=str(e))
             )
     
-    def apply_pareto_transformation_rules(self, pareto_data: Dict[str, Any], 
-                                            transformation_rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply Pareto-Lang-specific transformation rules."""
-        transformed_data = pareto_data.copy()
-        
-        # Apply optimization transformation rules
-        if transformation_rules.get("optimization_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_optimization_transformation_rules(
-                transformed_data, transformation_rules["optimization_wrapping"]
-            )
+    def unwrap_xml_source_to_pareto_lang(self, source: Union[str, Path, IO[bytes]],
+                                  context: Optional[Dict[str, Any]] = None) -> XMLTransformationResult:
+        """Unwrap a Pareto-Lang XML wrapper file or stream back to Pareto-Lang semantic data.
+        
+        The document is streamed with ``iterparse`` rather than loaded whole, so
+        large exports unwrap with bounded memory. ``source`` is a file path or a
+        binary file-like object; the data matches ``unwrap_xml_to_pareto_lang``.
+        """
+        start_time = time.time()
+        source_name = str(source) if isinstance(source, (str, Path)) else ""
+        root_info = {}
         
-        # Apply resource transformation rules
-        if transformation_rules.get("resource_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_resource_transformation_rules(
-                transformed_data, transformation_rules["resource_wrapping"]
-            )
+        def check_root(root: ET.Element) -> bool:
+            root_info["xml_validation"] = self._validate_xml_element(root)
+            root_info["version"] = root.get("version", self.xml_schema.version)
+            return root_info["xml_validation"]["valid"]
         
-        # Apply constraint transformation rules
-        if transformation_rules.get("constraint_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_constraint_transformation_rules(
-                transformed_data, transformation_rules["constraint_wrapping"]
+        try:
+            # Stream Pareto-Lang data out of the XML source
+            pareto_data = self.xml_schema.from_xml_source(source, check_root)
+            xml_validation = root_info["xml_validation"]
+            
+            if not xml_validation["valid"]:
+                return XMLTransformationResult(
+                    success=False,
+                    transformed_data={},
+                    xml_wrapper=source_name,
+                    transformation_time=time.time() - start_time,
+                    optimization_preserved=False,
+                    validation_result=xml_validation,
+                    metadata=intern_metadata(error="XML validation failed")
+                )
+            
+            # Validate extracted Pareto-Lang data
+            pareto_lang_validation = self._validate_pareto_lang_data(pareto_data, warnings=False)
+            
+            # Store transformation history
+            transformation_record = {
+                "timestamp": datetime.now().isoformat(),
+                "transformation_type": "xml_source_to_pareto_lang",
+                "context": context,
+                "success": True,
+                "transformation_time": time.time() - start_time
+            }
+            self.transformation_metrics.record(
+                transformation_record["transformation_time"], True, transformation_record
             )
-        
-        # Apply AI integration transformation rules
-        if transformation_rules.get("ai_integration_wrapping", {}).get("enabled", True):
-            transformed_data = self._apply_ai_integration_transformation_rules(
-                transformed_data, transformation_rules["ai_integration_wrapping"]
+            
+            return XMLTransformationResult.with_lazy_field(
+                ("xml_validation", "pareto_lang_validation"), (xml_validation, pareto_lang_validation),
+                success=True,
+                transformed_data=pareto_data,
+                xml_wrapper=source_name,
+                transformation_time=time.time() - start_time,
+                optimization_preserved=True,
+                metadata=intern_metadata(
+                    transformation_applied=True,
+                    context_applied=context is not None,
+                    optimization_preservation=True,
+                    streamed=True,
+                    xml_schema_version=root_info["version"]
+                )
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to unwrap XML source to Pareto-Lang: {e}")
+            return XMLTransformationResult(
+                success=False,
+                transformed_data={},
+                xml_wrapper=source_name,
+                transformation_time=time.time() - start_time,
+                optimization_preserved=False,
+                validation_result={"error": str(e)},
+                metadata=FrozenMetadata(exception=str(e))
             )
-        
-        return transformed_data
     
-    def _validate_pareto_lang_data(self, pareto_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate Pareto-Lang semantic data."""
-        validation_result = {"valid": True, "errors": [], "warnings": []}
+    def iter_unwrap_xml_to_pareto_lang(self, source: Union[str, Path, IO[bytes]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(section, record)`` pairs from a Pareto-Lang XML wrapper file or stream.
         
-        # Basic structure validation
-        if not isinstance(pareto_data, dict):
-            validation_result["valid"] = False
-            validation_result["errors"].append("Pareto-Lang data must be a dictionary")
-            return validation_result
+        Raises ValueError when the root element is not a valid Pareto-Lang wrapper.
+        """
+        def check_root(root: ET.Element) -> bool:
+            xml_validation = self._validate_xml_element(root)
+            if not xml_validation["valid"]:
+                raise ValueError(f"XML validation failed: {xml_validation['errors']}")
+            return True
         
-        # Validate optimizations if present
-        if "optimizations" in pareto_data:
-            if not isinstance(pareto_data["optimizations"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("Pareto-Lang optimizations must be a list")
-            else:
-                for i, optimization in enumerate(pareto_data["optimizations"]):
-                    if not isinstance(optimization, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"Pareto-Lang optimization {i} must be a dictionary")
-        
-        # Validate resources if present
-        if "resources" in pareto_data:
-            if not isinstance(pareto_data["resources"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("Pareto-Lang resources must be a list")
-            else:
-                for i, resource in enumerate(pareto_data["resources"]):
-                    if not isinstance(resource, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"Pareto-Lang resource {i} must be a dictionary")
-        
-        # Validate constraints if present
-        if "constraints" in pareto_data:
-            if not isinstance(pareto_data["constraints"], list):
-                validation_result["valid"] = False
-                validation_result["errors"].append("Pareto-Lang constraints must be a list")
-            else:
-                for i, constraint in enumerate(pareto_data["constraints"]):
-                    if not isinstance(constraint, dict):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"Pareto-Lang constraint {i} must be a dictionary")
+        return self.xml_schema.iter_xml_records(source, check_root)
+    
+    def apply_pareto_transformation_rules(self, pareto_data: Dict[str, Any], 
+                                            transformation_rules: Optional[Union[Dict[str, Any], TransformationPlan]] = None) -> Dict[str, Any]:
+        """Apply Pareto-Lang-specific transformation rules.
+        
+        Uses the compiled plan for the loaded rules by default; an explicit
+        rules dict is compiled on the fly.
+        """
+        plan = transformation_rules
+        if plan is None:
+            plan = self.transformation_plan
+        elif not isinstance(plan, TransformationPlan):
+            plan = compile_transformation_rules(
+                "pareto_lang", {"transformation_rules": plan}, self._TRANSFORMATION_RULE_SECTIONS
+            )
         
-        return validation_result
+        return plan.apply(pareto_data)
+    
+    def _validate_pareto_lang_data(self, pareto_data: Dict[str, Any], warnings: bool = True) -> Dict[str, Any]:
+        """Validate Pareto-Lang semantic data against the compiled schema.
+        
+        Structural violations are errors; value-level violations are
+        warnings. ``violations`` lists each with its path and keyword.
+        Unwrapped data is checked with ``warnings=False``: XML attributes
+        come back as strings, so value-level rules would flag every scalar.
+        """
+        return self.data_validator.validate(pareto_data, "Pareto-Lang", warnings)
     
     def _validate_xml_wrapper(self, xml_string: str) -> Dict[str, Any]:
         """Validate XML wrapper."""
@@ -497,6 +811,75 @@ class ParetoLangXMLTransformer:
         
         return validation_result
     
+    def _wrap_cache_key(self, pareto_data: Dict[str, Any]) -> str:
+        """Content hash of Pareto-Lang input plus everything that shapes its wrapper."""
+        return canonical_content_key(
+            "pareto_lang", pareto_data, self.xml_schema.wrapper_tag, self.xml_schema.version,
+            self.xml_schema.spec, self.validation_mode
+        )
+    
+    def _cached_wrap_result(self, pareto_data: Dict[str, Any], cached_entry: WrapCacheEntry,
+                            context: Optional[Dict[str, Any]], start_time: float) -> XMLTransformationResult:
+        """Build a wrap result from a cache entry, re-stamped with the current time."""
+        xml_string = cached_entry.template.render(datetime.now().isoformat())
+        
+        # Store transformation history
+        transformation_record = {
+            "timestamp": datetime.now().isoformat(),
+            "transformation_type": "pareto_lang_to_xml",
+            "context": context,
+            "success": True,
+            "cache_hit": True,
+            "transformation_time": time.time() - start_time
+        }
+        self.transformation_metrics.record(
+            transformation_record["transformation_time"], True, transformation_record
+        )
+        
+        return XMLTransformationResult(
+            success=True,
+            transformed_data=pareto_data,
+            xml_wrapper=xml_string,
+            transformation_time=time.time() - start_time,
+            optimization_preserved=True,
+            validation_result=copy.deepcopy(cached_entry.payload),
+            metadata=intern_metadata(
+                transformation_applied=True,
+                context_applied=context is not None,
+                optimization_preservation=True,
+                xml_schema_version=self.xml_schema.version,
+                xml_validation_mode=self.validation_mode,
+                xml_serializer=self.xml_serializer,
+                cache_hit=True
+            )
+        )
+    
+    def _build_xml_wrapper(self, pareto_data: Dict[str, Any]) -> Tuple[ET.Element, str]:
+        """Serialize a wrapper with the configured serializer.
+        
+        Returns the element to validate and the XML text; with the direct
+        serializer the element is the root start tag parsed back from the
+        text, so structural validation checks what was emitted.
+        """
+        if self.xml_serializer == "direct":
+            xml_string = self.xml_schema.to_xml_string(pareto_data, datetime.now().isoformat())
+            return parse_root_start(xml_string), xml_string
+        
+        xml_element = self.xml_schema.to_xml_element(pareto_data)
+        return xml_element, ET.tostring(xml_element, encoding='unicode')
+    
+    def _validate_built_xml(self, xml_element: ET.Element, xml_string: str) -> Dict[str, Any]:
+        """Validate a freshly built XML wrapper according to ``validation_mode``.
+        
+        ``structural-on-tree`` checks the in-memory element, ``full-reparse``
+        parses the serialized string again and ``none`` skips validation.
+        """
+        if self.validation_mode == "none":
+            return {"valid": True, "errors": [], "warnings": [], "skipped": True}
+        if self.validation_mode == "full-reparse":
+            return self._validate_xml_wrapper(xml_string or ET.tostring(xml_element, encoding='unicode'))
+        return self._validate_xml_element(xml_element)
+    
     def _validate_xml_element(self, xml_element: ET.Element) -> Dict[str, Any]:
         """Validate XML element."""
         validation_result = {"valid": True, "errors": [], "warnings": []}
@@ -524,74 +907,47 @@ class ParetoLangXMLTransformer:
         
         return validation_result
     
-    def _apply_optimization_transformation_rules(self, pareto_data: Dict[str, Any], 
-                                                  rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply optimization transformation rules."""
-        # Placeholder for optimization transformation logic
-        # In production, this would apply specific optimization transformation rules
-        return pareto_data
-    
-    def _apply_resource_transformation_rules(self, pareto_data: Dict[str, Any], 
-                                                 rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply resource transformation rules."""
-        # Placeholder for resource transformation logic
-        # In production, this would apply specific resource transformation rules
-        return pareto_data
-    
-    def _apply_constraint_transformation_rules(self, pareto_data: Dict[str, Any], 
-                                                 rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply constraint transformation rules."""
-        # Placeholder for constraint transformation logic
-        # In production, this would apply specific constraint transformation rules
-        return pareto_data
-    
-    def _apply_ai_integration_transformation_rules(self, pareto_data: Dict[str, Any], 
-                                                      rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply AI integration transformation rules."""
-        # Placeholder for AI integration transformation logic
-        # In production, this would apply specific AI integration transformation rules
-        return pareto_data
-    
     def get_transformation_status(self) -> Dict[str, Any]:
         """Get Pareto-Lang XML transformation status."""
         return {
             "status": "active",
             "xml_schema": asdict(self.xml_schema),
             "transformation_rules": self.validation_rules,
-            "transformation_history_size": len(self.transformation_history),
+            "transformation_plan_digest": self.transformation_plan.digest,
+            "xml_validation_mode": self.validation_mode,
+            "xml_serializer": self.xml_serializer,
+            "wrap_cache": self.wrap_cache.get_stats() if self.wrap_cache is not None else {"enabled": False},
+            "transformation_history_size": self.transformation_metrics.count,
             "performance_metrics": self._get_performance_metrics()
         }
     
     def _get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for Pareto-Lang XML transformations."""
-        if not self.transformation_history:
+        if not self.transformation_metrics.count:
             return {"status": "no_transformations_performed"}
         
-        transformation_times = [
-            record.get("transformation_time", 0) 
-            for record in self.transformation_history
-            if "transformation_time" in record
-        ]
-        
-        successful_transformations = [
-            record for record in self.transformation_history
-            if record.get("success", False)
-        ]
+        summary = self.transformation_metrics.summary()
         
         return {
-            "total_transformations": len(self.transformation_history),
-            "successful_transformations": len(successful_transformations),
-            "success_rate": len(successful_transformations) / len(self.transformation_history),
-            "average_transformation_time": (
-                sum(transformation_times) / len(transformation_times) 
-                if transformation_times else 0
-            ),
-            "last_transformation": self.transformation_history[-1] if self.transformation_history else None
+            "total_transformations": summary["count"],
+            "successful_transformations": summary["success_count"],
+            "success_rate": summary["success_rate"],
+            "average_transformation_time": summary["mean_time"],
+            "min_transformation_time": summary["min_time"],
+            "max_transformation_time": summary["max_time"],
+            "transformation_time_percentiles": {
+                "p50": summary["p50"],
+                "p95": summary["p95"],
+                "p99": summary["p99"]
+            },
+            "last_transformation": self.transformation_metrics.last_record
         }
 
 # Export main classes
 __all__ = [
     'ParetoLangXMLTransformer',
     'ParetoLangXMLSchema',
-    'XMLTransformationResult'
+    'XMLTransformationResult',
+    'XML_VALIDATION_MODES',
+    'XML_SERIALIZERS'
 ]
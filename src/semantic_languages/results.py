@@ -0,0 +1,123 @@
+"""
+FSL Continuum - Compact Result Types
+
+Building blocks for the slotted, frozen result classes returned by the BAML,
+Pareto-Lang and unified XML processors. Result instances carry no per-instance
+``__dict__``, constant metadata dictionaries are interned and shared between
+results, and validation summaries can be assembled on first access instead of
+on every wrap. Results stay dataclasses, so ``dataclasses.asdict`` keeps
+working.
+"""
+
+import logging
+from dataclasses import fields
+from typing import Dict, Optional, Any, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class FrozenMetadata(dict):
+    """Read-only metadata dictionary shared between results.
+
+    Mutating methods raise ``TypeError``; use ``dict(metadata)`` for a
+    private, mutable copy.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Result metadata is shared and read-only; copy it with dict() to modify it")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenMetadata, (dict(self),))
+
+    def __copy__(self) -> "FrozenMetadata":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenMetadata":
+        return self
+
+# (key, value, type) items -> shared metadata instance
+_interned_metadata: Dict[Tuple[Tuple[str, Any, type], ...], FrozenMetadata] = {}
+_MAX_INTERNED_METADATA = 4096
+
+def intern_metadata(**items: Any) -> FrozenMetadata:
+    """Get the shared read-only metadata dictionary for the given items.
+
+    Metadata with unhashable values, or seen once the intern table is full,
+    is returned as a fresh read-only dictionary.
+    """
+    key = tuple((name, value, type(value)) for name, value in items.items())
+    try:
+        metadata = _interned_metadata.get(key)
+    except TypeError:
+        return FrozenMetadata(items)
+
+    if metadata is None:
+        metadata = FrozenMetadata(items)
+        if len(_interned_metadata) < _MAX_INTERNED_METADATA:
+            _interned_metadata[key] = metadata
+    return metadata
+
+class SlottedResult:
+    """Mixin for frozen result dataclasses that declare their own ``__slots__``.
+
+    Subclasses name the field that may be materialized lazily in
+    ``_lazy_field`` and reserve a ``_lazy_parts`` slot for it; see
+    ``with_lazy_field``. ``_build_lazy_field`` turns the parts into the field
+    value and may be overridden to defer per-value work as well. Pickling and
+    copying materialize the field first.
+    """
+    __slots__ = ()
+    _lazy_field: Optional[str] = None
+
+    @classmethod
+    def with_lazy_field(cls, lazy_keys: Tuple[str, ...], lazy_values: Tuple[Any, ...], **values: Any):
+        """Create a result whose lazy field is the dict ``zip(lazy_keys, lazy_values)``.
+
+        The dictionary is only built when the field is first read.
+        """
+        result = cls.__new__(cls)
+        for field in fields(cls):
+            if field.name != cls._lazy_field:
+                object.__setattr__(result, field.name, values.pop(field.name))
+        if values:
+            raise TypeError(f"Unexpected {cls.__name__} fields: {', '.join(values)}")
+        object.__setattr__(result, "_lazy_parts", (lazy_keys, lazy_values))
+        return result
+
+    @staticmethod
+    def _build_lazy_field(keys: Tuple[str, ...], values: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Build the lazy field's dictionary from its parts."""
+        return dict(zip(keys, values))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots, i.e. a lazy field not yet materialized
+        if name == self._lazy_field:
+            try:
+                keys, values = object.__getattribute__(self, "_lazy_parts")
+            except AttributeError:
+                pass
+            else:
+                value = self._build_lazy_field(keys, values)
+                object.__setattr__(self, name, value)
+                object.__delattr__(self, "_lazy_parts")
+                return value
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+
+# Export result building blocks
+__all__ = [
+    'FrozenMetadata',
+    'SlottedResult',
+    'intern_metadata'
+]
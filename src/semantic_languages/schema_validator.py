@@ -0,0 +1,521 @@
+"""
+FSL Continuum - Schema Validator Compiler
+
+Compiles the JSON-Schema-style definitions in ``config/schemas.json`` and
+``config/baml_schemas.json`` into generated Python functions. Each schema
+becomes a ``check`` function with its keyword tests, property lookups and
+item loops inlined, so valid data is accepted in one pass without building
+paths or error lists. Only when ``check`` fails does the generated
+``collect`` function walk the data again and report structured violations.
+
+Supported keywords: ``type``, ``enum``, ``pattern``, ``minLength``,
+``maxLength``, ``minimum``, ``maximum``, ``required``, ``properties``,
+``items`` and local ``$ref`` pointers (``#/schemas/boundary``). Annotation
+keywords (``description``, ``default``, ``format``, ...) are ignored.
+
+Violations where the document frame is not the object or array its schema
+expects (the root, its sections and their records, down to
+``structural_depth``) are errors; every other violation (nested shapes,
+scalar types, enums, patterns, ranges, required fields) is a warning unless
+the validator is compiled ``strict``. Semantic data unwrapped from XML carries
+string scalars, and the bundled schema files disagree on some enums, so only
+frame violations reject data by default.
+
+Validators loaded from schema files are cached per process by file path and
+JSON pointer, keyed on modification time and size with a content hash
+fallback, and shared by every transformer instance.
+"""
+
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Types whose mismatch makes data structurally invalid
+STRUCTURAL_TYPES = frozenset(("object", "array"))
+
+_MISSING = object()
+
+Check = Callable[[Any], bool]
+Collect = Callable[[Any, Tuple[Union[str, int], ...], List["SchemaViolation"]], None]
+
+@dataclass(frozen=True)
+class SchemaViolation:
+    """A single schema violation at a path in the validated data."""
+    __slots__ = ("path", "keyword", "message", "severity")
+
+    path: Tuple[Union[str, int], ...]
+    keyword: str
+    message: str
+    severity: str
+
+    @property
+    def location(self) -> str:
+        """Path rendered as ``boundaries[0].type``."""
+        return format_path(self.path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the violation to a JSON-serializable dictionary."""
+        return {
+            "path": self.location,
+            "keyword": self.keyword,
+            "message": self.message,
+            "severity": self.severity
+        }
+
+def format_path(path: Tuple[Union[str, int], ...]) -> str:
+    """Render a violation path as ``boundaries[0].type`` (empty for the root)."""
+    rendered = ""
+    for part in path:
+        if isinstance(part, int):
+            rendered += f"[{part}]"
+        else:
+            rendered += f".{part}" if rendered else part
+    return rendered
+
+def _type_name(value: Any) -> str:
+    """JSON-Schema name for a value's type."""
+    if isinstance(value, bool):
+        return "boolean"
+    if value is None:
+        return "null"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return type(value).__name__
+
+# JSON-Schema type name -> expression testing ``{v}`` for it
+_TYPE_TESTS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, _ARRAY)",
+    "string": "isinstance({v}, str)",
+    "number": "(isinstance({v}, _NUMBER) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool) or isinstance({v}, float) and {v}.is_integer())",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None"
+}
+
+def _enum_member(value: Any, allowed: Tuple[Any, ...]) -> bool:
+    """Enum membership that does not treat True as 1."""
+    return any(type(value) is type(member) and value == member for member in allowed)
+
+def _resolve_pointer(document: Dict[str, Any], pointer: str) -> Dict[str, Any]:
+    """Resolve a local ``#/a/b`` JSON pointer against a schema document."""
+    if not pointer.startswith("#"):
+        raise ValueError(f"Only local schema references are supported: {pointer}")
+    node = document
+    for part in pointer[1:].split("/"):
+        if not part:
+            continue
+        part = part.replace("~1", "/").replace("~0", "~")
+        if not isinstance(node, dict) or part not in node:
+            raise ValueError(f"Unresolvable schema reference: {pointer}")
+        node = node[part]
+    return node
+
+class _SchemaCodeGenerator:
+    """Generates the check and collect functions for the schemas of one document.
+
+    In check mode a node's code returns False at the first violation. In
+    collect mode it reports every violation through ``add`` and builds the
+    violation path only when reporting. In errors-only mode, tests that can
+    only produce warnings are left out. Each ``$ref`` target becomes its own
+    function, so recursive schemas terminate.
+    """
+
+    def __init__(self, document: Dict[str, Any], strict: bool, structural_depth: int):
+        self.document = document
+        self.strict = strict
+        self.structural_depth = structural_depth
+        self.namespace: Dict[str, Any] = {
+            "_MISSING": _MISSING, "_ARRAY": (list, tuple), "_NUMBER": (int, float),
+            "_type_name": _type_name, "_enum_member": _enum_member, "_Violation": SchemaViolation
+        }
+        self.functions: List[str] = []
+        # (pointer, collect, errors_only, depth) -> generated function name
+        self.ref_functions: Dict[Tuple[str, bool, bool, int], str] = {}
+        self.names = 0
+
+    def name(self, prefix: str) -> str:
+        """A fresh identifier."""
+        self.names += 1
+        return f"{prefix}{self.names}"
+
+    def constant(self, value: Any) -> str:
+        """Bind a value into the generated module namespace."""
+        name = self.name("_c")
+        self.namespace[name] = value
+        return name
+
+    def function(self, schema: Dict[str, Any], collect: bool, errors_only: bool) -> str:
+        """Generate a function for a root schema and return its name."""
+        name = self.name("_collect" if collect else "_check")
+        self.define(name, schema, collect, errors_only, 0)
+        return name
+
+    def define(self, name: str, schema: Dict[str, Any], collect: bool, errors_only: bool, depth: int):
+        """Generate the function ``name`` validating ``schema``."""
+        signature = "value, path, add" if collect else "value"
+        body = self.node(schema, "value", ("path",), collect, errors_only, depth, 1)
+        lines = [f"def {name}({signature}):"] + (body or ["    pass"])
+        if not collect:
+            lines.append("    return True")
+        self.functions.append("\n".join(lines))
+
+    def ref_function(self, pointer: str, collect: bool, errors_only: bool, depth: int) -> str:
+        """Name of the function for a ``$ref`` target, generating it on first use."""
+        # Depths past the structural depth all report the same severities
+        depth = min(depth, self.structural_depth + 1) if collect or errors_only else 0
+        key = (pointer, collect, errors_only, depth)
+        if key not in self.ref_functions:
+            name = self.ref_functions[key] = self.name("_ref")
+            self.define(name, _resolve_pointer(self.document, pointer), collect, errors_only, depth)
+        return self.ref_functions[key]
+
+    def severity(self, depth: int, structural: bool) -> str:
+        """Severity literal for a violation at ``depth``."""
+        if self.strict or (structural and depth <= self.structural_depth):
+            return "'error'"
+        return "'warning'"
+
+    def node(self, schema: Dict[str, Any], v: str, path: Tuple[str, ...],
+             collect: bool, errors_only: bool, depth: int, indent: int) -> List[str]:
+        """Generate the statements validating variable ``v`` against ``schema``."""
+        if not isinstance(schema, dict):
+            raise ValueError(f"Schema node must be a dictionary, got {type(schema).__name__}")
+        if errors_only and not self.strict and depth > self.structural_depth:
+            return []
+
+        pad = "    " * indent
+        path_expr = f"{path[0]} + ({', '.join(path[1:])},)" if len(path) > 1 else path[0]
+        lines: List[str] = []
+
+        def fail(keyword: str, message: str, severity: str) -> List[str]:
+            if collect:
+                return [f"{pad}    add(_Violation({path_expr}, {keyword!r}, {message}, {severity}))"]
+            return [f"{pad}    return False"]
+
+        type_names: Tuple[str, ...] = ()
+        if "type" in schema:
+            type_names = tuple(schema["type"]) if isinstance(schema["type"], list) else (schema["type"],)
+            unknown = [type_name for type_name in type_names if type_name not in _TYPE_TESTS]
+            if unknown:
+                raise ValueError(f"Unsupported schema type: {unknown[0]}")
+        known = type_names[0] if len(type_names) == 1 else None
+
+        def guard(type_name: str, test: str) -> str:
+            """``test`` guarded so it only applies to values of ``type_name``."""
+            if known == type_name:
+                return test
+            return f"(not {_TYPE_TESTS[type_name].format(v=v)} or {test})"
+
+        value_severity = self.severity(depth, False)
+        checks: List[Tuple[str, str, str]] = []
+        scalar_schema = {} if errors_only and value_severity != "'error'" else schema
+
+        if "enum" in scalar_schema:
+            allowed = tuple(scalar_schema["enum"])
+            if all(isinstance(member, str) for member in allowed):
+                test = f"{v} in {self.constant(frozenset(allowed))}"
+                test = test if known == "string" else f"(isinstance({v}, str) and {test})"
+            else:
+                test = f"_enum_member({v}, {self.constant(allowed)})"
+            checks.append(("enum", test, f"repr({v}) + {' is not one of ' + repr(list(allowed))!r}"))
+
+        if "pattern" in scalar_schema:
+            search = self.constant(re.compile(scalar_schema["pattern"]).search)
+            checks.append(("pattern", guard("string", f"{search}({v}) is not None"),
+                           f"repr({v}) + {' does not match ' + repr(scalar_schema['pattern'])!r}"))
+
+        for keyword, operator, description in (("minLength", ">=", "shorter than"),
+                                                ("maxLength", "<=", "longer than")):
+            if keyword in scalar_schema:
+                limit = int(scalar_schema[keyword])
+                checks.append((keyword, guard("string", f"len({v}) {operator} {limit}"),
+                               f"repr({v}) + {f' is {description} {limit} characters'!r}"))
+
+        for keyword, operator, description in (("minimum", ">=", "less than"),
+                                               ("maximum", "<=", "greater than")):
+            if keyword in scalar_schema:
+                limit = self.constant(scalar_schema[keyword])
+                test = f"{v} {operator} {limit}"
+                if known not in ("number", "integer"):
+                    test = f"(not {_TYPE_TESTS['number'].format(v=v)} or {test})"
+                checks.append((keyword, test, f"repr({v}) + {f' is {description} ' + repr(scalar_schema[keyword])!r}"))
+
+        if scalar_schema.get("required"):
+            required = tuple(scalar_schema["required"])
+            test = " and ".join(f"{key!r} in {v}" for key in required)
+            missing = f"[key for key in {self.constant(required)} if key not in {v}]"
+            checks.append(("required", guard("object", f"({test})"),
+                           f"'missing required fields ' + repr({missing})"))
+
+        body: List[str] = []
+        for keyword, test, message in checks:
+            body.append(f"{pad}if not {test}:")
+            body.extend(fail(keyword, message, value_severity))
+
+        properties = schema.get("properties", {})
+        property_lines: List[str] = []
+        for key, child in properties.items():
+            item = self.name("v")
+            child_lines = self.node(child, item, path + (repr(key),), collect, errors_only, depth + 1, indent + 1)
+            if child_lines:
+                property_lines.append(f"{pad}{item} = {v}.get({key!r}, _MISSING)")
+                property_lines.append(f"{pad}if {item} is not _MISSING:")
+                property_lines.extend(child_lines)
+        if property_lines:
+            if known == "object":
+                body.extend(property_lines)
+            else:
+                body.append(f"{pad}if isinstance({v}, dict):")
+                body.extend("    " + line for line in property_lines)
+
+        if isinstance(schema.get("items"), dict):
+            item = self.name("v")
+            index = self.name("i")
+            item_lines = self.node(schema["items"], item, path + (index,), collect, errors_only,
+                                   depth + 1, indent + 1)
+            if item_lines:
+                loop = [f"{pad}for {index}, {item} in enumerate({v}):" if collect else f"{pad}for {item} in {v}:"]
+                loop.extend(item_lines)
+                if known == "array":
+                    body.extend(loop)
+                else:
+                    body.append(f"{pad}if isinstance({v}, _ARRAY):")
+                    body.extend("    " + line for line in loop)
+
+        if "$ref" in schema:
+            ref = self.ref_function(schema["$ref"], collect, errors_only, depth)
+            if collect:
+                body.append(f"{pad}{ref}({v}, {path_expr}, add)")
+            else:
+                body.append(f"{pad}if not {ref}({v}):")
+                body.append(f"{pad}    return False")
+
+        severity = self.severity(depth, set(type_names) <= STRUCTURAL_TYPES)
+        if type_names and not (errors_only and severity != "'error'"):
+            test = " or ".join(_TYPE_TESTS[type_name].format(v=v) for type_name in type_names)
+            message = f"{'expected ' + ' or '.join(type_names) + ', got '!r} + _type_name({v})"
+            lines.append(f"{pad}if not ({test}):")
+            lines.extend(fail("type", message, severity))
+            if body:
+                if collect:
+                    # Nothing below applies to a value of the wrong type
+                    lines.append(f"{pad}else:")
+                    body = ["    " + line for line in body]
+                lines.extend(body)
+        else:
+            lines.extend(body)
+
+        return lines
+
+    def build(self, schema: Dict[str, Any]) -> Tuple[Tuple[Check, Collect], Tuple[Check, Collect], str]:
+        """Generate and compile the root schema's functions.
+
+        Returns ``((check, collect), (check_errors, collect_errors), source)``.
+        """
+        names = [(self.function(schema, False, errors_only), self.function(schema, True, errors_only))
+                 for errors_only in (False, True)]
+        source = "\n\n".join(self.functions) + "\n"
+        exec(compile(source, "<fsl-schema-validator>", "exec"), self.namespace)
+
+        def bind(check_name: str, collect_name: str) -> Tuple[Check, Collect]:
+            root_collect = self.namespace[collect_name]
+
+            def collect(value, path, violations):
+                root_collect(value, path, violations.append)
+            return self.namespace[check_name], collect
+
+        return bind(*names[0]), bind(*names[1]), source
+
+@dataclass(frozen=True)
+class SchemaValidator:
+    """Compiled validator for one schema.
+
+    ``check``/``collect`` test every rule; ``check_errors``/``collect_errors``
+    test only the rules that can produce errors, which is all ``valid``
+    depends on. All four are generated from the schema, and
+    ``generated_source`` holds their Python source. ``schema`` and
+    ``document`` are kept so the validator can be pickled to worker
+    processes and recompiled there.
+    """
+    name: str
+    schema_version: str
+    strict: bool
+    structural_depth: int
+    source: str
+    digest: str
+    schema: Dict[str, Any]
+    document: Dict[str, Any]
+    check: Check
+    collect: Collect
+    check_errors: Check
+    collect_errors: Collect
+    generated_source: str
+
+    def is_valid(self, data: Any) -> bool:
+        """True when ``data`` has no error-level violations."""
+        return self.check_errors(data)
+
+    def violations(self, data: Any) -> List[SchemaViolation]:
+        """All violations in ``data``, in document order."""
+        violations: List[SchemaViolation] = []
+        if not self.check(data):
+            self.collect(data, (), violations)
+        return violations
+
+    def validate(self, data: Any, label: Optional[str] = None, warnings: bool = True) -> Dict[str, Any]:
+        """Validate data, returning ``valid``, ``errors``, ``warnings`` and ``violations``.
+
+        ``errors`` and ``warnings`` hold readable messages prefixed with
+        ``label`` and the violation path; ``violations`` holds the structured
+        form of each as a dictionary. With ``warnings=False`` only error-level
+        rules are tested.
+        """
+        check, collect = (self.check, self.collect) if warnings else (self.check_errors, self.collect_errors)
+        if check(data):
+            return {"valid": True, "errors": [], "warnings": [], "violations": []}
+
+        label = label or self.name
+        violations: List[SchemaViolation] = []
+        collect(data, (), violations)
+        error_messages = []
+        warning_messages = []
+        for violation in violations:
+            message = f"{label} {violation.location or 'data'}: {violation.message}"
+            (error_messages if violation.severity == "error" else warning_messages).append(message)
+
+        return {
+            "valid": not error_messages,
+            "errors": error_messages,
+            "warnings": warning_messages,
+            "violations": [violation.to_dict() for violation in violations]
+        }
+
+    def __reduce__(self):
+        return (compile_schema, (self.schema, self.document, self.name, self.schema_version,
+                                 self.strict, self.structural_depth, self.source, self.digest))
+
+def _schema_digest(schema: Dict[str, Any]) -> str:
+    """Content hash of a schema node."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()
+
+def compile_schema(schema: Dict[str, Any], document: Optional[Dict[str, Any]] = None,
+                   name: str = "data", schema_version: Optional[str] = None,
+                   strict: bool = False, structural_depth: int = 2,
+                   source: str = "<inline>", digest: Optional[str] = None) -> SchemaValidator:
+    """Compile a schema into a validator.
+
+    ``document`` is the schema file that ``$ref`` pointers resolve against
+    (defaults to ``schema`` itself). Object/array type violations at most
+    ``structural_depth`` levels below the root are errors, the rest are
+    warnings; ``strict`` makes every violation an error. Raises ValueError
+    for unsupported types or unresolvable references.
+    """
+    document = schema if document is None else document
+    (check, collect), (check_errors, collect_errors), generated_source = _SchemaCodeGenerator(
+        document, strict, structural_depth
+    ).build(schema)
+
+    if schema_version is None:
+        schema_version = schema.get("$id") or document.get("schema_version") or document.get("version", "")
+
+    return SchemaValidator(
+        name=name,
+        schema_version=schema_version,
+        strict=strict,
+        structural_depth=structural_depth,
+        source=source,
+        digest=digest or _schema_digest(schema),
+        schema=schema,
+        document=document,
+        check=check,
+        collect=collect,
+        check_errors=check_errors,
+        collect_errors=collect_errors,
+        generated_source=generated_source
+    )
+
+# (schema path, pointer, strict, structural depth) -> ((mtime_ns, size) or None, validator)
+_validator_cache: Dict[Tuple[str, str, bool, int], Tuple[Optional[Tuple[int, int]], SchemaValidator]] = {}
+_validator_cache_lock = threading.Lock()
+
+def load_schema_validator(schema_path: Union[str, Path], pointer: str,
+                          default_schema: Callable[[], Dict[str, Any]],
+                          name: str = "data", strict: bool = False,
+                          structural_depth: int = 2) -> SchemaValidator:
+    """Load the compiled validator for the schema at ``pointer`` in a schema file.
+
+    ``pointer`` is a JSON pointer such as ``#/semantic_language_schemas/baml_schema``.
+    The validator is recompiled only when the file's modification time or
+    size changes and its content hash differs from the cached validator.
+    Missing files, or files without the pointer, compile ``default_schema()``.
+    """
+    schema_path = Path(schema_path)
+    cache_key = (str(schema_path), pointer, strict, structural_depth)
+
+    try:
+        stat = schema_path.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
+
+    with _validator_cache_lock:
+        cached = _validator_cache.get(cache_key)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        validator = None
+        if file_key is not None:
+            raw_schema = schema_path.read_bytes()
+            digest = hashlib.sha256(raw_schema).hexdigest()
+            if cached is not None and cached[1].digest == digest:
+                validator = cached[1]
+            else:
+                document = json.loads(raw_schema)
+                try:
+                    schema = _resolve_pointer(document, pointer)
+                except ValueError:
+                    logger.warning(f"Schema {pointer} not found in {schema_path}, using defaults")
+                else:
+                    validator = compile_schema(schema, document, name, strict=strict,
+                                               structural_depth=structural_depth,
+                                               source=str(schema_path), digest=digest)
+        else:
+            logger.warning(f"{name} schema not found at {schema_path}, using defaults")
+
+        if validator is None:
+            validator = compile_schema(default_schema(), name=name, strict=strict,
+                                       structural_depth=structural_depth, source="<defaults>")
+
+        _validator_cache[cache_key] = (file_key, validator)
+        return validator
+
+def clear_schema_validator_cache():
+    """Drop all cached schema validators."""
+    with _validator_cache_lock:
+        _validator_cache.clear()
+
+# Export schema validator classes
+__all__ = [
+    'SchemaValidator',
+    'SchemaViolation',
+    'compile_schema',
+    'load_schema_validator',
+    'clear_schema_validator_cache',
+    'format_path'
+]
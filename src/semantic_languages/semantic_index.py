@@ -0,0 +1,399 @@
+"""
+FSL Continuum - Semantic Model Index
+
+Persistent adjacency index over the unified BAML and Pareto-Lang model.
+Boundaries are keyed by name, BAML connections by source and target, and
+Pareto-Lang optimizations by optimization target. Optimization pathways link
+a boundary to every optimization serving the boundary's optimization target.
+They are never materialized as a whole: the index keeps per-target boundary
+and optimization counts, so the pathway total and per-target summaries are
+maintained in O(1) per update, and individual pathways are produced on demand
+per boundary.
+
+Every structure is updated in place, so adding or removing one boundary,
+connection or optimization touches only the entries that record is part of,
+and lookups such as "all pathways from boundary X" cost O(degree) instead
+of a scan of the whole model.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Optimization target assumed for boundaries that do not declare one
+DEFAULT_OPTIMIZATION_TARGET = "pareto_efficiency"
+
+ConnectionKey = Tuple[str, str, str]
+
+def boundary_optimization_target(boundary: Dict[str, Any]) -> str:
+    """Return the optimization target a boundary's pathways follow."""
+    metadata = boundary.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return str(
+        boundary.get("optimization_target")
+        or metadata.get("optimization_target")
+        or DEFAULT_OPTIMIZATION_TARGET
+    )
+
+def connection_key(connection: Dict[str, Any]) -> ConnectionKey:
+    """Return the (source, target, type) key identifying a BAML connection."""
+    return (
+        str(connection.get("source", "unknown")),
+        str(connection.get("target", "unknown")),
+        str(connection.get("type", "")),
+    )
+
+class SemanticModelIndex:
+    """Incrementally maintained adjacency index for the unified semantic model.
+
+    Adjacency lists are insertion-ordered dictionaries used as sets, so
+    insertion and removal are O(1) and iteration follows the model order.
+    All public methods are thread-safe; hold ``lock`` to read a consistent
+    snapshot across several calls.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+        # Boundaries: name -> record, name -> optimization target, target -> count
+        self._boundaries: Dict[str, Dict[str, Any]] = {}
+        self._boundary_targets: Dict[str, str] = {}
+        self._boundary_counts: Dict[str, int] = {}
+
+        # BAML connections: key -> record, with outgoing and incoming adjacency
+        self._connections: Dict[ConnectionKey, Dict[str, Any]] = {}
+        self._outgoing: Dict[str, Dict[ConnectionKey, None]] = {}
+        self._incoming: Dict[str, Dict[ConnectionKey, None]] = {}
+
+        # Pareto-Lang optimizations: name -> record, target -> names
+        self._optimizations: Dict[str, Dict[str, Any]] = {}
+        self._optimization_targets: Dict[str, str] = {}
+        self._optimizations_by_target: Dict[str, Dict[str, None]] = {}
+
+        # Boundary x optimization pairs sharing a target, kept incrementally
+        self.pathway_count = 0
+
+        # Whole-model views, rebuilt only after index_updates moves
+        self._views: Dict[str, Tuple[int, Any]] = {}
+
+        self.index_updates = 0
+        self.last_sync: Optional[Dict[str, Any]] = None
+
+    # Boundaries
+
+    def add_boundary(self, boundary: Dict[str, Any]) -> str:
+        """Add or replace a boundary and return its name."""
+        name = str(boundary.get("name", "unknown"))
+        target = boundary_optimization_target(boundary)
+        with self.lock:
+            previous = self._boundary_targets.get(name)
+            if previous != target:
+                if previous is not None:
+                    self._count_boundary(previous, -1)
+                self._count_boundary(target, 1)
+                self.index_updates += 1
+            self._boundaries[name] = boundary
+            self._boundary_targets[name] = target
+        return name
+
+    def remove_boundary(self, name: str) -> bool:
+        """Remove a boundary; its connections stay indexed as edges."""
+        with self.lock:
+            if name not in self._boundaries:
+                return False
+            del self._boundaries[name]
+            self._count_boundary(self._boundary_targets.pop(name), -1)
+            self.index_updates += 1
+            return True
+
+    def _count_boundary(self, target: str, delta: int) -> None:
+        """Adjust a target's boundary count and the pathway total."""
+        count = self._boundary_counts.get(target, 0) + delta
+        if count:
+            self._boundary_counts[target] = count
+        else:
+            del self._boundary_counts[target]
+        self.pathway_count += delta * len(self._optimizations_by_target.get(target, ()))
+
+    def get_boundary(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a boundary record by name."""
+        return self._boundaries.get(name)
+
+    # Connections
+
+    def add_connection(self, connection: Dict[str, Any]) -> ConnectionKey:
+        """Add or replace a BAML connection and return its key."""
+        key = connection_key(connection)
+        source, target, _ = key
+        with self.lock:
+            if key not in self._connections:
+                self._outgoing.setdefault(source, {})[key] = None
+                self._incoming.setdefault(target, {})[key] = None
+                self.index_updates += 1
+            self._connections[key] = connection
+        return key
+
+    def remove_connection(self, key: ConnectionKey) -> bool:
+        """Remove a BAML connection by its (source, target, type) key."""
+        source, target, _ = key
+        with self.lock:
+            if self._connections.pop(key, None) is None:
+                return False
+            self._discard(self._outgoing, source, key)
+            self._discard(self._incoming, target, key)
+            self.index_updates += 1
+            return True
+
+    def connections_from(self, source: str) -> List[Dict[str, Any]]:
+        """Get the connections leaving a boundary."""
+        with self.lock:
+            return [self._connections[key] for key in self._outgoing.get(source, ())]
+
+    def connections_to(self, target: str) -> List[Dict[str, Any]]:
+        """Get the connections entering a boundary."""
+        with self.lock:
+            return [self._connections[key] for key in self._incoming.get(target, ())]
+
+    # Optimizations
+
+    def add_optimization(self, optimization: Dict[str, Any]) -> str:
+        """Add or replace a Pareto-Lang optimization and return its name."""
+        name = str(optimization.get("name", "unknown"))
+        target = str(optimization.get("target", DEFAULT_OPTIMIZATION_TARGET))
+        with self.lock:
+            previous = self._optimization_targets.get(name)
+            if previous != target:
+                if previous is not None:
+                    self._discard(self._optimizations_by_target, previous, name)
+                    self.pathway_count -= self._boundary_counts.get(previous, 0)
+                self._optimizations_by_target.setdefault(target, {})[name] = None
+                self.pathway_count += self._boundary_counts.get(target, 0)
+                self.index_updates += 1
+            self._optimizations[name] = optimization
+            self._optimization_targets[name] = target
+        return name
+
+    def remove_optimization(self, name: str) -> bool:
+        """Remove a Pareto-Lang optimization by name."""
+        with self.lock:
+            target = self._optimization_targets.pop(name, None)
+            if target is None:
+                return False
+            del self._optimizations[name]
+            self._discard(self._optimizations_by_target, target, name)
+            self.pathway_count -= self._boundary_counts.get(target, 0)
+            self.index_updates += 1
+            return True
+
+    def optimizations_for(self, target: str) -> List[Dict[str, Any]]:
+        """Get the optimizations serving an optimization target."""
+        with self.lock:
+            return [self._optimizations[name] for name in self._optimizations_by_target.get(target, ())]
+
+    # Pathways
+
+    def pathways_from(self, boundary: str, transitive: bool = False) -> List[Dict[str, Any]]:
+        """Get all optimization pathways from a boundary.
+
+        With ``transitive`` the pathways of every boundary reachable through
+        outgoing connections are included, each listing the boundary it
+        starts from.
+        """
+        with self.lock:
+            if boundary not in self._boundaries:
+                return []
+            if not transitive:
+                return self._boundary_pathways(boundary)
+
+            pathways = []
+            seen = {boundary}
+            queue = deque([boundary])
+            while queue:
+                current = queue.popleft()
+                if current in self._boundaries:
+                    pathways.extend(self._boundary_pathways(current))
+                for source, target, _ in self._outgoing.get(current, ()):
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append(target)
+            return pathways
+
+    def _boundary_pathways(self, boundary: str) -> List[Dict[str, Any]]:
+        """Build the direct pathways of an indexed boundary."""
+        target = self._boundary_targets[boundary]
+        return [
+            {
+                "pathway": f"baml.boundary.{boundary}->pareto.optimization.{name}",
+                "boundary": boundary,
+                "optimization": name,
+                "optimization_target": target,
+                "efficiency": self._optimizations[name].get("efficiency"),
+            }
+            for name in self._optimizations_by_target.get(target, ())
+        ]
+
+    # Whole-model views
+
+    def connection_matrix(self) -> List[List[str]]:
+        """Get the connection adjacency rows, each ``[source, *targets]``.
+
+        The rows are built once per index change; callers get a copy they
+        may modify without affecting the cached rows.
+        """
+        with self.lock:
+            return [list(row) for row in self._view("connection_matrix", self._build_connection_matrix)]
+
+    def _build_connection_matrix(self) -> List[List[str]]:
+        """Build the adjacency rows from the outgoing connection lists."""
+        matrix = []
+        for source, keys in self._outgoing.items():
+            row = [source]
+            for _, target, _ in keys:
+                if target not in row[1:]:
+                    row.append(target)
+            matrix.append(row)
+        return matrix
+
+    def pathway_summary(self) -> List[Dict[str, Any]]:
+        """Get the pathway counts per optimization target.
+
+        Costs O(targets) once per index change instead of O(pathways); use
+        ``pathways_from`` for the pathways of one boundary. Callers get a
+        copy of the cached summary.
+        """
+        with self.lock:
+            return [dict(entry) for entry in self._view("pathway_summary", self._build_pathway_summary)]
+
+    def _build_pathway_summary(self) -> List[Dict[str, Any]]:
+        """Build the per-target pathway counts."""
+        summary = []
+        for target, boundaries in self._boundary_counts.items():
+            optimizations = len(self._optimizations_by_target.get(target, ()))
+            if optimizations:
+                summary.append({
+                    "pathway": f"baml.boundary->pareto.optimization[{target}]",
+                    "optimization_target": target,
+                    "boundaries": boundaries,
+                    "optimizations": optimizations,
+                    "pathway_count": boundaries * optimizations,
+                })
+        return summary
+
+    def _view(self, name: str, build) -> Any:
+        """Return a cached whole-model view, rebuilding it after index changes."""
+        cached = self._views.get(name)
+        if cached is None or cached[0] != self.index_updates:
+            cached = self._views[name] = (self.index_updates, build())
+        return cached[1]
+
+    def optimization_pathways(self) -> List[Dict[str, Any]]:
+        """Get the pathways of every boundary.
+
+        Materializes all ``pathway_count`` pathways; prefer ``pathway_summary``
+        or ``pathways_from`` on large models.
+        """
+        with self.lock:
+            pathways = []
+            for boundary in self._boundaries:
+                pathways.extend(self._boundary_pathways(boundary))
+            return pathways
+
+    def sync(self, baml_data: Dict[str, Any], pareto_data: Dict[str, Any]) -> Dict[str, int]:
+        """Bring the index in line with parsed semantic data.
+
+        Records whose index keys are unchanged are only re-pointed at the new
+        record, so resyncing a mostly unchanged model reindexes only what
+        changed. Returns the number of records added and removed per kind.
+        """
+        start_time = time.perf_counter()
+        with self.lock:
+            updates_before = self.index_updates
+            changes = {
+                "boundaries": self._sync_named(
+                    self._records(baml_data, "boundaries"), self._boundaries,
+                    self.add_boundary, self.remove_boundary
+                ),
+                "connections": self._sync_connections(self._records(baml_data, "connections")),
+                "optimizations": self._sync_named(
+                    self._records(pareto_data, "optimizations"), self._optimizations,
+                    self.add_optimization, self.remove_optimization
+                ),
+            }
+            changes["index_updates"] = self.index_updates - updates_before
+            self.last_sync = {
+                "changes": changes,
+                "sync_time": time.perf_counter() - start_time,
+            }
+            return changes
+
+    def _sync_named(self, records: Iterable[Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                    add, remove) -> int:
+        """Sync name-keyed records, removing names no longer present."""
+        stale = dict.fromkeys(current)
+        added = 0
+        for record in records:
+            name = str(record.get("name", "unknown"))
+            if name not in current:
+                added += 1
+            stale.pop(name, None)
+            add(record)
+        for name in stale:
+            remove(name)
+        return added + len(stale)
+
+    def _sync_connections(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Sync connections, removing keys no longer present."""
+        stale = dict.fromkeys(self._connections)
+        added = 0
+        for record in records:
+            key = connection_key(record)
+            if key not in self._connections:
+                added += 1
+            stale.pop(key, None)
+            self.add_connection(record)
+        for key in stale:
+            self.remove_connection(key)
+        return added + len(stale)
+
+    @staticmethod
+    def _records(data: Dict[str, Any], section: str) -> List[Dict[str, Any]]:
+        """Get the mapping records of a parsed section."""
+        records = data.get(section) or []
+        if not isinstance(records, list):
+            return []
+        return [record for record in records if isinstance(record, dict)]
+
+    @staticmethod
+    def _discard(adjacency: Dict[Any, Dict[Any, None]], node: Any, item: Any) -> None:
+        """Remove an item from a node's adjacency, dropping empty nodes."""
+        items = adjacency.get(node)
+        if items is not None:
+            items.pop(item, None)
+            if not items:
+                del adjacency[node]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get index size and update statistics."""
+        with self.lock:
+            return {
+                "boundaries": len(self._boundaries),
+                "connections": len(self._connections),
+                "optimizations": len(self._optimizations),
+                "optimization_targets": len(self._optimizations_by_target),
+                "pathways": self.pathway_count,
+                "index_updates": self.index_updates,
+                "last_sync": self.last_sync,
+            }
+
+# Export semantic model index
+__all__ = [
+    'SemanticModelIndex',
+    'DEFAULT_OPTIMIZATION_TARGET'
+]
@@ -0,0 +1,184 @@
+"""
+FSL Continuum - Transformation Plan Compiler
+
+Compiles BAML and Pareto-Lang XML transformation rule documents into flat,
+immutable transformation plans. Attribute whitelists become frozensets and
+enabled rules become a tuple of per-section callables, so applying rules is a
+single loop instead of a walk over nested rule dictionaries.
+
+Plans loaded from rule files are cached per process by file path, keyed on
+modification time and size with a content hash fallback, and shared by every
+transformer instance. Plans only hold module-level callables, so they can be
+pickled to worker processes.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from functools import partial
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Optional, Any, Union, Tuple, Callable, FrozenSet
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class CompiledSectionRule:
+    """Compiled transformation rule for one semantic data section."""
+    rule_name: str
+    section: str
+    xml_tag: str
+    attributes: FrozenSet[str]
+    preserve_semantics: bool
+    apply: Optional[Callable[[Any], Any]] = None
+
+@dataclass(frozen=True)
+class TransformationPlan:
+    """Flat, precomputed transformation plan for a semantic language."""
+    language: str
+    sections: Tuple[CompiledSectionRule, ...]
+    steps: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+    enabled_validations: FrozenSet[str]
+    rules: Dict[str, Any]
+    source: str
+    digest: str
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the plan to semantic data, returning a shallow copy."""
+        transformed_data = data.copy()
+        for section, step in self.steps:
+            if section in transformed_data:
+                transformed_data[section] = step(transformed_data[section])
+        return transformed_data
+
+    def section_attributes(self, section: str) -> FrozenSet[str]:
+        """Get the attribute whitelist for a section."""
+        for section_rule in self.sections:
+            if section_rule.section == section:
+                return section_rule.attributes
+        return frozenset()
+
+def _project_record(attributes: FrozenSet[str], record: Any) -> Any:
+    """Keep only whitelisted attributes of a record."""
+    if isinstance(record, dict):
+        return {key: value for key, value in record.items() if key in attributes}
+    return record
+
+def _project_section(attributes: FrozenSet[str], value: Any) -> Any:
+    """Keep only whitelisted attributes of every record in a section."""
+    if isinstance(value, list):
+        return [_project_record(attributes, record) for record in value]
+    return _project_record(attributes, value)
+
+def _rules_digest(rules: Dict[str, Any]) -> str:
+    """Content hash of a rules document."""
+    return hashlib.sha256(json.dumps(rules, sort_keys=True, default=str).encode()).hexdigest()
+
+def compile_transformation_rules(language: str, rules: Dict[str, Any],
+                                 rule_sections: Dict[str, str],
+                                 source: str = "<inline>",
+                                 digest: Optional[str] = None) -> TransformationPlan:
+    """Compile a transformation rules document into a transformation plan.
+
+    ``rule_sections`` maps rule names (e.g. ``boundary_wrapping``) to the data
+    section they govern, in application order. Disabled rules are dropped.
+    Sections whose rule sets ``preserve_semantics`` to False are projected onto
+    the rule's attribute whitelist; all others pass through untouched.
+    """
+    transformation_rules = rules.get("transformation_rules", {})
+    sections = []
+    steps = []
+
+    for rule_name, section in rule_sections.items():
+        rule = transformation_rules.get(rule_name, {})
+        if not rule.get("enabled", True):
+            continue
+
+        attributes = frozenset(rule.get("attributes", ()))
+        preserve_semantics = rule.get("preserve_semantics", True)
+        apply = None if preserve_semantics else partial(_project_section, attributes)
+
+        sections.append(CompiledSectionRule(
+            rule_name=rule_name,
+            section=section,
+            xml_tag=rule.get("xml_tag", section),
+            attributes=attributes,
+            preserve_semantics=preserve_semantics,
+            apply=apply
+        ))
+        if apply is not None:
+            steps.append((section, apply))
+
+    enabled_validations = frozenset(
+        name for name, enabled in rules.get("validation_rules", {}).items() if enabled
+    )
+
+    return TransformationPlan(
+        language=language,
+        sections=tuple(sections),
+        steps=tuple(steps),
+        enabled_validations=enabled_validations,
+        rules=rules,
+        source=source,
+        digest=digest or _rules_digest(rules)
+    )
+
+# (language, rules path) -> ((mtime_ns, size) or None, plan)
+_plan_cache: Dict[Tuple[str, str], Tuple[Optional[Tuple[int, int]], TransformationPlan]] = {}
+_plan_cache_lock = threading.Lock()
+
+def load_transformation_plan(language: str, rules_path: Union[str, Path],
+                             rule_sections: Dict[str, str],
+                             default_rules: Callable[[], Dict[str, Any]]) -> TransformationPlan:
+    """Load the compiled transformation plan for a rules file.
+
+    The plan is recompiled only when the file's modification time or size
+    changes and its content hash differs from the cached plan. Missing files
+    compile ``default_rules()`` once.
+    """
+    rules_path = Path(rules_path)
+    cache_key = (language, str(rules_path))
+
+    try:
+        stat = rules_path.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
+
+    with _plan_cache_lock:
+        cached = _plan_cache.get(cache_key)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        if file_key is None:
+            logger.warning(f"{language} transformation rules not found at {rules_path}, using defaults")
+            plan = compile_transformation_rules(language, default_rules(), rule_sections, "<defaults>")
+        else:
+            raw_rules = rules_path.read_bytes()
+            digest = hashlib.sha256(raw_rules).hexdigest()
+            if cached is not None and cached[1].digest == digest:
+                plan = cached[1]
+            else:
+                plan = compile_transformation_rules(
+                    language, json.loads(raw_rules), rule_sections, str(rules_path), digest
+                )
+
+        _plan_cache[cache_key] = (file_key, plan)
+        return plan
+
+def clear_transformation_plan_cache():
+    """Drop all cached transformation plans."""
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+# Export transformation plan classes
+__all__ = [
+    'TransformationPlan',
+    'CompiledSectionRule',
+    'compile_transformation_rules',
+    'load_transformation_plan',
+    'clear_transformation_plan_cache'
+]
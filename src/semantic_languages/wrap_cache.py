@@ -0,0 +1,260 @@
+"""
+FSL Continuum - Semantic Wrap Cache
+
+Content-addressed memo cache for BAML, Pareto-Lang and unified XML wraps.
+Entries are keyed by a SHA-256 hash of the canonical JSON form of the input
+plus the schema identity, kept in a bounded LRU with optional TTL, and can be
+mirrored to an on-disk tier so warm results survive a restart.
+
+Wrapper root elements carry a ``timestamp`` attribute that differs on every
+wrap. Cached wrappers are stored as a timestamp template and re-stamped with
+the current time on every hit, so cached output is indistinguishable from a
+fresh wrap.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union, Iterable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Marker key for values JSON cannot tell apart (tuples, subclasses, non-str
+# keys); real keys starting with NUL are escaped so markers stay unambiguous
+_TYPE_MARKER = "\x00type"
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _canonical_form(value: Any) -> Any:
+    """Convert semantic input into JSON that differs whenever the XML wrap can.
+
+    Lists and string-keyed dicts keep their JSON shape because the XML writer
+    walks them the same way. Every other value, including tuples, which the
+    writer ``str()``-converts into attribute text while ``json`` would encode
+    them as lists, is tagged with its type.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    if isinstance(value, list):
+        return [_canonical_form(item) for item in value]
+    if isinstance(value, dict):
+        if all(type(key) is str for key in value):
+            return {
+                ("\x00" + key if key[:1] == "\x00" else key): _canonical_form(item)
+                for key, item in value.items()
+            }
+        items = [[_canonical_form(key), _canonical_form(item)] for key, item in value.items()]
+        return {_TYPE_MARKER: [f"{value_type.__module__}.{value_type.__qualname__}", items]}
+    return {_TYPE_MARKER: [f"{value_type.__module__}.{value_type.__qualname__}", str(value)]}
+
+def canonical_content_key(namespace: str, data: Any, *schema_identity: Any) -> str:
+    """Hash semantic input and schema identity into a cache key.
+
+    The canonical form is compact JSON of ``_canonical_form`` with non-ASCII
+    text kept as is. Key order is preserved rather than sorted because it
+    decides attribute and element order in the XML wrapper.
+    """
+    canonical = json.dumps(
+        [namespace, _canonical_form(list(schema_identity)), _canonical_form(data)],
+        separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+@dataclass
+class TimestampTemplate:
+    """XML text split around the ``timestamp`` attribute of wrapper roots."""
+    segments: List[str]
+
+    @classmethod
+    def from_xml(cls, xml_string: str, root_tags: Iterable[str]) -> "TimestampTemplate":
+        """Split an XML wrapper at the timestamps of the given root tags."""
+        pattern = re.compile(
+            '(<(?:' + "|".join(re.escape(tag) for tag in root_tags) + r')\s(?:[^>]*?\s)?timestamp=")[^"]*(")'
+        )
+        segments = []
+        position = 0
+        for match in pattern.finditer(xml_string):
+            segments.append(xml_string[position:match.end(1)])
+            position = match.start(2)
+        segments.append(xml_string[position:])
+        return cls(segments)
+
+    def render(self, timestamp: str) -> str:
+        """Rebuild the XML text with a fresh timestamp."""
+        return timestamp.join(self.segments)
+
+@dataclass
+class WrapCacheEntry:
+    """Cached wrap result."""
+    template: TimestampTemplate
+    payload: Dict[str, Any]
+    created_at: float
+
+class WrapCache:
+    """Bounded LRU/TTL cache of XML wraps with an optional on-disk tier.
+
+    ``max_entries`` bounds the in-memory tier (least recently used entries
+    are evicted first), ``ttl`` expires entries older than that many seconds
+    in both tiers, and ``cache_dir`` enables the on-disk tier.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None,
+                 cache_dir: Optional[Union[str, Path]] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.entries: "OrderedDict[str, WrapCacheEntry]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expired(self, entry: WrapCacheEntry) -> bool:
+        """Check whether an entry has outlived the TTL."""
+        return self.ttl is not None and time.time() - entry.created_at > self.ttl
+
+    def _disk_path(self, key: str) -> Path:
+        """Get the on-disk tier path for a key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_from_disk(self, key: str) -> Optional[WrapCacheEntry]:
+        """Load an entry from the on-disk tier."""
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            entry = WrapCacheEntry(
+                template=TimestampTemplate(stored["segments"]),
+                payload=stored["payload"],
+                created_at=stored["created_at"]
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable wrap cache entry {path}: {e}")
+            return None
+
+        if self._expired(entry):
+            with self.lock:
+                self.expirations += 1
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _store_on_disk(self, key: str, entry: WrapCacheEntry):
+        """Atomically write an entry to the on-disk tier."""
+        path = self._disk_path(key)
+        temp_path = None
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "segments": entry.template.segments,
+                    "payload": entry.payload,
+                    "created_at": entry.created_at
+                }, f, ensure_ascii=False, default=str)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write wrap cache entry {path}: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _insert(self, key: str, entry: WrapCacheEntry):
+        """Insert an entry into the in-memory tier, evicting LRU entries."""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[WrapCacheEntry]:
+        """Look up an entry, counting a hit or a miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        # The on-disk tier is read outside the lock so in-memory hits never
+        # wait on file I/O
+        if self.cache_dir is not None:
+            entry = self._load_from_disk(key)
+
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self.hits += 1
+            self._insert(key, entry)
+            return entry
+
+    def put(self, key: str, template: TimestampTemplate, payload: Dict[str, Any]) -> WrapCacheEntry:
+        """Store a wrap result in every enabled tier."""
+        entry = WrapCacheEntry(template=template, payload=payload, created_at=time.time())
+        with self.lock:
+            self._insert(key, entry)
+        # Written outside the lock so a slow disk does not stall lookups;
+        # the atomic replace keeps concurrent writers of one key safe
+        if self.cache_dir is not None:
+            self._store_on_disk(key, entry)
+        return entry
+
+    def clear(self, disk: bool = False):
+        """Drop in-memory entries (and on-disk entries if ``disk``)."""
+        with self.lock:
+            self.entries.clear()
+            if disk and self.cache_dir is not None:
+                for path in self.cache_dir.glob("*/*.json"):
+                    path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and configuration."""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "disk_tier": str(self.cache_dir) if self.cache_dir is not None else None
+            }
+
+# Export wrap cache classes
+__all__ = [
+    'WrapCache',
+    'WrapCacheEntry',
+    'TimestampTemplate',
+    'canonical_content_key'
+]
@@ -0,0 +1,325 @@
+"""
+FSL Continuum - Unified XML Archive
+
+Random access to the language sections of large on-disk archives of
+``unified-semantic-data`` documents.
+
+The archive file is memory-mapped and a byte-level scanner locates each
+``<unified-semantic-data>`` document and its ``<baml-semantic-data>`` /
+``<pareto-lang-semantic-data>`` child regions without parsing them: the
+scanner only stops at those tags and jumps from a section's start tag
+straight to its closing tag. Reading a section parses just its bytes.
+
+Archives may hold one document or many concatenated documents (for example
+one per line). Offsets can be saved to a sidecar index (``<archive>.idx``)
+of fixed-size records, so a later process finds any document's sections
+with a single read at a computed offset instead of rescanning the file.
+The index records the archive's size and modification time and is ignored
+when they no longer match.
+
+The scanner assumes the UTF-8, comment-free XML the unified processor
+writes; section tags inside comments or CDATA would be picked up.
+"""
+
+import os
+import re
+import mmap
+import struct
+import logging
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator
+
+from .baml.xml_transformer import BAMLXMLTransformer
+from .pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Language sections, in sidecar record order
+ARCHIVE_LANGUAGES = ("baml", "pareto_lang")
+
+ARCHIVE_SECTION_TAGS = {
+    "baml": "baml-semantic-data",
+    "pareto_lang": "pareto-lang-semantic-data"
+}
+
+UNIFIED_TAG = "unified-semantic-data"
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"FSLXIDX1"
+
+# Sidecar header: magic, archive size, archive mtime (ns), document count
+_INDEX_HEADER = struct.Struct("<8sQqQ")
+
+# Sidecar record: document start/end, then start/end per language
+# (0, 0 when the document has no such section)
+_INDEX_RECORD = struct.Struct("<" + "QQ" * (1 + len(ARCHIVE_LANGUAGES)))
+
+_LANGUAGES_BY_TAG = {tag.encode(): language for language, tag in ARCHIVE_SECTION_TAGS.items()}
+
+# Opening or closing unified/section tag names
+_TAG_PATTERN = re.compile(
+    rb"<(/?)(" + b"|".join(re.escape(tag.encode()) for tag in (UNIFIED_TAG, *ARCHIVE_SECTION_TAGS.values()))
+    + rb")(?=[\s/>])"
+)
+
+# Rest of a start tag, with quoted attribute values that may contain '>'
+_TAG_REST = re.compile(rb"""(?:[^>"']|"[^"]*"|'[^']*')*>""")
+
+_CLOSE_PATTERNS = {
+    tag.encode(): re.compile(rb"</" + re.escape(tag.encode()) + rb"\s*>")
+    for tag in (UNIFIED_TAG, *ARCHIVE_SECTION_TAGS.values())
+}
+
+@dataclass(frozen=True)
+class ArchiveSection:
+    """A language section's byte range within an archive."""
+    document: int
+    language: str
+    start: int
+    end: int
+
+def scan_unified_archive(buffer: Union[bytes, mmap.mmap]) -> List[Tuple[int, int, Dict[str, Tuple[int, int]]]]:
+    """Scan a unified XML archive for documents and their language sections.
+
+    Returns one ``(start, end, {language: (start, end)})`` entry per
+    ``unified-semantic-data`` document; only the first section of each
+    language in a document is kept. Sections outside a document are ignored.
+    """
+    documents = []
+    current = None
+    position = 0
+    while True:
+        match = _TAG_PATTERN.search(buffer, position)
+        if match is None:
+            break
+        closing, tag = match.group(1), match.group(2)
+        rest = _TAG_REST.match(buffer, match.end())
+        if rest is None:
+            raise ValueError(f"Unterminated <{tag.decode()}> tag at offset {match.start()}")
+        tag_end = rest.end()
+        self_closing = buffer[tag_end - 2:tag_end - 1] == b"/"
+
+        if tag == UNIFIED_TAG.encode():
+            if closing:
+                if current is not None:
+                    current[1] = tag_end
+                    documents.append(tuple(current))
+                    current = None
+            else:
+                if current is not None:
+                    # A new document starts before the previous one closed
+                    current[1] = match.start()
+                    documents.append(tuple(current))
+                current = [match.start(), tag_end, {}]
+                if self_closing:
+                    documents.append(tuple(current))
+                    current = None
+            position = tag_end
+            continue
+
+        if closing:
+            position = tag_end
+            continue
+
+        if self_closing:
+            section_end = tag_end
+        else:
+            close = _CLOSE_PATTERNS[tag].search(buffer, tag_end)
+            if close is None:
+                raise ValueError(f"Unclosed <{tag.decode()}> section at offset {match.start()}")
+            section_end = close.end()
+        if current is not None:
+            current[2].setdefault(_LANGUAGES_BY_TAG[tag], (match.start(), section_end))
+        position = section_end
+
+    if current is not None:
+        current[1] = len(buffer)
+        documents.append(tuple(current))
+    return documents
+
+class UnifiedXMLArchive:
+    """Memory-mapped, random-access reader for unified XML archives.
+
+    Offsets come from a valid sidecar index when one exists, and otherwise
+    from scanning the archive on first use; ``build_index`` writes the
+    sidecar. ``xml_transformers`` maps language types to the transformers
+    used to unwrap sections (by default, new ones with ``validation_mode``).
+    """
+
+    def __init__(self, path: Union[str, Path], index_path: Optional[Union[str, Path]] = None,
+                 validation_mode: str = "structural-on-tree",
+                 xml_transformers: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path is not None else self.path.with_name(
+            self.path.name + INDEX_SUFFIX
+        )
+        self.validation_mode = validation_mode
+        self.xml_transformers = xml_transformers
+        self.documents: Optional[List[Tuple[int, int, Dict[str, Tuple[int, int]]]]] = None
+        self.index_document_count = None
+        self.index_mmap = None
+
+        self.file = open(self.path, "rb")
+        try:
+            stat = os.fstat(self.file.fileno())
+            self.size = stat.st_size
+            self.mtime_ns = stat.st_mtime_ns
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+            self._open_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _open_index(self):
+        """Memory-map the sidecar index if it matches this archive."""
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) < _INDEX_HEADER.size:
+                    return
+                magic, size, mtime_ns, document_count = _INDEX_HEADER.unpack(header)
+                if magic != INDEX_MAGIC or (size, mtime_ns) != (self.size, self.mtime_ns):
+                    logger.info(f"Ignoring stale XML archive index {self.index_path}")
+                    return
+                if os.fstat(f.fileno()).st_size != _INDEX_HEADER.size + document_count * _INDEX_RECORD.size:
+                    logger.warning(f"Ignoring truncated XML archive index {self.index_path}")
+                    return
+                self.index_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.index_document_count = document_count
+        except FileNotFoundError:
+            return
+
+    def _scan(self) -> List[Tuple[int, int, Dict[str, Tuple[int, int]]]]:
+        """Scan the archive once and keep the offsets."""
+        if self.documents is None:
+            self.documents = scan_unified_archive(self.mmap)
+        return self.documents
+
+    @property
+    def document_count(self) -> int:
+        """Number of unified documents in the archive."""
+        if self.documents is None and self.index_mmap is not None:
+            return self.index_document_count
+        return len(self._scan())
+
+    def _document_entry(self, document: int) -> Tuple[int, int, Dict[str, Tuple[int, int]]]:
+        """Offsets for one document, from the sidecar index or the scan."""
+        count = self.document_count
+        if not 0 <= document < count:
+            raise ValueError(f"Document {document} out of range for archive with {count} documents")
+        if self.documents is None and self.index_mmap is not None:
+            values = _INDEX_RECORD.unpack_from(self.index_mmap, _INDEX_HEADER.size + document * _INDEX_RECORD.size)
+            sections = {
+                language: (values[2 + 2 * i], values[3 + 2 * i])
+                for i, language in enumerate(ARCHIVE_LANGUAGES)
+                if values[3 + 2 * i]
+            }
+            return values[0], values[1], sections
+        return self._scan()[document]
+
+    def section(self, language_type: str, document: int = 0) -> Optional[ArchiveSection]:
+        """Locate a language section; None when the document has none."""
+        if language_type not in ARCHIVE_SECTION_TAGS:
+            raise ValueError(f"Unsupported language type: {language_type}")
+        span = self._document_entry(document)[2].get(language_type)
+        if span is None:
+            return None
+        return ArchiveSection(document, language_type, span[0], span[1])
+
+    def sections(self) -> Iterator[ArchiveSection]:
+        """Iterate over every language section in archive order."""
+        for document in range(self.document_count):
+            for language_type, (start, end) in sorted(self._document_entry(document)[2].items(),
+                                                      key=lambda item: item[1]):
+                yield ArchiveSection(document, language_type, start, end)
+
+    def document_bytes(self, document: int = 0) -> bytes:
+        """Raw bytes of one unified document."""
+        start, end, _ = self._document_entry(document)
+        return self.mmap[start:end]
+
+    def section_bytes(self, language_type: str, document: int = 0) -> bytes:
+        """Raw bytes of one language section; raises ValueError when missing."""
+        section = self.section(language_type, document)
+        if section is None:
+            raise ValueError(f"Document {document} has no {language_type} section")
+        return self.mmap[section.start:section.end]
+
+    def _get_transformer(self, language_type: str) -> Any:
+        """Get the transformer that unwraps a language's sections."""
+        if self.xml_transformers is None:
+            self.xml_transformers = {
+                "baml": BAMLXMLTransformer(validation_mode=self.validation_mode),
+                "pareto_lang": ParetoLangXMLTransformer(validation_mode=self.validation_mode)
+            }
+        return self.xml_transformers[language_type]
+
+    def unwrap_section(self, language_type: str, document: int = 0,
+                       context: Optional[Dict[str, Any]] = None) -> Any:
+        """Parse and unwrap one language section of one document.
+
+        Only the section's bytes are parsed; the result is the language
+        transformer's ``XMLTransformationResult``.
+        """
+        xml_element = ET.fromstring(self.section_bytes(language_type, document))
+        return self._get_transformer(language_type).unwrap_from_element(xml_element, context)
+
+    def build_index(self) -> Path:
+        """Scan the archive if needed and atomically write the sidecar index."""
+        documents = self._scan()
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_INDEX_HEADER.pack(INDEX_MAGIC, self.size, self.mtime_ns, len(documents)))
+                for start, end, sections in documents:
+                    values = [start, end]
+                    for language_type in ARCHIVE_LANGUAGES:
+                        values.extend(sections.get(language_type, (0, 0)))
+                    f.write(_INDEX_RECORD.pack(*values))
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        logger.info(f"Indexed {len(documents)} unified documents of {self.path} in {self.index_path}")
+        return self.index_path
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get archive status."""
+        return {
+            "path": str(self.path),
+            "size": self.size,
+            "index_path": str(self.index_path),
+            "index_loaded": self.index_mmap is not None,
+            "scanned": self.documents is not None,
+            "document_count": self.document_count
+        }
+
+    def close(self):
+        """Release the memory maps and the archive file."""
+        for resource in (self.index_mmap, getattr(self, "mmap", None)):
+            if isinstance(resource, mmap.mmap):
+                resource.close()
+        self.index_mmap = None
+        self.mmap = b""
+        self.file.close()
+
+    def __enter__(self) -> "UnifiedXMLArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+# Export unified XML archive classes
+__all__ = [
+    'UnifiedXMLArchive',
+    'ArchiveSection',
+    'scan_unified_archive'
+]
@@ -5,11 +5,16 @@ Unified XML processor for BAML and Pareto-Lang semantic languages.
 Provides consistent XML transformation processing across all semantic languages.
 """
 
+import os
+import copy
 import json
 import time
 import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -19,12 +24,95 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import semantic language processors
-from .baml.xml_transformer import BAMLXMLTransformer
-from .pareto_lang.xml_transformer import ParetoLangXMLTransformer
+from .baml.xml_transformer import BAMLXMLTransformer, BAMLXMLSchema, XMLTransformationResult
+from .pareto_lang.xml_transformer import ParetoLangXMLTransformer, ParetoLangXMLSchema
+from .metrics import MetricsRecorder
+from .results import SlottedResult
+from .wrap_cache import WrapCache, WrapCacheEntry, TimestampTemplate, canonical_content_key
+from .xml_archive import UnifiedXMLArchive
+from .xml_writer import format_attributes
 
-@dataclass
-class UnifiedXMLProcessingResult:
-    """Result of unified XML processing operation."""
+# XML schemas used by batch workers (instantiated inside each worker process)
+BATCH_XML_SCHEMAS = {
+    "baml": BAMLXMLSchema,
+    "pareto_lang": ParetoLangXMLSchema
+}
+
+def _wrap_batch_chunk(language_type: str, documents: List[Dict[str, Any]]) -> List[str]:
+    """Wrap a chunk of documents with XML inside a batch worker.
+    
+    Documents that cannot be wrapped produce an empty wrapper, matching the
+    ``xml_wrapper=""`` convention of failed single-document transformations.
+    """
+    xml_schema = BATCH_XML_SCHEMAS[language_type]()
+    xml_wrappers = []
+    for document in documents:
+        try:
+            xml_wrappers.append(xml_schema.to_xml_string(document))
+        except Exception:
+            xml_wrappers.append("")
+    return xml_wrappers
+
+# Transformer classes used by process-pool language workers
+LANGUAGE_TRANSFORMERS = {
+    "baml": BAMLXMLTransformer,
+    "pareto_lang": ParetoLangXMLTransformer
+}
+
+# (language, validation mode, serializer) -> transformer, per worker process
+_worker_transformers: Dict[Tuple[str, str, str], Any] = {}
+
+def _timed_wrap(transformer: Any, language_type: str, semantic_data: Dict[str, Any],
+                context: Optional[Dict[str, Any]]) -> Tuple[XMLTransformationResult, float]:
+    """Wrap one language's data; returns the result and the wall-clock duration."""
+    start_time = time.perf_counter()
+    if language_type == "baml":
+        transformation_result = transformer.wrap_baml_with_xml(semantic_data, context)
+    else:
+        transformation_result = transformer.wrap_pareto_lang_with_xml(semantic_data, context)
+    return transformation_result, time.perf_counter() - start_time
+
+def _wrap_language_document(language_type: str, semantic_data: Dict[str, Any],
+                            context: Optional[Dict[str, Any]], validation_mode: str,
+                            xml_serializer: str) -> Tuple[XMLTransformationResult, float]:
+    """Wrap one language's data inside a process-pool worker."""
+    key = (language_type, validation_mode, xml_serializer)
+    transformer = _worker_transformers.get(key)
+    if transformer is None:
+        transformer = LANGUAGE_TRANSFORMERS[language_type](
+            validation_mode=validation_mode, xml_serializer=xml_serializer
+        )
+        _worker_transformers[key] = transformer
+    return _timed_wrap(transformer, language_type, semantic_data, context)
+
+def _chunk_documents(documents: Iterable[Dict[str, Any]], chunksize: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split an iterable of documents into lists of at most ``chunksize``."""
+    iterator = iter(documents)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+@dataclass(frozen=True)
+class UnifiedXMLProcessingResult(SlottedResult):
+    """Result of unified XML processing operation (slotted and frozen).
+    
+    Parsed unified wrappers keep their language elements and serialize them
+    into ``xml_wrappers`` on first access.
+    """
+    __slots__ = ("success", "processed_data", "xml_wrappers", "transformation_times",
+                 "semantic_preserved", "validation_results", "metadata", "_lazy_parts")
+    _lazy_field = "xml_wrappers"
+    
+    @staticmethod
+    def _build_lazy_field(keys: Tuple[str, ...], values: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Serialize the deferred language elements."""
+        return {
+            key: ET.tostring(value, encoding='unicode') if isinstance(value, ET.Element) else value
+            for key, value in zip(keys, values)
+        }
+    
     success: bool
     processed_data: Dict[str, Any]
     xml_wrappers: Dict[str, Any]
@@ -61,16 +149,94 @@ class UnifiedXMLSchema:
             raise ValueError(f"Unsupported language type: {language_type}")
 
 class UnifiedXMLProcessor:
-    """Unified XML processor for semantic languages."""
+    """Unified XML processor for semantic languages.
     
-    def __init__(self):
-        self.baml_transformer = BAMLXMLTransformer()
-        self.pareto_lang_transformer = ParetoLangXMLTransformer()
+    ``executor`` runs the per-language wraps of a multi-language call
+    concurrently. Without one the languages are wrapped one after the other:
+    wrapping is GIL-bound Python, so a thread pool cannot overlap it. Pass a
+    ``ProcessPoolExecutor`` to overlap the wraps on separate CPUs, in which
+    case each worker process wraps with its own transformers (their history
+    is not recorded on this processor's transformers). The caller owns the
+    executor and shuts it down.
+    """
+    
+    def __init__(self, history_size: int = 100, validation_mode: str = "structural-on-tree",
+                 xml_serializer: str = "direct", wrap_cache: Optional[WrapCache] = None,
+                 executor: Optional[Executor] = None):
+        self.baml_transformer = BAMLXMLTransformer(history_size, validation_mode, xml_serializer, wrap_cache)
+        self.pareto_lang_transformer = ParetoLangXMLTransformer(history_size, validation_mode, xml_serializer, wrap_cache)
         self.unified_schema = UnifiedXMLSchema()
+        self.validation_mode = validation_mode
+        self.xml_serializer = xml_serializer
+        self.wrap_cache = wrap_cache
+        
+        self.executor = executor
         
-        self.processing_history = []
+        self.processing_metrics = MetricsRecorder(history_size)
         self.performance_metrics = {}
         
+    @property
+    def processing_history(self):
+        """Most recent processing records (bounded by ``history_size``)."""
+        return self.processing_metrics.recent_records
+    
+    def _record_processing(self, processing_record: Dict[str, Any]):
+        """Record a processing operation in the bounded processing metrics."""
+        if "language_type" in processing_record:
+            languages = (processing_record["language_type"],)
+        else:
+            languages = processing_record.get("language_types", ())
+        
+        self.processing_metrics.record(
+            processing_record["processing_time"],
+            processing_record["success"],
+            processing_record,
+            languages
+        )
+    
+    def _get_transformer(self, language_type: str) -> Any:
+        """Get the transformer for a language type."""
+        if language_type == "baml":
+            return self.baml_transformer
+        if language_type == "pareto_lang":
+            return self.pareto_lang_transformer
+        raise ValueError(f"Unsupported language type: {language_type}")
+    
+    def _wrap_languages(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                        context: Optional[Dict[str, Any]]) -> Dict[str, Tuple[XMLTransformationResult, float]]:
+        """Wrap every language's data, concurrently on the executor if one is configured.
+        
+        Returns ``language -> (result, seconds)`` in input order; each duration
+        is measured around that language's own wrap.
+        """
+        transformers = {
+            language_type: self._get_transformer(language_type)
+            for language_type in semantic_data_dict
+        }
+        executor = self.executor
+        if executor is None or len(transformers) < 2:
+            return {
+                language_type: _timed_wrap(transformer, language_type, semantic_data_dict[language_type], context)
+                for language_type, transformer in transformers.items()
+            }
+        
+        if isinstance(executor, ProcessPoolExecutor):
+            futures = {
+                language_type: executor.submit(
+                    _wrap_language_document, language_type, semantic_data_dict[language_type],
+                    context, self.validation_mode, self.xml_serializer
+                )
+                for language_type in transformers
+            }
+        else:
+            futures = {
+                language_type: executor.submit(
+                    _timed_wrap, transformer, language_type, semantic_data_dict[language_type], context
+                )
+                for language_type, transformer in transformers.items()
+            }
+        return {language_type: future.result() for language_type, future in futures.items()}
+    
     def process_semantic_data_with_xml(self, semantic_data: Dict[str, Any], 
                                         language_type: str,
                                         context: Optional[Dict[str, Any]] = None) -> UnifiedXMLProcessingResult:
@@ -78,24 +244,24 @@ class UnifiedXMLProcessor:
         start_time = time.time()
         
         try:
-            # Validate language type
-            if language_type not in ["baml", "pareto_lang"]:
-                raise ValueError(f"Unsupported language type: {language_type}")
-            
             # Get appropriate transformer
-            if language_type == "baml":
-                transformer = self.baml_transformer
-            else:
-                transformer = self.pareto_lang_transformer
+            transformer = self._get_transformer(language_type)
             
             # Apply XML transformation
             if context and context.get("xml_transformation_enabled", False):
-                transformation_result = transformer.wrap_data_with_xml(semantic_data)
+                transformation_result, transformation_time = _timed_wrap(
+                    transformer, language_type, semantic_data, context
+                )
                 xml_wrapper = transformation_result.xml_wrapper
                 xml_applied = True
+                semantic_preserved = transformation_result.success
+                xml_validation = transformation_result.validation_result
             else:
                 xml_wrapper = ""
                 xml_applied = False
+                transformation_time = 0.0
+                semantic_preserved = True
+                xml_validation = {"valid": True, "skipped": True}
             
             # Calculate processing metrics
             processing_time = time.time() - start_time
@@ -106,19 +272,19 @@ class UnifiedXMLProcessor:
                 "language_type": language_type,
                 "xml_transformation_applied": xml_applied,
                 "processing_time": processing_time,
-                "success": True
+                "success": semantic_preserved
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
-                success=True,
+                success=semantic_preserved,
                 processed_data=semantic_data,
                 xml_wrappers={language_type: xml_wrapper},
-                transformation_times={language_type: processing_time},
-                semantic_preserved={language_type: True},
+                transformation_times={language_type: transformation_time},
+                semantic_preserved={language_type: semantic_preserved},
                 validation_results={
-                    "semantic_validation": {"valid": True},
-                    "xml_validation": {"valid": True} if xml_applied else {"valid": True, "skipped": True}
+                    "semantic_validation": {"valid": semantic_preserved},
+                    "xml_validation": xml_validation
                 },
                 metadata={
                     "language_type": language_type,
@@ -142,7 +308,7 @@ class UnifiedXMLProcessor:
                 "success": False,
                 "error": str(e)
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
                 success=False,
@@ -159,63 +325,114 @@ class UnifiedXMLProcessor:
                 }
             )
     
+    def process_batch(self, documents: Iterable[Dict[str, Any]], 
+                      language_type: str,
+                      workers: Optional[int] = None,
+                      chunksize: Optional[int] = None) -> Iterator[str]:
+        """Wrap a batch of semantic documents with XML across a process pool.
+        
+        Yields one XML wrapper per document in input order as chunks complete;
+        documents that fail to wrap yield an empty string. At most two chunks
+        per worker are in flight, so ``documents`` may be a lazy iterable.
+        A single processing-history record with batch timing is stored when
+        the batch finishes, rather than one record per document.
+        
+        Unsupported languages raise ``ValueError`` at call time, before any
+        document is consumed.
+        """
+        if language_type not in BATCH_XML_SCHEMAS:
+            raise ValueError(f"Unsupported language type: {language_type}")
+        
+        workers = workers or os.cpu_count() or 1
+        if chunksize is None:
+            # Roughly four chunks per worker for sized batches
+            chunksize = max(1, len(documents) // (workers * 4)) if hasattr(documents, "__len__") else 64
+        
+        return self._iter_batch(documents, language_type, workers, chunksize)
+    
+    def _iter_batch(self, documents: Iterable[Dict[str, Any]], language_type: str,
+                    workers: int, chunksize: int) -> Iterator[str]:
+        """Yield the XML wrappers of a validated batch (see ``process_batch``)."""
+        start_time = time.time()
+        batch_stats = {"document_count": 0, "failed_count": 0}
+        
+        def collect(xml_wrappers: List[str]) -> List[str]:
+            batch_stats["document_count"] += len(xml_wrappers)
+            batch_stats["failed_count"] += xml_wrappers.count("")
+            return xml_wrappers
+        
+        try:
+            if workers == 1:
+                for chunk in _chunk_documents(documents, chunksize):
+                    yield from collect(_wrap_batch_chunk(language_type, chunk))
+                return
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for chunk in _chunk_documents(documents, chunksize):
+                    pending.append(executor.submit(_wrap_batch_chunk, language_type, chunk))
+                    if len(pending) >= workers * 2:
+                        yield from collect(pending.popleft().result())
+                
+                while pending:
+                    yield from collect(pending.popleft().result())
+        finally:
+            processing_time = time.time() - start_time
+            document_count = batch_stats["document_count"]
+            
+            # Store one processing record for the whole batch
+            processing_record = {
+                "timestamp": datetime.now().isoformat(),
+                "operation": "batch_xml_wrapping",
+                "language_type": language_type,
+                "xml_transformation_applied": True,
+                "document_count": document_count,
+                "failed_count": batch_stats["failed_count"],
+                "workers": workers,
+                "chunksize": chunksize,
+                "processing_time": processing_time,
+                "documents_per_second": document_count / processing_time if processing_time > 0 else 0.0,
+                "success": batch_stats["failed_count"] == 0
+            }
+            self._record_processing(processing_record)
+    
     def process_multiple_semantic_data_with_xml(self, semantic_data_dict: Dict[str, Dict[str, Any]], 
                                                context: Optional[Dict[str, Any]] = None) -> UnifiedXMLProcessingResult:
-        """Process multiple semantic data types with XML transformations."""
+        """Process multiple semantic data types with XML transformations.
+        
+        With XML transformation enabled and a ``ProcessPoolExecutor``
+        configured, the languages are wrapped concurrently, so the call costs
+        close to the slowest language rather than the sum. ``transformation_times``
+        holds each language's own wrap duration.
+        """
         start_time = time.time()
         
         try:
-            results = {}
-            xml_wrappers = {}
-            transformation_times = {}
-            semantic_preserved = {}
-            validation_results = {}
-            
-            # Process each language type
-            for language_type, semantic_data in semantic_data_dict.items():
-                if language_type in ["baml", "pareto_lang"]:
-                    # Get appropriate transformer
-                    if language_type == "baml":
-                        transformer = self.baml_transformer
-                    else:
-                        transformer = self.pareto_lang_transformer
-                    
-                    # Apply XML transformation
-                    if context and context.get("xml_transformation_enabled", False):
-                        transformation_result = transformer.wrap_data_with_xml(semantic_data)
-                        xml_wrappers[language_type] = transformation_result.xml_wrapper
-                        results[language_type] = transformation_result.transformed_data
-                        validation_results[language_type] = transformation_result.validation_result
-                    else:
-                        xml_wrappers[language_type] = ""
-                        results[language_type] = semantic_data
-                        validation_results[language_type] = {"valid": True, "xml_skipped": True}
-                    
-                    semantic_preserved[language_type] = True
-                    transformation_times[language_type] = time.time()  # Will be updated below
-                else:
-                    raise ValueError(f"Unsupported language type: {language_type}")
+            # Apply XML transformation to every language type
+            individual_results = self._wrap_language_results(semantic_data_dict, context)
             
             # Calculate total processing time
             total_processing_time = time.time() - start_time
+            success = individual_results.success
             
             # Store processing history
             processing_record = {
                 "timestamp": datetime.now().isoformat(),
                 "language_types": list(semantic_data_dict.keys()),
                 "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
+                "transformation_times": individual_results.transformation_times,
                 "processing_time": total_processing_time,
-                "success": True
+                "success": success
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
-                success=True,
-                processed_data=results,
-                xml_wrappers=xml_wrappers,
-                transformation_times=transformation_times,
-                semantic_preserved=semantic_preserved,
-                validation_results=validation_results,
+                success=success,
+                processed_data=individual_results.processed_data,
+                xml_wrappers=individual_results.xml_wrappers,
+                transformation_times=individual_results.transformation_times,
+                semantic_preserved=individual_results.semantic_preserved,
+                validation_results=individual_results.validation_results,
                 metadata={
                     "language_types": list(semantic_data_dict.keys()),
                     "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
@@ -237,7 +454,7 @@ class UnifiedXMLProcessor:
                 "success": False,
                 "error": str(e)
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
                 success=False,
@@ -254,45 +471,110 @@ class UnifiedXMLProcessor:
                 }
             )
     
+    def _wrap_language_results(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                               context: Optional[Dict[str, Any]]) -> UnifiedXMLProcessingResult:
+        """Wrap every language with its transformer and collect the per-language results.
+        
+        Each language's ``xml_wrapper`` is serialized once (or served from the
+        wrap cache); languages whose wrap failed or was skipped have an empty
+        wrapper.
+        """
+        results = {}
+        xml_wrappers = {}
+        transformation_times = {}
+        semantic_preserved = {}
+        validation_results = {}
+        
+        if context and context.get("xml_transformation_enabled", False):
+            wrapped = self._wrap_languages(semantic_data_dict, context)
+            for language_type, (transformation_result, transformation_time) in wrapped.items():
+                xml_wrappers[language_type] = transformation_result.xml_wrapper
+                results[language_type] = transformation_result.transformed_data
+                validation_results[language_type] = transformation_result.validation_result
+                semantic_preserved[language_type] = transformation_result.success
+                transformation_times[language_type] = transformation_time
+        else:
+            for language_type, semantic_data in semantic_data_dict.items():
+                self._get_transformer(language_type)
+                xml_wrappers[language_type] = ""
+                results[language_type] = semantic_data
+                validation_results[language_type] = {"valid": True, "xml_skipped": True}
+                semantic_preserved[language_type] = True
+                transformation_times[language_type] = 0.0
+        
+        return UnifiedXMLProcessingResult(
+            success=all(semantic_preserved.values()),
+            processed_data=results,
+            xml_wrappers=xml_wrappers,
+            transformation_times=transformation_times,
+            semantic_preserved=semantic_preserved,
+            validation_results=validation_results,
+            metadata={"language_types": list(semantic_data_dict.keys())}
+        )
+    
+    def _compose_unified_xml(self, timestamp: str, language_types: Iterable[str],
+                             language_xml: List[str]) -> str:
+        """Compose the unified wrapper text around already serialized languages.
+        
+        Produces exactly what ``ET.tostring`` gives for the unified tree, so
+        each language is serialized once and ``xml_wrappers`` are slices of
+        the unified text.
+        """
+        root_attributes = format_attributes((
+            ("version", self.unified_schema.unified_version),
+            ("spec", self.unified_schema.spec),
+            ("timestamp", timestamp),
+            ("languages", ",".join(language_types))
+        ))
+        schema_info = format_attributes((("unified_version", self.unified_schema.unified_version),))
+        language_data = (
+            f"<language-data>{''.join(language_xml)}</language-data>" if language_xml
+            else "<language-data />"
+        )
+        return (
+            f"<unified-semantic-data{root_attributes}>"
+            f"<metadata><schema-info{schema_info} /></metadata>"
+            f"{language_data}</unified-semantic-data>"
+        )
+    
     def create_unified_xml_wrapper(self, semantic_data_dict: Dict[str, Dict[str, Any]], 
                                     context: Optional[Dict[str, Any]] = None) -> UnifiedXMLProcessingResult:
         """Create unified XML wrapper for multiple semantic languages."""
         start_time = time.time()
         
         try:
-            # Process each language with XML
-            individual_results = self.process_multiple_semantic_data_with_xml(
-                semantic_data_dict, context
+            # Serve repeated inputs from the wrap cache
+            cache_key = None
+            if self.wrap_cache is not None:
+                cache_key = self._unified_wrap_cache_key(semantic_data_dict, context)
+                cached_entry = self.wrap_cache.get(cache_key)
+                if cached_entry is not None:
+                    return self._cached_unified_result(semantic_data_dict, cached_entry, context, start_time)
+            
+            # Wrap each language once with its transformer
+            individual_results = self._wrap_language_results(semantic_data_dict, context)
+            
+            # Compose the unified XML from each language's single serialization
+            unified_xml_string = self._compose_unified_xml(
+                datetime.now().isoformat(), semantic_data_dict.keys(),
+                [xml_wrapper for xml_wrapper in individual_results.xml_wrappers.values() if xml_wrapper]
             )
             
-            if not individual_results.success:
-                return individual_results
-            
-            # Create unified XML structure
-            unified_root = ET.Element("unified-semantic-data")
-            unified_root.set("version", self.unified_schema.unified_version)
-            unified_root.set("spec", self.unified_schema.spec)
-            unified_root.set("timestamp", datetime.now().isoformat())
-            unified_root.set("languages", ",".join(semantic_data_dict.keys()))
-            
-            # Add metadata
-            metadata = ET.SubElement(unified_root, "metadata")
-            schema_info = ET.SubElement(metadata, "schema-info")
-            schema_info.set("unified_version", self.unified_schema.unified_version)
-            
-            # Add language-specific XML
-            language_data = ET.SubElement(unified_root, "language-data")
-            
-            for language_type, xml_wrapper in individual_results.xml_wrappers.items():
-                if xml_wrapper:  # Only add if XML wrapper exists
-                    try:
-                        lang_xml = ET.fromstring(xml_wrapper)
-                        language_data.append(lang_xml)
-                    except ET.ParseError:
-                        logger.warning(f"Failed to parse XML for {language_type}, skipping")
-            
-            # Convert unified XML to string
-            unified_xml_string = ET.tostring(unified_root, encoding='unicode')
+            if cache_key is not None:
+                self.wrap_cache.put(
+                    cache_key,
+                    TimestampTemplate.from_xml(unified_xml_string, self._unified_root_tags()),
+                    copy.deepcopy({
+                        "xml_wrappers": {
+                            language_type: TimestampTemplate.from_xml(
+                                xml_wrapper, self._unified_root_tags()
+                            ).segments
+                            for language_type, xml_wrapper in individual_results.xml_wrappers.items()
+                        },
+                        "semantic_preserved": individual_results.semantic_preserved,
+                        "validation_results": individual_results.validation_results
+                    })
+                )
             
             # Calculate processing time
             total_processing_time = time.time() - start_time
@@ -304,12 +586,12 @@ class UnifiedXMLProcessor:
                 "language_types": list(semantic_data_dict.keys()),
                 "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
                 "processing_time": total_processing_time,
-                "success": True
+                "success": individual_results.success
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
-                success=True,
+                success=individual_results.success,
                 processed_data=individual_results.processed_data,
                 xml_wrappers={
                     **individual_results.xml_wrappers,
@@ -324,7 +606,8 @@ class UnifiedXMLProcessor:
                     "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
                     "processing_time": total_processing_time,
                     "unified_xml_created": True,
-                    "context_applied": context is not None
+                    "context_applied": context is not None,
+                    "cache_hit": False
                 }
             )
             
@@ -342,7 +625,7 @@ class UnifiedXMLProcessor:
                 "success": False,
                 "error": str(e)
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
                 success=False,
@@ -379,7 +662,8 @@ class UnifiedXMLProcessor:
                 raise ValueError("No language data found in unified XML wrapper")
             
             results = {}
-            xml_wrappers = {}
+            # Language elements, serialized into xml_wrappers on first access
+            language_elements = {}
             transformation_times = {}
             semantic_preserved = {}
             validation_results = {}
@@ -399,16 +683,16 @@ class UnifiedXMLProcessor:
                     else:
                         continue
                     
-                    # Convert XML element to string
-                    lang_xml_string = ET.tostring(lang_element, encoding='unicode')
-                    
-                    # Parse with appropriate transformer
-                    transformation_result = transformer.unwrap_xml_to_xml_data(lang_xml_string)
+                    # Unwrap the element in place with the appropriate transformer
+                    transformation_result = transformer.unwrap_from_element(lang_element, context)
                     
                     results[lang_key] = transformation_result.transformed_data
-                    xml_wrappers[lang_key] = lang_xml_string
+                    language_elements[lang_key] = lang_element
                     validation_results[lang_key] = transformation_result.validation_result
-                    semantic_preserved[lang_key] = transformation_result.semantic_preserved
+                    semantic_preserved[lang_key] = (
+                        transformation_result.semantic_preserved if lang_key == "baml"
+                        else transformation_result.optimization_preserved
+                    )
                     transformation_times[lang_key] = transformation_result.transformation_time
                 else:
                     logger.warning(f"Unsupported language element: {language_type}")
@@ -425,12 +709,12 @@ class UnifiedXMLProcessor:
                 "processing_time": total_processing_time,
                 "success": True
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
-            return UnifiedXMLProcessingResult(
+            return UnifiedXMLProcessingResult.with_lazy_field(
+                tuple(language_elements), tuple(language_elements.values()),
                 success=True,
                 processed_data=results,
-                xml_wrappers=xml_wrappers,
                 transformation_times=transformation_times,
                 semantic_preserved=semantic_preserved,
                 validation_results=validation_results,
@@ -458,7 +742,7 @@ class UnifiedXMLProcessor:
                 "success": False,
                 "error": str(e)
             }
-            self.processing_history.append(processing_record)
+            self._record_processing(processing_record)
             
             return UnifiedXMLProcessingResult(
                 success=False,
@@ -476,6 +760,80 @@ class UnifiedXMLProcessor:
                 }
             )
     
+    def open_xml_archive(self, archive_path: Union[str, Path],
+                         index_path: Optional[Union[str, Path]] = None) -> UnifiedXMLArchive:
+        """Open an on-disk unified XML archive for memory-mapped section reads.
+
+        Sections are unwrapped with this processor's transformers, so their
+        history and validation mode apply.
+        """
+        return UnifiedXMLArchive(
+            archive_path, index_path, self.validation_mode,
+            {"baml": self.baml_transformer, "pareto_lang": self.pareto_lang_transformer}
+        )
+    
+    def _unified_root_tags(self) -> Tuple[str, ...]:
+        """Root tags whose ``timestamp`` is refreshed on unified cache hits."""
+        return (
+            "unified-semantic-data",
+            self.baml_transformer.xml_schema.wrapper_tag,
+            self.pareto_lang_transformer.xml_schema.wrapper_tag
+        )
+    
+    def _unified_wrap_cache_key(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                                context: Optional[Dict[str, Any]]) -> str:
+        """Content hash of unified input plus everything that shapes its wrapper."""
+        return canonical_content_key(
+            "unified", semantic_data_dict,
+            self.unified_schema.unified_version, self.unified_schema.spec,
+            self.baml_transformer.xml_schema.version, self.pareto_lang_transformer.xml_schema.version,
+            self.validation_mode, bool(context and context.get("xml_transformation_enabled", False))
+        )
+    
+    def _cached_unified_result(self, semantic_data_dict: Dict[str, Dict[str, Any]],
+                               cached_entry: WrapCacheEntry, context: Optional[Dict[str, Any]],
+                               start_time: float) -> UnifiedXMLProcessingResult:
+        """Build a unified wrapper result from a cache entry, re-stamped with the current time."""
+        timestamp = datetime.now().isoformat()
+        payload = copy.deepcopy(cached_entry.payload)
+        xml_wrappers = {
+            language_type: TimestampTemplate(segments).render(timestamp)
+            for language_type, segments in payload["xml_wrappers"].items()
+        }
+        xml_wrappers["unified"] = cached_entry.template.render(timestamp)
+        success = all(payload["semantic_preserved"].values())
+        total_processing_time = time.time() - start_time
+        
+        # Store processing history
+        processing_record = {
+            "timestamp": timestamp,
+            "operation": "unified_xml_wrapper_creation",
+            "language_types": list(semantic_data_dict.keys()),
+            "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
+            "processing_time": total_processing_time,
+            "cache_hit": True,
+            "success": success
+        }
+        self._record_processing(processing_record)
+        
+        return UnifiedXMLProcessingResult(
+            success=success,
+            processed_data=dict(semantic_data_dict),
+            xml_wrappers=xml_wrappers,
+            transformation_times={language_type: 0.0 for language_type in semantic_data_dict},
+            semantic_preserved=payload["semantic_preserved"],
+            validation_results=payload["validation_results"],
+            metadata={
+                "operation": "unified_xml_wrapper_creation",
+                "language_types": list(semantic_data_dict.keys()),
+                "xml_transformation_applied": context and context.get("xml_transformation_enabled", False),
+                "processing_time": total_processing_time,
+                "unified_xml_created": True,
+                "context_applied": context is not None,
+                "cache_hit": True
+            }
+        )
+    
     def get_unified_processor_status(self) -> Dict[str, Any]:
         """Get status of unified XML processor."""
         return {
@@ -483,40 +841,33 @@ class UnifiedXMLProcessor:
             "unified_schema": asdict(self.unified_schema),
             "baml_transformer_status": self.baml_transformer.get_transformation_status(),
             "pareto_lang_transformer_status": self.pareto_lang_transformer.get_transformation_status(),
-            "processing_history_size": len(self.processing_history),
+            "wrap_cache": self.wrap_cache.get_stats() if self.wrap_cache is not None else {"enabled": False},
+            "processing_history_size": self.processing_metrics.count,
             "performance_metrics": self._get_performance_metrics()
         }
     
     def _get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for unified XML processor."""
-        if not self.processing_history:
+        if not self.processing_metrics.count:
             return {"status": "no_processing_performed"}
         
-        total_operations = len(self.processing_history)
-        successful_operations = sum(1 for record in self.processing_history if record.get("success", False))
-        
-        processing_times = [
-            record.get("processing_time", 0) 
-            for record in self.processing_history
-        ]
-        
-        language_distribution = {}
-        for record in self.processing_history:
-            if "language_type" in record:
-                lang = record["language_type"]
-                language_distribution[lang] = language_distribution.get(lang, 0) + 1
-            elif "language_types" in record:
-                for lang in record["language_types"]:
-                    language_distribution[lang] = language_distribution.get(lang, 0) + 1
+        summary = self.processing_metrics.summary()
         
         return {
-            "total_operations": total_operations,
-            "successful_operations": successful_operations,
-            "success_rate": successful_operations / total_operations,
-            "average_processing_time": sum(processing_times) / len(processing_times),
-            "total_processing_time": sum(processing_times),
-            "language_distribution": language_distribution,
-            "last_operation": self.processing_history[-1] if self.processing_history else None
+            "total_operations": summary["count"],
+            "successful_operations": summary["success_count"],
+            "success_rate": summary["success_rate"],
+            "average_processing_time": summary["mean_time"],
+            "total_processing_time": summary["total_time"],
+            "min_processing_time": summary["min_time"],
+            "max_processing_time": summary["max_time"],
+            "processing_time_percentiles": {
+                "p50": summary["p50"],
+                "p95": summary["p95"],
+                "p99": summary["p99"]
+            },
+            "language_distribution": dict(self.processing_metrics.label_counts),
+            "last_operation": self.processing_metrics.last_record
         }
 
 # Export main classes
@@ -0,0 +1,151 @@
+"""
+FSL Continuum - Direct XML Writer
+
+Fast-path XML serialization for the flat BAML and Pareto-Lang wrapper schemas.
+Writes escaped XML text straight into a buffer without building an
+ElementTree, producing exactly the text ``ET.tostring(element,
+encoding='unicode')`` would produce for the equivalent element.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, Optional, Any, Tuple, Callable, Iterable
+from xml.sax.saxutils import escape
+
+# Entities ElementTree writes in attribute values, besides the ``&``, ``<``
+# and ``>`` that ``escape`` always replaces; the golden fixtures pin the
+# output to ``ET.tostring``. Most values need no escaping, so a single regex
+# scan guards the call
+_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+_needs_escape = re.compile('[&<>"\r\n\t]').search
+
+def escape_attribute(value: str) -> str:
+    """Escape an attribute value the way ``ET.tostring`` does."""
+    return escape(value, _ATTRIBUTE_ENTITIES)
+
+# Attribute name -> ' name="' prefix, for names already checked
+_attribute_prefixes: Dict[str, str] = {}
+_MAX_CACHED_PREFIXES = 4096
+
+class DirectXMLUnsupported(ValueError):
+    """Raised when data needs ElementTree-specific handling (e.g. namespaced
+    or non-string names) that the direct writer does not reproduce."""
+
+def _check_name(name: Any) -> str:
+    """Ensure a tag or attribute name is written verbatim by ElementTree."""
+    if type(name) is not str or name[:1] == "{":
+        raise DirectXMLUnsupported(f"Unsupported XML name for direct serialization: {name!r}")
+    return name
+
+def _attribute_prefix(key: Any) -> str:
+    """Get the checked ``' key="'`` prefix for an attribute name."""
+    prefix = f' {_check_name(key)}="'
+    if len(_attribute_prefixes) < _MAX_CACHED_PREFIXES:
+        _attribute_prefixes[key] = prefix
+    return prefix
+
+def format_attributes(items: Iterable[Tuple[str, Any]]) -> str:
+    """Format ``str()``-converted, escaped attributes in insertion order."""
+    parts = []
+    for key, value in items:
+        value = str(value)
+        if _needs_escape(value):
+            value = escape_attribute(value)
+        parts.append((_attribute_prefixes.get(key) or _attribute_prefix(key)) + value + '"')
+    return "".join(parts)
+
+def write_record(write: Callable[[str], Any], tag: str, record: Dict[str, Any],
+                 list_children: Optional[Dict[str, str]] = None,
+                 dict_children: Tuple[str, ...] = ()):
+    """Write a semantic record as one element.
+
+    Keys in ``list_children`` holding lists become a wrapper element of the
+    same name with one child per item (tag given by the mapping); keys in
+    ``dict_children`` holding dicts become a child element; every other key is
+    written as an attribute.
+    """
+    parts = ["<", tag]
+    nested = None
+    for key, value in record.items():
+        if (list_children and key in list_children and isinstance(value, list)) or \
+                (dict_children and key in dict_children and isinstance(value, dict)):
+            if nested is None:
+                nested = []
+            nested.append((key, value))
+            continue
+        value = str(value)
+        if _needs_escape(value):
+            value = escape_attribute(value)
+        parts.append((_attribute_prefixes.get(key) or _attribute_prefix(key)) + value + '"')
+
+    if nested is None:
+        parts.append(" />")
+        write("".join(parts))
+        return
+
+    parts.append(">")
+    for key, value in nested:
+        if isinstance(value, dict):
+            parts.append(f"<{key}{format_attributes(value.items())} />")
+        elif value:
+            child_tag = list_children[key]
+            parts.append(f"<{key}>")
+            for item in value:
+                parts.append(f"<{child_tag}{format_attributes(item.items())} />")
+            parts.append(f"</{key}>")
+        else:
+            parts.append(f"<{key} />")
+    parts.append(f"</{tag}>")
+    write("".join(parts))
+
+def write_section(write: Callable[[str], Any], section_tag: str, record_tag: str,
+                  records: Iterable[Dict[str, Any]],
+                  list_children: Optional[Dict[str, str]] = None,
+                  dict_children: Tuple[str, ...] = ()):
+    """Write a section element holding one element per record."""
+    empty = True
+    for record in records:
+        if empty:
+            write(f"<{section_tag}>")
+            empty = False
+        write_record(write, record_tag, record, list_children, dict_children)
+    write(f"<{section_tag} />" if empty else f"</{section_tag}>")
+
+def write_ai_integration(write: Callable[[str], Any], ai_integration: Dict[str, Any]):
+    """Write an ``ai-integration`` element (dict values become child elements)."""
+    attributes = []
+    children = []
+    for key, value in ai_integration.items():
+        if isinstance(value, dict):
+            children.append(f"<{_check_name(key)}{format_attributes(value.items())} />")
+        else:
+            attributes.append(f' {_check_name(key)}="{escape_attribute(str(value))}"')
+
+    if children:
+        write(f"<ai-integration{''.join(attributes)}>{''.join(children)}</ai-integration>")
+    else:
+        write(f"<ai-integration{''.join(attributes)} />")
+
+def parse_root_start(xml_string: str) -> ET.Element:
+    """Parse just the root start tag of serialized XML into a childless element.
+
+    Attribute values escape ``>``, so the start tag ends at the first ``>``.
+    Lets structural validation check the emitted text without parsing the
+    whole document.
+    """
+    parser = ET.XMLPullParser(events=("start",))
+    parser.feed(xml_string[:xml_string.index(">") + 1])
+    for _, element in parser.read_events():
+        return element
+    raise ET.ParseError("No root element in XML text")
+
+# Export direct XML writer helpers
+__all__ = [
+    'DirectXMLUnsupported',
+    'escape_attribute',
+    'format_attributes',
+    'parse_root_start',
+    'write_record',
+    'write_section',
+    'write_ai_integration'
+]
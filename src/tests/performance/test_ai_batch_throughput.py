@@ -0,0 +1,80 @@
+"""
+FSL Continuum - AI Batch Processing Throughput Benchmark
+
+Compares analyzing thousands of BAML and Pareto-Lang documents one call at a
+time with the vectorized batch mode of SemanticAIProcessor.
+"""
+
+import time
+import unittest
+
+# Import AI processor
+try:
+    from src.semantic_languages.ai_integration import SemanticAIProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.ai_integration import SemanticAIProcessor
+
+
+def generate_documents(count):
+    """Generate BAML and Pareto-Lang documents of varying size."""
+    baml_documents = [
+        {
+            "boundaries": [
+                {"name": f"boundary_{i}_{j}", "constraints": [{"type": "data_validation"}] * (j % 3)}
+                for j in range(i % 8)
+            ],
+            "connections": [{"source": f"boundary_{i}_0", "target": f"boundary_{i}_1"}] * (i % 4)
+        }
+        for i in range(count)
+    ]
+    pareto_documents = [
+        {
+            "optimizations": [
+                {"name": f"optimization_{i}_{j}", "efficiency": (i + j) % 100 / 100}
+                for j in range(i % 6)
+            ],
+            "resources": [{"name": "compute"}] * (i % 3)
+        }
+        for i in range(count)
+    ]
+    return baml_documents, pareto_documents
+
+
+class TestAIBatchThroughput(unittest.TestCase):
+    """Throughput benchmark for batch AI semantic processing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.count = 5000
+        self.baml_documents, self.pareto_documents = generate_documents(self.count)
+
+    def test_batch_faster_than_per_document_calls(self):
+        """Test one batch call beats one call per document."""
+        print(f"\nAI semantic processing of {self.count} documents")
+        for name, method, documents in (
+            ("BAML", "analyze_baml_semantics", self.baml_documents),
+            ("Pareto-Lang", "optimize_pareto_semantics", self.pareto_documents),
+        ):
+            processor = SemanticAIProcessor()
+            start_time = time.perf_counter()
+            singles = [getattr(processor, method)(document) for document in documents]
+            single_time = time.perf_counter() - start_time
+
+            processor = SemanticAIProcessor()
+            start_time = time.perf_counter()
+            batch = getattr(processor, method)(documents)
+            batch_time = time.perf_counter() - start_time
+
+            self.assertTrue(batch.success)
+            self.assertTrue(all(result.success for result in singles))
+            print(f"  {name:<12} per document {single_time:7.3f} s  "
+                  f"batch {batch_time:7.3f} s  ({single_time / batch_time:.0f}x, "
+                  f"{self.count / batch_time:,.0f} docs/s)")
+            self.assertLess(batch_time * 5, single_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
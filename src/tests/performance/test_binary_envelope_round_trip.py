@@ -0,0 +1,109 @@
+"""
+FSL Continuum - Binary Envelope Round Trip Benchmark
+
+Measures the size and round-trip cost of the binary envelope against the
+XML wrapper path used as a semantic preservation check.
+"""
+
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+# Import binary envelope
+try:
+    from src.semantic_languages.binary_envelope import BinaryEnvelope
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.binary_envelope import BinaryEnvelope
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+TIMESTAMP = "2025-01-01T00:00:00"
+
+
+class TestBinaryEnvelopeRoundTrip(unittest.TestCase):
+    """Size and speed benchmark for BinaryEnvelope against the XML wrapper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        count = 200
+        self.cases = {
+            "baml": (BAMLXMLTransformer(), {
+                "boundaries": [
+                    {"name": f"boundary_{i}", "type": "data", "ai_enhanced": True,
+                     "constraints": [{"type": "validation", "operator": ">", "value": i, "ai_enforced": True}]}
+                    for i in range(count)
+                ],
+                "connections": [
+                    {"source": f"boundary_{i}", "target": f"boundary_{i + 1}", "type": "data_flow",
+                     "direction": "unidirectional", "ai_enhanced": True}
+                    for i in range(count - 1)
+                ],
+                "constraints": [
+                    {"name": f"constraint_{i}", "type": "boundary", "scope": "global",
+                     "conditions": [{"variable": "latency", "operator": "<", "value": 5.5}]}
+                    for i in range(count // 4)
+                ]
+            }),
+            "pareto_lang": (ParetoLangXMLTransformer(), {
+                "optimizations": [
+                    {"name": f"opt_{i}", "type": "pareto", "target": "latency", "efficiency": i / count,
+                     "ai_enhanced": True}
+                    for i in range(count)
+                ],
+                "resources": [{"name": f"cpu_{i}", "type": "compute", "capacity": 4} for i in range(count // 4)]
+            })
+        }
+
+    def time_per_call(self, func, repeat=20):
+        """Best-of-five mean seconds per call."""
+        best = float("inf")
+        for _ in range(5):
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            best = min(best, (time.perf_counter() - start_time) / repeat)
+        return best
+
+    def test_binary_round_trip_is_smaller_and_faster(self):
+        """Test the binary envelope beats the XML wrap/unwrap round trip on size and time."""
+        for language, (transformer, data) in self.cases.items():
+            if language == "baml":
+                wrap, unwrap = transformer.wrap_baml_with_xml, transformer.unwrap_xml_to_baml
+            else:
+                wrap, unwrap = transformer.wrap_pareto_lang_with_xml, transformer.unwrap_xml_to_pareto_lang
+            schema = transformer.xml_schema
+            envelope = BinaryEnvelope.for_data(data, language, TIMESTAMP)
+            blob = envelope.encode()
+            xml_wrapper = schema.to_xml_string(data, TIMESTAMP)
+
+            self.assertEqual(BinaryEnvelope.decode(blob), envelope)
+            self.assertTrue(unwrap(wrap(data).xml_wrapper).success)
+
+            timings = {
+                "XML wrap + unwrap": self.time_per_call(lambda: unwrap(wrap(data).xml_wrapper)),
+                "XML serialize + parse": self.time_per_call(
+                    lambda: schema.from_xml_element(ET.fromstring(schema.to_xml_string(data, TIMESTAMP)))
+                ),
+                "binary encode + decode": self.time_per_call(lambda: BinaryEnvelope.decode(envelope.encode())),
+                "binary encode": self.time_per_call(envelope.encode),
+                "binary decode": self.time_per_call(lambda: BinaryEnvelope.decode(blob))
+            }
+
+            xml_size = len(xml_wrapper.encode("utf-8"))
+            print(f"\n{language}: XML {xml_size} bytes, binary {len(blob)} bytes "
+                  f"({xml_size / len(blob):.1f}x smaller)")
+            for name, seconds in timings.items():
+                print(f"  {name:<24} {seconds * 1e3:7.2f} ms")
+
+            self.assertLess(len(blob) * 4, xml_size)
+            self.assertLess(timings["binary encode + decode"], timings["XML wrap + unwrap"])
+
+
+if __name__ == '__main__':
+    unittest.main()
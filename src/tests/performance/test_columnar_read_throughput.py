@@ -0,0 +1,80 @@
+"""
+FSL Continuum - Columnar Read Throughput Benchmark
+
+Measures pulling one field out of a Pareto-Lang corpus from a columnar
+export against unwrapping every XML wrapper.
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Import columnar exporter
+try:
+    from src.semantic_languages.columnar_export import ColumnarExporter, read_columnar
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.columnar_export import ColumnarExporter, read_columnar
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+class TestColumnarReadThroughput(unittest.TestCase):
+    """Analytics read benchmark for columnar exports."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = ParetoLangXMLTransformer()
+        self.documents = [
+            {
+                "optimizations": [
+                    {"name": f"opt_{d}_{i}", "type": ["pareto", "efficiency", "resource"][i % 3],
+                     "target": "latency", "efficiency": ((d * 7 + i) % 100) / 100}
+                    for i in range(5)
+                ],
+                "resources": [{"name": f"cpu_{d}", "type": "compute", "capacity": 4}]
+            }
+            for d in range(2000)
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "corpus"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_columnar_read_beats_xml_unwrap(self):
+        """Test reading efficiencies from the columnar export is faster than unwrapping XML."""
+        wrappers = [self.transformer.wrap_pareto_lang_with_xml(document).xml_wrapper
+                    for document in self.documents]
+
+        exporter = ColumnarExporter("npz")
+        exporter.add_documents(("pareto_lang", document) for document in self.documents)
+        summary = exporter.write(self.path)
+
+        start_time = time.perf_counter()
+        from_xml = []
+        for xml_wrapper in wrappers:
+            data = self.transformer.unwrap_xml_to_pareto_lang(xml_wrapper).transformed_data
+            from_xml.extend(float(opt["efficiency"]) for opt in data["optimizations"])
+        xml_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        tables = read_columnar(self.path, tables=["optimizations"], columns=["efficiency"])
+        from_columns = tables["optimizations"].column("efficiency")
+        columnar_time = time.perf_counter() - start_time
+
+        print(f"\n{len(self.documents)} Pareto-Lang documents, {len(from_xml)} efficiencies")
+        print(f"  XML unwrap      {xml_time * 1e3:9.1f} ms")
+        print(f"  columnar read   {columnar_time * 1e3:9.1f} ms ({Path(summary['path']).stat().st_size} bytes on disk)")
+        print(f"  speedup         {xml_time / columnar_time:9.1f}x")
+
+        self.assertEqual(from_columns.tolist(), from_xml)
+        self.assertLess(columnar_time * 10, xml_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
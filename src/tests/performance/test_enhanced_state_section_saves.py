@@ -0,0 +1,97 @@
+"""
+FSL Continuum - Enhanced State Section Save Benchmark
+
+Applies update_state_with_ai to an enhanced continuum state whose
+operations log and completed flows have grown, saving the whole state file
+per update (the default) and saving only the changed sections to a
+JournalStateStore. Also compares snapshot_state with a deep copy of the
+state.
+"""
+
+import copy
+import json
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Import enhanced state manager and section store
+try:
+    from src.config.enhanced_continuum_state import EnhancedStateManager
+    from src.fsl_continuum.continuum.state_storage import JournalStateStore
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from config.enhanced_continuum_state import EnhancedStateManager
+    from fsl_continuum.continuum.state_storage import JournalStateStore
+
+
+STATE_FILE = Path(__file__).resolve().parents[2] / "config" / "enhanced_continuum_state.json"
+
+
+class TestEnhancedStateSectionSaves(unittest.TestCase):
+    """Save cost benchmark for EnhancedStateManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        state = json.loads(STATE_FILE.read_text())
+        state["operations_log"] = [
+            {"operation": "pipeline_trigger", "flow_id": f"flow_{i}", "timestamp": "2025-01-01T00:00:00", "success": True}
+            for i in range(2000)
+        ]
+        state["completed_flows"] = {
+            f"flow_{i}": {"status": "completed", "duration": i / 10, "markets": ["US", "China", "India", "Japan"]}
+            for i in range(1000)
+        }
+        self.state = state
+        self.updates = 200
+
+    def run_updates(self, name, with_store):
+        """Seconds per update and bytes written per update."""
+        config_path = Path(self.temp_dir.name) / f"{name}.json"
+        config_path.write_text(json.dumps(self.state, indent=2))
+        sections_path = Path(self.temp_dir.name) / f"{name}_sections"
+        store = JournalStateStore(str(sections_path), compact_bytes=1 << 30) if with_store else None
+        manager = EnhancedStateManager(str(config_path), section_store=store)
+
+        start_time = time.perf_counter()
+        for i in range(self.updates):
+            manager.update_state_with_ai({"context_intelligence": {"context_accuracy": i / self.updates}})
+        elapsed = time.perf_counter() - start_time
+
+        written = (store.journal_size if with_store else config_path.stat().st_size * self.updates)
+        return elapsed / self.updates, written / self.updates
+
+    def test_section_saves_write_only_changed_sections(self):
+        """Test saving changed sections is cheaper than rewriting the state file."""
+        full = self.run_updates("full", False)
+        sections = self.run_updates("sections", True)
+
+        manager = EnhancedStateManager(str(Path(self.temp_dir.name) / "full.json"))
+        start_time = time.perf_counter()
+        for _ in range(20):
+            copy.deepcopy(manager.state_config)
+        deep_copy = (time.perf_counter() - start_time) / 20
+        start_time = time.perf_counter()
+        for _ in range(self.updates):
+            manager.snapshot_state()
+        snapshot = (time.perf_counter() - start_time) / self.updates
+
+        print(f"\n{self.updates} updates to a state with {len(self.state['operations_log'])} operations "
+              f"and {len(self.state['completed_flows'])} completed flows")
+        print(f"  whole state file    {full[0] * 1e3:8.3f} ms/update  {full[1]:10.0f} bytes/update")
+        print(f"  changed sections    {sections[0] * 1e3:8.3f} ms/update  {sections[1]:10.0f} bytes/update")
+        print(f"  deep copy           {deep_copy * 1e6:8.1f} us/snapshot")
+        print(f"  snapshot_state      {snapshot * 1e6:8.1f} us/snapshot")
+
+        self.assertLess(sections[1] * 10, full[1])
+        self.assertLess(sections[0], full[0])
+        self.assertLess(snapshot * 10, deep_copy)
+
+
+if __name__ == '__main__':
+    unittest.main()
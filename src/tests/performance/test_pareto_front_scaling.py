@@ -0,0 +1,82 @@
+"""
+FSL Continuum - Pareto Front Scaling Benchmark
+
+Measures non-dominated sorting and crowding distance time across candidate
+counts and objective dimensions.
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+# Import Pareto front engine
+try:
+    from src.semantic_languages.pareto_lang.pareto_front import non_dominated_sort, crowding_distance
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.pareto_lang.pareto_front import non_dominated_sort, crowding_distance
+
+
+class TestParetoFrontScaling(unittest.TestCase):
+    """Scaling benchmark for the Pareto front engine."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = np.random.default_rng(42)
+
+    def test_scaling_across_candidates_and_dimensions(self):
+        """Test 100k candidates rank in seconds for two to five objectives."""
+        print("\nNon-dominated sort + crowding distance (uniform random candidates)")
+        print(f"  {'objectives':>10} {'candidates':>10} {'sort s':>8} {'crowding s':>10} {'fronts':>7} {'front 0':>8}")
+        for dimensions in (2, 3, 4, 5):
+            for count in (1000, 10000, 100000):
+                candidates = self.rng.random((count, dimensions))
+
+                start_time = time.perf_counter()
+                ranks = non_dominated_sort(candidates)
+                sort_time = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                distance = crowding_distance(candidates, ranks)
+                crowding_time = time.perf_counter() - start_time
+
+                self.assertEqual(len(distance), count)
+                print(f"  {dimensions:>10} {count:>10} {sort_time:8.3f} {crowding_time:10.3f} "
+                      f"{ranks.max() + 1:>7} {np.count_nonzero(ranks == 0):>8}")
+                if count == 100000:
+                    self.assertLess(sort_time + crowding_time, 30.0)
+
+    def test_faster_than_pairwise_sort(self):
+        """Test the engine beats a pairwise dominance-matrix sort."""
+        candidates = self.rng.random((3000, 3))
+
+        start_time = time.perf_counter()
+        dominates = (
+            (candidates[:, None, :] >= candidates[None, :, :]).all(axis=2)
+            & (candidates[:, None, :] > candidates[None, :, :]).any(axis=2)
+        )
+        expected = np.full(len(candidates), -1)
+        remaining = np.ones(len(candidates), dtype=bool)
+        rank = 0
+        while remaining.any():
+            current = remaining & ~dominates[remaining].any(axis=0)
+            expected[current] = rank
+            remaining &= ~current
+            rank += 1
+        pairwise_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        ranks = non_dominated_sort(candidates)
+        engine_time = time.perf_counter() - start_time
+
+        np.testing.assert_array_equal(ranks, expected)
+        print(f"\n3000 x 3 candidates: pairwise {pairwise_time:.3f} s, engine {engine_time:.3f} s "
+              f"({pairwise_time / engine_time:.0f}x)")
+        self.assertLess(engine_time, pairwise_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
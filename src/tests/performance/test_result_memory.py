@@ -0,0 +1,122 @@
+"""
+FSL Continuum - Result Memory Benchmark
+
+Measures retained bytes per XML transformation result with tracemalloc,
+comparing the previous plain dataclass layout with the slotted, frozen
+results that share interned metadata and build validation summaries lazily.
+"""
+
+import time
+import tracemalloc
+import unittest
+from dataclasses import dataclass
+from typing import Dict, Any
+
+# Import XML transformer and result building blocks
+try:
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer, XMLTransformationResult
+    from src.semantic_languages.results import intern_metadata
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer, XMLTransformationResult
+    from semantic_languages.results import intern_metadata
+
+
+@dataclass
+class LegacyXMLTransformationResult:
+    """Previous result layout: plain dataclass with per-result dictionaries."""
+    success: bool
+    transformed_data: Dict[str, Any]
+    xml_wrapper: str
+    transformation_time: float
+    semantic_preserved: bool
+    validation_result: Dict[str, Any]
+    metadata: Dict[str, Any]
+
+
+class TestResultMemory(unittest.TestCase):
+    """Bytes-per-result benchmark for compact result types."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.count = 20000
+        transformer = BAMLXMLTransformer()
+        sample = transformer.wrap_baml_with_xml({"boundaries": [{"name": "boundary", "type": "data"}]})
+        # Inputs shared by both layouts, so only the result containers differ
+        self.baml_data = sample.transformed_data
+        self.xml_wrapper = sample.xml_wrapper
+        self.baml_validation = sample.validation_result["baml_validation"]
+        self.xml_validation = sample.validation_result["xml_validation"]
+
+    def legacy_result(self) -> LegacyXMLTransformationResult:
+        """Build a result the way wraps did before."""
+        return LegacyXMLTransformationResult(
+            success=True,
+            transformed_data=self.baml_data,
+            xml_wrapper=self.xml_wrapper,
+            transformation_time=time.time(),
+            semantic_preserved=True,
+            validation_result={
+                "baml_validation": self.baml_validation,
+                "xml_validation": self.xml_validation
+            },
+            metadata={
+                "transformation_applied": True,
+                "context_applied": False,
+                "semantic_preservation": True,
+                "xml_schema_version": "1.0.0-baml-xml",
+                "xml_validation_mode": "structural-on-tree",
+                "xml_serializer": "direct",
+                "cache_hit": False
+            }
+        )
+
+    def compact_result(self) -> XMLTransformationResult:
+        """Build a result the way wraps do now."""
+        return XMLTransformationResult.with_lazy_field(
+            ("baml_validation", "xml_validation"), (self.baml_validation, self.xml_validation),
+            success=True,
+            transformed_data=self.baml_data,
+            xml_wrapper=self.xml_wrapper,
+            transformation_time=time.time(),
+            semantic_preserved=True,
+            metadata=intern_metadata(
+                transformation_applied=True,
+                context_applied=False,
+                semantic_preservation=True,
+                xml_schema_version="1.0.0-baml-xml",
+                xml_validation_mode="structural-on-tree",
+                xml_serializer="direct",
+                cache_hit=False
+            )
+        )
+
+    def bytes_per_result(self, build) -> float:
+        """Measure traced bytes retained per result."""
+        build()  # Warm interned metadata outside the measurement
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            results = [build() for _ in range(self.count)]
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(results), self.count)
+        return retained / self.count
+
+    def test_bytes_per_result(self):
+        """Test compact results retain fewer bytes than the previous layout."""
+        legacy = self.bytes_per_result(self.legacy_result)
+        compact = self.bytes_per_result(self.compact_result)
+
+        print(f"\nRetained bytes per XML transformation result ({self.count} results)")
+        print(f"  plain dataclass     {legacy:7.1f} B")
+        print(f"  slotted, interned   {compact:7.1f} B  ({legacy / compact:.1f}x smaller)")
+
+        self.assertLess(compact, legacy / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
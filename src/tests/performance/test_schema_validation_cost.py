@@ -0,0 +1,131 @@
+"""
+FSL Continuum - Schema Validation Cost Benchmark
+
+Measures schema-compiled BAML validation against an interpreted schema walk,
+the previous hand-written section walk, and the wrap/unwrap transforms it
+guards.
+"""
+
+import time
+import unittest
+
+# Import BAML XML transformer
+try:
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+
+
+INTERPRETED_TYPES = {
+    "object": dict, "array": list, "string": str, "boolean": bool, "number": (int, float)
+}
+
+
+def interpret(schema, value, path, errors):
+    """Validate by walking the schema dictionary for every value."""
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if not any(isinstance(value, INTERPRETED_TYPES[name]) for name in types):
+            errors.append((path, "type"))
+            return
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append((path, "enum"))
+    if isinstance(value, dict):
+        for key, child in schema.get("properties", {}).items():
+            if key in value:
+                interpret(child, value[key], path + (key,), errors)
+    if isinstance(value, list) and "items" in schema:
+        for index, item in enumerate(value):
+            interpret(schema["items"], item, path + (index,), errors)
+
+
+def hand_written_walk(baml_data):
+    """The section/record walk the transformer used before schema compilation."""
+    errors = []
+    if not isinstance(baml_data, dict):
+        return ["BAML data must be a dictionary"]
+    for section in ("boundaries", "connections", "constraints"):
+        if section in baml_data:
+            if not isinstance(baml_data[section], list):
+                errors.append(f"BAML {section} must be a list")
+            else:
+                for i, record in enumerate(baml_data[section]):
+                    if not isinstance(record, dict):
+                        errors.append(f"BAML {section} {i} must be a dictionary")
+    return errors
+
+
+class TestSchemaValidationCost(unittest.TestCase):
+    """Validation cost benchmark for schema-compiled validators."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = BAMLXMLTransformer()
+        self.validator = self.transformer.data_validator
+        count = 200
+        self.document = {
+            "version": "1.0.0",
+            "boundaries": [
+                {"name": f"boundary_{i}", "type": "data", "ai_enhanced": True,
+                 "constraints": [{"type": "validation", "operator": ">", "value": i, "ai_enforced": True}]}
+                for i in range(count)
+            ],
+            "connections": [
+                {"source": f"boundary_{i}", "target": f"boundary_{i + 1}", "type": "data_flow",
+                 "direction": "unidirectional", "ai_enhanced": True}
+                for i in range(count - 1)
+            ],
+            "constraints": [
+                {"name": f"constraint_{i}", "type": "boundary", "scope": ["boundary_0"],
+                 "conditions": [{"variable": "latency", "operator": "<", "value": 5}]}
+                for i in range(count // 4)
+            ]
+        }
+
+    def time_per_call(self, func, repeat):
+        """Best-of-three mean seconds per call."""
+        best = float("inf")
+        for _ in range(3):
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            best = min(best, (time.perf_counter() - start_time) / repeat)
+        return best
+
+    def test_validation_is_small_fraction_of_transform(self):
+        """Test compiled validation beats interpretation and stays a small share of transforms."""
+        schema = self.validator.schema
+        wrapped = self.transformer.wrap_baml_with_xml(self.document)
+        unwrapped = self.transformer.unwrap_xml_to_baml(wrapped.xml_wrapper).transformed_data
+        self.assertTrue(wrapped.success)
+
+        timings = {
+            "hand-written walk": self.time_per_call(lambda: hand_written_walk(self.document), 200),
+            "interpreted schema": self.time_per_call(lambda: interpret(schema, self.document, (), []), 50),
+            "compiled (full)": self.time_per_call(lambda: self.validator.validate(self.document), 200),
+            "compiled (errors only)": self.time_per_call(
+                lambda: self.validator.validate(unwrapped, warnings=False), 200
+            ),
+            "wrap": self.time_per_call(lambda: self.transformer.wrap_baml_with_xml(self.document), 20),
+            "unwrap": self.time_per_call(lambda: self.transformer.unwrap_xml_to_baml(wrapped.xml_wrapper), 20)
+        }
+
+        records = sum(len(self.document[section]) for section in ("boundaries", "connections", "constraints"))
+        print(f"\nBAML document with {records} records")
+        for name, seconds in timings.items():
+            print(f"  {name:<24} {seconds * 1e6:9.1f} us")
+        full_share = timings["compiled (full)"] / timings["wrap"]
+        errors_share = timings["compiled (errors only)"] / timings["unwrap"]
+        print(f"  full validation / wrap          {full_share:6.1%}")
+        print(f"  errors-only validation / unwrap {errors_share:6.1%}")
+
+        self.assertLess(timings["compiled (full)"], timings["interpreted schema"])
+        self.assertLess(full_share, 0.25)
+        self.assertLess(errors_share, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
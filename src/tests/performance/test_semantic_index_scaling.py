@@ -0,0 +1,113 @@
+"""
+FSL Continuum - Semantic Model Index Scaling Benchmark
+
+Compares adding one boundary to the incrementally maintained semantic model
+index with rebuilding the index from scratch, across model sizes.
+"""
+
+import time
+import unittest
+
+# Import semantic model index
+try:
+    from src.semantic_languages.semantic_index import SemanticModelIndex
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.semantic_index import SemanticModelIndex
+
+
+def generate_model(boundary_count):
+    """Generate a chain of connected boundaries over a fixed set of optimizations.
+
+    Every target keeps ten optimizations, so pathway degree stays constant
+    while the model grows.
+    """
+    targets = [f"target_{i}" for i in range(50)]
+    baml_data = {
+        "boundaries": [
+            {"name": f"boundary_{i}", "optimization_target": targets[i % len(targets)]}
+            for i in range(boundary_count)
+        ],
+        "connections": [
+            {"source": f"boundary_{i}", "target": f"boundary_{i + 1}", "type": "data_flow"}
+            for i in range(boundary_count - 1)
+        ]
+    }
+    pareto_data = {
+        "optimizations": [
+            {"name": f"optimization_{i}", "target": targets[i % len(targets)], "efficiency": 0.9}
+            for i in range(500)
+        ]
+    }
+    return baml_data, pareto_data
+
+
+class TestSemanticIndexScaling(unittest.TestCase):
+    """Add-one-boundary cost for incremental updates versus full rebuilds."""
+
+    def test_add_boundary_cost_is_independent_of_model_size(self):
+        """Test adding a boundary stays flat while a rebuild grows with the model."""
+        print("\nAdd one boundary (+ one connection) and query its pathways")
+        incremental_times = []
+        for boundary_count in (1000, 10000, 100000):
+            baml_data, pareto_data = generate_model(boundary_count)
+            new_boundary = {"name": "new_boundary", "optimization_target": "target_7"}
+            new_connection = {"source": f"boundary_{boundary_count - 1}", "target": "new_boundary"}
+
+            start_time = time.perf_counter()
+            rebuilt = SemanticModelIndex()
+            rebuilt.sync(
+                {"boundaries": baml_data["boundaries"] + [new_boundary],
+                 "connections": baml_data["connections"] + [new_connection]},
+                pareto_data
+            )
+            expected = rebuilt.pathways_from("new_boundary")
+            rebuild_time = time.perf_counter() - start_time
+
+            index = SemanticModelIndex()
+            index.sync(baml_data, pareto_data)
+            rounds = 1000
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                index.add_boundary(new_boundary)
+                index.add_connection(new_connection)
+                pathways = index.pathways_from("new_boundary")
+                index.remove_connection(("boundary_%d" % (boundary_count - 1), "new_boundary", ""))
+                index.remove_boundary("new_boundary")
+            incremental_time = (time.perf_counter() - start_time) / rounds
+            incremental_times.append(incremental_time)
+
+            self.assertEqual(pathways, expected)
+            print(f"  {boundary_count:>7} boundaries  rebuild {rebuild_time * 1000:9.3f} ms  "
+                  f"incremental {incremental_time * 1e6:7.2f} us  ({rebuild_time / incremental_time:,.0f}x)")
+            self.assertLess(incremental_time, rebuild_time)
+
+        # Per-update cost follows the record's degree, not the model size
+        self.assertLess(incremental_times[-1], incremental_times[0] * 5)
+
+    def test_resync_cost_does_not_follow_pathway_count(self):
+        """Test integrating the same model again skips the boundary x optimization product."""
+        print("\nResync + whole-model views, every boundary on one target")
+        for count in (200, 1000, 2000):
+            baml_data = {"boundaries": [{"name": f"boundary_{i}"} for i in range(count)]}
+            pareto_data = {"optimizations": [{"name": f"optimization_{i}"} for i in range(count)]}
+            index = SemanticModelIndex()
+            index.sync(baml_data, pareto_data)
+
+            start_time = time.perf_counter()
+            index.sync(baml_data, pareto_data)
+            index.connection_matrix()
+            summary = index.pathway_summary()
+            resync_time = time.perf_counter() - start_time
+
+            self.assertEqual(index.pathway_count, count * count)
+            self.assertEqual(summary[0]["pathway_count"], count * count)
+            print(f"  {count:>5} x {count:<5} ({count * count:>9,} pathways)  resync {resync_time * 1000:7.3f} ms")
+            # A sync is linear in the records; 4M pathways took seconds to build
+            self.assertLess(resync_time, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
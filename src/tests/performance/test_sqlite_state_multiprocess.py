@@ -0,0 +1,116 @@
+"""
+FSL Continuum - SQLite State Multi-Process Benchmark
+
+Runs several writer processes against one continuum state: SQLite in WAL
+mode with one transaction per key and with batched transactions, and the
+JSON StateManager saving after every change, which has no cross-process
+locking.
+"""
+
+import asyncio
+import multiprocessing
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Import state managers
+try:
+    from src.fsl_continuum.continuum.sqlite_state import SQLiteStateManager
+    from src.fsl_continuum.continuum.state_management import StateManager
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from fsl_continuum.continuum.sqlite_state import SQLiteStateManager
+    from fsl_continuum.continuum.state_management import StateManager
+
+
+WRITERS = 4
+KEYS_PER_WRITER = 250
+
+
+def _sqlite_writer(db_path, worker, batch_size, barrier):
+    """Write this worker's keys to SQLite in transactions of ``batch_size`` keys."""
+    async def write():
+        manager = SQLiteStateManager(db_path)
+        await manager.initialize()
+        barrier.wait()
+        for start in range(0, KEYS_PER_WRITER, batch_size):
+            batch = {f"writer_{worker}_flow_{i}": {"velocity_score": i}
+                     for i in range(start, min(start + batch_size, KEYS_PER_WRITER))}
+            if batch_size == 1:
+                key, value = next(iter(batch.items()))
+                await manager.set(key, value)
+            else:
+                await manager.update(batch)
+        await manager.shutdown()
+
+    asyncio.run(write())
+
+
+def _json_writer(state_file, worker, batch_size, barrier):
+    """Write this worker's keys to the JSON state file, saving after each one."""
+    async def write():
+        manager = StateManager(state_file)
+        barrier.wait()
+        for i in range(KEYS_PER_WRITER):
+            await manager.save_state({f"writer_{worker}_flow_{i}": {"velocity_score": i}})
+        await manager.shutdown()
+
+    asyncio.run(write())
+
+
+class TestSQLiteStateMultiProcess(unittest.TestCase):
+    """Concurrent writer benchmark for SQLiteStateManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+    def run_writers(self, target, path, batch_size):
+        """Wall-clock seconds for all writer processes to finish."""
+        barrier = self.context.Barrier(WRITERS + 1)
+        processes = [self.context.Process(target=target, args=(str(path), worker, batch_size, barrier))
+                     for worker in range(WRITERS)]
+        for process in processes:
+            process.start()
+        barrier.wait()
+        start_time = time.perf_counter()
+        for process in processes:
+            process.join(120)
+        elapsed = time.perf_counter() - start_time
+        self.assertEqual([process.exitcode for process in processes], [0] * WRITERS)
+        return elapsed
+
+    def test_concurrent_writers_keep_every_update(self):
+        """Test N SQLite writer processes lose no updates and batching raises throughput."""
+        total = WRITERS * KEYS_PER_WRITER
+        results = {}
+        for name, batch_size in (("SQLite, 1 key/transaction", 1), ("SQLite, 25 keys/transaction", 25)):
+            db_path = Path(self.temp_dir.name) / f"state_{batch_size}.db"
+            elapsed = self.run_writers(_sqlite_writer, db_path, batch_size)
+            kept = len(asyncio.run(SQLiteStateManager(str(db_path)).load_state()))
+            results[name] = (elapsed, kept)
+
+        state_file = Path(self.temp_dir.name) / "fsl_state.json"
+        elapsed = self.run_writers(_json_writer, state_file, 1)
+        kept = len(asyncio.run(StateManager(str(state_file)).load_state()))
+        results["JSON StateManager, save per key"] = (elapsed, kept)
+
+        print(f"\n{WRITERS} writer processes x {KEYS_PER_WRITER} keys")
+        for name, (elapsed, kept) in results.items():
+            print(f"  {name:<32} {elapsed * 1e3:9.1f} ms  {total / elapsed:9.0f} keys/s  "
+                  f"{kept}/{total} keys kept")
+
+        per_key, batched = results["SQLite, 1 key/transaction"], results["SQLite, 25 keys/transaction"]
+        self.assertEqual(per_key[1], total)
+        self.assertEqual(batched[1], total)
+        self.assertLess(batched[0], per_key[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
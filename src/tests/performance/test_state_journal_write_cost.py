@@ -0,0 +1,84 @@
+"""
+FSL Continuum - State Journal Write Cost Benchmark
+
+Measures the cost of flushing small changes to a large continuum state with
+the whole-file JSON store against the append-only journal store, and the
+journal's recovery time.
+"""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Import state storage
+try:
+    from src.fsl_continuum.continuum.state_management import StateManager
+    from src.fsl_continuum.continuum.state_storage import JSONStateStore, JournalStateStore
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from fsl_continuum.continuum.state_management import StateManager
+    from fsl_continuum.continuum.state_storage import JSONStateStore, JournalStateStore
+
+
+class TestStateJournalWriteCost(unittest.TestCase):
+    """Per-flush write cost benchmark for JSONStateStore and JournalStateStore."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.initial_state = {
+            f"flow_{i}": {"productivity": i / 10, "velocity_score": i, "markets": ["US", "China", "India", "Japan"]}
+            for i in range(5000)
+        }
+        self.flushes = 300
+
+    def run_flushes(self, store):
+        """Seconds per flush of one changed key, with the final state."""
+        async def scenario():
+            manager = StateManager(store=store, flush_interval=60)
+            await manager.update(self.initial_state)
+            await manager.flush()
+            start_time = time.perf_counter()
+            for i in range(self.flushes):
+                await manager.set(f"flow_{i}", {"productivity": i, "velocity_score": -i})
+                await manager.flush()
+            elapsed = time.perf_counter() - start_time
+            await manager.shutdown()
+            return elapsed / self.flushes, manager.state
+
+        return asyncio.run(scenario())
+
+    def test_journal_flush_cost_is_independent_of_state_size(self):
+        """Test journal flushes write a small delta instead of the whole state."""
+        json_path = Path(self.temp_dir.name) / "json_state.json"
+        json_time, json_state = self.run_flushes(JSONStateStore(str(json_path)))
+        json_bytes = json_path.stat().st_size
+
+        journal_path = Path(self.temp_dir.name) / "journal_state.json"
+        journal_store = JournalStateStore(str(journal_path), compact_bytes=1 << 30)
+        journal_time, journal_state = self.run_flushes(journal_store)
+        base_record = len(JournalStateStore(str(journal_path)).encode(self.initial_state, self.initial_state)[0])
+        delta_bytes = (journal_store.journal_size - base_record) / self.flushes
+
+        start_time = time.perf_counter()
+        recovered = JournalStateStore(str(journal_path)).load()
+        recovery_time = time.perf_counter() - start_time
+
+        print(f"\n{self.flushes} flushes of one changed key to a {len(self.initial_state)}-key state")
+        print(f"  JSON rewrite       {json_time * 1e3:8.3f} ms/flush  {json_bytes:9d} bytes/flush")
+        print(f"  journal append     {journal_time * 1e3:8.3f} ms/flush  {delta_bytes:9.0f} bytes/flush")
+        print(f"  journal recovery   {recovery_time * 1e3:8.3f} ms ({self.flushes + 1} records)")
+
+        self.assertEqual(recovered, json_state)
+        self.assertEqual(journal_state, json_state)
+        self.assertLess(delta_bytes * 1000, json_bytes)
+        self.assertLess(journal_time * 10, json_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
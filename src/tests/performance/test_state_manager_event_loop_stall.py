@@ -0,0 +1,113 @@
+"""
+FSL Continuum - StateManager Event Loop Stall Benchmark
+
+Measures event loop stalls while concurrent pipeline triggers persist
+continuum state: writing on the event loop (the previous behaviour), an
+immediate save on the state I/O thread, and the write-behind update that
+FSLContinuum._save_persistent_state now uses.
+"""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from concurrent.futures import Executor, Future
+from pathlib import Path
+
+# Import state manager
+try:
+    from src.fsl_continuum.continuum.state_management import StateManager
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from fsl_continuum.continuum.state_management import StateManager
+
+
+class InlineExecutor(Executor):
+    """Runs submitted calls immediately, on the event loop thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class TestStateManagerEventLoopStall(unittest.TestCase):
+    """Event loop stall benchmark for StateManager persistence."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.initial_state = {
+            f"flow_{i}": {"productivity": i / 10, "velocity_score": i, "markets": ["US", "China", "India", "Japan"]}
+            for i in range(5000)
+        }
+        self.triggers = 20
+        self.tick_interval = 0.001
+
+    def run_triggers(self, name, executor, write_behind):
+        """Max and total loop stall, wall time and status for concurrent triggers."""
+        async def scenario():
+            manager = StateManager(str(Path(self.temp_dir.name) / f"{name}.json"), executor=executor)
+            await manager.update(self.initial_state)
+            await manager.flush()
+
+            stalls = []
+            done = asyncio.Event()
+
+            async def ticker():
+                while not done.is_set():
+                    expected = time.perf_counter() + self.tick_interval
+                    await asyncio.sleep(self.tick_interval)
+                    stalls.append(max(0.0, time.perf_counter() - expected))
+
+            async def trigger(i):
+                # Pipeline work in flight, then persist its metrics
+                await asyncio.sleep(0.002 * (i % 5))
+                state = {"productivity": i, "velocity_score": i / 2}
+                if write_behind:
+                    await manager.update(state)
+                else:
+                    await manager.save_state(state)
+
+            ticker_task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0.01)
+            start_time = time.perf_counter()
+            await asyncio.gather(*(trigger(i) for i in range(self.triggers)))
+            await manager.flush()
+            elapsed = time.perf_counter() - start_time
+            done.set()
+            await ticker_task
+            await manager.shutdown()
+            return max(stalls), sum(stalls), elapsed, manager.get_status()
+
+        return asyncio.run(scenario())
+
+    def test_state_io_does_not_stall_the_event_loop(self):
+        """Test the I/O thread keeps loop stalls far below writing on the loop."""
+        results = {
+            "write on event loop": self.run_triggers("inline", InlineExecutor(), False),
+            "save on I/O thread": self.run_triggers("thread", None, False),
+            "write-behind on I/O thread": self.run_triggers("write_behind", None, True)
+        }
+
+        print(f"\n{self.triggers} concurrent pipeline triggers persisting a {len(self.initial_state)}-key state")
+        for name, (max_stall, total_stall, elapsed, status) in results.items():
+            print(f"  {name:<28} max stall {max_stall * 1e3:7.2f} ms  total stall {total_stall * 1e3:8.2f} ms  "
+                  f"wall {elapsed * 1e3:8.2f} ms  writes {status['flush_count'] - 1:3d}  "
+                  f"loop {status['loop_time'] * 1e3:6.2f} ms  I/O {status['io_time'] * 1e3:7.2f} ms")
+
+        inline_stall = results["write on event loop"][0]
+        self.assertLess(results["save on I/O thread"][0] * 2, inline_stall)
+        self.assertLess(results["write-behind on I/O thread"][0] * 2, inline_stall)
+        self.assertLess(results["write-behind on I/O thread"][3]["flush_count"],
+                        results["save on I/O thread"][3]["flush_count"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+FSL Continuum - Unified XML Serialization Passes Benchmark
+
+Measures the serialization passes unified XML wrappers no longer make:
+re-serializing the whole unified tree after each language was serialized,
+building per-language element trees only to serialize the data again, and
+serializing every parsed language element for ``xml_wrappers``.
+"""
+
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+# Import XML processor
+try:
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestUnifiedXMLSerializationPasses(unittest.TestCase):
+    """Benchmark for unified wrapper composition and lazy parse wrappers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.iterations = 5
+        self.context = {"xml_transformation_enabled": True}
+        self.semantic_data = {
+            "baml": {
+                "boundaries": [
+                    {"name": f"boundary_{i}", "type": "data", "ai_enhanced": True}
+                    for i in range(20000)
+                ]
+            },
+            "pareto_lang": {
+                "optimizations": [
+                    {"name": f"optimization_{i}", "type": "performance", "efficiency": 0.9}
+                    for i in range(20000)
+                ]
+            }
+        }
+
+    def measure(self, operation):
+        """Return the best wall time of an operation over the iterations."""
+        timings = []
+        for _ in range(self.iterations):
+            start_time = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - start_time)
+        return min(timings)
+
+    def test_saved_serialization_passes(self):
+        """Test composing and lazy parse wrappers cost less than the passes they replace."""
+        processor = UnifiedXMLProcessor()
+        created = processor.create_unified_xml_wrapper(self.semantic_data, self.context)
+        unified_xml = created.xml_wrappers["unified"]
+        unified_root = ET.fromstring(unified_xml)
+
+        create_time = self.measure(
+            lambda: processor.create_unified_xml_wrapper(self.semantic_data, self.context)
+        )
+        plain_wraps_time = self.measure(lambda: (
+            processor.baml_transformer.wrap_baml_with_xml(self.semantic_data["baml"], self.context),
+            processor.pareto_lang_transformer.wrap_pareto_lang_with_xml(self.semantic_data["pareto_lang"], self.context)
+        ))
+        compose_time = self.measure(lambda: processor._compose_unified_xml(
+            "2025-01-01T00:00:00", self.semantic_data.keys(),
+            [created.xml_wrappers["baml"], created.xml_wrappers["pareto_lang"]]
+        ))
+        # The pass creating used to make after serializing every language
+        reserialize_time = self.measure(lambda: ET.tostring(unified_root, encoding="unicode"))
+
+        parse_time = self.measure(lambda: processor.parse_unified_xml_wrapper(unified_xml))
+        parse_with_wrappers_time = self.measure(
+            lambda: processor.parse_unified_xml_wrapper(unified_xml).xml_wrappers
+        )
+
+        print("\nUnified XML wrappers, 2 x 20000 records (best of 5)")
+        print(f"  create             {create_time * 1000:8.1f} ms  "
+              f"(compose {compose_time * 1000:.1f} ms instead of re-serializing {reserialize_time * 1000:.1f} ms)")
+        print(f"  plain wraps        {plain_wraps_time * 1000:8.1f} ms")
+        print(f"  parse              {parse_time * 1000:8.1f} ms  "
+              f"(+ xml_wrappers on access: {parse_with_wrappers_time * 1000:.1f} ms)")
+
+        self.assertLess(compose_time, reserialize_time)
+        # Creating costs the language wraps plus composing, nothing more
+        self.assertLess(create_time, plain_wraps_time * 1.2 + compose_time)
+        self.assertLess(parse_time, parse_with_wrappers_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
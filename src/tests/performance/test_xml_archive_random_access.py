@@ -0,0 +1,119 @@
+"""
+FSL Continuum - Unified XML Archive Random Access Benchmark
+
+Measures random section reads from a large on-disk archive of unified XML
+documents: parsing whole documents from the file, memory-mapped scanning
+plus a single-section parse, and the sidecar index plus a single-section
+parse.
+"""
+
+import random
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Import XML archive
+try:
+    from src.semantic_languages.xml_archive import UnifiedXMLArchive
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_archive import UnifiedXMLArchive
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestXMLArchiveRandomAccess(unittest.TestCase):
+    """Random access benchmark for UnifiedXMLArchive."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = UnifiedXMLProcessor()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        context = {"xml_transformation_enabled": True}
+        count = 60
+        documents = []
+        for n in range(200):
+            documents.append(self.processor.create_unified_xml_wrapper({
+                "baml": {
+                    "boundaries": [{"name": f"boundary_{n}_{i}", "type": "data", "ai_enhanced": True}
+                                   for i in range(count)],
+                    "connections": [{"source": f"boundary_{n}_{i}", "target": f"boundary_{n}_{i + 1}",
+                                     "type": "data_flow"} for i in range(count - 1)]
+                },
+                "pareto_lang": {
+                    "optimizations": [{"name": f"opt_{n}_{i}", "type": "pareto", "target": "latency",
+                                       "efficiency": 0.5} for i in range(count)],
+                    "resources": [{"name": f"cpu_{n}_{i}", "type": "compute", "capacity": 4}
+                                  for i in range(count)]
+                }
+            }, context).xml_wrappers["unified"])
+        self.path = Path(self.temp_dir.name) / "archive.xml"
+        self.path.write_text("\n".join(documents) + "\n", encoding="utf-8")
+        self.document_count = len(documents)
+
+        rng = random.Random(7)
+        self.queries = [(rng.randrange(self.document_count), rng.choice(("baml", "pareto_lang")))
+                        for _ in range(40)]
+
+    def test_indexed_section_reads_beat_full_parse(self):
+        """Test scanned and indexed section reads beat reading and parsing whole documents."""
+        def full_parse():
+            results = []
+            for document, language_type in self.queries:
+                lines = self.path.read_text(encoding="utf-8").splitlines()
+                unified = self.processor.parse_unified_xml_wrapper(lines[document])
+                results.append(unified.processed_data[language_type])
+            return results
+
+        def scanned():
+            with UnifiedXMLArchive(self.path, index_path=self.path.with_name("missing.idx")) as archive:
+                return [archive.unwrap_section(language_type, document).transformed_data
+                        for document, language_type in self.queries]
+
+        def indexed():
+            with UnifiedXMLArchive(self.path) as archive:
+                return [archive.unwrap_section(language_type, document).transformed_data
+                        for document, language_type in self.queries]
+
+        def open_scanned():
+            with UnifiedXMLArchive(self.path, index_path=self.path.with_name("missing.idx")) as archive:
+                return archive.document_count
+
+        def open_indexed():
+            with UnifiedXMLArchive(self.path) as archive:
+                return archive.document_count
+
+        with UnifiedXMLArchive(self.path) as archive:
+            archive.build_index()
+
+        timings = {}
+        results = {}
+        for name, func in (("full parse", full_parse), ("mmap scan + section", scanned),
+                           ("sidecar index + section", indexed), ("open + scan", open_scanned),
+                           ("open + index", open_indexed)):
+            best = float("inf")
+            for _ in range(3):
+                start_time = time.perf_counter()
+                results[name] = func()
+                best = min(best, time.perf_counter() - start_time)
+            timings[name] = best
+
+        size = self.path.stat().st_size
+        print(f"\n{self.document_count} documents, {size / 1e6:.1f} MB, {len(self.queries)} random section reads")
+        for name, seconds in timings.items():
+            print(f"  {name:<26} {seconds * 1e3:9.2f} ms")
+
+        self.assertEqual(results["full parse"], results["mmap scan + section"])
+        self.assertEqual(results["full parse"], results["sidecar index + section"])
+        self.assertEqual(results["open + scan"], self.document_count)
+        self.assertLess(timings["mmap scan + section"] * 5, timings["full parse"])
+        self.assertLess(timings["sidecar index + section"], timings["mmap scan + section"])
+        self.assertLess(timings["open + index"] * 5, timings["open + scan"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+FSL Continuum - Unified XML Batch Scaling Benchmark
+
+Measures process_batch throughput as the worker count grows up to the
+number of available cores, against wrapping each document in a plain loop.
+"""
+
+import os
+import time
+import unittest
+
+# Import unified XML processor
+try:
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLSchema
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+    from semantic_languages.baml.xml_transformer import BAMLXMLSchema
+
+
+def available_cpus():
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class TestXMLBatchScaling(unittest.TestCase):
+    """Scaling benchmark for batch XML wrapping."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = UnifiedXMLProcessor()
+        self.documents = [
+            {
+                "boundaries": [
+                    {"name": f"boundary_{i}_{j}", "type": "data", "ai_enhanced": True}
+                    for j in range(20)
+                ],
+                "connections": [{"source": f"boundary_{i}_0", "target": f"boundary_{i}_1"}]
+            }
+            for i in range(5000)
+        ]
+
+    def best_throughput(self, wrap_all, repeat=3):
+        """Best documents per second of ``repeat`` runs of ``wrap_all``."""
+        best = 0.0
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            count = wrap_all()
+            best = max(best, count / (time.perf_counter() - start_time))
+        return best
+
+    def test_batch_throughput_scaling(self):
+        """Test batch throughput across worker counts never falls below the sequential loop."""
+        cpu_count = available_cpus()
+        worker_counts = sorted({1, 2, 4, 8, cpu_count})
+        worker_counts = [w for w in worker_counts if w <= cpu_count] or [1]
+
+        xml_schema = BAMLXMLSchema()
+        sequential = self.best_throughput(
+            lambda: sum(1 for document in self.documents if xml_schema.to_xml_string(document))
+        )
+        throughput = {}
+        print(f"\nprocess_batch scaling ({len(self.documents)} BAML documents, {cpu_count} cores)")
+        print(f"  sequential  {sequential:10.0f} docs/s")
+        for workers in worker_counts:
+            throughput[workers] = self.best_throughput(
+                lambda: sum(1 for _ in self.processor.process_batch(self.documents, "baml", workers=workers))
+            )
+            print(f"  workers={workers:<3} {throughput[workers]:10.0f} docs/s  "
+                  f"speedup {throughput[workers] / sequential:.2f}x")
+
+        self.assertEqual(len(self.processor.processing_history), len(worker_counts) * 3)
+        for workers, docs_per_second in throughput.items():
+            with self.subTest(workers=workers):
+                self.assertGreaterEqual(docs_per_second, sequential * 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
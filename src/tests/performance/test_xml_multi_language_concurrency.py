@@ -0,0 +1,108 @@
+"""
+FSL Continuum - Multi-Language XML Concurrency Benchmark
+
+Measures process_multiple_semantic_data_with_xml against wrapping each
+language one after the other: without an executor (the sequential default),
+on a thread pool, which cannot overlap the GIL-bound wraps, and on a process
+pool, which can.
+"""
+
+import os
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Import XML processors
+try:
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+def available_cpus():
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class TestXMLMultiLanguageConcurrency(unittest.TestCase):
+    """Concurrency benchmark for multi-language XML processing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        count = 400
+        self.semantic_data = {
+            "baml": {
+                "boundaries": [{"name": f"boundary_{i}", "type": "data", "ai_enhanced": True} for i in range(count)],
+                "connections": [{"source": f"boundary_{i}", "target": f"boundary_{i + 1}", "type": "data_flow"}
+                                for i in range(count - 1)]
+            },
+            "pareto_lang": {
+                "optimizations": [{"name": f"opt_{i}", "type": "pareto", "target": "latency", "efficiency": 0.5}
+                                  for i in range(count)],
+                "resources": [{"name": f"cpu_{i}", "type": "compute", "capacity": 4} for i in range(count)]
+            }
+        }
+        self.context = {"xml_transformation_enabled": True}
+
+    def best_wall_time(self, func, repeat=5):
+        """Best wall-clock seconds of ``repeat`` calls, with the last result."""
+        best = float("inf")
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start_time)
+        return best, result
+
+    def test_concurrent_languages_cost_close_to_slowest(self):
+        """Test the sequential default costs no more than a thread pool and a process pool overlaps wraps."""
+        processor = UnifiedXMLProcessor()
+
+        def sequential():
+            return {
+                language_type: processor.process_semantic_data_with_xml(data, language_type, self.context)
+                for language_type, data in self.semantic_data.items()
+            }
+
+        sequential_time, _ = self.best_wall_time(sequential)
+        default_time, default_result = self.best_wall_time(
+            lambda: processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            thread_processor = UnifiedXMLProcessor(executor=executor)
+            thread_time, thread_result = self.best_wall_time(
+                lambda: thread_processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+            )
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            process_processor = UnifiedXMLProcessor(executor=executor)
+            process_processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+            process_time, process_result = self.best_wall_time(
+                lambda: process_processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+            )
+
+        cpus = available_cpus()
+        print(f"\nTwo languages, {cpus} CPU(s)")
+        print(f"  sequential          {sequential_time * 1e3:8.2f} ms")
+        print(f"  default (no pool)   {default_time * 1e3:8.2f} ms")
+        print(f"  thread pool         {thread_time * 1e3:8.2f} ms  per-language "
+              + ", ".join(f"{name} {seconds * 1e3:.2f} ms" for name, seconds in thread_result.transformation_times.items()))
+        print(f"  process pool        {process_time * 1e3:8.2f} ms  per-language "
+              + ", ".join(f"{name} {seconds * 1e3:.2f} ms" for name, seconds in process_result.transformation_times.items()))
+
+        for result in (default_result, thread_result, process_result):
+            self.assertTrue(result.success)
+            self.assertLessEqual(max(result.transformation_times.values()), result.metadata["processing_time"])
+        self.assertLess(default_time, sequential_time * 1.1 + 0.001)
+        self.assertLess(default_time, thread_time * 1.1 + 0.001)
+        if cpus >= 2:
+            slowest = max(process_result.transformation_times.values())
+            self.assertLess(process_time, sequential_time * 0.8)
+            self.assertLess(process_time, slowest * 1.5 + 0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+FSL Continuum - Streaming XML Unwrap Memory Benchmark
+
+Compares peak memory of the tree-based BAML unwrap against the
+iterparse-based streaming unwrap on a large generated wrapper.
+"""
+
+import io
+import time
+import tracemalloc
+import unittest
+
+# Import BAML XML transformer
+try:
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+
+
+class TestXMLStreamingMemory(unittest.TestCase):
+    """Memory benchmark for streaming XML unwrap."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = BAMLXMLTransformer()
+        self.boundary_count = 50000
+        baml_data = {
+            "boundaries": [
+                {"name": f"boundary_{i}", "type": "data", "scope": "global", "ai_enhanced": True}
+                for i in range(self.boundary_count)
+            ]
+        }
+        self.xml_bytes = self.transformer.wrap_baml_with_xml(baml_data).xml_wrapper.encode()
+
+    def measure(self, operation):
+        """Return (peak traced bytes, elapsed seconds) for an operation."""
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak, elapsed
+
+    def test_streaming_unwrap_peak_memory(self):
+        """Test streaming record iteration stays far below tree unwrap memory."""
+        xml_string = self.xml_bytes.decode()
+        tree_peak, tree_time = self.measure(
+            lambda: self.transformer.unwrap_xml_to_baml(xml_string)
+        )
+        stream_peak, stream_time = self.measure(
+            lambda: sum(1 for _ in self.transformer.iter_unwrap_xml_to_baml(io.BytesIO(self.xml_bytes)))
+        )
+
+        print(f"\nBAML unwrap ({len(self.xml_bytes) / 1e6:.1f} MB, {self.boundary_count} boundaries)")
+        print(f"  tree:   peak {tree_peak / 1e6:8.2f} MB  {tree_time:.2f}s")
+        print(f"  stream: peak {stream_peak / 1e6:8.2f} MB  {stream_time:.2f}s")
+
+        # Streaming holds at most one record plus parser buffers
+        self.assertLess(stream_peak, tree_peak / 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
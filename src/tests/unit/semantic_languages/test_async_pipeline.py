@@ -0,0 +1,233 @@
+"""
+FSL Continuum - Async Semantic Pipeline Unit Tests
+
+Unit tests for the asyncio facade over the semantic language pipeline.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Import async pipeline and XML processor
+try:
+    from src.semantic_languages.async_pipeline import AsyncSemanticPipeline
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.async_pipeline import AsyncSemanticPipeline
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class ConcurrencyProbe:
+    """Blocking callable that records peak concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(value)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return value * 2
+
+
+class StubConnections:
+    """Synchronous connections stand-in recording the calling thread."""
+
+    def __init__(self):
+        self.threads = []
+
+    def connect_baml_to_continuum(self, baml_schema, continuum_state):
+        self.threads.append(threading.current_thread())
+        return {"connection_type": "baml_to_continuum", "baml_schema": baml_schema}
+
+    def connect_pareto_to_continuum(self, pareto_schema, continuum_state):
+        self.threads.append(threading.current_thread())
+        return {"connection_type": "pareto_to_continuum", "pareto_schema": pareto_schema}
+
+
+class TestAsyncSemanticPipeline(unittest.TestCase):
+    """Unit tests for AsyncSemanticPipeline."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.baml_data = {"boundaries": [{"name": "test_boundary", "type": "data"}]}
+        self.pareto_data = {"optimizations": [{"name": "test_optimization", "efficiency": 0.9}]}
+        self.context = {"xml_transformation_enabled": True}
+
+    def test_invalid_limits(self):
+        """Test invalid concurrency limits are rejected."""
+        with self.assertRaises(ValueError):
+            AsyncSemanticPipeline(max_concurrency=0)
+        with self.assertRaises(ValueError):
+            AsyncSemanticPipeline(max_concurrency=4, max_pending=2)
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency calls run at once."""
+        probe = ConcurrencyProbe()
+        pipeline = AsyncSemanticPipeline(max_concurrency=2)
+
+        async def scenario():
+            return await asyncio.gather(*(pipeline.run(probe, i) for i in range(8)))
+
+        results = asyncio.run(scenario())
+        pipeline.shutdown()
+
+        self.assertEqual(results, [i * 2 for i in range(8)])
+        self.assertEqual(probe.peak, 2)
+        status = pipeline.get_pipeline_status()
+        self.assertEqual(status["completed_calls"], 8)
+        self.assertEqual(status["in_flight"], 0)
+        self.assertEqual(status["admitted"], 0)
+
+    def test_backpressure_limits_admitted_calls(self):
+        """Test callers beyond max_pending wait for admission."""
+        release = threading.Event()
+        pipeline = AsyncSemanticPipeline(max_concurrency=1, max_pending=2)
+
+        async def scenario():
+            tasks = [asyncio.ensure_future(pipeline.run(release.wait, 5)) for _ in range(4)]
+            await asyncio.sleep(0.05)
+            admitted = pipeline.admitted
+            release.set()
+            await asyncio.gather(*tasks)
+            return admitted
+
+        admitted = asyncio.run(scenario())
+        pipeline.shutdown()
+        self.assertEqual(admitted, 2)
+
+    def test_cancellation_skips_queued_calls(self):
+        """Test cancelling queued callers frees their slots without running them."""
+        release = threading.Event()
+        probe = ConcurrencyProbe(delay=0)
+        pipeline = AsyncSemanticPipeline(max_concurrency=1)
+
+        async def scenario():
+            blocker = asyncio.ensure_future(pipeline.run(release.wait, 5))
+            queued = [asyncio.ensure_future(pipeline.run(probe, i)) for i in range(3)]
+            await asyncio.sleep(0.05)
+            for task in queued:
+                task.cancel()
+            release.set()
+            await blocker
+            cancelled = await asyncio.gather(*queued, return_exceptions=True)
+            follow_up = await pipeline.run(probe, 10)
+            return cancelled, follow_up
+
+        cancelled, follow_up = asyncio.run(scenario())
+        pipeline.shutdown()
+
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in cancelled))
+        self.assertEqual(probe.calls, [10])
+        self.assertEqual(follow_up, 20)
+        status = pipeline.get_pipeline_status()
+        self.assertEqual(status["cancelled_calls"], 3)
+        self.assertEqual(status["admitted"], 0)
+
+    def test_failures_propagate(self):
+        """Test executor exceptions reach the caller and are recorded."""
+        def fail():
+            raise RuntimeError("boom")
+
+        pipeline = AsyncSemanticPipeline()
+
+        async def scenario():
+            await pipeline.run(fail)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(scenario())
+        pipeline.shutdown()
+        self.assertEqual(pipeline.get_pipeline_status()["failed_calls"], 1)
+
+    def test_rejected_submit_releases_slots(self):
+        """Test calls the executor refuses hand back their slots."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        pipeline = AsyncSemanticPipeline(executor=executor, max_concurrency=1, max_pending=1)
+
+        async def scenario():
+            for _ in range(3):
+                with self.assertRaises(RuntimeError):
+                    await asyncio.wait_for(pipeline.run(len, ()), 1)
+
+        asyncio.run(scenario())
+        status = pipeline.get_pipeline_status()
+        self.assertEqual((status["in_flight"], status["admitted"], status["failed_calls"]), (0, 0, 3))
+
+    def test_map_preserves_order(self):
+        """Test map yields results in input order with bounded outstanding calls."""
+        probe = ConcurrencyProbe(delay=0.005)
+        pipeline = AsyncSemanticPipeline(max_concurrency=3, max_pending=3)
+
+        async def scenario():
+            return [result async for result in pipeline.map(probe, ((i,) for i in range(20)))]
+
+        results = asyncio.run(scenario())
+        pipeline.shutdown()
+
+        self.assertEqual(results, [i * 2 for i in range(20)])
+        self.assertLessEqual(probe.peak, 3)
+
+    def test_connections_run_off_the_event_loop(self):
+        """Test connection calls run on executor threads."""
+        connections = StubConnections()
+
+        async def scenario():
+            async with AsyncSemanticPipeline(connections=connections) as pipeline:
+                return await asyncio.gather(
+                    pipeline.connect_baml_to_continuum(self.baml_data, {}),
+                    pipeline.connect_pareto_to_continuum(self.pareto_data, {})
+                ), pipeline
+
+        (baml_result, pareto_result), pipeline = asyncio.run(scenario())
+
+        self.assertEqual(baml_result["connection_type"], "baml_to_continuum")
+        self.assertEqual(pareto_result["connection_type"], "pareto_to_continuum")
+        self.assertTrue(all(thread is not threading.main_thread() for thread in connections.threads))
+        self.assertEqual(
+            pipeline.get_pipeline_status()["operation_distribution"],
+            {"connect_baml_to_continuum": 1, "connect_pareto_to_continuum": 1}
+        )
+
+    def test_unified_xml_round_trip(self):
+        """Test unified XML wrap and parse through the facade."""
+        pipeline = AsyncSemanticPipeline(xml_processor=UnifiedXMLProcessor())
+        semantic_data = {"baml": self.baml_data, "pareto_lang": self.pareto_data}
+
+        async def scenario():
+            wrapped = await pipeline.create_unified_xml_wrapper(semantic_data, self.context)
+            parsed = await pipeline.parse_unified_xml_wrapper(wrapped.xml_wrappers["unified"], self.context)
+            return wrapped, parsed
+
+        wrapped, parsed = asyncio.run(scenario())
+        pipeline.shutdown()
+
+        self.assertTrue(wrapped.success)
+        self.assertTrue(parsed.success)
+        self.assertEqual(parsed.processed_data["baml"]["boundaries"][0]["name"], "test_boundary")
+
+    def test_pipeline_reusable_across_event_loops(self):
+        """Test the pipeline rebinds its primitives to each running loop."""
+        probe = ConcurrencyProbe(delay=0)
+        pipeline = AsyncSemanticPipeline()
+
+        self.assertEqual(asyncio.run(pipeline.run(probe, 1)), 2)
+        self.assertEqual(asyncio.run(pipeline.run(probe, 2)), 4)
+        pipeline.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
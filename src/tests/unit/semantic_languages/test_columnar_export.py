@@ -0,0 +1,206 @@
+"""
+FSL Continuum - Columnar Export Unit Tests
+
+Unit tests for flattening semantic documents into columnar tables and
+reading them back.
+"""
+
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Import columnar exporter
+try:
+    from src.semantic_languages.columnar_export import (
+        ColumnarExporter, export_columnar, read_columnar, PARQUET_AVAILABLE
+    )
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.columnar_export import (
+        ColumnarExporter, export_columnar, read_columnar, PARQUET_AVAILABLE
+    )
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+
+
+GOLDEN_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "xml_golden"
+
+
+class TestColumnarExport(unittest.TestCase):
+    """Unit tests for ColumnarExporter and read_columnar."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with open(GOLDEN_DIR / "semantic_documents.json", "r") as f:
+            self.documents = json.load(f)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "export"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def exporter(self, format="npz"):
+        """An exporter loaded with the golden BAML and Pareto-Lang documents."""
+        exporter = ColumnarExporter(format)
+        exporter.add_document(self.documents["baml"], "baml")
+        exporter.add_document(self.documents["pareto_lang"], "pareto_lang")
+        return exporter
+
+    def test_flattening(self):
+        """Test sections become tables, nested objects dotted columns, record lists child tables."""
+        tables = self.exporter().tables()
+
+        boundaries = tables["boundaries"]
+        self.assertEqual(boundaries.num_rows, 3)
+        self.assertEqual(list(boundaries.column("name")), ["user_input", "empty_constraints", "whitespace"])
+        self.assertEqual(boundaries.kinds["weight"], "float")
+        np.testing.assert_array_equal(boundaries.is_valid("weight"), [False, False, True])
+
+        constraints = tables["boundaries.constraints"]
+        self.assertEqual(list(constraints.column("_parent")), [0, 0])
+        self.assertEqual(constraints.to_records()[0],
+                         {"_document": 0, "_language": "baml", "_index": 0, "_parent": 0,
+                          "name": "max_length", "value": "1024"})
+
+        connections = tables["connections"]
+        self.assertEqual(connections.kinds["context.retries"], "int")
+        self.assertEqual(connections.to_records()[1]["context"], "not-a-dict")
+
+        shared = tables["constraints"]
+        self.assertEqual(set(shared.column("_language")), {"baml", "pareto_lang"})
+        self.assertIn("optimizations", tables)
+
+    def test_npz_round_trip(self):
+        """Test NPZ exports read back identical tables, with or without compression."""
+        for compression in (None, "deflate"):
+            exporter = self.exporter()
+            exporter.compression = compression
+            summary = exporter.write(self.path)
+            self.assertEqual(summary["format"], "npz")
+            self.assertTrue(summary["path"].endswith(".npz"))
+
+            expected = exporter.tables()
+            loaded = read_columnar(self.path)
+            self.assertEqual(set(loaded), set(expected))
+            for name, table in expected.items():
+                with self.subTest(table=name, compression=compression):
+                    self.assertEqual(loaded[name].kinds, table.kinds)
+                    self.assertEqual(loaded[name].to_records(), table.to_records())
+
+    def test_dictionary_encoding_and_projection(self):
+        """Test repeated strings are dictionary-encoded and projections load only what is asked."""
+        documents = [("pareto_lang", {"optimizations": [
+            {"name": f"opt_{i}_{j}", "type": ["pareto", "efficiency"][i % 2], "efficiency": i / 100, "note": None}
+            for i in range(50)
+        ]}) for j in range(4)]
+        export_columnar(documents, self.path, format="npz")
+
+        with np.load(self.path.with_suffix(".npz")) as archive:
+            arrays = json.loads(archive["_tables.json"].tobytes())["arrays"]["optimizations"]
+        self.assertIn("codes", arrays["type"])
+        self.assertNotIn("codes", arrays["name"])
+
+        loaded = read_columnar(self.path, tables=["optimizations"], columns=["type", "efficiency"])
+        optimizations = loaded["optimizations"]
+        self.assertEqual(set(optimizations.columns), {"type", "efficiency"})
+        self.assertEqual(optimizations.num_rows, 200)
+        self.assertEqual(list(optimizations.column("type")[:3]), ["pareto", "efficiency", "pareto"])
+        self.assertAlmostEqual(float(optimizations.column("efficiency").mean()), 0.245)
+
+    def test_xml_ingest(self):
+        """Test XML wrappers stream into the same section tables as their documents."""
+        xml_wrapper = BAMLXMLTransformer().wrap_baml_with_xml(self.documents["baml"]).xml_wrapper
+        exporter = ColumnarExporter("npz")
+        self.assertEqual(exporter.add_xml(io.BytesIO(xml_wrapper.encode("utf-8")), "baml"), 0)
+
+        direct = ColumnarExporter("npz")
+        direct.add_document(self.documents["baml"], "baml")
+        direct = direct.tables()
+        from_xml = exporter.tables()
+        self.assertEqual(set(from_xml), {"boundaries", "connections", "constraints"})
+        for name in from_xml:
+            self.assertEqual(from_xml[name].num_rows, direct[name].num_rows)
+        self.assertEqual(list(from_xml["boundaries"].column("name")), list(direct["boundaries"].column("name")))
+
+    def test_invalid_arguments(self):
+        """Test unsupported formats, languages, documents and paths raise ValueError."""
+        with self.assertRaises(ValueError):
+            ColumnarExporter("csv")
+        with self.assertRaises(ValueError):
+            ColumnarExporter("npz").add_document({}, "yaml")
+        with self.assertRaises(ValueError):
+            ColumnarExporter("npz").add_document([], "baml")
+        with self.assertRaises(ValueError):
+            read_columnar(self.path)
+        if not PARQUET_AVAILABLE:
+            with self.assertRaises(ValueError):
+                ColumnarExporter("parquet")
+            self.assertEqual(ColumnarExporter().format, "npz")
+
+    def test_reserved_and_colliding_columns_rejected(self):
+        """Test records cannot overwrite bookkeeping columns or share a flattened column."""
+        exporter = ColumnarExporter("npz")
+        exporter.add_document({"boundaries": [{"name": "kept", "limits": [{"max": 1}]}]}, "baml")
+
+        rejected = [
+            {"boundaries": [{"name": "a"}, {"name": "b", "_document": 99}]},
+            {"boundaries": [{"name": "a", "_index": "x"}]},
+            {"boundaries": [{"name": "a", "limits": [{"_parent": 5}]}]},
+            {"boundaries": [{"ctx": {"m": 1}, "ctx.m": 2}]},
+            {"boundaries": [{"ctx": {"rules": [{"id": 1}]}, "ctx.rules": [{"id": 2}]}]},
+        ]
+        for document in rejected:
+            with self.subTest(document=document):
+                with self.assertRaises(ValueError):
+                    exporter.add_document(document, "baml")
+
+        # Rejected documents add no rows and take no document number
+        self.assertEqual(exporter.add_document({"boundaries": [{"ctx": {"m": 1}}]}, "baml"), 1)
+        tables = exporter.tables()
+        self.assertEqual(tables["boundaries"].num_rows, 2)
+        self.assertEqual(tables["boundaries"].kinds["_index"], "int")
+        self.assertEqual(list(tables["boundaries"].column("_document")), [0, 1])
+        self.assertEqual(tables["boundaries.limits"].to_records(),
+                         [{"max": 1, "_document": 0, "_language": "baml", "_index": 0, "_parent": 0}])
+
+    def test_npz_arrays_do_not_collide_with_dotted_columns(self):
+        """Test columns named like another column's validity or string arrays round-trip intact."""
+        exporter = ColumnarExporter("npz")
+        exporter.add_document({"boundaries": [
+            {"x": 1, "name": "a"},
+            {"x": {"valid": 7, "codes": 2}, "name": {"data": "d", "offsets": "o"}},
+            {}
+        ]}, "baml")
+        exporter.write(self.path)
+
+        expected = exporter.tables()["boundaries"]
+        loaded = read_columnar(self.path)["boundaries"]
+        self.assertEqual(loaded.kinds, expected.kinds)
+        self.assertEqual(loaded.to_records(), expected.to_records())
+        self.assertEqual(loaded.is_valid("x").tolist(), [True, False, False])
+        self.assertEqual(int(loaded.column("x")[0]), 1)
+        self.assertEqual(loaded.to_records()[1]["x.valid"], 7)
+
+    @unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_parquet_round_trip(self):
+        """Test Parquet exports read back the same tables as NPZ exports."""
+        summary = self.exporter("parquet").write(self.path)
+        self.assertTrue((self.path / "boundaries.parquet").exists())
+        self.assertEqual(summary["format"], "parquet")
+
+        expected = self.exporter().tables()
+        loaded = read_columnar(self.path)
+        for name, table in expected.items():
+            with self.subTest(table=name):
+                self.assertEqual(loaded[name].to_records(), table.to_records())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+FSL Continuum - Semantic Connection Pool Unit Tests
+
+Unit tests for the bounded, fair connection pool behind SemanticDataConnections.
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Import connection pool and data connections
+try:
+    from src.semantic_languages import connection_pool
+    from src.semantic_languages.connection_pool import (
+        SemanticConnectionPool, ConnectionPoolTimeout, ConnectionPoolFull
+    )
+    from src.semantic_languages.connections import SemanticDataConnections
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages import connection_pool
+    from semantic_languages.connection_pool import (
+        SemanticConnectionPool, ConnectionPoolTimeout, ConnectionPoolFull
+    )
+    from semantic_languages.connections import SemanticDataConnections
+
+
+class TestSemanticConnectionPool(unittest.TestCase):
+    """Unit tests for SemanticConnectionPool."""
+
+    def wait_for_queue_depth(self, pool, depth):
+        """Wait until ``depth`` callers are queued."""
+        deadline = time.monotonic() + 5
+        while pool.get_status()["queue_depth"] < depth:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def grant_order(self, load_balancing):
+        """Queue four BAML then two Pareto-Lang callers behind a held slot; return grant order."""
+        pool = SemanticConnectionPool(max_connections=1, load_balancing=load_balancing)
+        order = []
+        held = pool.acquire("setup")
+
+        def worker(flow):
+            with pool.connection(flow):
+                order.append(flow)
+
+        threads = []
+        for flow in ["baml"] * 4 + ["pareto_lang"] * 2:
+            thread = threading.Thread(target=worker, args=(flow,))
+            thread.start()
+            threads.append(thread)
+            self.wait_for_queue_depth(pool, len(threads))
+
+        held.release()
+        for thread in threads:
+            thread.join()
+        return order
+
+    def test_max_connections_enforced(self):
+        """Test no more than max_connections slots are held at once."""
+        pool = SemanticConnectionPool(max_connections=2)
+        lock = threading.Lock()
+        current = [0, 0]
+
+        def worker():
+            with pool.connection("baml"):
+                with lock:
+                    current[0] += 1
+                    current[1] = max(current[1], current[0])
+                time.sleep(0.01)
+                with lock:
+                    current[0] -= 1
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        status = pool.get_status()
+        self.assertEqual(current[1], 2)
+        self.assertEqual(status["active_connections"], 0)
+        self.assertEqual(status["requests_by_flow"], {"baml": 8})
+        self.assertGreater(status["max_queue_depth"], 0)
+        self.assertGreater(status["wait_time"]["max_time"], 0.0)
+
+    def test_round_robin_across_flows(self):
+        """Test freed slots alternate between flows instead of following arrival order."""
+        self.assertEqual(
+            self.grant_order("semantic_aware"),
+            ["baml", "pareto_lang", "baml", "pareto_lang", "baml", "baml"]
+        )
+        self.assertEqual(
+            self.grant_order("fifo"),
+            ["baml", "baml", "baml", "baml", "pareto_lang", "pareto_lang"]
+        )
+
+    def test_timeout(self):
+        """Test waiting callers give up after the timeout and leave the queue."""
+        pool = SemanticConnectionPool(max_connections=1, connection_timeout=0.05)
+        with pool.connection("baml"):
+            start_time = time.monotonic()
+            with self.assertRaises(ConnectionPoolTimeout):
+                pool.acquire("pareto_lang")
+            self.assertGreaterEqual(time.monotonic() - start_time, 0.05)
+
+        status = pool.get_status()
+        self.assertEqual((status["timeouts"], status["queue_depth"]), (1, 0))
+        with pool.connection("pareto_lang", timeout=0):
+            pass
+
+    def test_backpressure_when_queue_full(self):
+        """Test callers are refused while the wait queue stays full."""
+        pool = SemanticConnectionPool(max_connections=1, buffer_size=1)
+        held = pool.acquire("baml")
+        waiter = threading.Thread(target=lambda: pool.acquire("baml", timeout=5).release())
+        waiter.start()
+        self.wait_for_queue_depth(pool, 1)
+
+        with self.assertRaises(ConnectionPoolFull):
+            pool.acquire("pareto_lang", timeout=0.02)
+        self.assertEqual(pool.get_status()["rejections"], 1)
+
+        held.release()
+        waiter.join()
+
+    def test_retry_with_jitter(self):
+        """Test failures are retried with jittered exponential backoff."""
+        pool = SemanticConnectionPool(retry_attempts=3, retry_backoff=0.01, max_retry_backoff=0.015)
+        calls = []
+
+        def flaky(value):
+            calls.append(value)
+            if len(calls) < 3:
+                raise ConnectionError("transient")
+            return value * 2
+
+        with mock.patch.object(connection_pool, "random") as jitter:
+            jitter.uniform.return_value = 0.0
+            self.assertEqual(pool.run("baml", flaky, 21), 42)
+            self.assertEqual([c.args for c in jitter.uniform.call_args_list], [(0, 0.01), (0, 0.015)])
+
+            with self.assertRaises(ValueError):
+                pool.run("baml", self.fail_always)
+
+        status = pool.get_status()
+        self.assertEqual((status["retries"], status["failures"]), (5, 1))
+        self.assertEqual(status["active_connections"], 0)
+
+    def fail_always(self):
+        """Always fail."""
+        raise ValueError("permanent")
+
+    def test_config_limits(self):
+        """Test pools are built from connections.json settings."""
+        connections = SemanticDataConnections()
+        settings = connections.connections_config["connection_settings"]
+        pool = connections.connection_pool
+
+        self.assertEqual(pool.max_connections, settings["max_connections"])
+        self.assertEqual(pool.connection_timeout, settings["connection_timeout"])
+        self.assertEqual(pool.retry_attempts, settings["retry_attempts"])
+        self.assertEqual(pool.buffer_size, settings["buffer_size"])
+        self.assertEqual(
+            pool.load_balancing,
+            connections.connections_config["flow_management"]["load_balancing"]
+        )
+        with self.assertRaises(ValueError):
+            SemanticConnectionPool(max_connections=0)
+
+    def test_connections_retry_transient_failures(self):
+        """Test connect calls apply the configured retries to transient failures only."""
+        connections = SemanticDataConnections()
+        connections.connection_pool.retry_backoff = 0.0
+        process = connections._process_pareto_for_continuum
+        failures = [ConnectionError("transient")]
+
+        def flaky(*args):
+            if failures:
+                raise failures.pop()
+            return process(*args)
+
+        with mock.patch.object(connections, "_process_pareto_for_continuum", side_effect=flaky):
+            self.assertTrue(connections.connect_pareto_to_continuum({}, {})["success"])
+        self.assertEqual(connections.connection_pool.get_status()["retries"], 1)
+
+        with mock.patch.object(connections, "_process_pareto_for_continuum", side_effect=ValueError("bad data")):
+            result = connections.connect_pareto_to_continuum({}, {})
+        self.assertEqual((result["success"], result["error"]), (False, "bad data"))
+        status = connections.connection_pool.get_status()
+        self.assertEqual((status["retries"], status["failures"], status["active_connections"]), (1, 0, 0))
+
+    def test_connections_use_unique_ids_and_stay_bounded(self):
+        """Test concurrent connections get distinct ids and registries stay bounded."""
+        connections = SemanticDataConnections()
+        limit = connections.connection_pool.max_connections
+        results = []
+
+        def worker():
+            for _ in range(limit // 2):
+                results.append(connections.connect_baml_to_continuum({}, {}))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(len({result["connection_id"] for result in results}), len(results))
+        self.assertEqual(len(connections.baml_connections), limit)
+        self.assertEqual(len(connections.active_connections), limit)
+        self.assertEqual(connections.get_connection_status()["connection_pool"]["requests_by_flow"],
+                         {"baml": len(results)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+FSL Continuum - Semantic Language Metrics Unit Tests
+
+Unit tests for the bounded metrics recorder and its use by the XML
+transformers and unified XML processor.
+"""
+
+import random
+import unittest
+
+# Import metrics and XML components
+try:
+    from src.semantic_languages.metrics import MetricsRecorder, DurationDigest
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.metrics import MetricsRecorder, DurationDigest
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestMetricsRecorder(unittest.TestCase):
+    """Unit tests for MetricsRecorder."""
+
+    def test_streaming_counters(self):
+        """Test count, success, mean, min and max."""
+        recorder = MetricsRecorder()
+        for duration, success in [(0.1, True), (0.3, False), (0.2, True)]:
+            recorder.record(duration, success)
+
+        summary = recorder.summary()
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["success_count"], 2)
+        self.assertAlmostEqual(summary["mean_time"], 0.2)
+        self.assertEqual(summary["min_time"], 0.1)
+        self.assertEqual(summary["max_time"], 0.3)
+
+    def test_recent_records_are_bounded(self):
+        """Test only the last history_size records are kept."""
+        recorder = MetricsRecorder(history_size=5)
+        for i in range(100):
+            recorder.record(0.01, True, {"index": i})
+
+        self.assertEqual(recorder.count, 100)
+        self.assertEqual([r["index"] for r in recorder.get_recent_records()], list(range(95, 100)))
+        self.assertEqual(recorder.last_record, {"index": 99})
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test digest quantiles stay within the configured relative error."""
+        rng = random.Random(7)
+        durations = [rng.lognormvariate(-5, 1) for _ in range(20000)]
+        recorder = MetricsRecorder(history_size=0, relative_accuracy=0.01)
+        for duration in durations:
+            recorder.record(duration)
+
+        durations.sort()
+        for name, q in MetricsRecorder.QUANTILES.items():
+            exact = durations[int(q * (len(durations) - 1))]
+            self.assertAlmostEqual(recorder.summary()[name] / exact, 1.0, delta=0.02)
+
+    def test_digest_size_is_fixed(self):
+        """Test the digest does not grow with the number of samples."""
+        digest = DurationDigest()
+        bucket_count = len(digest.buckets)
+        for i in range(10000):
+            digest.add(i * 1e-4)
+        self.assertEqual(len(digest.buckets), bucket_count)
+
+
+class TestProcessorMetrics(unittest.TestCase):
+    """Status dictionaries backed by the metrics recorder."""
+
+    def test_transformer_status(self):
+        """Test BAML transformer status keeps its keys with bounded history."""
+        transformer = BAMLXMLTransformer(history_size=3)
+        for i in range(10):
+            transformer.wrap_baml_with_xml({"boundaries": [{"name": f"boundary_{i}"}]})
+
+        status = transformer.get_transformation_status()
+        metrics = status["performance_metrics"]
+        self.assertEqual(status["transformation_history_size"], 10)
+        self.assertEqual(len(transformer.transformation_history), 3)
+        self.assertEqual(metrics["total_transformations"], 10)
+        self.assertEqual(metrics["success_rate"], 1.0)
+        self.assertGreater(metrics["average_transformation_time"], 0.0)
+        self.assertIn("p99", metrics["transformation_time_percentiles"])
+
+    def test_unified_processor_language_distribution(self):
+        """Test language distribution is tracked without rescanning history."""
+        processor = UnifiedXMLProcessor(history_size=2)
+        for _ in range(4):
+            processor.process_semantic_data_with_xml({"boundaries": []}, "baml")
+        processor.process_semantic_data_with_xml({"optimizations": []}, "pareto_lang")
+
+        metrics = processor.get_unified_processor_status()["performance_metrics"]
+        self.assertEqual(metrics["total_operations"], 5)
+        self.assertEqual(metrics["language_distribution"], {"baml": 4, "pareto_lang": 1})
+        self.assertEqual(len(processor.processing_history), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
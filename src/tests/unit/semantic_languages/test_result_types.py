@@ -0,0 +1,130 @@
+"""
+FSL Continuum - Compact Result Types Unit Tests
+
+Unit tests for the slotted, frozen XML transformation and processing results.
+"""
+
+import copy
+import json
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError, asdict
+
+# Import result building blocks and XML processors
+try:
+    from src.semantic_languages.results import FrozenMetadata, intern_metadata
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.results import FrozenMetadata, intern_metadata
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestResultTypes(unittest.TestCase):
+    """Unit tests for compact result types."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.baml_data = {"boundaries": [{"name": "test_boundary", "type": "data"}]}
+        self.pareto_data = {"optimizations": [{"name": "test_optimization", "efficiency": 0.9}]}
+        self.baml_transformer = BAMLXMLTransformer()
+        self.pareto_transformer = ParetoLangXMLTransformer()
+
+    def test_results_are_slotted_and_frozen(self):
+        """Test results have no instance dict and reject attribute assignment."""
+        result = self.baml_transformer.wrap_baml_with_xml(self.baml_data)
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            result.success = False
+
+    def test_constant_metadata_is_shared(self):
+        """Test equal metadata is one shared, read-only dictionary."""
+        first = self.baml_transformer.wrap_baml_with_xml(self.baml_data)
+        second = self.baml_transformer.wrap_baml_with_xml({"boundaries": []})
+
+        self.assertIs(first.metadata, second.metadata)
+        self.assertIsInstance(first.metadata, FrozenMetadata)
+        with self.assertRaises(TypeError):
+            first.metadata["cache_hit"] = True
+        with self.assertRaises(TypeError):
+            first.metadata.update(cache_hit=True)
+
+        with_context = self.baml_transformer.wrap_baml_with_xml(self.baml_data, {"source": "test"})
+        self.assertIsNot(first.metadata, with_context.metadata)
+        self.assertTrue(with_context.metadata["context_applied"])
+
+    def test_intern_metadata_distinguishes_value_types(self):
+        """Test interning keys on value types as well as values."""
+        self.assertIs(intern_metadata(flag=True), intern_metadata(flag=True))
+        self.assertIsNot(intern_metadata(flag=True), intern_metadata(flag=1))
+        self.assertEqual(intern_metadata(items=[1, 2]), {"items": [1, 2]})
+
+    def test_validation_result_is_lazy(self):
+        """Test validation results are assembled on first access."""
+        result = self.pareto_transformer.wrap_pareto_lang_with_xml(self.pareto_data)
+
+        self.assertEqual(
+            list(result.validation_result),
+            ["pareto_lang_validation", "xml_validation"]
+        )
+        self.assertIs(result.validation_result, result.validation_result)
+        self.assertTrue(result.validation_result["xml_validation"]["valid"])
+
+        unwrapped = self.pareto_transformer.unwrap_xml_to_pareto_lang(result.xml_wrapper)
+        self.assertEqual(list(unwrapped.validation_result), ["xml_validation", "pareto_lang_validation"])
+
+    def test_asdict_export(self):
+        """Test dataclasses.asdict exports every field as before."""
+        result = self.baml_transformer.wrap_baml_with_xml(self.baml_data)
+        exported = asdict(result)
+
+        self.assertEqual(list(exported), [
+            "success", "transformed_data", "xml_wrapper", "transformation_time",
+            "semantic_preserved", "validation_result", "metadata"
+        ])
+        self.assertEqual(exported["validation_result"]["baml_validation"]["valid"], True)
+        self.assertEqual(exported["metadata"]["xml_serializer"], "direct")
+        json.dumps(exported)
+
+    def test_pickle_and_copy(self):
+        """Test results survive pickling and copying, including lazy fields."""
+        result = self.pareto_transformer.wrap_pareto_lang_with_xml(self.pareto_data)
+
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual(restored, result)
+        self.assertEqual(copy.deepcopy(result), result)
+        self.assertIs(copy.deepcopy(result).metadata, result.metadata)
+
+    def test_failure_results(self):
+        """Test failed operations still return compact results."""
+        result = self.baml_transformer.unwrap_xml_to_baml("<not-xml")
+
+        self.assertFalse(result.success)
+        self.assertIn("error", result.validation_result)
+        self.assertIn("exception", result.metadata)
+        self.assertFalse(hasattr(result, "__dict__"))
+
+    def test_unified_result_is_slotted_and_frozen(self):
+        """Test unified processing results are slotted and frozen."""
+        processor = UnifiedXMLProcessor()
+        result = processor.create_unified_xml_wrapper(
+            {"baml": self.baml_data, "pareto_lang": self.pareto_data},
+            {"xml_transformation_enabled": True}
+        )
+
+        self.assertTrue(result.success)
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            result.metadata = {}
+        self.assertEqual(asdict(result)["processed_data"]["baml"], self.baml_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+FSL Continuum - Schema Validator Unit Tests
+
+Unit tests for schema-compiled BAML and Pareto-Lang data validators.
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import schema validator compiler
+try:
+    from src.semantic_languages.schema_validator import (
+        compile_schema, load_schema_validator, clear_schema_validator_cache
+    )
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.schema_validator import (
+        compile_schema, load_schema_validator, clear_schema_validator_cache
+    )
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "semantic_languages" / "config"
+
+
+class TestSchemaValidator(unittest.TestCase):
+    """Unit tests for schema validator compilation and caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        clear_schema_validator_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.schema_path = Path(self.temp_dir.name) / "schemas.json"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+        clear_schema_validator_cache()
+
+    def test_baml_data_errors_and_warnings(self):
+        """Test frame violations are errors and value violations are warnings."""
+        transformer = BAMLXMLTransformer()
+        result = transformer._validate_baml_data({
+            "boundaries": [{"name": "api", "type": "api", "ai_enhanced": "yes"}],
+            "connections": {"source": "a"},
+            "constraints": [{"name": "latency", "scope": "global"}, "not-a-record"]
+        })
+
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["errors"], [
+            "BAML connections: expected array, got object",
+            "BAML constraints[1]: expected object, got string"
+        ])
+        self.assertEqual(
+            [(v["path"], v["keyword"], v["severity"]) for v in result["violations"]],
+            [("boundaries[0].type", "enum", "warning"),
+             ("boundaries[0].ai_enhanced", "type", "warning"),
+             ("connections", "type", "error"),
+             ("constraints[0].scope", "type", "warning"),
+             ("constraints[1]", "type", "error")]
+        )
+        self.assertEqual(
+            transformer._validate_baml_data([]),
+            {"valid": False, "errors": ["BAML data: expected object, got array"], "warnings": [],
+             "violations": [{"path": "", "keyword": "type", "message": "expected object, got array",
+                             "severity": "error"}]}
+        )
+
+    def test_pareto_lang_data(self):
+        """Test the Pareto-Lang validator is compiled from config/schemas.json."""
+        transformer = ParetoLangXMLTransformer()
+        self.assertEqual(transformer.data_validator.source, str(CONFIG_DIR / "schemas.json"))
+
+        valid = transformer._validate_pareto_lang_data({
+            "optimizations": [{"name": "fast", "type": "pareto", "target": "latency", "efficiency": 0.9}]
+        })
+        self.assertEqual(valid, {"valid": True, "errors": [], "warnings": [], "violations": []})
+
+        invalid = transformer._validate_pareto_lang_data({"resources": [1], "optimizations": [{"type": "magic"}]})
+        self.assertFalse(invalid["valid"])
+        self.assertEqual(invalid["errors"], ["Pareto-Lang resources[0]: expected object, got number"])
+        self.assertEqual(len(invalid["warnings"]), 1)
+
+    def test_errors_only_skips_value_rules(self):
+        """Test unwrapped string scalars pass without re-flagging every value."""
+        transformer = BAMLXMLTransformer()
+        data = {"boundaries": [{"name": "a", "type": "data", "ai_enhanced": True}]}
+        wrapped = transformer.wrap_baml_with_xml(data)
+        unwrapped = transformer.unwrap_xml_to_baml(wrapped.xml_wrapper)
+
+        self.assertEqual(unwrapped.transformed_data["boundaries"][0]["ai_enhanced"], "True")
+        self.assertEqual(unwrapped.validation_result["baml_validation"]["warnings"], [])
+        full = transformer._validate_baml_data(unwrapped.transformed_data)
+        self.assertTrue(full["valid"])
+        self.assertEqual(full["warnings"], ["BAML boundaries[0].ai_enhanced: expected boolean, got string"])
+
+    def test_refs_required_and_strict(self):
+        """Test $ref pointers, required fields and strict mode against baml_schemas.json."""
+        with open(CONFIG_DIR / "baml_schemas.json", "r") as f:
+            document = json.load(f)
+        root = compile_schema(document["schemas"]["baml_root"], document, "BAML", strict=True)
+        example = dict(document["examples"]["complex_baml"], version="1.0.0")
+
+        self.assertTrue(root.is_valid(example))
+        self.assertEqual(root.schema_version, document["schema_version"])
+
+        invalid = dict(example, boundaries=[{"name": "9lives", "type": "data"}, {"type": "data"}])
+        del invalid["spec"]
+        self.assertEqual(
+            [(v.location, v.keyword, v.severity) for v in root.violations(invalid)],
+            [("", "required", "error"),
+             ("boundaries[0].name", "pattern", "error"),
+             ("boundaries[1]", "required", "error")]
+        )
+
+        lenient = compile_schema(document["schemas"]["baml_root"], document, "BAML")
+        self.assertTrue(lenient.is_valid(invalid))
+        self.assertFalse(lenient.validate(invalid)["errors"])
+
+    def test_keywords_and_recursive_refs(self):
+        """Test type, enum, range and length keywords and a self-referencing schema."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer", "minimum": 1, "maximum": 10},
+                "ratio": {"type": "number"},
+                "flag": {"enum": [True, "auto"]},
+                "label": {"type": ["string", "null"], "minLength": 2, "maxLength": 4},
+                "children": {"type": "array", "items": {"$ref": "#"}}
+            }
+        }
+        validator = compile_schema(schema, strict=True)
+
+        self.assertTrue(validator.is_valid({"count": 2.0, "ratio": 1, "flag": True, "label": None}))
+        cases = [
+            ({"count": True}, "type"), ({"count": 1.5}, "type"), ({"count": 11}, "maximum"),
+            ({"ratio": False}, "type"), ({"flag": 1}, "enum"), ({"label": "x"}, "minLength"),
+            ({"label": "toolong"}, "maxLength"), ({"children": [{"children": [{"count": 0}]}]}, "minimum")
+        ]
+        for data, keyword in cases:
+            with self.subTest(data=data):
+                self.assertEqual([v.keyword for v in validator.violations(data)], [keyword])
+        self.assertEqual(validator.violations(cases[-1][0])[0].path, ("children", 0, "children", 0, "count"))
+        self.assertIn("def _check", validator.generated_source)
+
+        with self.assertRaises(ValueError):
+            compile_schema({"type": "decimal"})
+        with self.assertRaises(ValueError):
+            compile_schema({"$ref": "#/missing"})
+
+    def test_loader_cache_and_defaults(self):
+        """Test validators are shared, recompiled on change and defaulted when missing."""
+        default_schema = lambda: {"type": "object"}
+        self.schema_path.write_text(json.dumps({"version": "1", "schemas": {"doc": {"type": "array"}}}))
+
+        validator = load_schema_validator(self.schema_path, "#/schemas/doc", default_schema)
+        self.assertIs(load_schema_validator(self.schema_path, "#/schemas/doc", default_schema), validator)
+        self.assertTrue(validator.is_valid([]))
+
+        self.schema_path.write_text(json.dumps({"version": "2", "schemas": {"doc": {"type": "string"}}}))
+        stat = self.schema_path.stat()
+        os.utime(self.schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        updated = load_schema_validator(self.schema_path, "#/schemas/doc", default_schema)
+        self.assertEqual(updated.schema_version, "2")
+        self.assertTrue(updated.is_valid("text"))
+
+        missing_pointer = load_schema_validator(self.schema_path, "#/schemas/other", default_schema)
+        missing_file = load_schema_validator(Path(self.temp_dir.name) / "none.json", "#", default_schema)
+        for defaulted in (missing_pointer, missing_file):
+            self.assertEqual(defaulted.source, "<defaults>")
+            self.assertTrue(defaulted.is_valid({}))
+
+        self.assertIs(BAMLXMLTransformer().data_validator, BAMLXMLTransformer().data_validator)
+
+    def test_pickle_recompiles(self):
+        """Test validators survive pickling to worker processes."""
+        validator = BAMLXMLTransformer().data_validator
+        restored = pickle.loads(pickle.dumps(validator))
+
+        self.assertEqual(restored.digest, validator.digest)
+        self.assertEqual(restored.validate([], "BAML"), validator.validate([], "BAML"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+FSL Continuum - Semantic Model Index Unit Tests
+
+Unit tests for the incrementally maintained semantic model adjacency index.
+"""
+
+import unittest
+from unittest import mock
+
+# Import semantic model index
+try:
+    from src.semantic_languages.semantic_index import SemanticModelIndex, DEFAULT_OPTIMIZATION_TARGET
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.semantic_index import SemanticModelIndex, DEFAULT_OPTIMIZATION_TARGET
+
+
+class TestSemanticModelIndex(unittest.TestCase):
+    """Unit tests for SemanticModelIndex."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.baml_data = {
+            "boundaries": [
+                {"name": "data_boundary", "optimization_target": "efficiency_maximization"},
+                {"name": "process_boundary", "metadata": {"optimization_target": "speed_optimization"}},
+                {"name": "system_boundary"}
+            ],
+            "connections": [
+                {"source": "data_boundary", "target": "process_boundary", "type": "data_flow"},
+                {"source": "process_boundary", "target": "system_boundary", "type": "process_flow"},
+                {"source": "data_boundary", "target": "process_boundary", "type": "control_flow"}
+            ]
+        }
+        self.pareto_data = {
+            "optimizations": [
+                {"name": "pareto_optimization_01", "target": "efficiency_maximization", "efficiency": 0.92},
+                {"name": "performance_optimization_01", "target": "speed_optimization", "efficiency": 0.95},
+                {"name": "default_optimization", "target": DEFAULT_OPTIMIZATION_TARGET, "efficiency": 0.8}
+            ]
+        }
+        self.index = SemanticModelIndex()
+        self.index.sync(self.baml_data, self.pareto_data)
+
+    def test_connection_adjacency(self):
+        """Test connections are indexed by source and by target."""
+        self.assertEqual(self.index.connection_matrix(), [
+            ["data_boundary", "process_boundary"],
+            ["process_boundary", "system_boundary"]
+        ])
+        self.assertEqual(
+            [c["type"] for c in self.index.connections_from("data_boundary")],
+            ["data_flow", "control_flow"]
+        )
+        self.assertEqual(
+            [c["source"] for c in self.index.connections_to("system_boundary")],
+            ["process_boundary"]
+        )
+        self.assertEqual(self.index.connections_from("missing"), [])
+
+    def test_pathways_from_boundary(self):
+        """Test pathways follow each boundary's optimization target."""
+        pathways = self.index.pathways_from("data_boundary")
+        self.assertEqual([p["optimization"] for p in pathways], ["pareto_optimization_01"])
+        self.assertEqual(pathways[0]["efficiency"], 0.92)
+
+        self.assertEqual(
+            [p["optimization"] for p in self.index.pathways_from("process_boundary")],
+            ["performance_optimization_01"]
+        )
+        self.assertEqual(
+            [p["optimization"] for p in self.index.pathways_from("system_boundary")],
+            ["default_optimization"]
+        )
+        self.assertEqual(self.index.pathways_from("missing"), [])
+        self.assertEqual(len(self.index.optimization_pathways()), 3)
+
+    def test_pathway_counts_and_summary(self):
+        """Test pathway totals follow updates without materializing pathways."""
+        self.assertEqual(self.index.pathway_count, 3)
+        summary = self.index.pathway_summary()
+        self.assertEqual(
+            [(s["optimization_target"], s["pathway_count"]) for s in summary],
+            [("efficiency_maximization", 1), ("speed_optimization", 1), (DEFAULT_OPTIMIZATION_TARGET, 1)]
+        )
+
+        # Unchanged resyncs reuse the cached views, and callers get copies
+        matrix = self.index.connection_matrix()
+        self.index.sync(self.baml_data, self.pareto_data)
+        with mock.patch.object(self.index, "_build_pathway_summary") as build, \
+                mock.patch.object(self.index, "_build_connection_matrix") as build_matrix:
+            summary[0]["pathway_count"] = -1
+            matrix[0].append("mutated")
+            self.assertEqual(self.index.pathway_summary()[0]["pathway_count"], 1)
+            self.assertNotIn("mutated", self.index.connection_matrix()[0])
+        build.assert_not_called()
+        build_matrix.assert_not_called()
+
+        self.index.add_boundary({"name": "edge_boundary", "optimization_target": "speed_optimization"})
+        self.index.add_optimization({"name": "extra", "target": "speed_optimization"})
+        self.assertEqual(self.index.pathway_count, 6)
+        self.index.add_boundary({"name": "edge_boundary", "optimization_target": "efficiency_maximization"})
+        self.assertEqual(self.index.pathway_count, 5)
+        self.index.remove_optimization("extra")
+        self.index.remove_boundary("edge_boundary")
+        self.assertEqual(self.index.pathway_count, 3)
+        self.assertEqual(self.index.pathway_count, len(self.index.optimization_pathways()))
+        self.assertEqual([s["pathway_count"] for s in self.index.pathway_summary()], [1, 1, 1])
+
+    def test_transitive_pathways(self):
+        """Test transitive pathways include downstream boundaries."""
+        pathways = self.index.pathways_from("data_boundary", transitive=True)
+        self.assertEqual(
+            [(p["boundary"], p["optimization"]) for p in pathways],
+            [("data_boundary", "pareto_optimization_01"),
+             ("process_boundary", "performance_optimization_01"),
+             ("system_boundary", "default_optimization")]
+        )
+
+    def test_incremental_add_and_remove(self):
+        """Test single records are added and removed in place."""
+        self.index.add_optimization({"name": "extra", "target": "speed_optimization"})
+        self.index.add_boundary({"name": "edge_boundary", "optimization_target": "speed_optimization"})
+        self.assertEqual(
+            [p["optimization"] for p in self.index.pathways_from("edge_boundary")],
+            ["performance_optimization_01", "extra"]
+        )
+
+        # Retargeting an optimization moves it between target buckets
+        self.index.add_optimization({"name": "extra", "target": "efficiency_maximization"})
+        self.assertEqual(
+            [o["name"] for o in self.index.optimizations_for("efficiency_maximization")],
+            ["pareto_optimization_01", "extra"]
+        )
+
+        self.assertTrue(self.index.remove_optimization("performance_optimization_01"))
+        self.assertEqual(self.index.pathways_from("edge_boundary"), [])
+        self.assertTrue(self.index.remove_connection(("data_boundary", "process_boundary", "data_flow")))
+        self.assertFalse(self.index.remove_connection(("data_boundary", "process_boundary", "data_flow")))
+        self.assertEqual(len(self.index.connections_from("data_boundary")), 1)
+        self.assertTrue(self.index.remove_boundary("edge_boundary"))
+        self.assertIsNone(self.index.get_boundary("edge_boundary"))
+
+    def test_sync_only_reindexes_changes(self):
+        """Test resyncing reindexes changed records and drops missing ones."""
+        status = self.index.get_status()
+        self.assertEqual((status["boundaries"], status["connections"], status["optimizations"]), (3, 3, 3))
+
+        changes = self.index.sync(self.baml_data, self.pareto_data)
+        self.assertEqual(changes["index_updates"], 0)
+
+        baml_data = dict(self.baml_data)
+        baml_data["boundaries"] = self.baml_data["boundaries"][:2] + [
+            {"name": "system_boundary", "optimization_target": "efficiency_maximization", "type": "system"}
+        ]
+        baml_data["connections"] = self.baml_data["connections"][:2]
+        changes = self.index.sync(baml_data, self.pareto_data)
+
+        self.assertEqual(changes["connections"], 1)
+        self.assertEqual(changes["index_updates"], 2)
+        self.assertEqual(self.index.get_boundary("system_boundary")["type"], "system")
+        self.assertEqual(
+            [p["optimization"] for p in self.index.pathways_from("system_boundary")],
+            ["pareto_optimization_01"]
+        )
+
+        changes = self.index.sync({}, {})
+        self.assertEqual(changes["boundaries"], 3)
+        self.assertEqual(self.index.connection_matrix(), [])
+        self.assertEqual(self.index.get_status()["optimization_targets"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+FSL Continuum - Transformation Plan Unit Tests
+
+Unit tests for compiled, cached BAML and Pareto-Lang transformation plans.
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import transformation plan compiler
+try:
+    from src.semantic_languages.transformation_plan import (
+        compile_transformation_rules, load_transformation_plan, clear_transformation_plan_cache
+    )
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.transformation_plan import (
+        compile_transformation_rules, load_transformation_plan, clear_transformation_plan_cache
+    )
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+RULE_SECTIONS = BAMLXMLTransformer._TRANSFORMATION_RULE_SECTIONS
+
+
+class TestTransformationPlan(unittest.TestCase):
+    """Unit tests for transformation plan compilation and caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        clear_transformation_plan_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rules_path = Path(self.temp_dir.name) / "transformation_rules.json"
+        self.rules = {
+            "transformation_rules": {
+                "boundary_wrapping": {
+                    "enabled": True,
+                    "attributes": ["name", "type"],
+                    "preserve_semantics": False
+                },
+                "connection_wrapping": {"enabled": False}
+            },
+            "validation_rules": {"xml_structure_validation": True, "baml_compatibility_validation": False}
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+        clear_transformation_plan_cache()
+
+    def write_rules(self, rules):
+        """Write a rules document to the temporary rules file."""
+        self.rules_path.write_text(json.dumps(rules))
+
+    def test_compile_flattens_rules(self):
+        """Test rules compile to frozensets and per-section steps."""
+        plan = compile_transformation_rules("baml", self.rules, RULE_SECTIONS)
+
+        self.assertEqual(
+            [rule.section for rule in plan.sections],
+            ["boundaries", "constraints", "ai_integration"]
+        )
+        self.assertEqual(plan.section_attributes("boundaries"), frozenset({"name", "type"}))
+        self.assertEqual([section for section, _ in plan.steps], ["boundaries"])
+        self.assertEqual(plan.enabled_validations, frozenset({"xml_structure_validation"}))
+
+    def test_apply_projects_non_preserving_sections(self):
+        """Test only sections that drop semantics are rewritten."""
+        plan = compile_transformation_rules("baml", self.rules, RULE_SECTIONS)
+        data = {
+            "boundaries": [{"name": "b", "type": "data", "scope": "global"}],
+            "connections": [{"source": "a", "target": "b", "weight": 1}]
+        }
+
+        transformed = plan.apply(data)
+
+        self.assertEqual(transformed["boundaries"], [{"name": "b", "type": "data"}])
+        self.assertIs(transformed["connections"], data["connections"])
+        self.assertIn("scope", data["boundaries"][0])
+
+    def test_default_rules_preserve_data(self):
+        """Test transformers keep data intact under their default rules."""
+        baml_data = {"boundaries": [{"name": "b", "scope": "global"}]}
+        pareto_data = {"optimizations": [{"name": "o", "weight": 0.5}]}
+
+        self.assertEqual(BAMLXMLTransformer().apply_baml_transformation_rules(baml_data), baml_data)
+        self.assertEqual(
+            ParetoLangXMLTransformer().apply_pareto_transformation_rules(pareto_data, {}),
+            pareto_data
+        )
+
+    def test_plan_shared_until_file_changes(self):
+        """Test plans are cached by mtime and recompiled on content change."""
+        self.write_rules(self.rules)
+        first = load_transformation_plan("baml", self.rules_path, RULE_SECTIONS, dict)
+        self.assertIs(load_transformation_plan("baml", self.rules_path, RULE_SECTIONS, dict), first)
+
+        # Touching the file without changing content reuses the plan
+        stat = self.rules_path.stat()
+        os.utime(self.rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIs(load_transformation_plan("baml", self.rules_path, RULE_SECTIONS, dict), first)
+
+        self.rules["transformation_rules"]["connection_wrapping"]["enabled"] = True
+        self.write_rules(self.rules)
+        os.utime(self.rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        second = load_transformation_plan("baml", self.rules_path, RULE_SECTIONS, dict)
+
+        self.assertIsNot(second, first)
+        self.assertIn("connections", [rule.section for rule in second.sections])
+
+    def test_transformer_instances_share_plan(self):
+        """Test transformer instances reuse one compiled plan."""
+        self.assertIs(BAMLXMLTransformer().transformation_plan, BAMLXMLTransformer().transformation_plan)
+
+    def test_plan_is_picklable(self):
+        """Test compiled plans can be shipped to worker processes."""
+        plan = compile_transformation_rules("baml", self.rules, RULE_SECTIONS)
+        restored = pickle.loads(pickle.dumps(plan))
+        data = {"boundaries": [{"name": "b", "type": "data", "scope": "global"}]}
+
+        self.assertEqual(restored.apply(data), plan.apply(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+FSL Continuum - Wrap Cache Unit Tests
+
+Unit tests for the content-addressed XML wrap cache.
+"""
+
+import re
+import tempfile
+import time
+import unittest
+
+# Import wrap cache and XML processors
+try:
+    from src.semantic_languages.wrap_cache import WrapCache, TimestampTemplate, canonical_content_key
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.wrap_cache import WrapCache, TimestampTemplate, canonical_content_key
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+def strip_timestamps(xml_string):
+    """Remove timestamp attribute values from XML text."""
+    return re.sub(r' timestamp="[^"]*"', ' timestamp=""', xml_string)
+
+
+class TestWrapCache(unittest.TestCase):
+    """Unit tests for WrapCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.baml_data = {"boundaries": [{"name": "test_boundary", "type": "data"}]}
+        self.pareto_data = {"optimizations": [{"name": "test_optimization", "efficiency": 0.9}]}
+
+    def test_key_depends_on_content_order_and_schema(self):
+        """Test keys are stable for equal input and change with order or schema."""
+        key = canonical_content_key("baml", {"a": 1, "b": 2}, "1.0")
+
+        self.assertEqual(key, canonical_content_key("baml", {"a": 1, "b": 2}, "1.0"))
+        self.assertNotEqual(key, canonical_content_key("baml", {"b": 2, "a": 1}, "1.0"))
+        self.assertNotEqual(key, canonical_content_key("baml", {"a": 1, "b": 2}, "2.0"))
+        self.assertNotEqual(key, canonical_content_key("pareto_lang", {"a": 1, "b": 2}, "1.0"))
+
+    def test_key_tells_apart_values_the_xml_writer_does(self):
+        """Test tuples, non-string keys and marker-like keys get distinct keys."""
+        key = canonical_content_key("baml", {"tags": ["p", "q"]})
+
+        self.assertNotEqual(key, canonical_content_key("baml", {"tags": ("p", "q")}))
+        self.assertNotEqual(
+            canonical_content_key("baml", {1: "a"}), canonical_content_key("baml", {"1": "a"})
+        )
+        self.assertNotEqual(
+            canonical_content_key("baml", {"tags": ("p", "q")}),
+            canonical_content_key("baml", {"tags": {"\x00type": ["builtins.tuple", "('p', 'q')"]}})
+        )
+
+    def test_tuple_input_does_not_hit_list_entry(self):
+        """Test a cached list wrap is not served for the same data as a tuple."""
+        transformer = BAMLXMLTransformer(wrap_cache=WrapCache())
+        list_data = {"boundaries": [{"name": "x", "tags": ["p", "q"]}]}
+        tuple_data = {"boundaries": [{"name": "x", "tags": ("p", "q")}]}
+
+        transformer.wrap_baml_with_xml(list_data)
+        cached = transformer.wrap_baml_with_xml(tuple_data)
+        uncached = BAMLXMLTransformer().wrap_baml_with_xml(tuple_data)
+
+        self.assertFalse(cached.metadata["cache_hit"])
+        self.assertEqual(strip_timestamps(cached.xml_wrapper), strip_timestamps(uncached.xml_wrapper))
+
+    def test_template_restamps_root_timestamps_only(self):
+        """Test only wrapper root timestamps are replaced."""
+        xml_string = (
+            '<root version="1" timestamp="t0"><record timestamp="keep" />'
+            '<child-root timestamp="t1" /></root>'
+        )
+        template = TimestampTemplate.from_xml(xml_string, ("root", "child-root"))
+
+        self.assertEqual(
+            template.render("NOW"),
+            '<root version="1" timestamp="NOW"><record timestamp="keep" />'
+            '<child-root timestamp="NOW" /></root>'
+        )
+
+    def test_transformer_hits_return_fresh_timestamp(self):
+        """Test cache hits return the same wrapper with a current timestamp."""
+        cache = WrapCache()
+        transformer = BAMLXMLTransformer(wrap_cache=cache)
+
+        first = transformer.wrap_baml_with_xml(self.baml_data)
+        time.sleep(0.001)
+        second = transformer.wrap_baml_with_xml(dict(self.baml_data))
+
+        self.assertFalse(first.metadata["cache_hit"])
+        self.assertTrue(second.metadata["cache_hit"])
+        self.assertNotEqual(first.xml_wrapper, second.xml_wrapper)
+        self.assertEqual(strip_timestamps(first.xml_wrapper), strip_timestamps(second.xml_wrapper))
+        self.assertEqual(first.validation_result, second.validation_result)
+
+        stats = transformer.get_transformation_status()["wrap_cache"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_lru_eviction_and_ttl(self):
+        """Test size-bounded LRU eviction and TTL expiry."""
+        cache = WrapCache(max_entries=2, ttl=60)
+        transformer = ParetoLangXMLTransformer(wrap_cache=cache)
+        documents = [{"optimizations": [{"name": f"opt_{i}"}]} for i in range(3)]
+
+        for document in documents:
+            transformer.wrap_pareto_lang_with_xml(document)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+        self.assertTrue(transformer.wrap_pareto_lang_with_xml(documents[2]).metadata["cache_hit"])
+        self.assertFalse(transformer.wrap_pareto_lang_with_xml(documents[0]).metadata["cache_hit"])
+
+        cache.ttl = 0
+        time.sleep(0.001)
+        self.assertFalse(transformer.wrap_pareto_lang_with_xml(documents[0]).metadata["cache_hit"])
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+    def test_disk_tier_survives_restart(self):
+        """Test warm results are served from disk by a new cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = BAMLXMLTransformer(wrap_cache=WrapCache(cache_dir=cache_dir))
+            expected = first.wrap_baml_with_xml(self.baml_data)
+
+            restarted_cache = WrapCache(cache_dir=cache_dir)
+            result = BAMLXMLTransformer(wrap_cache=restarted_cache).wrap_baml_with_xml(self.baml_data)
+
+            self.assertTrue(result.metadata["cache_hit"])
+            self.assertEqual(strip_timestamps(result.xml_wrapper), strip_timestamps(expected.xml_wrapper))
+            self.assertEqual(restarted_cache.get_stats()["disk_hits"], 1)
+
+    def test_unified_wrapper_cached(self):
+        """Test unified wrappers are cached and exposed in processor status."""
+        processor = UnifiedXMLProcessor(wrap_cache=WrapCache())
+        semantic_data = {"baml": self.baml_data, "pareto_lang": self.pareto_data}
+
+        first = processor.create_unified_xml_wrapper(semantic_data)
+        second = processor.create_unified_xml_wrapper(semantic_data)
+
+        self.assertTrue(second.metadata["cache_hit"])
+        self.assertEqual(
+            strip_timestamps(first.xml_wrappers["unified"]),
+            strip_timestamps(second.xml_wrappers["unified"])
+        )
+        self.assertEqual(processor.get_unified_processor_status()["wrap_cache"]["hits"], 1)
+
+    def test_cache_disabled_by_default(self):
+        """Test transformers only cache when given a WrapCache."""
+        status = BAMLXMLTransformer().get_transformation_status()
+        self.assertEqual(status["wrap_cache"], {"enabled": False})
+
+
+if __name__ == '__main__':
+    unittest.main()
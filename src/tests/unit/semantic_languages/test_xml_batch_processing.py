@@ -0,0 +1,80 @@
+"""
+FSL Continuum - Unified XML Batch Processing Unit Tests
+
+Unit tests for process-pool batch wrapping in the unified XML processor.
+"""
+
+import unittest
+import xml.etree.ElementTree as ET
+
+# Import unified XML processor
+try:
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestUnifiedXMLBatchProcessing(unittest.TestCase):
+    """Unit tests for UnifiedXMLProcessor.process_batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = UnifiedXMLProcessor()
+        self.documents = [
+            {"boundaries": [{"name": f"boundary_{i}", "type": "data"}]}
+            for i in range(40)
+        ]
+
+    def boundary_names(self, xml_wrappers):
+        """Extract the first boundary name of every wrapper."""
+        return [
+            ET.fromstring(xml_wrapper).find("baml-content/boundaries/boundary").get("name")
+            for xml_wrapper in xml_wrappers
+        ]
+
+    def test_results_preserve_input_order(self):
+        """Test wrappers stream back in input order across workers."""
+        for workers in (1, 2):
+            xml_wrappers = list(self.processor.process_batch(
+                self.documents, "baml", workers=workers, chunksize=3
+            ))
+            self.assertEqual(
+                self.boundary_names(xml_wrappers),
+                [f"boundary_{i}" for i in range(40)]
+            )
+
+    def test_lazy_iterable_input(self):
+        """Test generators are accepted as batch input."""
+        documents = ({"optimizations": [{"name": f"opt_{i}"}]} for i in range(10))
+        xml_wrappers = list(self.processor.process_batch(documents, "pareto_lang", workers=2))
+
+        self.assertEqual(len(xml_wrappers), 10)
+        self.assertTrue(all(w.startswith("<pareto-lang-semantic-data") for w in xml_wrappers))
+
+    def test_single_history_record_per_batch(self):
+        """Test one processing record with timing is stored per batch."""
+        documents = self.documents + [{"boundaries": "not-a-list"}]
+        xml_wrappers = list(self.processor.process_batch(documents, "baml", workers=2))
+
+        self.assertEqual(xml_wrappers[-1], "")
+        self.assertEqual(len(self.processor.processing_history), 1)
+
+        record = self.processor.processing_history[0]
+        self.assertEqual(record["operation"], "batch_xml_wrapping")
+        self.assertEqual(record["document_count"], 41)
+        self.assertEqual(record["failed_count"], 1)
+        self.assertFalse(record["success"])
+        self.assertGreaterEqual(record["processing_time"], 0.0)
+
+    def test_unsupported_language(self):
+        """Test unsupported languages are rejected when called, not when iterated."""
+        with self.assertRaises(ValueError):
+            self.processor.process_batch(self.documents, "unknown")
+        self.assertEqual(len(self.processor.processing_history), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+FSL Continuum - Multi-Language XML Processing Unit Tests
+
+Unit tests for sequential and executor-backed per-language wrapping in
+UnifiedXMLProcessor.
+"""
+
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Import XML processors
+try:
+    from src.semantic_languages.xml_processor import UnifiedXMLProcessor
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.xml_processor import UnifiedXMLProcessor
+
+
+class TestXMLMultiLanguage(unittest.TestCase):
+    """Unit tests for process_multiple_semantic_data_with_xml."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.semantic_data = {
+            "baml": {
+                "boundaries": [{"name": "test_boundary", "type": "data"}],
+                "connections": [{"source": "test_boundary", "target": "model"}]
+            },
+            "pareto_lang": {
+                "optimizations": [{"name": "test_optimization", "efficiency": "0.9"}],
+                "resources": [{"name": "cpu", "capacity": "16"}]
+            }
+        }
+        self.context = {"xml_transformation_enabled": True}
+        self.processor = UnifiedXMLProcessor()
+
+    def assert_wrapped(self, result):
+        """Assert both languages were wrapped with per-language durations."""
+        self.assertTrue(result.success)
+        self.assertEqual(list(result.xml_wrappers), ["baml", "pareto_lang"])
+        self.assertTrue(result.xml_wrappers["baml"].startswith("<baml-semantic-data "))
+        self.assertTrue(result.xml_wrappers["pareto_lang"].startswith("<pareto-lang-semantic-data "))
+        self.assertEqual(result.processed_data, self.semantic_data)
+        self.assertEqual(result.semantic_preserved, {"baml": True, "pareto_lang": True})
+        self.assertIn("pareto_lang_validation", result.validation_results["pareto_lang"])
+        for language_type, duration in result.transformation_times.items():
+            with self.subTest(language_type=language_type):
+                self.assertGreater(duration, 0.0)
+                self.assertLessEqual(duration, result.metadata["processing_time"])
+
+    def test_sequential_without_executor(self):
+        """Test languages are wrapped in the calling thread when no executor is configured."""
+        result = self.processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+
+        self.assert_wrapped(result)
+        self.assertIsNone(self.processor.executor)
+        self.assertEqual(
+            self.processor.processing_history[-1]["transformation_times"], result.transformation_times
+        )
+        self.assertEqual(self.processor.baml_transformer.transformation_metrics.count, 1)
+
+    def test_caller_provided_executors(self):
+        """Test caller-provided thread and process pools wrap every language and stay open."""
+        for executor_class in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with self.subTest(executor=executor_class.__name__):
+                with executor_class(max_workers=2) as executor:
+                    processor = UnifiedXMLProcessor(executor=executor)
+                    result = processor.process_multiple_semantic_data_with_xml(self.semantic_data, self.context)
+                    self.assertEqual(executor.submit(int, "7").result(), 7)
+
+                self.assert_wrapped(result)
+
+    def test_failures_and_skipped_xml(self):
+        """Test failed wraps, unsupported languages and disabled XML."""
+        skipped = self.processor.process_multiple_semantic_data_with_xml(self.semantic_data)
+        self.assertTrue(skipped.success)
+        self.assertEqual(skipped.transformation_times, {"baml": 0.0, "pareto_lang": 0.0})
+        self.assertEqual(skipped.xml_wrappers, {"baml": "", "pareto_lang": ""})
+        self.assertIsNone(self.processor.executor)
+
+        failed = self.processor.process_multiple_semantic_data_with_xml(
+            {"baml": self.semantic_data["baml"], "pareto_lang": []}, self.context
+        )
+        self.assertFalse(failed.success)
+        self.assertEqual(failed.semantic_preserved, {"baml": True, "pareto_lang": False})
+
+        # The unified wrapper path reports the same per-language outcome
+        unified = self.processor.create_unified_xml_wrapper(
+            {"baml": self.semantic_data["baml"], "pareto_lang": []}, self.context
+        )
+        self.assertFalse(unified.success)
+        self.assertEqual(unified.semantic_preserved, failed.semantic_preserved)
+
+        unsupported = self.processor.process_multiple_semantic_data_with_xml({"yaml": {}}, self.context)
+        self.assertFalse(unsupported.success)
+        self.assertIn("Unsupported language type", unsupported.validation_results["error"])
+
+    def test_single_language_processing(self):
+        """Test single-language processing wraps with the language transformer."""
+        start_time = time.time()
+        result = self.processor.process_semantic_data_with_xml(
+            self.semantic_data["baml"], "baml", self.context
+        )
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.xml_wrappers["baml"].startswith("<baml-semantic-data "))
+        self.assertLess(result.transformation_times["baml"], time.time() - start_time + 1e-6)
+        self.assertTrue(result.validation_results["xml_validation"]["baml_validation"]["valid"])
+        self.assertIsNone(self.processor.executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+FSL Continuum - Streaming XML Unwrap Unit Tests
+
+Unit tests for the iterparse-based unwrap path of the BAML and Pareto-Lang
+XML transformers.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+# Import XML transformers
+try:
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+class TestBAMLStreamingUnwrap(unittest.TestCase):
+    """Streaming unwrap must match the in-memory BAML unwrap."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = BAMLXMLTransformer()
+        self.baml_data = {
+            "boundaries": [
+                {"name": f"boundary_{i}", "type": "data", "ai_enhanced": True}
+                for i in range(25)
+            ],
+            "connections": [
+                {"source": "boundary_0", "target": "boundary_1", "context": {"flow": "sync"}}
+            ],
+            "constraints": [
+                {"name": "latency", "type": "performance", "conditions": [{"operator": "lt", "value": 100}]}
+            ],
+            "ai_integration": {"semantic_analysis": True, "optimization": {"enabled": True}}
+        }
+        self.xml_wrapper = self.transformer.wrap_baml_with_xml(self.baml_data).xml_wrapper
+
+    def test_stream_matches_unwrap(self):
+        """Test streamed data equals unwrap_xml_to_baml output."""
+        expected = self.transformer.unwrap_xml_to_baml(self.xml_wrapper).transformed_data
+        result = self.transformer.unwrap_xml_source_to_baml(io.BytesIO(self.xml_wrapper.encode()))
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.metadata["streamed"])
+        self.assertEqual(result.transformed_data, expected)
+
+    def test_stream_from_file_path(self):
+        """Test streaming unwrap from a file path."""
+        with tempfile.NamedTemporaryFile('w', suffix='.xml', delete=False) as handle:
+            handle.write(self.xml_wrapper)
+        try:
+            result = self.transformer.unwrap_xml_source_to_baml(handle.name)
+        finally:
+            os.unlink(handle.name)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.xml_wrapper, handle.name)
+        self.assertEqual(len(result.transformed_data["boundaries"]), 25)
+
+    def test_iter_records_in_document_order(self):
+        """Test records are yielded one at a time in document order."""
+        records = list(self.transformer.iter_unwrap_xml_to_baml(io.BytesIO(self.xml_wrapper.encode())))
+
+        sections = [section for section, _ in records]
+        self.assertEqual(sections.count("boundaries"), 25)
+        self.assertEqual(records[0], ("boundaries", {"name": "boundary_0", "type": "data", "ai_enhanced": "True"}))
+        self.assertEqual(records[-1][0], "ai_integration")
+
+    def test_invalid_root(self):
+        """Test invalid wrapper roots are rejected."""
+        result = self.transformer.unwrap_xml_source_to_baml(io.BytesIO(b"<other-data/>"))
+        self.assertFalse(result.success)
+        self.assertFalse(result.validation_result["valid"])
+
+        with self.assertRaises(ValueError):
+            list(self.transformer.iter_unwrap_xml_to_baml(io.BytesIO(b"<other-data/>")))
+
+
+class TestParetoLangStreamingUnwrap(unittest.TestCase):
+    """Streaming unwrap must match the in-memory Pareto-Lang unwrap."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = ParetoLangXMLTransformer()
+        self.pareto_data = {
+            "optimizations": [
+                {"name": f"optimization_{i}", "type": "performance", "efficiency": 0.9}
+                for i in range(25)
+            ],
+            "resources": [{"name": "cpu", "capacity": 8, "utilization": 0.5}],
+            "constraints": [
+                {"name": "budget", "type": "cost", "conditions": [{"operator": "lt", "value": 10}]}
+            ],
+            "ai_integration": {"pareto_efficiency": True}
+        }
+        self.xml_wrapper = self.transformer.wrap_pareto_lang_with_xml(self.pareto_data).xml_wrapper
+
+    def test_stream_matches_unwrap(self):
+        """Test streamed data equals unwrap_xml_to_pareto_lang output."""
+        expected = self.transformer.unwrap_xml_to_pareto_lang(self.xml_wrapper).transformed_data
+        result = self.transformer.unwrap_xml_source_to_pareto_lang(io.BytesIO(self.xml_wrapper.encode()))
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.transformed_data, expected)
+
+    def test_iter_records(self):
+        """Test Pareto-Lang records are streamed per section."""
+        records = list(self.transformer.iter_unwrap_xml_to_pareto_lang(io.BytesIO(self.xml_wrapper.encode())))
+
+        sections = [section for section, _ in records]
+        self.assertEqual(sections.count("optimizations"), 25)
+        self.assertEqual(sections.count("resources"), 1)
+        self.assertEqual(sections.count("constraints"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+FSL Continuum - XML Validation Mode Unit Tests
+
+Unit tests for the configurable wrap-time XML validation modes of the BAML
+and Pareto-Lang XML transformers.
+"""
+
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+# Import XML transformers
+try:
+    from src.semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from src.semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from semantic_languages.baml.xml_transformer import BAMLXMLTransformer
+    from semantic_languages.pareto_lang.xml_transformer import ParetoLangXMLTransformer
+
+
+class TestXMLValidationModes(unittest.TestCase):
+    """Unit tests for XML validation modes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.baml_data = {"boundaries": [{"name": "test_boundary", "type": "data"}]}
+        self.pareto_data = {"optimizations": [{"name": "test_optimization", "efficiency": 0.9}]}
+
+    def test_structural_is_default(self):
+        """Test the in-memory tree is validated by default."""
+        transformer = BAMLXMLTransformer()
+        result = transformer.wrap_baml_with_xml(self.baml_data)
+
+        self.assertEqual(transformer.validation_mode, "structural-on-tree")
+        self.assertEqual(result.metadata["xml_validation_mode"], "structural-on-tree")
+        self.assertTrue(result.validation_result["xml_validation"]["valid"])
+
+    def test_modes_agree_on_valid_output(self):
+        """Test structural and full re-parse validation give the same verdict."""
+        for transformer_class, method, data in [
+            (BAMLXMLTransformer, "wrap_baml_with_xml", self.baml_data),
+            (ParetoLangXMLTransformer, "wrap_pareto_lang_with_xml", self.pareto_data)
+        ]:
+            results = {
+                mode: getattr(transformer_class(validation_mode=mode), method)(data)
+                for mode in ("structural-on-tree", "full-reparse")
+            }
+            self.assertEqual(
+                results["structural-on-tree"].validation_result["xml_validation"],
+                results["full-reparse"].validation_result["xml_validation"]
+            )
+
+    def test_none_mode_skips_validation(self):
+        """Test validation is skipped but wrapping still happens."""
+        transformer = ParetoLangXMLTransformer(validation_mode="none")
+        result = transformer.wrap_pareto_lang_with_xml(self.pareto_data)
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.validation_result["xml_validation"]["skipped"])
+        self.assertEqual(ET.fromstring(result.xml_wrapper).tag, "pareto-lang-semantic-data")
+
+    def test_structural_mode_reports_invalid_tree(self):
+        """Test structural validation catches the same errors as a re-parse."""
+        xml_element = ET.Element("baml-semantic-data", {"version": "1.0.0", "language": "pareto_lang"})
+        xml_string = ET.tostring(xml_element, encoding="unicode")
+
+        structural = BAMLXMLTransformer()._validate_built_xml(xml_element, xml_string)
+        full_reparse = BAMLXMLTransformer(validation_mode="full-reparse")._validate_built_xml(
+            xml_element, xml_string
+        )
+
+        self.assertFalse(structural["valid"])
+        self.assertEqual(structural, full_reparse)
+
+    def test_direct_serializer_validates_emitted_text(self):
+        """Test structural validation of direct output checks the emitted root, not a rebuilt one."""
+        emitted = ('<baml-semantic-data version="1.0.0" spec="x" timestamp="t" language="pareto_lang">'
+                   '<boundaries><boundary name="a&gt;b" /></boundaries></baml-semantic-data>')
+        for mode in ("structural-on-tree", "full-reparse"):
+            transformer = BAMLXMLTransformer(validation_mode=mode)
+            with mock.patch.object(transformer.xml_schema, "to_xml_string", return_value=emitted):
+                result = transformer.wrap_baml_with_xml(self.baml_data)
+            with self.subTest(mode=mode):
+                self.assertEqual(result.xml_wrapper, emitted)
+                self.assertFalse(result.validation_result["xml_validation"]["valid"])
+                self.assertIn("Language must be 'baml', got 'pareto_lang'",
+                              result.validation_result["xml_validation"]["errors"])
+
+    def test_unknown_mode_rejected(self):
+        """Test unsupported validation modes are rejected."""
+        with self.assertRaises(ValueError):
+            BAMLXMLTransformer(validation_mode="lazy")
+
+
+if __name__ == '__main__':
+    unittest.main()
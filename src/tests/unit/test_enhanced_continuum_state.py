@@ -0,0 +1,99 @@
+"""
+Unit tests for EnhancedStateManager section tracking and snapshots.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import enhanced state manager and section store
+try:
+    from src.config.enhanced_continuum_state import EnhancedStateManager, SECTION_ATTRIBUTES
+    from src.fsl_continuum.continuum.state_storage import JournalStateStore
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from config.enhanced_continuum_state import EnhancedStateManager, SECTION_ATTRIBUTES
+    from fsl_continuum.continuum.state_storage import JournalStateStore
+
+
+STATE_FILE = Path(__file__).resolve().parents[2] / "config" / "enhanced_continuum_state.json"
+
+
+class TestEnhancedStateManagerSections(unittest.TestCase):
+    """Test changed-section saves and structurally shared snapshots."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = Path(self.temp_dir.name) / "enhanced_continuum_state.json"
+        shutil.copy(STATE_FILE, self.config_path)
+        self.sections_path = Path(self.temp_dir.name) / "sections"
+
+    def test_snapshot_is_not_changed_by_later_updates(self):
+        """Test snapshots share unchanged sections and keep replaced ones."""
+        manager = EnhancedStateManager(str(self.config_path), section_store=JournalStateStore(str(self.sections_path)))
+        snapshot = manager.snapshot_state()
+
+        result = manager.update_state_with_ai({"neural_field": {"field_id": "updated"}, "statistics": {"runs": 3}})
+
+        self.assertTrue(result["success"])
+        self.assertNotEqual(snapshot["neural_field"]["field_id"], "updated")
+        self.assertNotIn("runs", snapshot["statistics"])
+        self.assertEqual(manager.snapshot_state()["neural_field"]["field_id"], "updated")
+        self.assertIs(manager.snapshot_state()["operations_log"], snapshot["operations_log"])
+        with self.assertRaises(TypeError):
+            snapshot["neural_field"] = {}
+
+    def test_section_store_saves_only_changed_sections(self):
+        """Test an update journals its sections and leaves the state file alone."""
+        original = self.config_path.read_text()
+        manager = EnhancedStateManager(str(self.config_path), section_store=JournalStateStore(str(self.sections_path)))
+
+        manager.update_state_with_ai({"schematics_consciousness": {"active_ai_system": "test"}})
+
+        self.assertEqual(manager.dirty_sections, set())
+        self.assertEqual(self.config_path.read_text(), original)
+        store = JournalStateStore(str(self.sections_path))
+        self.assertEqual(set(store.load()), {"schematics_consciousness_state", "last_updated"})
+
+        reloaded = EnhancedStateManager(str(self.config_path), section_store=JournalStateStore(str(self.sections_path)))
+        self.assertEqual(reloaded.schematics_consciousness_state["active_ai_system"], "test")
+        self.assertEqual(reloaded.state_config["last_updated"], manager.state_config["last_updated"])
+
+    def test_updates_by_state_file_key_persist(self):
+        """Test updates addressed by each state file key reach memory and disk."""
+        for journaled in (False, True):
+            def open_manager():
+                store = JournalStateStore(str(self.sections_path)) if journaled else None
+                return EnhancedStateManager(str(self.config_path), section_store=store)
+
+            manager = open_manager()
+            updates = {key: {"review_marker": 42} for key in SECTION_ATTRIBUTES}
+
+            self.assertTrue(manager.update_state_with_ai(updates)["success"])
+
+            reloaded = open_manager()
+            for key, attribute in SECTION_ATTRIBUTES.items():
+                with self.subTest(key=key, section_store=journaled):
+                    self.assertEqual(getattr(manager, attribute)["review_marker"], 42)
+                    self.assertEqual(manager.snapshot_state()[key]["review_marker"], 42)
+                    self.assertEqual(getattr(reloaded, attribute)["review_marker"], 42)
+
+    def test_without_section_store_state_file_is_rewritten(self):
+        """Test the default save still writes the whole state file."""
+        manager = EnhancedStateManager(str(self.config_path))
+
+        manager.update_state_with_ai({"symbolic_residue": {"tracking_active": False}})
+
+        saved = json.loads(self.config_path.read_text())
+        self.assertFalse(saved["symbolic_residue"]["tracking_active"])
+        self.assertEqual(saved["operations_log"], json.loads(STATE_FILE.read_text())["operations_log"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the SQLite-backed continuum state manager.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import SQLite state manager
+try:
+    from src.fsl_continuum.continuum.sqlite_state import SQLiteStateManager
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from fsl_continuum.continuum.sqlite_state import SQLiteStateManager
+
+
+def _write_from_child(manager, key):
+    """Write keys from a forked process through an inherited manager."""
+    async def write():
+        await manager.set(key, os.getpid())
+        await manager.set(f"{key}_connection_pid", manager.connection_pid)
+
+    asyncio.run(write())
+
+
+class TestSQLiteStateManager(unittest.TestCase):
+    """Test the StateManager API on SQLite in WAL mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = Path(self.temp_dir.name) / "fsl_state.db"
+
+    def test_bare_save_state_writes_in_place_changes(self):
+        """Test save_state() without arguments persists the in-memory state."""
+        async def scenario():
+            manager = SQLiteStateManager(str(self.db_path))
+            await manager.set("flow", {"velocity_score": 1})
+            state = await manager.load_state()
+            state["productivity"] = 2.0
+            state["flow"]["velocity_score"] = 5
+            self.assertTrue(await manager.save_state())
+            await manager.shutdown()
+
+            reopened = SQLiteStateManager(str(self.db_path))
+            loaded = await reopened.load_state()
+            await reopened.shutdown()
+            return loaded
+
+        self.assertEqual(asyncio.run(scenario()), {"flow": {"velocity_score": 5}, "productivity": 2.0})
+
+    def test_state_manager_api(self):
+        """Test get/set/update/load_state/save_state round trip through the database."""
+        async def scenario():
+            manager = SQLiteStateManager(str(self.db_path))
+            await manager.initialize()
+            self.assertEqual(await manager.load_state(), {})
+            await manager.set("productivity", 1.5)
+            await manager.update({"velocity_score": 2.0, "markets": ["US", "Japan"]})
+            self.assertTrue(await manager.save_state({"flow": {"state": "deep"}}))
+            self.assertEqual(await manager.get("markets"), ["US", "Japan"])
+            self.assertIsNone(await manager.get("missing"))
+            self.assertEqual(await manager.get("missing", 0), 0)
+            status = manager.get_status()
+            await manager.shutdown()
+            return status
+
+        status = asyncio.run(scenario())
+        self.assertEqual((status["journal_mode"], status["keys"]), ("wal", 4))
+
+        other = SQLiteStateManager(str(self.db_path))
+        self.assertEqual(asyncio.run(other.load_state()), {
+            "productivity": 1.5, "velocity_score": 2.0, "markets": ["US", "Japan"], "flow": {"state": "deep"}
+        })
+
+    def test_instances_see_each_others_commits(self):
+        """Test every call reads committed state instead of a cached copy."""
+        async def scenario():
+            first = SQLiteStateManager(str(self.db_path))
+            second = SQLiteStateManager(str(self.db_path))
+            await first.set("velocity_score", 1)
+            self.assertEqual(await second.get("velocity_score"), 1)
+            await second.set("velocity_score", 2)
+            self.assertEqual(await first.get("velocity_score"), 2)
+            await first.shutdown()
+            await second.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_failed_update_writes_nothing(self):
+        """Test a batched update is all-or-nothing."""
+        async def scenario():
+            manager = SQLiteStateManager(str(self.db_path))
+            with self.assertRaises(TypeError):
+                await manager.update({"a": 1, "b": object()})
+            self.assertEqual(await manager.load_state(), {})
+            await manager.shutdown()
+
+        asyncio.run(scenario())
+        with self.assertRaises(ValueError):
+            SQLiteStateManager(str(self.db_path), synchronous="SOMETIMES")
+
+    def test_lock_wait_does_not_block_event_loop(self):
+        """Test a write waiting on another connection's lock leaves the loop running."""
+        async def scenario():
+            manager = SQLiteStateManager(str(self.db_path), timeout=5.0)
+            await manager.initialize()
+            holder = sqlite3.connect(str(self.db_path), isolation_level=None)
+            holder.execute("BEGIN IMMEDIATE")
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.3, holder.execute, "COMMIT")
+
+            ticks = 0
+            write = asyncio.ensure_future(manager.set("velocity_score", 1))
+            while not write.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            await write
+            holder.close()
+            value = await manager.get("velocity_score")
+            await manager.shutdown()
+            return ticks, value
+
+        ticks, value = asyncio.run(scenario())
+        self.assertEqual(value, 1)
+        self.assertGreater(ticks, 10)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires fork")
+    def test_forked_process_opens_its_own_connection(self):
+        """Test a child process inheriting a manager opens its own connection."""
+        manager = SQLiteStateManager(str(self.db_path))
+        asyncio.run(manager.initialize())
+        parent_pid = manager.connection_pid
+
+        process = multiprocessing.get_context("fork").Process(target=_write_from_child, args=(manager, "child"))
+        process.start()
+        process.join(30)
+        self.assertEqual(process.exitcode, 0)
+
+        child_pid = asyncio.run(manager.get("child"))
+        self.assertNotEqual(child_pid, parent_pid)
+        self.assertEqual(asyncio.run(manager.get("child_connection_pid")), child_pid)
+        self.assertEqual(manager.connection_pid, parent_pid)
+        asyncio.run(manager.shutdown())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the write-behind continuum StateManager.
+"""
+
+import asyncio
+import json
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Import state manager
+try:
+    from src.fsl_continuum.continuum.state_management import StateManager
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    sys.path.insert(0, 'src')
+    from fsl_continuum.continuum.state_management import StateManager
+
+
+class TestStateManager(unittest.TestCase):
+    """Test write-behind persistence in StateManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.state_file = Path(self.temp_dir.name) / "fsl_state.json"
+
+    def read_file(self):
+        """Read the state file from disk."""
+        with open(self.state_file, 'r') as f:
+            return json.load(f)
+
+    def test_updates_coalesce_into_one_write(self):
+        """Test many updates are served from memory and written once."""
+        async def scenario():
+            manager = StateManager(str(self.state_file), flush_interval=0.02)
+            for i in range(100):
+                await manager.set(f"key_{i % 10}", i)
+            await manager.update({"a": 1, "b": 2})
+            self.assertFalse(self.state_file.exists())
+            self.assertEqual(await manager.get("key_3"), 93)
+            self.assertTrue(manager.get_status()["flush_pending"])
+
+            await asyncio.sleep(0.1)
+            return manager
+
+        manager = asyncio.run(scenario())
+        status = manager.get_status()
+        self.assertEqual((status["flush_count"], status["coalesced_updates"]), (1, 101))
+        self.assertEqual((status["pending_updates"], status["dirty_keys"]), (0, []))
+        self.assertEqual(self.read_file(), manager.state)
+        self.assertEqual(len(manager.state), 12)
+
+    def test_memory_is_authoritative_after_load(self):
+        """Test the file is read once and explicit saves merge and write immediately."""
+        self.state_file.write_text(json.dumps({"productivity": 1.5}))
+
+        async def scenario():
+            manager = StateManager(str(self.state_file))
+            await manager.initialize()
+            self.state_file.write_text(json.dumps({"productivity": 9.0}))
+            self.assertEqual(await manager.get("productivity"), 1.5)
+
+            self.assertTrue(await manager.save_state({"velocity_score": 2.0}))
+            self.assertEqual(self.read_file(), {"productivity": 1.5, "velocity_score": 2.0})
+            await manager.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_shutdown_flushes_and_fsyncs(self):
+        """Test shutdown writes pending changes before the interval and cancels the flush."""
+        async def scenario():
+            manager = StateManager(str(self.state_file), flush_interval=60)
+            await manager.set("flow", {"state": "deep"})
+            task = manager.flush_task
+            self.assertTrue(await manager.shutdown())
+            await asyncio.sleep(0)
+            self.assertTrue(task.cancelled())
+            self.assertFalse(manager.unsynced)
+
+            reloaded = StateManager(str(self.state_file))
+            return await reloaded.load_state()
+
+        self.assertEqual(asyncio.run(scenario()), {"flow": {"state": "deep"}})
+        self.assertEqual(list(Path(self.temp_dir.name).iterdir()), [self.state_file])
+
+    def test_failed_write_keeps_changes_pending(self):
+        """Test a failed flush keeps changes dirty so the next flush retries them."""
+        state_file = Path(self.temp_dir.name) / "missing" / "fsl_state.json"
+
+        async def scenario():
+            manager = StateManager(str(state_file), flush_interval=60)
+            await manager.update({"a": 1})
+            self.assertFalse(await manager.flush())
+            self.assertEqual(manager.get_status()["dirty_keys"], ["a"])
+
+            state_file.parent.mkdir()
+            self.assertTrue(await manager.shutdown())
+            return manager
+
+        manager = asyncio.run(scenario())
+        self.assertEqual(json.loads(state_file.read_text()), {"a": 1})
+        self.assertEqual(manager.pending_updates, 0)
+
+
+    def test_store_io_runs_off_the_event_loop(self):
+        """Test loads and writes run on the I/O executor, not the event loop thread."""
+        io_threads = []
+
+        class RecordingStore:
+            path = self.state_file
+
+            def load(self):
+                io_threads.append(threading.current_thread().name)
+                return {}
+
+            def encode(self, state, dirty_keys):
+                return dict(state)
+
+            def write(self, payload, fsync=False):
+                io_threads.append(threading.current_thread().name)
+
+            def sync(self):
+                pass
+
+            def close(self):
+                pass
+
+            def get_status(self):
+                return {}
+
+        async def scenario(manager):
+            await manager.set("flow", 1)
+            self.assertTrue(await manager.flush())
+            await manager.shutdown()
+            return manager.get_status()
+
+        status = asyncio.run(scenario(StateManager(store=RecordingStore())))
+        self.assertEqual(len(io_threads), 2)
+        self.assertTrue(all(name.startswith("fsl-state-io") for name in io_threads))
+        self.assertGreater(status["io_time"], 0.0)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="caller-io") as executor:
+            manager = StateManager(store=RecordingStore(), executor=executor)
+            asyncio.run(scenario(manager))
+            self.assertIs(manager.executor, executor)
+            self.assertEqual(executor.submit(lambda: 1).result(), 1)
+        self.assertTrue(io_threads[-1].startswith("caller-io"))
+
+if __name__ == '__main__':
+    unittest.main()